@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+과시즌 에이징 큐브 (시즌 연차 × Subcategory × Period)
+
+- 원천 행을 한 번만 순회해 (시즌 구분 F/S, 시즌 연도, Subcategory_Code) × Period 합계 행렬 생성
+  (stock_weeks.PeriodPrefixSums) — 재고(Stock_Price) / 택매출(Gross_Sales) 측정값
+- 연차 = 기준 Period 연도 - 시즌 연도 (2512 기준 24F = 1년차, 23F = 2년차, 22F 이하 = 3년차 이상)
+  → 연차는 조회 시점에 계산하므로 당월 / 전년 동월 어느 기준이든 같은 큐브에서 슬라이스
+- 과시즌 재고 / 판매 카드의 연차별 · Subcategory별 집계를 Period마다 행 재순회 없이 조회
+
+사용 예:
+    from aging_cube import AgingCube
+
+    aging = AgingCube(data, include=lambda row: row['Brand'] == 'MLB')
+    aging.bucket('Stock_Price', '2512', '1년차')                      # 24F 재고
+    aging.bucket('Gross_Sales', '2412', '3년차_이상')                 # 21F 이하 택매출
+    aging.total('Stock_Price', '2512', min_age=1, max_age=1, subcategory='JP')
+    aging.subcategories('2512', min_age=1, max_age=1)                # 24F Subcategory (처음 나온 순)
+"""
+import numpy as np
+
+from stock_weeks import ROW_COUNT, period_sums
+
+MEASURES = ['Stock_Price', 'Gross_Sales']
+
+# 연차 구간: (최소 연차, 최대 연차) — None은 제한 없음
+AGE_BUCKETS = {
+    '1년차': (1, 1),
+    '2년차': (2, 2),
+    '3년차_이상': (3, None),
+}
+
+
+def period_year(period):
+    """YYMM → 연도 2자리"""
+    return int(str(period)[:2])
+
+
+class AgingCube:
+    """시즌 연차 × Subcategory × Period 재고 / 판매 큐브"""
+
+    def __init__(self, rows, include=None, periods=None):
+        """
+        Args:
+            rows: 원천 행 dict 목록
+            include: 행 필터 (None이면 전체)
+            periods: Period 축 (기본: 행에 있는 Period)
+        """
+        self._names = {}
+
+        def key(row):
+            if include is not None and not include(row):
+                return None
+            season_code = row['Season_Code']
+            if len(season_code) < 2 or not season_code[:2].isdigit() or season_code[-1] not in ('F', 'S'):
+                return None
+            season_type, season_year = season_code[-1], int(season_code[:2])
+            subcategory = row['Subcategory_Code'].strip()
+            self._names[(season_type, season_year, subcategory, row['Period'])] = row['Subcategory'].strip()
+            return season_type, season_year, subcategory
+
+        self.sums = period_sums(rows, key, MEASURES + [ROW_COUNT], periods)
+        keys = self.sums[ROW_COUNT].keys
+        self._season_type = np.array([k[0] for k in keys], dtype=object)
+        self._season_year = np.array([k[1] for k in keys], dtype=np.int64)
+        self._subcategory = np.array([k[2] for k in keys], dtype=object)
+
+    def _mask(self, period, season_type, min_age=None, max_age=None, subcategory=None):
+        mask = self._season_type == season_type
+        age = period_year(period) - self._season_year
+        if min_age is not None:
+            mask &= age >= min_age
+        if max_age is not None:
+            mask &= age <= max_age
+        if subcategory is not None:
+            mask &= self._subcategory == subcategory
+        return mask
+
+    def total(self, column, period, season_type='F', min_age=None, max_age=None, subcategory=None):
+        """기준 Period의 연차 구간 합계 (column: MEASURES 또는 ROW_COUNT)"""
+        sums = self.sums[column]
+        mask = self._mask(period, season_type, min_age, max_age, subcategory)
+        return sums.keys_sum(mask, *sums.positions(period, period))
+
+    def bucket(self, column, period, bucket, season_type='F', subcategory=None):
+        """AGE_BUCKETS 구간 합계"""
+        min_age, max_age = AGE_BUCKETS[bucket]
+        return self.total(column, period, season_type, min_age, max_age, subcategory)
+
+    def subcategories(self, period, season_type='F', min_age=None, max_age=None):
+        """기준 Period에 행이 있는 연차 구간 Subcategory 코드 (원천 행에서 처음 나온 순)"""
+        base = period_year(period)
+        period = str(period)
+        codes = {}
+        for (row_type, season_year, subcategory, row_period) in self._names:
+            age = base - season_year
+            if (row_type == season_type and row_period == period
+                    and (min_age is None or age >= min_age) and (max_age is None or age <= max_age)):
+                codes[subcategory] = None
+        return list(codes)
+
+    def subcategory_name(self, period, subcategory, age, season_type='F'):
+        """age 연차 시즌의 Subcategory 이름 (기준 Period 행 기준, 없으면 '')"""
+        key = (season_type, period_year(period) - age, subcategory, str(period))
+        return self._names.get(key, '')
@@ -0,0 +1,57 @@
+// 콘텐츠 해시 URL (/dashboard/v/{hash}/{file}) → public/dashboard/{file}
+// - 현재 파일 내용의 해시(dashboard_manifest.py와 같은 sha256 앞 12자리)가 URL 해시와 같을 때만 영구 캐시 헤더로 응답
+// - 매니페스트를 갱신하지 않은 스크립트가 파일을 덮어써 해시가 달라지면 404 (이전 내용이 영구 캐시되지 않음)
+//   → 클라이언트(lib/dashboard-manifest.ts)는 원본 URL로 재요청
+import { createHash } from 'crypto';
+import { promises as fs } from 'fs';
+import path from 'path';
+
+const DASHBOARD_DIR = path.join(process.cwd(), 'public', 'dashboard');
+const HASH_LENGTH = 12;
+
+// 파일별 해시 캐시 (수정시각 / 크기가 같으면 재계산 없음)
+const hashCache = new Map<string, { mtimeMs: number; size: number; hash: string }>();
+
+async function readWithHash(filePath: string): Promise<{ body: Buffer; hash: string } | null> {
+  try {
+    const stat = await fs.stat(filePath);
+    if (!stat.isFile()) {
+      return null;
+    }
+    const body = await fs.readFile(filePath);
+    const cached = hashCache.get(filePath);
+    if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+      return { body, hash: cached.hash };
+    }
+    const hash = createHash('sha256').update(body).digest('hex').slice(0, HASH_LENGTH);
+    hashCache.set(filePath, { mtimeMs: stat.mtimeMs, size: stat.size, hash });
+    return { body, hash };
+  } catch {
+    return null;
+  }
+}
+
+const notFound = () =>
+  new Response('Not Found', { status: 404, headers: { 'Cache-Control': 'no-store' } });
+
+export async function GET(
+  _request: Request,
+  { params }: { params: Promise<{ hash: string; file: string }> }
+) {
+  const { hash, file } = await params;
+  if (path.basename(file) !== file || !file.endsWith('.json')) {
+    return notFound();
+  }
+
+  const result = await readWithHash(path.join(DASHBOARD_DIR, file));
+  if (!result || result.hash !== hash) {
+    return notFound();
+  }
+
+  return new Response(new Uint8Array(result.body), {
+    headers: {
+      'Content-Type': 'application/json; charset=utf-8',
+      'Cache-Control': 'public, max-age=31536000, immutable',
+    },
+  });
+}
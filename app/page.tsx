@@ -5,6 +5,8 @@ import { useEffect, useState, useMemo } from 'react';
 import { ChevronDown, ChevronRight } from 'lucide-react';
 import hkStoreAreas from '@/components/dashboard/hongkong-store-areas.json';
 import twStoreAreas from '@/components/dashboard/taiwan-store-areas.json';
+import { fetchDashboardJson } from '@/lib/dashboard-manifest';
+import { fetchDashboardData } from '@/lib/dashboard-bundle';
 
 export default function Home() {
   const [hkData, setHkData] = useState<any>(null);
@@ -25,63 +27,35 @@ export default function Home() {
     const loadData = async () => {
       setIsLoading(true);
       try {
-        // Period별 파일명 생성
-        const hkDashboardPath = `/dashboard/hongkong-dashboard-data-${selectedPeriod}.json`;
-        const twDashboardPath = `/dashboard/taiwan-dashboard-data-${selectedPeriod}.json`;
-        
-        // PL 데이터도 동일한 period 사용
-        const hkPlPath = `/dashboard/hongkong-pl-data-${selectedPeriod}.json`;
-        const twPlPath = `/dashboard/taiwan-pl-data-${selectedPeriod}.json`;
-
-        // Period별 파일 로드 시도, 없으면 기본 파일 사용
-        const loadWithFallback = async (periodPath: string, defaultPath: string) => {
-          try {
-            const res = await fetch(periodPath);
-            if (res.ok) {
-              return await res.json();
-            }
-          } catch (e) {
-            console.warn(`Period 파일 로드 실패 (${periodPath}), 기본 파일 사용`);
+        // Period별 파일 로드 (매니페스트에 없으면 기본 파일 사용 - 추가 요청 없음)
+        const loadWithFallback = async (region: 'hongkong' | 'taiwan', kind: string) => {
+          // 대시보드 데이터는 델타 번들 우선 (Period 전환 시 재다운로드 없음)
+          const data = kind === 'dashboard-data'
+            ? await fetchDashboardData(region, selectedPeriod, { fallbackToDefault: true })
+            : await fetchDashboardJson(region, kind, selectedPeriod, { fallbackToDefault: true });
+          if (!data) {
+            throw new Error(`파일을 찾을 수 없습니다: ${region}-${kind}`);
           }
-          // 기본 파일 로드
-          const defaultRes = await fetch(defaultPath);
-          if (defaultRes.ok) {
-            return await defaultRes.json();
-          }
-          throw new Error(`파일을 찾을 수 없습니다: ${defaultPath}`);
+          return data;
         };
 
-        // BS 데이터 경로
-        const bsPath = `/dashboard/bs-data-${selectedPeriod}.json`;
-        // CF 데이터 경로
-        const cfPath = `/dashboard/cf-data-${selectedPeriod}.json`;
-        // 평당매출 데이터 경로
-        const hkSalesPerPyeongPath = `/dashboard/hongkong-sales-per-pyeong-${selectedPeriod}.json`;
-        const twSalesPerPyeongPath = `/dashboard/taiwan-sales-per-pyeong-${selectedPeriod}.json`;
-
         // 모든 데이터 병렬 로드
-        const [hkDashboard, twDashboard, hkPl, twPl, bs, cf, hkSalesPyeong, twSalesPyeong] = await Promise.all([
-          loadWithFallback(hkDashboardPath, '/dashboard/hongkong-dashboard-data.json'),
-          loadWithFallback(twDashboardPath, '/dashboard/taiwan-dashboard-data.json'),
-          loadWithFallback(hkPlPath, '/dashboard/hongkong-pl-data.json'),
-          loadWithFallback(twPlPath, '/dashboard/taiwan-pl-data.json'),
-          fetch(bsPath).then(res => res.ok ? res.json() : null).catch(() => null),
-          fetch(cfPath).then(res => res.ok ? res.json() : null).catch(() => null),
-          fetch(hkSalesPerPyeongPath).then(res => res.ok ? res.json() : null).catch(() => null),
-          fetch(twSalesPerPyeongPath).then(res => res.ok ? res.json() : null).catch(() => null)
+        const [hkDashboard, twDashboard, hkPl, twPl, bs, cf, hkSalesPyeong, twSalesPyeong, tagSummaryData] = await Promise.all([
+          loadWithFallback('hongkong', 'dashboard-data'),
+          loadWithFallback('taiwan', 'dashboard-data'),
+          loadWithFallback('hongkong', 'pl-data'),
+          loadWithFallback('taiwan', 'pl-data'),
+          fetchDashboardJson('common', 'bs-data', selectedPeriod),
+          fetchDashboardJson('common', 'cf-data', selectedPeriod),
+          fetchDashboardJson('hongkong', 'sales-per-pyeong', selectedPeriod),
+          fetchDashboardJson('taiwan', 'sales-per-pyeong', selectedPeriod),
+          // TAG Summary 데이터 (전처리된 재고 YOY)
+          fetchDashboardJson('taiwan', 'tag-summary', selectedPeriod)
         ]);
 
-        // TAG Summary 데이터 로드 (전처리된 재고 YOY)
-        try {
-          const tagSummaryPath = `/dashboard/taiwan-tag-summary-${selectedPeriod}.json`;
-          const tagSummaryResponse = await fetch(tagSummaryPath);
-          if (tagSummaryResponse.ok) {
-            const tagSummaryData = await tagSummaryResponse.json();
-            // twDashboard에 TAG Summary 추가
-            (twDashboard as any).tag_summary = tagSummaryData;
-          }
-        } catch (e) {
-          console.log('TAG Summary data not found, skipping...');
+        // twDashboard에 TAG Summary 추가
+        if (tagSummaryData) {
+          (twDashboard as any).tag_summary = tagSummaryData;
         }
 
         // ending_inventory는 components 폴더에서 import
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+생성 스크립트 벤치마크 (합성 데이터)
+
+- synthetic_data로 매장 수 / 이력 연수별 원천 CSV를 만든 샌드박스에서 생성 스크립트를 실행해 시간 측정
+  샌드박스 구조: {sandbox}/Dashboard_Raw_Data, {sandbox}/work (작업 폴더 — 스크립트의 ../Dashboard_Raw_Data,
+  public/dashboard 상대 경로가 그대로 동작)
+- 케이스마다 별도 프로세스로 실행 (모듈 캐시/전역 상태 영향 없음, 최대 메모리 측정)
+- 케이스 결과에 stage_profiler 단계별 시간/행 수 포함
+- 결과는 benchmark_history.jsonl에 누적 → 같은 규모의 이전 실행과 비교해 속도 변화 출력 (.gitignore 대상)
+- 합성 데이터에서 입력이 비는 케이스는 CASE_NOTES로 결과 옆에 표시 (측정값 해석 주의)
+
+사용법:
+    python benchmark_generators.py                          # 기본 규모 (매장 20, 2년)
+    python benchmark_generators.py --stores 40 --years 1,2,3  # 이력 연수별 확장성
+    python benchmark_generators.py --cases hk_dashboard,tw_pl_summary --repeat 3
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import io
+from datetime import datetime
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32' and __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_FILE = os.path.join(REPO_DIR, 'benchmark_history.jsonl')
+RESULT_MARKER = 'BENCHMARK_RESULT '
+RAW_DIR = '../Dashboard_Raw_Data'
+
+# 케이스: (모듈, 함수, 인자 템플릿) — 인자의 {period}는 실행 시 치환, 작업 폴더 기준 상대 경로
+CASES = {
+    'hk_dashboard': ('update_hongkong_dashboard', 'generate_dashboard_data',
+                     [RAW_DIR, 'components/dashboard/hongkong-dashboard-data-{period}.json', '{period}']),
+    'tw_dashboard': ('generate_taiwan_dashboard_data', 'generate_dashboard_data',
+                     [RAW_DIR + '/TW/{period}/TW_Inventory_{period}.csv', 'components/dashboard/taiwan-dashboard-data.json', '{period}']),
+    'hk_pl_summary': ('generate_hongkong_pl_summary', 'main', ['{period}']),
+    'tw_pl_summary': ('generate_taiwan_pl_summary_2512', 'main', ['{period}']),
+    'hk_cumulative': ('generate_hongkong_cumulative_2512', 'generate_cumulative_dashboard_data',
+                      [RAW_DIR + '/HKMC/{period}/HKMC_Inventory_{period}.csv', 'public/dashboard/hongkong-dashboard-cumulative-{period}.json', '{period}']),
+    'tw_cumulative': ('generate_taiwan_cumulative_2512', 'generate_cumulative_dashboard_data',
+                      [RAW_DIR + '/TW/{period}/TW_Inventory_{period}.csv', 'public/dashboard/taiwan-dashboard-cumulative-{period}.json', '{period}']),
+}
+
+# 케이스 참고 사항 (결과 출력 / 기록에 포함)
+CASE_NOTES = {
+    # read_pl_database가 CNTRY_CD TW / T99 오피스 행만 남기는데 HKMC_PL(실데이터와 같은 HK / MC 행)이 먼저 선택됨
+    'hk_pl_summary': 'PL 0행 — HKMC_PL에 TW 행 없음, CSV 로드 / 빈 집계 시간만 측정',
+}
+
+
+def peak_rss_mb():
+    """현재 프로세스 최대 메모리 (MB, 측정 불가 시 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case_inline(name, period, repo_dir=REPO_DIR):
+    """자식 프로세스: 케이스 1개 실행 후 결과 JSON 출력 (생성 스크립트는 repo_dir에서 import)"""
+    module_name, function_name, arg_templates = CASES[name]
+    sys.path.insert(0, repo_dir)
+    args = [arg.format(period=period) for arg in arg_templates]
+
+    start_wall, start_cpu = time.perf_counter(), time.process_time()
+    module = __import__(module_name)
+    import_seconds = time.perf_counter() - start_wall
+    getattr(module, function_name)(*args)
+    from stage_profiler import summarize
+    result = {
+        'seconds': time.perf_counter() - start_wall,
+        'import_seconds': import_seconds,
+        'cpu_seconds': time.process_time() - start_cpu,
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': {name: {'calls': item['calls'], 'seconds': item['seconds'], 'rows': item['rows']}
+                   for name, item in summarize().items()},
+    }
+    print(RESULT_MARKER + json.dumps(result))
+
+
+def run_case(name, period, work_dir, log_dir, repo_dir=REPO_DIR):
+    """
+    케이스를 별도 프로세스로 실행 → 결과 dict (실패 시 error 포함)
+
+    repo_dir: 생성 스크립트를 가져올 폴더 (다른 리비전 비교용, 기본: 현재 저장소)
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([repo_dir, REPO_DIR, os.environ.get('PYTHONPATH', '')]),
+               PYTHONIOENCODING='utf-8')
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--run-case', name, '--period', period, '--repo', repo_dir],
+        cwd=work_dir, env=env, capture_output=True, text=True, encoding='utf-8', errors='replace',
+    )
+    wall = time.perf_counter() - start
+    log_path = os.path.join(log_dir, f'{name}.log')
+    with open(log_path, 'w', encoding='utf-8') as f:
+        f.write(proc.stdout)
+        f.write(proc.stderr)
+
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            result = json.loads(line[len(RESULT_MARKER):])
+            result['process_seconds'] = wall
+            return result
+    last_error = next((line for line in reversed(proc.stderr.splitlines()) if line.strip()), '')
+    return {'error': f'exit {proc.returncode}: {last_error[:200]}', 'log': log_path}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def load_history(path=HISTORY_FILE):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(record, path=HISTORY_FILE):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def previous_run(history, scale):
+    """같은 규모의 가장 최근 실행"""
+    for record in reversed(history):
+        if record.get('scale') == scale:
+            return record
+    return None
+
+
+def make_work_dir(path):
+    """작업 폴더 (생성 스크립트 cwd): 출력 폴더 + 로그 폴더"""
+    for sub in ['components/dashboard', 'public/dashboard', 'logs']:
+        os.makedirs(os.path.join(path, sub), exist_ok=True)
+    return path
+
+
+def make_sandbox(period='2512', stores=20, years=2, rows=60, seed=7, prefix='dashboard-bench-'):
+    """
+    샌드박스 폴더 + 합성 원천 데이터 생성
+
+    Returns:
+        (샌드박스 경로, write_dataset 결과)
+    """
+    from synthetic_data import write_dataset
+
+    sandbox = tempfile.mkdtemp(prefix=prefix)
+    dataset = write_dataset(os.path.join(sandbox, 'Dashboard_Raw_Data'), period, stores, years, rows, seed)
+    return sandbox, dataset
+
+
+def run_benchmark(period='2512', stores=20, years=2, rows=60, cases=None, repeat=1, seed=7, keep=False):
+    """
+    합성 데이터 1세트 생성 후 케이스별 실행 (repeat회 중 최소 시간 기록)
+
+    Returns:
+        기록 dict (history 한 줄)
+    """
+    cases = cases or list(CASES)
+    scale = {'period': period, 'stores': stores, 'years': years, 'rows_per_store': rows, 'seed': seed}
+    print(f"\n[규모] 매장 {stores}개, 이력 {years}년, 매장당 {rows}행 (Period {period})")
+    start = time.perf_counter()
+    sandbox, dataset = make_sandbox(period, stores, years, rows, seed)
+    work_dir = make_work_dir(os.path.join(sandbox, 'work'))
+    print(f"  합성 데이터 생성: {time.perf_counter() - start:.1f}s, "
+          f"재고 {dataset['rows']['hkmc_inventory']:,}+{dataset['rows']['tw_inventory']:,}행, "
+          f"PL {dataset['rows']['pl_database']:,}행, {dataset['bytes'] / 1024 / 1024:,.1f} MB")
+
+    results = {}
+    for name in cases:
+        runs = [run_case(name, period, work_dir, os.path.join(work_dir, 'logs')) for _ in range(repeat)]
+        ok = [r for r in runs if 'error' not in r]
+        results[name] = min(ok, key=lambda r: r['seconds']) if ok else runs[0]
+        if name in CASE_NOTES:
+            results[name]['note'] = CASE_NOTES[name]
+        if ok:
+            r = results[name]
+            memory = f", 최대 메모리 {r['peak_rss_mb']:.0f} MB" if r.get('peak_rss_mb') else ""
+            note = f" [{CASE_NOTES[name]}]" if name in CASE_NOTES else ""
+            print(f"  {name:15s} {r['seconds']:8.2f}s (CPU {r['cpu_seconds']:.2f}s{memory}){note}")
+        else:
+            print(f"  {name:15s} 실패: {runs[0]['error']} (로그: {runs[0]['log']})")
+
+    record = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': sys.version.split()[0],
+        'scale': scale,
+        'input_rows': dataset['rows'],
+        'input_bytes': dataset['bytes'],
+        'results': results,
+    }
+    if keep:
+        print(f"  샌드박스 유지: {sandbox}")
+    else:
+        shutil.rmtree(sandbox, ignore_errors=True)
+    return record
+
+
+def print_comparison(record, previous):
+    """같은 규모 이전 실행 대비 속도 변화"""
+    if not previous:
+        return
+    print(f"  이전 실행 대비 ({previous['timestamp']}, {previous.get('revision')}):")
+    for name, result in record['results'].items():
+        before = previous['results'].get(name, {})
+        if 'seconds' in result and 'seconds' in before and result['seconds'] > 0:
+            print(f"    {name:15s} {before['seconds']:8.2f}s → {result['seconds']:8.2f}s "
+                  f"(x{before['seconds'] / result['seconds']:.2f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='생성 스크립트 벤치마크 (합성 데이터)')
+    parser.add_argument('--period', default='2512')
+    parser.add_argument('--stores', default='20', help='매장 수 (쉼표로 여러 값)')
+    parser.add_argument('--years', default='2', help='이력 연수 (쉼표로 여러 값)')
+    parser.add_argument('--rows', type=int, default=60, help='Period × 매장당 재고 행 수')
+    parser.add_argument('--cases', default=','.join(CASES), help='실행할 케이스 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--keep', action='store_true', help='샌드박스 폴더 유지')
+    parser.add_argument('--no-history', action='store_true', help='결과를 기록하지 않음')
+    parser.add_argument('--run-case', help=argparse.SUPPRESS)
+    parser.add_argument('--repo', default=REPO_DIR, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        run_case_inline(args.run_case, args.period, args.repo)
+        return
+
+    cases = [c for c in args.cases.split(',') if c]
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"알 수 없는 케이스: {unknown} (가능: {list(CASES)})")
+
+    print("=" * 80)
+    print("생성 스크립트 벤치마크")
+    print("=" * 80)
+
+    history = load_history()
+    for stores in [int(s) for s in args.stores.split(',')]:
+        for years in [int(y) for y in args.years.split(',')]:
+            record = run_benchmark(args.period, stores, years, args.rows, cases, args.repeat, args.seed, args.keep)
+            print_comparison(record, previous_run(history, record['scale']))
+            if not args.no_history:
+                append_history(record)
+                history.append(record)
+
+    if not args.no_history:
+        print(f"\n기록 저장: {HISTORY_FILE}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
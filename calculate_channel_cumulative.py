@@ -1,5 +1,7 @@
 import json
 
+from channel_sums import HKMC_CHANNEL_KEYS, ChannelSums
+
 # Load dashboard data
 with open('public/dashboard/hongkong-dashboard-data-2512.json', 'r', encoding='utf-8') as f:
     dd = json.load(f)
@@ -12,12 +14,12 @@ with open('public/dashboard/hongkong-pl-data-2512.json', 'r', encoding='utf-8')
 monthly_data = dd['monthly_channel_data']
 monthly_channel_yoy = dd.get('monthly_channel_yoy', {})
 
-# Calculate cumulative by channel
-channels = ['HK_Retail', 'HK_Outlet', 'HK_Online', 'MC_Retail', 'MC_Outlet']
+# Calculate cumulative by channel (month-indexed channel prefix sums)
+channels = HKMC_CHANNEL_KEYS
+channel_sums = ChannelSums.from_monthly(monthly_data, channels)
 cumulative = {}
 
-for channel in channels:
-    net_sales = sum([period.get(channel, 0) for period in monthly_data])
+for channel, net_sales in channel_sums.totals('net_sales').items():
     cumulative[channel] = {'net_sales': net_sales}
     print(f'{channel} cumulative net_sales: {net_sales:,.0f}')
 
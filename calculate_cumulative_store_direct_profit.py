@@ -3,10 +3,12 @@
 """
 오프라인 매장별 누적 직접이익 계산 (CSV 기반)
 """
-import csv
 import sys
 import os
-from collections import defaultdict
+
+import numpy as np
+
+from pl_tensor import STORE_PL_TREE, load_pl_tensor
 
 def parse_period(period_str):
     """Period 문자열을 파싱 (예: 2511 -> 2025, 11)"""
@@ -29,84 +31,31 @@ def calculate_cumulative_direct_profit(csv_file, period):
     if year is None:
         raise ValueError(f"Invalid period: {period}")
     
-    # 누적 period 리스트 (1월~해당월) - 6자리 형식만 사용 (202501, 202502, ...)
-    all_periods = set([f"{year}{m:02d}" for m in range(1, month + 1)])
+    # 누적 구간 (1월~해당월) - 6자리 형식 (202501 ~ 202511)
+    # 전년 / 전전년 누적 구간 (전년 YOY 계산용)
+    windows = {
+        '': (f"{year}01", f"{year}{month:02d}"),
+        '_prev': (f"{year - 1}01", f"{year - 1}{month:02d}"),
+        '_prev_prev': (f"{year - 2}01", f"{year - 2}{month:02d}"),
+    }
     
-    # 전년 누적 period 리스트 - 6자리 형식만 사용 (202401, 202402, ...)
-    prev_year = year - 1
-    all_prev_periods = set([f"{prev_year}{m:02d}" for m in range(1, month + 1)])
+    print(f"PL 텐서 로드 중: {csv_file}")
+    tensor = load_pl_tensor(csv_file)
     
-    # 전전년 누적 period 리스트 - 6자리 형식만 사용 (202301, 202302, ...) - 전년 YOY 계산용
-    prev_prev_year = prev_year - 1
-    all_prev_prev_periods = set([f"{prev_prev_year}{m:02d}" for m in range(1, month + 1)])
+    # 오프라인 매장만, HK/MC만, MLB만
+    offline = tensor.store_mask(brand='M', country=['HK', 'MC'])
+    offline &= np.array([is_offline_store(store[2]) for store in tensor.stores], dtype=bool)
+    # 매장 초기화 (당년, 전년, 전전년 데이터 중 하나라도 있으면)
+    active = offline & (tensor.active(*windows['']) | tensor.active(*windows['_prev']) | tensor.active(*windows['_prev_prev']))
     
     stores = {}
+    for suffix, (start, end) in windows.items():
+        for store_code, measures in tensor.shop_measures(STORE_PL_TREE, start, end, active).items():
+            data = stores.setdefault(store_code, {})
+            data['net_sales' + suffix] = measures['net_sales']
+            data['gross_profit' + suffix] = measures['gross_profit']
+            data['selling_expense' + suffix] = measures['selling_expense']
     
-    print(f"CSV 파일 읽는 중: {csv_file}")
-    with open(csv_file, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        row_count = 0
-        for row in reader:
-            row_count += 1
-            if row_count % 10000 == 0:
-                print(f"  처리 중: {row_count:,}개 행...")
-            
-            period_str = row['PERIOD']
-            
-            # 오프라인 매장만, HK/MC만, MLB만
-            if (row['CNTRY_CD'] not in ['HK', 'MC'] or 
-                row['BRD_CD'] != 'M' or
-                not is_offline_store(row['SHOP_CD'])):
-                continue
-            
-            store_code = row['SHOP_CD']
-            account_nm = row['ACCOUNT_NM'].strip()
-            account_cd = row['ACCOUNT_CD'].strip()
-            value = float(row['VALUE'] or 0)
-            
-            # 매장 초기화 (당년, 전년, 전전년 데이터 중 하나라도 있으면)
-            if period_str in all_periods or period_str in all_prev_periods or period_str in all_prev_prev_periods:
-                if store_code not in stores:
-                    stores[store_code] = {
-                        'net_sales': 0,
-                        'net_sales_prev': 0,
-                        'gross_profit': 0,
-                        'gross_profit_prev': 0,
-                        'selling_expense': 0,  # 판매관리비
-                        'selling_expense_prev': 0,
-                        'net_sales_prev_prev': 0,  # 전전년 (전년 YOY 계산용)
-                        'gross_profit_prev_prev': 0,
-                        'selling_expense_prev_prev': 0,
-                    }
-            
-            # 당년 누적 데이터
-            if period_str in all_periods:
-                if account_nm == '실매출액' or account_cd == 'ACT_SALE_AMT':
-                    stores[store_code]['net_sales'] += value
-                elif account_nm == '매출총이익':
-                    stores[store_code]['gross_profit'] += value
-                elif account_nm == '판매관리비':
-                    stores[store_code]['selling_expense'] += value
-            
-            # 전년 누적 데이터
-            if period_str in all_prev_periods:
-                if account_nm == '실매출액' or account_cd == 'ACT_SALE_AMT':
-                    stores[store_code]['net_sales_prev'] += value
-                elif account_nm == '매출총이익':
-                    stores[store_code]['gross_profit_prev'] += value
-                elif account_nm == '판매관리비':
-                    stores[store_code]['selling_expense_prev'] += value
-            
-            # 전전년 누적 데이터 (전년 YOY 계산용)
-            if period_str in all_prev_prev_periods:
-                if account_nm == '실매출액' or account_cd == 'ACT_SALE_AMT':
-                    stores[store_code]['net_sales_prev_prev'] += value
-                elif account_nm == '매출총이익':
-                    stores[store_code]['gross_profit_prev_prev'] += value
-                elif account_nm == '판매관리비':
-                    stores[store_code]['selling_expense_prev_prev'] += value
-    
-    print(f"총 {row_count:,}개 행 처리 완료")
     print(f"오프라인 매장 {len(stores)}개 발견\n")
     
     # 누적 직접이익 계산 (generate_store_status.py 방식: 매출총이익 - 판매관리비)
@@ -1,407 +1,332 @@
+#!/usr/bin/env python3
+"""
+평당매출(일평균) 계산 - 전 기간 / HK·MC·TW
+
+- 면적: store_area_index (매장 × 월 면적 행렬, 1회 로드 후 캐시)
+- 매출: PL CSV 실매출액 → 매장 × 월 피벗 (MLB), PL VALUE(1K HKD) × 1000 → HKD
+  (출력 total_sales_hkd / sales_per_pyeong_daily는 HKD 단위)
+- 당월: 면적 > 0 이고 당월 매출 > 0 인 매장 / 당월 일수
+- 누적: 1월~당월 누적 매출 1K HKD 이상 매장의 월별 면적 가중평균 / 1월~당월 일수
+- 일수는 달력 기준 (월별 28~31일, 윤년 366일)
+- 온라인 채널, M03 제외
+
+출력:
+    public/dashboard/hongkong-sales-per-pyeong-{period}.json
+    public/dashboard/taiwan-sales-per-pyeong-{period}.json (TW PL CSV가 있을 때)
+
+사용법:
+    python calculate_sales_per_pyeong_2512.py          # 2512
+    python calculate_sales_per_pyeong_2512.py 2601
+"""
+import calendar
+import glob
+import os
+
 import pandas as pd
-import json
-
-# 면적 데이터 로드
-area_df = pd.read_csv(r'D:\Cursor_work_space\HKMCTW_Dashboard\Dashboard_Raw_Data\HKMC\2512\HKMC Store pyung 2512.csv', 
-                      encoding='utf-8-sig')
-
-# 매출 데이터 로드
-with open('public/dashboard/hongkong-dashboard-cumulative-2512.json', 'r', encoding='utf-8') as f:
-    cumulative = json.load(f)
-
-with open('public/dashboard/hongkong-dashboard-data-2512.json', 'r', encoding='utf-8') as f:
-    monthly = json.load(f)
-
-store_summary = cumulative.get('store_summary', {})
-monthly_summary = monthly.get('store_summary', {})
-
-# 매장 코드를 키로 하는 면적 딕셔너리 생성
-store_areas = {}
-for _, row in area_df.iterrows():
-    code = row['Store code']
-    store_areas[code] = {
-        'country': row['country'],
-        'channel': row['channel'],
-        'monthly_area_2025': {f'{i:02d}': row[f'25{i:02d}'] for i in range(1, 13)},  # 2501~2512
-        'monthly_area_2024': {f'{i:02d}': row[f'24{i:02d}'] for i in range(1, 13)},  # 2401~2412
-        'area_2512': row['2512'],  # 당년 12월 면적
-        'area_2412': row['2412']   # 전년 12월 면적
-    }
 
-print("=" * 80)
-print("면적 데이터 로드 완료")
-print(f"총 매장 수: {len(store_areas)}")
-print("=" * 80)
-
-# === 당월 (12월) 계산 ===
-print("\n=== 당년 당월 (2512) 평당매출 계산 ===")
-
-monthly_total_sales = 0
-monthly_total_area = 0
-monthly_stores = []
-
-for code, area_info in store_areas.items():
-    if code == 'M03' or area_info['channel'] == 'Online':
-        continue
-    
-    store = monthly_summary.get(code, {})
-    sales = store.get('current', {}).get('net_sales', 0)
-    area = area_info['area_2512']
-    
-    if pd.notna(area) and area > 0 and sales > 0:
-        monthly_total_sales += sales
-        monthly_total_area += area
-        monthly_stores.append({'code': code, 'sales': sales, 'area': area})
-
-monthly_days = 31
-monthly_sales_per_pyeong = monthly_total_sales / monthly_total_area if monthly_total_area > 0 else 0
-monthly_daily_sales_per_pyeong = monthly_sales_per_pyeong / monthly_days
-
-print(f"매장 수: {len(monthly_stores)}")
-print(f"총 매출: {monthly_total_sales:,.0f} HKD = {monthly_total_sales/1000:,.1f} K HKD")
-print(f"총 면적: {monthly_total_area:.0f}평")
-print(f"일평당매출: {monthly_daily_sales_per_pyeong:,.0f} HKD/평/일")
-
-# === 전년 당월 (2412) 계산 ===
-print("\n=== 전년 당월 (2412) 평당매출 계산 ===")
-
-prev_monthly_total_sales = 0
-prev_monthly_total_area = 0
-prev_monthly_stores = []
-
-for code, area_info in store_areas.items():
-    if code == 'M03' or area_info['channel'] == 'Online':
-        continue
-    
-    store = monthly_summary.get(code, {})
-    sales = store.get('previous', {}).get('net_sales', 0)
-    area = area_info['area_2412']
-    
-    if pd.notna(area) and area > 0 and sales > 0:
-        prev_monthly_total_sales += sales
-        prev_monthly_total_area += area
-        prev_monthly_stores.append({'code': code, 'sales': sales, 'area': area})
-
-prev_monthly_sales_per_pyeong = prev_monthly_total_sales / prev_monthly_total_area if prev_monthly_total_area > 0 else 0
-prev_monthly_daily_sales_per_pyeong = prev_monthly_sales_per_pyeong / monthly_days
-
-print(f"매장 수: {len(prev_monthly_stores)}")
-print(f"총 매출: {prev_monthly_total_sales:,.0f} HKD = {prev_monthly_total_sales/1000:,.1f} K HKD")
-print(f"총 면적: {prev_monthly_total_area:.0f}평")
-print(f"일평당매출: {prev_monthly_daily_sales_per_pyeong:,.0f} HKD/평/일")
-
-monthly_yoy = (monthly_daily_sales_per_pyeong / prev_monthly_daily_sales_per_pyeong * 100) if prev_monthly_daily_sales_per_pyeong > 0 else 0
-print(f"YOY: {monthly_yoy:.1f}%")
-
-# === 당년 누적 (2025) 계산 ===
-print("\n=== 당년 누적 (2501~2512) 평당매출 계산 (가중평균) ===")
-
-monthly_area_sums = []
-for month in range(1, 13):
-    month_key = f'{month:02d}'
-    month_area_sum = 0
-    
-    for code, area_info in store_areas.items():
-        if code == 'M03' or area_info['channel'] == 'Online':
-            continue
-        
-        store = store_summary.get(code, {})
-        cumulative_sales = store.get('current', {}).get('net_sales', 0)
-        
-        if cumulative_sales >= 1000:
-            area = area_info['monthly_area_2025'].get(month_key, 0)
-            if pd.notna(area) and area > 0:
-                month_area_sum += area
-    
-    monthly_area_sums.append(month_area_sum)
-    print(f"  {month:02d}월 면적: {month_area_sum:.0f}평")
-
-weighted_avg_area = sum(monthly_area_sums) / 12
-print(f"가중평균 면적: {weighted_avg_area:.1f}평")
-
-cumulative_total_sales = 0
-cumulative_stores = []
-
-for code, area_info in store_areas.items():
-    if code == 'M03' or area_info['channel'] == 'Online':
-        continue
-    
-    store = store_summary.get(code, {})
-    sales = store.get('current', {}).get('net_sales', 0)
-    
-    if sales >= 1000:
-        cumulative_total_sales += sales
-        cumulative_stores.append({'code': code, 'sales': sales})
-
-cumulative_days = 365
-cumulative_sales_per_pyeong = cumulative_total_sales / weighted_avg_area if weighted_avg_area > 0 else 0
-cumulative_daily_sales_per_pyeong = cumulative_sales_per_pyeong / cumulative_days
-
-print(f"매장 수: {len(cumulative_stores)}")
-print(f"총 매출: {cumulative_total_sales:,.0f} HKD = {cumulative_total_sales/1000:,.1f} K HKD")
-print(f"일평당매출: {cumulative_daily_sales_per_pyeong:,.0f} HKD/평/일")
-
-# === 전년 누적 (2024) 계산 ===
-print("\n=== 전년 누적 (2401~2412) 평당매출 계산 (가중평균) ===")
-
-prev_monthly_area_sums = []
-for month in range(1, 13):
-    month_key = f'{month:02d}'
-    month_area_sum = 0
-    
-    for code, area_info in store_areas.items():
-        if code == 'M03' or area_info['channel'] == 'Online':
-            continue
-        
-        store = store_summary.get(code, {})
-        prev_cumulative_sales = store.get('previous', {}).get('net_sales', 0)
-        
-        if prev_cumulative_sales >= 1000:
-            area = area_info['monthly_area_2024'].get(month_key, 0)
-            if pd.notna(area) and area > 0:
-                month_area_sum += area
-    
-    prev_monthly_area_sums.append(month_area_sum)
-    print(f"  {month:02d}월 면적: {month_area_sum:.0f}평")
-
-prev_weighted_avg_area = sum(prev_monthly_area_sums) / 12
-print(f"가중평균 면적: {prev_weighted_avg_area:.1f}평")
-
-prev_cumulative_total_sales = 0
-prev_cumulative_stores = []
-
-for code, area_info in store_areas.items():
-    if code == 'M03' or area_info['channel'] == 'Online':
-        continue
-    
-    store = store_summary.get(code, {})
-    sales = store.get('previous', {}).get('net_sales', 0)
-    
-    if sales >= 1000:
-        prev_cumulative_total_sales += sales
-        prev_cumulative_stores.append({'code': code, 'sales': sales})
-
-prev_cumulative_sales_per_pyeong = prev_cumulative_total_sales / prev_weighted_avg_area if prev_weighted_avg_area > 0 else 0
-prev_cumulative_daily_sales_per_pyeong = prev_cumulative_sales_per_pyeong / cumulative_days
-
-print(f"매장 수: {len(prev_cumulative_stores)}")
-print(f"총 매출: {prev_cumulative_total_sales:,.0f} HKD = {prev_cumulative_total_sales/1000:,.1f} K HKD")
-print(f"일평당매출: {prev_cumulative_daily_sales_per_pyeong:,.0f} HKD/평/일")
-
-cumulative_yoy = (cumulative_daily_sales_per_pyeong / prev_cumulative_daily_sales_per_pyeong * 100) if prev_cumulative_daily_sales_per_pyeong > 0 else 0
-print(f"YOY: {cumulative_yoy:.1f}%")
-
-# === 채널별 평당매출 계산 ===
-print("\n=== 채널별 평당매출 계산 ===")
-
-# 채널 매핑
-channel_mapping = {
-    'HK_Retail': ('HK', '정상'),
-    'HK_Outlet': ('HK', '아울렛'),
-    'MC_Retail': ('MC', '정상'),
-    'MC_Outlet': ('MC', '아울렛')
+from store_area_index import load_region_area_index, to_short_period
+
+EXCLUDED_STORES = ['M03']
+MIN_YTD_SALES = 1000  # 누적 매출 1K HKD(= 1,000 HKD) 이상 매장만 누적 면적에 포함
+PL_VALUE_UNIT = 1000  # PL CSV VALUE는 1K HKD 단위 (HK / TW 모두 환율 적용 후 1000으로 나눈 값)
+
+# 지역별 설정: 면적 인덱스, PL CSV 후보, 국가, 채널 키
+REGIONS = {
+    'hongkong': {
+        'area_region': 'HKMC',
+        'countries': ['HK', 'MC'],
+        'total_segment': 'HKMC',
+        'pl_paths': [
+            '../Dashboard_Raw_Data/HKMC/{period}/HKMC_PL_{period}.csv',
+            '../Dashboard_Raw_Data/HKMC/{period}/HKMC PL {period}.csv',
+        ],
+        'pl_glob': '../Dashboard_Raw_Data/HKMC/{period}/*PL*.csv',
+        'channels': ['HK_Retail', 'HK_Outlet', 'MC_Retail', 'MC_Outlet'],
+    },
+    'taiwan': {
+        'area_region': 'TW',
+        'countries': ['TW'],
+        'total_segment': 'TW',
+        'pl_paths': [
+            '../Dashboard_Raw_Data/TW/{period}/TWPL_{period}.csv',
+            '../Dashboard_Raw_Data/TW/{period}/TW_PL_{period}.csv',
+        ],
+        'pl_glob': '../Dashboard_Raw_Data/TW/{period}/*PL*.csv',
+        'channels': ['TW_Retail', 'TW_Outlet'],
+    },
 }
 
-channels_data = {}
-
-for channel_key, (country, channel_type) in channel_mapping.items():
-    print(f"\n--- {country} {channel_type} ---")
-    
-    # 당월
-    monthly_channel_sales = 0
-    monthly_channel_area = 0
-    
-    for code, area_info in store_areas.items():
-        if area_info['country'] != country or area_info['channel'] != channel_type:
-            continue
-        if code == 'M03':
-            continue
-            
-        store = monthly_summary.get(code, {})
-        sales = store.get('current', {}).get('net_sales', 0)
-        area = area_info['area_2512']
-        
-        if pd.notna(area) and area > 0:
-            monthly_channel_sales += sales
-            monthly_channel_area += area
-    
-    monthly_channel_daily = (monthly_channel_sales / monthly_channel_area / monthly_days) if monthly_channel_area > 0 else 0
-    
-    # 전년 당월
-    prev_monthly_channel_sales = 0
-    prev_monthly_channel_area = 0
-    
-    for code, area_info in store_areas.items():
-        if area_info['country'] != country or area_info['channel'] != channel_type:
-            continue
-        if code == 'M03':
-            continue
-            
-        store = monthly_summary.get(code, {})
-        sales = store.get('previous', {}).get('net_sales', 0)
-        area = area_info['area_2412']
-        
-        if pd.notna(area) and area > 0:
-            prev_monthly_channel_sales += sales
-            prev_monthly_channel_area += area
-    
-    prev_monthly_channel_daily = (prev_monthly_channel_sales / prev_monthly_channel_area / monthly_days) if prev_monthly_channel_area > 0 else 0
-    monthly_channel_yoy = (monthly_channel_daily / prev_monthly_channel_daily * 100) if prev_monthly_channel_daily > 0 else 0
-    
-    print(f"당월: {monthly_channel_daily:,.0f} HKD/평/일 (면적: {monthly_channel_area}평)")
-    print(f"전년: {prev_monthly_channel_daily:,.0f} HKD/평/일 (YOY: {monthly_channel_yoy:.1f}%)")
-    
-    # 누적 - 가중평균
-    cumulative_channel_monthly_areas = []
-    for month in range(1, 13):
-        month_key = f'{month:02d}'
-        month_area = 0
-        
-        for code, area_info in store_areas.items():
-            if area_info['country'] != country or area_info['channel'] != channel_type:
-                continue
-            if code == 'M03':
-                continue
-                
-            store = store_summary.get(code, {})
-            cumulative_sales = store.get('current', {}).get('net_sales', 0)
-            
-            if cumulative_sales >= 1000:
-                area = area_info['monthly_area_2025'].get(month_key, 0)
-                if pd.notna(area) and area > 0:
-                    month_area += area
-        
-        cumulative_channel_monthly_areas.append(month_area)
-    
-    cumulative_channel_avg_area = sum(cumulative_channel_monthly_areas) / 12
-    
-    cumulative_channel_sales = 0
-    for code, area_info in store_areas.items():
-        if area_info['country'] != country or area_info['channel'] != channel_type:
-            continue
-        if code == 'M03':
-            continue
-            
-        store = store_summary.get(code, {})
-        sales = store.get('current', {}).get('net_sales', 0)
-        
-        if sales >= 1000:
-            cumulative_channel_sales += sales
-    
-    cumulative_channel_daily = (cumulative_channel_sales / cumulative_channel_avg_area / cumulative_days) if cumulative_channel_avg_area > 0 else 0
-    
-    # 전년 누적
-    prev_cumulative_channel_monthly_areas = []
-    for month in range(1, 13):
-        month_key = f'{month:02d}'
-        month_area = 0
-        
-        for code, area_info in store_areas.items():
-            if area_info['country'] != country or area_info['channel'] != channel_type:
-                continue
-            if code == 'M03':
-                continue
-                
-            store = store_summary.get(code, {})
-            prev_cumulative_sales = store.get('previous', {}).get('net_sales', 0)
-            
-            if prev_cumulative_sales >= 1000:
-                area = area_info['monthly_area_2024'].get(month_key, 0)
-                if pd.notna(area) and area > 0:
-                    month_area += area
-        
-        prev_cumulative_channel_monthly_areas.append(month_area)
-    
-    prev_cumulative_channel_avg_area = sum(prev_cumulative_channel_monthly_areas) / 12
-    
-    prev_cumulative_channel_sales = 0
-    for code, area_info in store_areas.items():
-        if area_info['country'] != country or area_info['channel'] != channel_type:
-            continue
-        if code == 'M03':
-            continue
-            
-        store = store_summary.get(code, {})
-        sales = store.get('previous', {}).get('net_sales', 0)
-        
-        if sales >= 1000:
-            prev_cumulative_channel_sales += sales
-    
-    prev_cumulative_channel_daily = (prev_cumulative_channel_sales / prev_cumulative_channel_avg_area / cumulative_days) if prev_cumulative_channel_avg_area > 0 else 0
-    cumulative_channel_yoy = (cumulative_channel_daily / prev_cumulative_channel_daily * 100) if prev_cumulative_channel_daily > 0 else 0
-    
-    print(f"누적: {cumulative_channel_daily:,.0f} HKD/평/일 (가중평균 면적: {cumulative_channel_avg_area:.1f}평)")
-    print(f"전년: {prev_cumulative_channel_daily:,.0f} HKD/평/일 (YOY: {cumulative_channel_yoy:.1f}%)")
-    
-    channels_data[channel_key] = {
+
+def find_pl_csv(config, period):
+    """PL CSV 경로 탐색 (없으면 None)"""
+    for path in config['pl_paths']:
+        path = path.format(period=period)
+        if os.path.exists(path):
+            return path
+    matches = glob.glob(config['pl_glob'].format(period=period))
+    return matches[0] if matches else None
+
+
+def load_net_sales_matrix(pl_csv, countries, brand='M'):
+    """PL CSV 실매출액 → 매장 × Period(YYMM) 피벗 (HKD)"""
+    df = pd.read_csv(pl_csv, encoding='utf-8-sig', dtype=str,
+                     usecols=['PERIOD', 'CNTRY_CD', 'SHOP_CD', 'BRD_CD', 'ACCOUNT_NM', 'VALUE'])
+    df = df[(df['BRD_CD'] == brand) & df['CNTRY_CD'].isin(countries)
+            & (df['ACCOUNT_NM'].str.strip() == '실매출액')]
+    values = pd.to_numeric(df['VALUE'].str.replace(',', '').str.strip(), errors='coerce').fillna(0) * PL_VALUE_UNIT
+    df = df.assign(VALUE=values, PERIOD=df['PERIOD'].map(to_short_period))
+    return df.pivot_table(index='SHOP_CD', columns='PERIOD', values='VALUE', aggfunc='sum', fill_value=0)
+
+
+def days_in_month(period):
+    year, month = divmod(period, 100)
+    return calendar.monthrange(2000 + year, month)[1]
+
+
+def days_to_date(period):
+    """1월 1일 ~ 해당 월 말일 일수"""
+    year, month = divmod(period, 100)
+    return sum(calendar.monthrange(2000 + year, m)[1] for m in range(1, month + 1))
+
+
+def _daily(sales, area, days):
+    return (sales / area / days).where(area > 0, 0.0)
+
+
+class SalesPerPyeong:
+    """
+    매장 × 월 면적/매출 행렬로 전 기간 · 전 세그먼트 평당매출 계산
+
+    세그먼트: 국가_채널(HK_Retail 등), 국가(HK, MC, TW), 지역 합계(HKMC)
+    """
+
+    def __init__(self, area_index, sales, region_groups, exclude=EXCLUDED_STORES):
+        stores = area_index.stores
+        stores = stores[(stores['channel'] != 'Online') & ~stores.index.isin(exclude)]
+        self.periods = sorted(set(area_index.periods) & set(sales.columns))
+
+        self.area = area_index.area_matrix(self.periods, stores.index)
+        self.sales = sales.reindex(index=stores.index, columns=self.periods, fill_value=0)
+
+        country_to_region = {c: region for region, countries in region_groups.items() for c in countries}
+        self.labels = [
+            stores['country'] + '_' + stores['channel'],
+            stores['country'],
+            stores['country'].map(country_to_region),
+        ]
+
+        years = [p // 100 for p in self.periods]
+        self.months = pd.Series([p % 100 for p in self.periods], index=self.periods)
+        self.days = pd.Series([days_in_month(p) for p in self.periods], index=self.periods)
+        self.ytd_days = pd.Series([days_to_date(p) for p in self.periods], index=self.periods)
+
+        # 당월 영업 매장: 면적 > 0, 매출 > 0
+        self.active = (self.area > 0) & (self.sales > 0)
+        # 누적: 연도별 1월~당월 누적 매출/면적 합
+        self.ytd_sales = self.sales.T.groupby(years).cumsum().T
+        self.ytd_area_sum = self.area.T.groupby(years).cumsum().T
+        self.ytd_active = self.ytd_sales >= MIN_YTD_SALES
+
+        self.metrics = self._compute_metrics()
+
+    def _segment_sum(self, frame):
+        """매장 × Period → 세그먼트 × Period (모든 세그먼트 구분 합계)"""
+        summed = pd.concat([frame.groupby(label).sum() for label in self.labels])
+        # 단일 국가 지역(TW)은 국가/지역 세그먼트가 같으므로 한 번만 유지
+        return summed[~summed.index.duplicated()]
+
+    def _compute_metrics(self):
+        sales = self._segment_sum(self.sales.where(self.active, 0))
+        area = self._segment_sum(self.area.where(self.active, 0))
+        ytd_sales = self._segment_sum(self.ytd_sales.where(self.ytd_active, 0))
+        ytd_area = self._segment_sum(self.ytd_area_sum.where(self.ytd_active, 0)) / self.months
+
+        columns = {
+            'stores': self._segment_sum(self.active.astype(int)),
+            'sales': sales,
+            'area': area,
+            'days': pd.DataFrame([self.days] * len(sales), index=sales.index),
+            'sales_per_pyeong_daily': _daily(sales, area, self.days),
+            'ytd_stores': self._segment_sum(self.ytd_active.astype(int)),
+            'ytd_sales': ytd_sales,
+            'ytd_area': ytd_area,
+            'ytd_days': pd.DataFrame([self.ytd_days] * len(sales), index=sales.index),
+            'ytd_sales_per_pyeong_daily': _daily(ytd_sales, ytd_area, self.ytd_days),
+        }
+        return pd.concat({name: frame.stack() for name, frame in columns.items()}, axis=1)
+
+    def get(self, segment, period):
+        """세그먼트/Period 지표 (없으면 0)"""
+        key = (segment, to_short_period(period))
+        if key in self.metrics.index:
+            return self.metrics.loc[key]
+        return pd.Series(0, index=self.metrics.columns)
+
+    def ytd_monthly_areas(self, segment, period):
+        """누적 대상 매장(당월 기준)의 1월~당월 월별 면적 합계"""
+        period = to_short_period(period)
+        if period not in self.periods:
+            return []
+        months = [p for p in self.periods if p // 100 == period // 100 and p <= period]
+        in_segment = pd.Series(False, index=self.area.index)
+        for label in self.labels:
+            in_segment |= label == segment
+        stores = self.ytd_active[period] & in_segment
+        return self.area.loc[stores, months].sum().tolist()
+
+
+def _yoy(current, previous):
+    return (current / previous * 100) if previous > 0 else 0
+
+
+def build_region_output(engine, config, period):
+    """기존 sales-per-pyeong JSON 형식 (당월/누적/채널) + 전 기간 시계열"""
+    period = to_short_period(period)
+    prev_period = period - 100
+    total = config['total_segment']
+
+    cur, prev = engine.get(total, period), engine.get(total, prev_period)
+    result = {
         "monthly": {
             "current": {
-                "sales_per_pyeong_daily": monthly_channel_daily,
-                "area": monthly_channel_area
+                "stores": int(cur['stores']),
+                "total_sales_hkd": float(cur['sales']),
+                "total_area": float(cur['area']),
+                "sales_per_pyeong_daily": float(cur['sales_per_pyeong_daily']),
+                "days": int(cur['days'])
             },
             "previous": {
-                "sales_per_pyeong_daily": prev_monthly_channel_daily,
-                "area": prev_monthly_channel_area
+                "stores": int(prev['stores']),
+                "total_sales_hkd": float(prev['sales']),
+                "total_area": float(prev['area']),
+                "sales_per_pyeong_daily": float(prev['sales_per_pyeong_daily']),
+                "days": int(prev['days'])
             },
-            "yoy": monthly_channel_yoy
+            "yoy": _yoy(cur['sales_per_pyeong_daily'], prev['sales_per_pyeong_daily'])
         },
         "cumulative": {
             "current": {
-                "sales_per_pyeong_daily": cumulative_channel_daily,
-                "weighted_avg_area": cumulative_channel_avg_area
+                "stores": int(cur['ytd_stores']),
+                "total_sales_hkd": float(cur['ytd_sales']),
+                "weighted_avg_area": float(cur['ytd_area']),
+                "monthly_areas": engine.ytd_monthly_areas(total, period),
+                "sales_per_pyeong_daily": float(cur['ytd_sales_per_pyeong_daily']),
+                "days": int(cur['ytd_days'])
             },
             "previous": {
-                "sales_per_pyeong_daily": prev_cumulative_channel_daily,
-                "weighted_avg_area": prev_cumulative_channel_avg_area
+                "stores": int(prev['ytd_stores']),
+                "total_sales_hkd": float(prev['ytd_sales']),
+                "weighted_avg_area": float(prev['ytd_area']),
+                "monthly_areas": engine.ytd_monthly_areas(total, prev_period),
+                "sales_per_pyeong_daily": float(prev['ytd_sales_per_pyeong_daily']),
+                "days": int(prev['ytd_days'])
             },
-            "yoy": cumulative_channel_yoy
-        }
+            "yoy": _yoy(cur['ytd_sales_per_pyeong_daily'], prev['ytd_sales_per_pyeong_daily'])
+        },
+        "channels": {},
+        "series": {}
     }
 
-# JSON으로 저장
-result = {
-    "monthly": {
-        "current": {
-            "stores": len(monthly_stores),
-            "total_sales_hkd": monthly_total_sales,
-            "total_area": monthly_total_area,
-            "sales_per_pyeong_daily": monthly_daily_sales_per_pyeong,
-            "days": monthly_days
-        },
-        "previous": {
-            "stores": len(prev_monthly_stores),
-            "total_sales_hkd": prev_monthly_total_sales,
-            "total_area": prev_monthly_total_area,
-            "sales_per_pyeong_daily": prev_monthly_daily_sales_per_pyeong,
-            "days": monthly_days
-        },
-        "yoy": monthly_yoy
-    },
-    "cumulative": {
-        "current": {
-            "stores": len(cumulative_stores),
-            "total_sales_hkd": cumulative_total_sales,
-            "weighted_avg_area": weighted_avg_area,
-            "monthly_areas": monthly_area_sums,
-            "sales_per_pyeong_daily": cumulative_daily_sales_per_pyeong,
-            "days": cumulative_days
-        },
-        "previous": {
-            "stores": len(prev_cumulative_stores),
-            "total_sales_hkd": prev_cumulative_total_sales,
-            "weighted_avg_area": prev_weighted_avg_area,
-            "monthly_areas": prev_monthly_area_sums,
-            "sales_per_pyeong_daily": prev_cumulative_daily_sales_per_pyeong,
-            "days": cumulative_days
-        },
-        "yoy": cumulative_yoy
-    },
-    "channels": channels_data
-}
+    for channel_key in config['channels']:
+        ch_cur, ch_prev = engine.get(channel_key, period), engine.get(channel_key, prev_period)
+        result["channels"][channel_key] = {
+            "monthly": {
+                "current": {
+                    "sales_per_pyeong_daily": float(ch_cur['sales_per_pyeong_daily']),
+                    "area": float(ch_cur['area'])
+                },
+                "previous": {
+                    "sales_per_pyeong_daily": float(ch_prev['sales_per_pyeong_daily']),
+                    "area": float(ch_prev['area'])
+                },
+                "yoy": _yoy(ch_cur['sales_per_pyeong_daily'], ch_prev['sales_per_pyeong_daily'])
+            },
+            "cumulative": {
+                "current": {
+                    "sales_per_pyeong_daily": float(ch_cur['ytd_sales_per_pyeong_daily']),
+                    "weighted_avg_area": float(ch_cur['ytd_area'])
+                },
+                "previous": {
+                    "sales_per_pyeong_daily": float(ch_prev['ytd_sales_per_pyeong_daily']),
+                    "weighted_avg_area": float(ch_prev['ytd_area'])
+                },
+                "yoy": _yoy(ch_cur['ytd_sales_per_pyeong_daily'], ch_prev['ytd_sales_per_pyeong_daily'])
+            }
+        }
+
+    # 전 기간 시계열 (기준 Period까지)
+    periods = [p for p in engine.periods if p <= period]
+    for segment in [total] + config['countries'] + config['channels']:
+        result["series"][segment] = [
+            {
+                "period": str(p),
+                "sales_per_pyeong_daily": float(engine.get(segment, p)['sales_per_pyeong_daily']),
+                "area": float(engine.get(segment, p)['area']),
+                "cumulative_sales_per_pyeong_daily": float(engine.get(segment, p)['ytd_sales_per_pyeong_daily']),
+                "weighted_avg_area": float(engine.get(segment, p)['ytd_area'])
+            }
+            for p in periods
+        ]
+    return result
+
+
+def print_summary(region, output, period):
+    print(f"\n=== {region} {period} 평당매출 ===")
+    for key, label in [('monthly', '당월'), ('cumulative', '누적')]:
+        block = output[key]
+        area_key = 'total_area' if key == 'monthly' else 'weighted_avg_area'
+        print(f"{label}: {block['current']['sales_per_pyeong_daily']:,.0f} HKD/평/일 "
+              f"(매장 {block['current']['stores']}개, 면적 {block['current'][area_key]:,.1f}평, "
+              f"{block['current']['days']}일) / 전년 {block['previous']['sales_per_pyeong_daily']:,.0f} "
+              f"(YOY {block['yoy']:.1f}%)")
+    for channel_key, data in output['channels'].items():
+        print(f"  {channel_key}: 당월 {data['monthly']['current']['sales_per_pyeong_daily']:,.0f} "
+              f"(YOY {data['monthly']['yoy']:.1f}%), 누적 {data['cumulative']['current']['sales_per_pyeong_daily']:,.0f} "
+              f"(YOY {data['cumulative']['yoy']:.1f}%)")
+
+
+def main(period='2512'):
+    from dashboard_writer import ArtifactWriter
+
+    period = str(to_short_period(period))
+
+    print("=" * 80)
+    print(f"평당매출 계산: {period}")
+    print("=" * 80)
+
+    # 지역별 면적/매출 로드 → 하나의 인덱스/매출 행렬로 합쳐 1회 계산
+    area_index, sales_frames, regions = None, [], []
+    for region, config in REGIONS.items():
+        pl_csv = find_pl_csv(config, period)
+        if not pl_csv:
+            print(f"[{region}] PL CSV 없음, 건너뜀")
+            continue
+        index = load_region_area_index(config['area_region'], period)
+        print(f"[{region}] 면적: {len(index.stores)}개 매장, {index.periods[0]}~{index.periods[-1]} / PL: {pl_csv}")
+        area_index = index if area_index is None else area_index.combine(index)
+        sales_frames.append(load_net_sales_matrix(pl_csv, config['countries']))
+        regions.append(region)
+
+    if area_index is None:
+        print("ERROR 계산할 지역이 없습니다.")
+        return
+
+    sales = pd.concat(sales_frames).fillna(0)
+    engine = SalesPerPyeong(area_index, sales, {REGIONS[r]['total_segment']: REGIONS[r]['countries'] for r in regions})
+
+    with ArtifactWriter() as writer:
+        for region in regions:
+            output = build_region_output(engine, REGIONS[region], period)
+            print_summary(region, output, period)
+            writer.write(f'public/dashboard/{region}-sales-per-pyeong-{period}.json', output)
+
 
-output_file = 'public/dashboard/hongkong-sales-per-pyeong-2512.json'
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(result, f, ensure_ascii=False, indent=2)
+if __name__ == '__main__':
+    import sys
+    import io
 
-print(f"\n저장 완료: {output_file}")
+    # Windows 콘솔 인코딩 문제 해결
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+    main(sys.argv[1] if len(sys.argv) > 1 else '2512')
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+채널 누적 엔진 (매장 → 채널 코드 배열 + 채널 × 지표 × Period 누적합)
+
+- 채널 매핑은 PL 테이블 키(매장)마다 1회 → 채널 코드 배열 (-1: 채널 없음)
+  · store_channel: 매장 코드 패턴 (get_store_channel — TU / D숫자 → Outlet, TE / DE → Online, 나머지 Retail)
+    대만 매장 코드 판별(is_mlb_* / is_discovery_*)은 여기서만 정의 — 대만 스크립트는 import
+    (누적 / 대시보드 스크립트의 get_channel_from_store_code는 D숫자를 Retail로 두므로 별도,
+     홍콩 OUTLET_CODES 등 매장 코드 목록 분류는 각 홍콩 스크립트에 그대로)
+  · hkmc_channel: CNTRY_CD + CHNL_CD (A·정규점 / F·아웃렛 / O) → HK_Retail / HK_Outlet / HK_Online / MC_Retail / MC_Outlet
+- 채널 × 지표(계정 트리, opex_engine 형식) × Period 합계를 한 번만 집계하고 Period 축 누적합 보관
+  (stock_weeks.PeriodPrefixSums) → 당월 / YTD / 최근 N개월 채널 합계는 채널 수만큼의 누적합 차이
+  (월 · 채널마다 PL 재로드 / 행 재필터 없음)
+- 대시보드 JSON의 monthly_channel_data(월별 채널 실판매출)도 같은 구조로 적재 (from_monthly)
+
+사용 예:
+    from channel_sums import CHANNEL_SALES_TREE, ChannelSums, hkmc_channel
+    from pl_table import load_pl_table
+
+    channels = ChannelSums.from_table(load_pl_table('HKMC_PL_2512.csv'), hkmc_channel, CHANNEL_SALES_TREE, brand='M')
+    channels.totals('net_sales', '202512')                # 당월 {채널: 실판매출}
+    channels.window('202501', '202512')                   # 누적 {채널: {지표: 합계}}
+    channels.rolling('net_sales', '202512', 3)            # 최근 3개월 (달력 기준)
+"""
+import re
+
+import numpy as np
+
+from opex_engine import classify_account
+from pl_table import KEY_INDEX
+from stock_weeks import PeriodPrefixSums
+
+HKMC_CHANNEL_KEYS = ['HK_Retail', 'HK_Outlet', 'HK_Online', 'MC_Retail', 'MC_Outlet']
+STORE_CHANNEL_KEYS = ['Retail', 'Outlet', 'Online']
+
+# PL CHNL_CD → 채널 (코드 / 한글 표기 모두)
+CHANNEL_CODES = {'A': 'Retail', '정규점': 'Retail', 'F': 'Outlet', '아웃렛': 'Outlet', 'O': 'Online'}
+# PL CNTRY_CD → 국가 (마카오는 MO / MC 모두 MC)
+COUNTRY_CODES = {'HK': 'HK', 'MO': 'MC', 'MC': 'MC'}
+
+# 채널 매출 지표: 계정명
+CHANNEL_SALES_TREE = [
+    ('net_sales', [('net_sales', [], ['실판매출', '실매출액'])]),
+    ('tag_sales', [('tag_sales', [], ['Tag매출액'])]),
+]
+
+
+# Store Code 분류 (대만)
+def is_mlb_retail(store_code):
+    """MLB 리테일 (T로 시작하는 숫자)"""
+    return bool(re.match(r'^T\d+$', store_code))
+
+
+def is_mlb_online(store_code):
+    """MLB 온라인 (TE로 시작)"""
+    return store_code.startswith('TE')
+
+
+def is_mlb_outlet(store_code):
+    """MLB 아울렛 (TU로 시작)"""
+    return store_code.startswith('TU')
+
+
+def is_discovery_retail(store_code):
+    """Discovery 리테일 (D로 시작하는 숫자)"""
+    return bool(re.match(r'^D\d+$', store_code))
+
+
+def is_discovery_online(store_code):
+    """Discovery 온라인 (DE로 시작)"""
+    return store_code.startswith('DE')
+
+
+def get_store_channel(store_code):
+    """Store Code를 기반으로 채널 반환"""
+    if is_mlb_outlet(store_code) or is_discovery_retail(store_code):  # 아울렛은 없을 수도 있음
+        return 'Outlet'
+    elif is_mlb_online(store_code) or is_discovery_online(store_code):
+        return 'Online'
+    else:
+        return 'Retail'
+
+
+def store_channel(key):
+    """PL 테이블 키 → 매장 코드 기준 채널"""
+    return get_store_channel(key[KEY_INDEX['shop']])
+
+
+def hkmc_channel(key):
+    """PL 테이블 키 → HKMC 국가-채널 (HKMC_CHANNEL_KEYS 외는 None)"""
+    country = COUNTRY_CODES.get(key[KEY_INDEX['country']])
+    channel = CHANNEL_CODES.get(key[KEY_INDEX['channel_code']])
+    if country is None or channel is None:
+        return None
+    country_channel = f"{country}_{channel}"
+    return country_channel if country_channel in HKMC_CHANNEL_KEYS else None
+
+
+def channel_codes(keys, channel_of, channels):
+    """키 목록 → 채널 위치 배열 (channels 순서, 채널 없음 / 목록 외는 -1)"""
+    index = {channel: i for i, channel in enumerate(channels)}
+    return np.array([index.get(channel_of(key), -1) for key in keys], dtype=np.int64)
+
+
+class ChannelSums:
+    """채널 × 지표 × Period 합계와 Period 축 누적합"""
+
+    def __init__(self, channels, cells, periods=None):
+        """
+        Args:
+            channels: 채널 목록 (결과 순서, 데이터가 없는 채널은 0)
+            cells: {지표: {(채널, Period): 합계}}
+            periods: Period 축 (stock_weeks.PeriodPrefixSums 참고)
+        """
+        self.channels = list(channels)
+        self.sums = {measure: PeriodPrefixSums(measure_cells, periods) for measure, measure_cells in cells.items()}
+        self.measures = list(self.sums)
+
+    @classmethod
+    def from_table(cls, table, channel_of, tree, channels=HKMC_CHANNEL_KEYS, **filters):
+        """
+        PL 테이블 → 채널 × 지표 누적합 (키마다 채널 / 지표 1회 분류 후 np.add.at 1회 집계)
+
+        Args:
+            table: pl_table.PLTable
+            channel_of: 키 → 채널 (hkmc_channel / store_channel)
+            tree: 지표 계정 트리 — 카테고리가 지표 (트리 순서 첫 매칭)
+            channels: 채널 목록
+            filters: PLTable.mask 필터 (brand / country / shops / office ...)
+        """
+        keys = table.values.keys
+        channel = channel_codes(keys, channel_of, channels)
+        code, name = KEY_INDEX['account_code'], KEY_INDEX['account']
+        leaf = np.array([classify_account(tree, key[code], key[name]) for key in keys], dtype=np.int64)
+        measure_of_leaf = np.array([m for m, (_, leaves) in enumerate(tree) for _ in leaves], dtype=np.int64)
+        mask = table.mask(**filters) & (channel >= 0) & (leaf >= 0)
+
+        periods = table.periods
+        matrix = np.zeros((len(channels), len(tree), len(periods)))
+        np.add.at(matrix, (channel[mask], measure_of_leaf[leaf[mask]]), table.values.matrix[mask])
+        cells = {
+            measure: {(ch, period): float(matrix[c, m, j])
+                      for c, ch in enumerate(channels) for j, period in enumerate(periods)}
+            for m, (measure, _) in enumerate(tree)
+        }
+        return cls(channels, cells, periods)
+
+    @classmethod
+    def from_monthly(cls, monthly, channels=HKMC_CHANNEL_KEYS, measure='net_sales'):
+        """대시보드 monthly_channel_data ([{'period': YYMM, 채널: 값, ...}, ...]) → 채널 누적합"""
+        cells = {}
+        for entry in monthly:
+            period = str(entry['period'])
+            for channel in channels:
+                cell = (channel, period)
+                cells[cell] = cells.get(cell, 0.0) + float(entry.get(channel, 0) or 0)
+        return cls(channels, {measure: cells})
+
+    def totals(self, measure, start=None, end=None):
+        """{채널: start ~ end(양끝 포함, end 생략 시 start 당월, start 생략 시 전체 Period) 합계}"""
+        sums = self.sums[measure]
+        if start is None:
+            lo, hi = 0, len(sums.periods)
+        else:
+            lo, hi = sums.positions(start, start if end is None else end)
+        by_key = dict(zip(sums.keys, sums.key_totals(lo, hi).tolist()))
+        return {channel: by_key.get(channel, 0.0) for channel in self.channels}
+
+    def window(self, start=None, end=None):
+        """{채널: {지표: 합계}} — totals와 같은 구간"""
+        by_measure = {measure: self.totals(measure, start, end) for measure in self.measures}
+        return {channel: {measure: by_measure[measure][channel] for measure in self.measures}
+                for channel in self.channels}
+
+    def ytd(self, measure, period):
+        """{채널: 당해 1월 ~ period 누적}"""
+        period = str(period)
+        return self.totals(measure, period[:-2] + '01', period)
+
+    def rolling(self, measure, period, months):
+        """{채널: 달력 기준 period 포함 최근 months개월 합계}"""
+        sums = self.sums[measure]
+        return {channel: sums.calendar_sum(channel, period, months) for channel in self.channels}
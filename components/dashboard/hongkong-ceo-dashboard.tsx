@@ -4,6 +4,8 @@ import React, { useState, useEffect, useMemo } from 'react';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, LineChart, Line, ComposedChart, Legend, LabelList, ReferenceLine, Cell, Layer } from 'recharts';
 import { TrendingDown, TrendingUp, ChevronDown, ChevronRight } from 'lucide-react';
 import storeAreasData from './hongkong-store-areas.json';
+import { fetchDashboardJson } from '@/lib/dashboard-manifest';
+import { fetchDashboardData } from '@/lib/dashboard-bundle';
 
 interface HongKongCEODashboardProps {
   period?: string;
@@ -53,59 +55,27 @@ const HongKongCEODashboard: React.FC<HongKongCEODashboardProps> = ({ period = '2
         setIsLoading(true);
         console.log('[HK Dashboard] Loading data for period:', period);
         
-        // 캐시 무효화를 위한 타임스탬프 추가
-        const cacheBuster = `?_=${Date.now()}`;
-        
-        // Dashboard 데이터 로드
-        const dashboardResponse = await fetch(`/dashboard/hongkong-dashboard-data-${period}.json${cacheBuster}`, {
-          cache: 'no-store',
-          headers: {
-            'Cache-Control': 'no-cache, no-store, must-revalidate',
-            'Pragma': 'no-cache',
-            'Expires': '0'
-          }
-        });
-        if (!dashboardResponse.ok) {
+        // Dashboard 데이터 로드 (매니페스트의 콘텐츠 해시 URL 사용 - 내용이 바뀌면 URL도 바뀜)
+        const prevYear = String(parseInt(period) - 100); // 2512 -> 2412
+        const [dashData, prevYearData, cumulativeData] = await Promise.all([
+          fetchDashboardData('hongkong', period),
+          // 전년도 Dashboard 데이터 (채널별 누적 YOY 계산용) - 같은 번들에 있으면 추가 요청 없음
+          fetchDashboardData('hongkong', prevYear),
+          fetchDashboardJson('hongkong', 'dashboard-cumulative', period),
+        ]);
+        if (!dashData) {
           throw new Error(`Failed to load dashboard data for period ${period}`);
         }
-        const dashData = await dashboardResponse.json();
         setDashboardData(dashData);
         
-        // 전년도 Dashboard 데이터 로드 (채널별 누적 YOY 계산용)
-        const prevYear = String(parseInt(period) - 100); // 2512 -> 2412
-        try {
-          console.log('[HK Dashboard] Loading prev year data:', prevYear);
-          const prevYearResponse = await fetch(`/dashboard/hongkong-dashboard-data-${prevYear}.json${cacheBuster}`, {
-            cache: 'no-store',
-            headers: {
-              'Cache-Control': 'no-cache, no-store, must-revalidate',
-              'Pragma': 'no-cache',
-              'Expires': '0'
-            }
-          });
-          console.log('[HK Dashboard] Prev year response status:', prevYearResponse.status);
-          if (prevYearResponse.ok) {
-            const prevYearData = await prevYearResponse.json();
-            console.log('[HK Dashboard] Prev year data loaded, monthly periods:', prevYearData?.monthly_channel_data?.length);
-            setPrevYearDashboardData(prevYearData);
-          } else {
-            console.error('[HK Dashboard] Failed to load prev year data, status:', prevYearResponse.status);
-          }
-        } catch (e) {
-          console.error('[HK Dashboard] Error loading prev year data:', e);
+        if (prevYearData) {
+          console.log('[HK Dashboard] Prev year data loaded, monthly periods:', prevYearData?.monthly_channel_data?.length);
+          setPrevYearDashboardData(prevYearData);
+        } else {
+          console.log('[HK Dashboard] Prev year data not available:', prevYear);
         }
         
-        // Cumulative Dashboard 데이터 로드
-        const cumulativeResponse = await fetch(`/dashboard/hongkong-dashboard-cumulative-${period}.json${cacheBuster}`, {
-          cache: 'no-store',
-          headers: {
-            'Cache-Control': 'no-cache, no-store, must-revalidate',
-            'Pragma': 'no-cache',
-            'Expires': '0'
-          }
-        });
-        if (cumulativeResponse.ok) {
-          const cumulativeData = await cumulativeResponse.json();
+        if (cumulativeData) {
           setCumulativeDashboardData(cumulativeData);
         }
         
@@ -213,9 +183,8 @@ const HongKongCEODashboard: React.FC<HongKongCEODashboardProps> = ({ period = '2
         }
         
         // CEO 인사이트 데이터 로드 (period별)
-        const ceoInsightsResponse = await fetch(`/dashboard/hongkong-ceo-insights-${period}.json?_=${Date.now()}`);
-        if (ceoInsightsResponse.ok) {
-          const ceoInsightsResult = await ceoInsightsResponse.json();
+        const ceoInsightsResult = await fetchDashboardJson('hongkong', 'ceo-insights', period);
+        if (ceoInsightsResult) {
           setCeoInsightsData(ceoInsightsResult);
         }
         
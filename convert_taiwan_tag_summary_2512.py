@@ -8,6 +8,9 @@ import json
 from datetime import datetime
 import os
 
+from dashboard_manifest import update_manifest
+from kpi_table import record_kpis, tag_summary_kpis
+
 print("=" * 80)
 print("2512 대만 TAG Summary 데이터 변환")
 print("=" * 80)
@@ -99,6 +102,12 @@ os.makedirs(os.path.dirname(output_file), exist_ok=True)
 with open(output_file, 'w', encoding='utf-8') as f:
     json.dump(result, f, ensure_ascii=False, indent=2)
 
+# 매니페스트 갱신 (콘텐츠 해시 URL)
+update_manifest([output_file])
+
+# KPI 테이블 갱신 (CEO 인사이트 입력)
+record_kpis('taiwan', '2512', tag_summary_kpis(result, '2512'))
+
 print(f"\n[OK] TAG Summary 데이터 변환 완료")
 print(f"  - 출력 파일: {output_file}")
 print(f"  - TAG 수: {len(result['tag_detail'])}")
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+CSV 데이터 검증 엔진 (선언형 규칙)
+
+- 소스별(홍콩 재고수불, 대만 재고수불, PL Database) 규칙을 SOURCES에 선언
+- 파일은 규칙에 필요한 컬럼만 명시적 dtype으로 1회 로드
+- 청크 단위 누적(ValidationStats.update): Period별 행 수 / NULL 수 / 0 수 / 합계를
+  한 번의 groupby로 누적하고, 키 중복은 행 해시로 누적
+- 모든 규칙은 누적 통계에서 평가 → 같은 통계로 여러 규칙을 재스캔 없이 판정
+- 결과는 JSON 리포트로 저장 가능 (write_report)
+
+규칙 종류:
+    required_columns  필수 컬럼 존재
+    row_count         대상 Period 행 수 하한
+    null_ratio        컬럼별 NULL 비율(%) 상한
+    zero_ratio        컬럼별 0 비율(%) 상한 (max 없으면 보고만)
+    sum_min           대상 Period 합계 하한
+    change_band       전월(mom)/전년(yoy) 대비 합계 비율(%) 범위
+    unique_key        키 컬럼 조합 중복 없음
+    distribution      컬럼 값별 행 수 (보고용)
+
+severity: 'error'는 검증 실패, 'warning'은 경고만
+"""
+import glob
+import json
+import os
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+RAW_DATA_DIR = '../Dashboard_Raw_Data'
+
+INVENTORY_DTYPES = {
+    'Period': 'float64',
+    'Brand': 'category',
+    'Store_Code': 'category',
+    'Season_Code': 'category',
+    'Category': 'category',
+    'Subcategory_Code': 'category',
+    'Country': 'category',
+    'Channel': 'category',
+    'Net_Sales': 'float64',
+    'Gross_Sales': 'float64',
+    'Stock_Price': 'float64',
+    'Stock_Cost': 'float64',
+}
+
+PL_DTYPES = {
+    'PERIOD': 'float64',
+    'CNTRY_CD': 'category',
+    'SHOP_CD': 'category',
+    'BRD_CD': 'category',
+    'ACCOUNT_CD': 'category',
+    'ACCOUNT_NM': 'category',
+    'VALUE': 'str',
+}
+
+SOURCES = {
+    'hongkong': {
+        'label': '홍콩',
+        'paths': [
+            '{raw}/HKMC/{period}/HKMC_Inventory_{period}.csv',
+            '{raw}/홍콩재고수불_{period}.csv',
+            '{raw}/24012{period} 홍콩재고수불.csv',
+        ],
+        'globs': [],
+        'period_column': 'Period',
+        'period_format': 'short',
+        'currency': 'HKD',
+        'dtypes': INVENTORY_DTYPES,
+        'rules': [
+            {'type': 'required_columns', 'columns': ['Period', 'Net_Sales', 'Gross_Sales', 'Stock_Price', 'Stock_Cost']},
+            {'type': 'row_count', 'min': 1},
+            {'type': 'null_ratio', 'columns': ['Net_Sales', 'Gross_Sales', 'Stock_Price', 'Stock_Cost'], 'max': 50},
+            {'type': 'zero_ratio', 'columns': ['Net_Sales', 'Gross_Sales', 'Stock_Price', 'Stock_Cost']},
+            {'type': 'sum_min', 'column': 'Net_Sales', 'min': 1000000},
+            {'type': 'change_band', 'column': 'Net_Sales', 'compare': 'mom', 'low': 50, 'high': 200, 'severity': 'warning'},
+            {'type': 'change_band', 'column': 'Net_Sales', 'compare': 'yoy', 'low': 50, 'high': 200, 'severity': 'warning'},
+            {'type': 'unique_key', 'columns': ['Brand', 'Store_Code', 'Season_Code', 'Subcategory_Code'], 'severity': 'warning'},
+        ],
+    },
+    'taiwan': {
+        'label': '대만',
+        'paths': [
+            '{raw}/TW/{period}/TW_Inventory_{period}.csv',
+            '{raw}/대만재고수불_{period}.csv',
+        ],
+        'globs': [
+            '{raw}/TW/{period}/TW_Inventory_*.csv',
+            '{raw}/TW/{period}/*Inventory*.csv',
+        ],
+        'period_column': 'Period',
+        'period_format': 'short',
+        'currency': 'TWD',
+        'dtypes': INVENTORY_DTYPES,
+        'rules': [
+            {'type': 'required_columns', 'columns': ['Period', 'Net_Sales']},
+            {'type': 'row_count', 'min': 1},
+            {'type': 'null_ratio', 'columns': ['Net_Sales', 'Gross_Sales', 'Stock_Price'], 'max': 50},
+            {'type': 'zero_ratio', 'columns': ['Net_Sales', 'Gross_Sales', 'Stock_Price']},
+            {'type': 'sum_min', 'column': 'Net_Sales', 'min': 10000000},
+            {'type': 'change_band', 'column': 'Net_Sales', 'compare': 'mom', 'low': 50, 'high': 200, 'severity': 'warning'},
+            {'type': 'change_band', 'column': 'Net_Sales', 'compare': 'yoy', 'low': 50, 'high': 200, 'severity': 'warning'},
+        ],
+    },
+    'pl': {
+        'label': 'PL',
+        'paths': [
+            '{raw}/HKMC/{period}/HKMC_PL_{period}.csv',
+            '{raw}/HKMC/{period}/HKMC PL {period}.csv',
+            '{raw}/hmd_pl_database_{period}.csv',
+            '{raw}/hmd_pl_database.csv',
+        ],
+        'globs': [],
+        'period_column': 'PERIOD',
+        'period_format': 'full',
+        'currency': 'HKD',
+        'dtypes': PL_DTYPES,
+        'numeric_text': ['VALUE'],
+        'rules': [
+            {'type': 'required_columns', 'columns': ['PERIOD', 'CNTRY_CD', 'SHOP_CD', 'ACCOUNT_NM', 'VALUE']},
+            {'type': 'row_count', 'min': 1},
+            {'type': 'null_ratio', 'columns': ['VALUE'], 'max': 50},
+            {'type': 'unique_key', 'columns': ['CNTRY_CD', 'SHOP_CD', 'BRD_CD', 'ACCOUNT_CD'], 'severity': 'warning'},
+            {'type': 'distribution', 'column': 'CNTRY_CD'},
+        ],
+    },
+}
+
+
+def find_source_file(source, period, raw_dir=RAW_DATA_DIR):
+    """소스 CSV 경로 탐색 (없으면 None)"""
+    spec = SOURCES[source]
+    for path in spec['paths']:
+        path = path.format(raw=raw_dir, period=period)
+        if os.path.exists(path):
+            return path
+    for pattern in spec['globs']:
+        matches = sorted(glob.glob(pattern.format(raw=raw_dir, period=period)))
+        if matches:
+            return matches[0]
+    return None
+
+
+def to_source_period(spec, period):
+    """'2511' → 소스 Period 값 (short: 2511, full: 202511)"""
+    period = int(period) % 10000
+    return 200000 + period if spec['period_format'] == 'full' else period
+
+
+def shift_period(period, months):
+    """YYMM/YYYYMM 월 이동 (2501, -1 → 2412)"""
+    year, month = divmod(period, 100)
+    index = year * 12 + (month - 1) + months
+    return (index // 12) * 100 + index % 12 + 1
+
+
+def rule_columns(spec):
+    """규칙 평가에 필요한 컬럼 목록"""
+    columns = {spec['period_column']}
+    for rule in spec['rules']:
+        columns.update(rule.get('columns', []))
+        if 'column' in rule:
+            columns.add(rule['column'])
+    return columns
+
+
+def _numeric_columns(spec):
+    """NULL/0/합계 통계를 누적할 숫자 컬럼"""
+    columns = set()
+    for rule in spec['rules']:
+        if rule['type'] in ('null_ratio', 'zero_ratio'):
+            columns.update(rule['columns'])
+        elif rule['type'] in ('sum_min', 'change_band'):
+            columns.add(rule['column'])
+    return sorted(columns)
+
+
+class ValidationStats:
+    """
+    소스 하나의 검증 통계 누적기
+
+    update(chunk)를 여러 번 호출할 수 있으므로 전체 로드/청크 스트리밍 모두 사용 가능
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.spec = SOURCES[source]
+        self.columns = None
+        self.table = None
+        self.key_hashes = defaultdict(lambda: defaultdict(list))
+        self.distributions = defaultdict(lambda: defaultdict(int))
+
+    def prepare(self, chunk):
+        """숫자 텍스트 컬럼(쉼표 포함) 변환 및 Period 정수화 (문자열로 읽은 청크도 허용)"""
+        for column, dtype in self.spec['dtypes'].items():
+            if dtype == 'float64' and column in chunk.columns and not pd.api.types.is_numeric_dtype(chunk[column]):
+                chunk[column] = pd.to_numeric(chunk[column].replace('', np.nan), errors='coerce')
+        for column in self.spec.get('numeric_text', []):
+            if column in chunk.columns:
+                text = chunk[column].astype(str).str.replace(',', '').str.strip()
+                chunk[column] = pd.to_numeric(text, errors='coerce')
+        period_column = self.spec['period_column']
+        if period_column in chunk.columns:
+            chunk[period_column] = pd.to_numeric(chunk[period_column], errors='coerce').fillna(0).astype('int64')
+        return chunk
+
+    def update(self, chunk):
+        """청크 통계 누적 (Period별 행 수 / NULL / 0 / 합계를 groupby 1회로 계산)"""
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+        period_column = self.spec['period_column']
+        if period_column not in chunk.columns:
+            return
+        periods = chunk[period_column]
+
+        indicators = {'rows': pd.Series(1, index=chunk.index)}
+        for column in _numeric_columns(self.spec):
+            if column not in chunk.columns:
+                continue
+            values = chunk[column]
+            indicators[f'{column}:null'] = values.isna()
+            indicators[f'{column}:zero'] = values.eq(0)
+            indicators[f'{column}:sum'] = values.fillna(0)
+        stats = pd.DataFrame(indicators).groupby(periods).sum()
+        self.table = stats if self.table is None else self.table.add(stats, fill_value=0)
+
+        for rule in self.spec['rules']:
+            if rule['type'] == 'unique_key' and set(rule['columns']) <= set(chunk.columns):
+                hashes = pd.util.hash_pandas_object(chunk[rule['columns']], index=False).to_numpy()
+                for period, index in pd.Series(np.arange(len(chunk))).groupby(periods.to_numpy()).groups.items():
+                    self.key_hashes[tuple(rule['columns'])][period].append(hashes[np.asarray(index)])
+            elif rule['type'] == 'distribution' and rule['column'] in chunk.columns:
+                counts = chunk.groupby([periods, rule['column']], observed=True).size()
+                for (period, value), count in counts.items():
+                    self.distributions[(period, rule['column'])][value] += int(count)
+
+    def period_stat(self, period, name, default=0):
+        if self.table is None or period not in self.table.index or name not in self.table.columns:
+            return default
+        return self.table.at[period, name]
+
+    def periods(self):
+        return [] if self.table is None else sorted(int(p) for p in self.table.index)
+
+    def evaluate(self, period):
+        """대상 Period에 모든 규칙 적용 → 체크 목록"""
+        spec = self.spec
+        period = to_source_period(spec, period)
+        rows = int(self.period_stat(period, 'rows'))
+        checks = []
+
+        def add(rule, status, message, **values):
+            checks.append({'rule': rule['type'], 'status': status, 'message': message, **values})
+
+        def failed(rule):
+            return 'warning' if rule.get('severity') == 'warning' else 'fail'
+
+        for rule in spec['rules']:
+            kind = rule['type']
+            if kind == 'required_columns':
+                missing = [c for c in rule['columns'] if c not in (self.columns or [])]
+                add(rule, failed(rule) if missing else 'pass',
+                    f"필수 컬럼 누락: {missing}" if missing else "필수 컬럼 존재", missing=missing)
+            elif kind == 'row_count':
+                ok = rows >= rule['min']
+                add(rule, 'pass' if ok else failed(rule),
+                    f"데이터 행 수: {rows:,}개" if ok else f"{period} Period 데이터가 없습니다 (존재 Period: {self.periods()})",
+                    value=rows, threshold=rule['min'])
+            elif kind in ('null_ratio', 'zero_ratio'):
+                suffix = 'null' if kind == 'null_ratio' else 'zero'
+                for column in rule['columns']:
+                    if column not in (self.columns or []):
+                        continue
+                    count = int(self.period_stat(period, f'{column}:{suffix}'))
+                    ratio = count / rows * 100 if rows else 0
+                    ok = rule.get('max') is None or ratio < rule['max']
+                    add(rule, 'pass' if ok else failed(rule),
+                        f"{column}: {suffix.upper()} {ratio:.1f}% ({count:,}개)",
+                        column=column, value=round(ratio, 2), count=count, threshold=rule.get('max'))
+            elif kind == 'sum_min':
+                total = float(self.period_stat(period, f"{rule['column']}:sum"))
+                ok = total >= rule['min']
+                add(rule, 'pass' if ok else failed(rule),
+                    f"총 {rule['column']}: {total:,.0f} {spec['currency']}" + ("" if ok else f" (최소 {rule['min']:,} 필요)"),
+                    column=rule['column'], value=round(total, 2), threshold=rule['min'])
+            elif kind == 'change_band':
+                months = -1 if rule['compare'] == 'mom' else -12
+                base_period = shift_period(period, months)
+                label = '전월' if rule['compare'] == 'mom' else '전년'
+                if int(self.period_stat(base_period, 'rows')) == 0:
+                    add(rule, 'skip', f"{label}({base_period}) 데이터 없음", base_period=base_period)
+                    continue
+                total = float(self.period_stat(period, f"{rule['column']}:sum"))
+                base = float(self.period_stat(base_period, f"{rule['column']}:sum"))
+                ratio = total / base * 100 if base > 0 else 0
+                ok = rule['low'] <= ratio <= rule['high']
+                add(rule, 'pass' if ok else failed(rule),
+                    f"{label}({base_period}) 대비 {ratio:.1f}% ({base:,.0f} → {total:,.0f})",
+                    column=rule['column'], base_period=base_period, value=round(ratio, 2),
+                    threshold=[rule['low'], rule['high']])
+            elif kind == 'unique_key':
+                parts = self.key_hashes.get(tuple(rule['columns']), {}).get(period)
+                if parts is None:
+                    continue
+                hashes = np.concatenate(parts)
+                duplicates = int(len(hashes) - len(np.unique(hashes)))
+                add(rule, 'pass' if duplicates == 0 else failed(rule),
+                    f"키 {rule['columns']} 중복 {duplicates:,}건", columns=rule['columns'], value=duplicates)
+            elif kind == 'distribution':
+                counts = self.distributions.get((period, rule['column']), {})
+                counts = {str(k): v for k, v in sorted(counts.items(), key=lambda kv: -kv[1])}
+                add(rule, 'info', f"{rule['column']} 분포: {counts}", column=rule['column'], value=counts)
+        return checks
+
+
+def load_source(source, path, stats=None, chunksize=None):
+    """
+    규칙에 필요한 컬럼만 명시적 dtype으로 로드하며 통계 누적
+
+    Returns:
+        (DataFrame, ValidationStats)
+    """
+    spec = SOURCES[source]
+    stats = stats or ValidationStats(source)
+    wanted = rule_columns(spec)
+    reader = pd.read_csv(path, encoding='utf-8-sig', usecols=lambda c: c in wanted,
+                         dtype={c: t for c, t in spec['dtypes'].items() if c in wanted},
+                         chunksize=chunksize)
+    chunks = [reader] if chunksize is None else reader
+    frames = []
+    for chunk in chunks:
+        chunk = stats.prepare(chunk)
+        stats.update(chunk)
+        frames.append(chunk)
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0], stats
+
+
+def new_report(source, period, path=None):
+    """빈 소스 리포트"""
+    return {'source': source, 'label': SOURCES[source]['label'], 'period': str(period), 'file': path,
+            'passed': False, 'checks': []}
+
+
+def stats_report(stats, period=None, path=None):
+    """
+    누적 통계 → 소스 리포트
+
+    period가 없으면 데이터의 마지막 Period 기준
+    """
+    if period is None:
+        periods = stats.periods()
+        period = periods[-1] % 10000 if periods else 0
+    report = new_report(stats.source, period, path)
+    report['checks'] = stats.evaluate(period)
+    report['passed'] = not any(c['status'] == 'fail' for c in report['checks'])
+    return report
+
+
+def validate_source(source, period, raw_dir=RAW_DATA_DIR, path=None):
+    """소스 1개 검증 → 리포트 dict"""
+    spec = SOURCES[source]
+    report = new_report(source, period)
+    path = path or find_source_file(source, period, raw_dir)
+    if not path:
+        report['error'] = 'CSV 파일을 찾을 수 없습니다.'
+        report['searched'] = [p.format(raw=raw_dir, period=period) for p in spec['paths'] + spec['globs']]
+        return report
+    report['file'] = path
+    try:
+        _, stats = load_source(source, path)
+    except Exception as e:
+        report['error'] = f'CSV 파일 읽기 실패: {e}'
+        return report
+    return stats_report(stats, period, path)
+
+
+def validate_all(period, sources=None, raw_dir=RAW_DATA_DIR):
+    """전체 소스 검증 → {'period', 'passed', 'sources': {source: report}}"""
+    reports = {source: validate_source(source, period, raw_dir) for source in (sources or SOURCES)}
+    return {
+        'period': str(period),
+        'passed': all(r['passed'] for r in reports.values()),
+        'sources': reports,
+    }
+
+
+STATUS_ICONS = {'pass': '✅', 'fail': '❌', 'warning': '⚠️ ', 'skip': '➖', 'info': '📋'}
+
+
+def print_report(report):
+    """소스 리포트 콘솔 출력"""
+    print(f"\n{'='*80}")
+    print(f"[{report['label']}] {report['period']} 데이터 검증")
+    print(f"{'='*80}")
+    if report.get('error'):
+        print(f"❌ {report['error']}")
+        for path in report.get('searched', []):
+            print(f"   - {path}")
+        return
+    print(f"✅ CSV 파일: {report['file']}\n")
+    for check in report['checks']:
+        print(f"  {STATUS_ICONS.get(check['status'], '')} [{check['rule']}] {check['message']}")
+    print(f"\n{'✅ 검증 통과' if report['passed'] else '❌ 검증 실패'}: [{report['label']}] {report['period']}")
+
+
+def write_report(result, output_path):
+    """검증 리포트 JSON 저장"""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+    return output_path
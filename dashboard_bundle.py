@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Period별 대시보드 JSON을 델타 인코딩 번들로 묶기
+
+- 기준 Period(기본: 최신 Period) 1개는 전체 JSON, 나머지 Period는 기준 대비 변경분(델타)만 저장
+- 추세 배열, 매장 목록 등 Period 간 공통 부분은 한 번만 전송/파싱
+- 출력: public/dashboard/{region}-dashboard-bundle.json
+- 클라이언트 복원: lib/dashboard-bundle.ts (applyDelta), Python 복원: read_bundle_period()
+
+델타 노드 형식:
+    {"=": value}                          값 전체 교체
+    {"o": {key: delta}, "-": [key, ...]}  객체: 변경 키만 재귀 패치, "-"는 삭제 키
+        "k": [key, ...]                   (선택) 결과 키 순서 — 기준 키 순서 + 추가 키 순서와 다를 때만
+    {"a": {index: delta}, "n": length}    배열: 변경 인덱스만 패치, 길이 조정
+
+사용법:
+    python dashboard_bundle.py hongkong 2509 2510 2511 2512
+    python dashboard_bundle.py taiwan              # public/dashboard에 있는 모든 Period
+"""
+import json
+import os
+import re
+
+from dashboard_writer import atomic_write_text, is_unchanged
+
+DASHBOARD_DIR = 'public/dashboard'
+BUNDLE_VERSION = 1
+
+
+def _compact(value):
+    """크기 비교용 직렬화 (번들 저장 형식과 동일)"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def same_json(a, b):
+    """JSON 값 동일 여부 (dict 키 순서 포함 — 대시보드는 dict를 키 순서대로 렌더링)"""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(same_json(value, b[key]) for key, value in a.items())
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same_json(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def diff_json(base, target):
+    """
+    base → target 델타 계산 (키 순서까지 같으면 None)
+
+    패치가 교체보다 커지는 경우는 교체({"=": target})를 사용
+    """
+    if same_json(base, target):
+        return None
+
+    patch = None
+    if isinstance(base, dict) and isinstance(target, dict):
+        changed = {}
+        for key, value in target.items():
+            if key not in base:
+                changed[key] = {'=': value}
+                continue
+            sub = diff_json(base[key], value)
+            if sub is not None:
+                changed[key] = sub
+        removed = [key for key in base if key not in target]
+        patch = {'o': changed}
+        if removed:
+            patch['-'] = removed
+        # 패치 적용 결과의 키 순서 (기준 순서 + 추가 키)가 target과 다르면 순서 기록
+        patched_order = [key for key in base if key in target] + [key for key in target if key not in base]
+        if patched_order != list(target):
+            patch['k'] = list(target)
+    elif isinstance(base, list) and isinstance(target, list):
+        changed = {}
+        for index, value in enumerate(target):
+            if index >= len(base):
+                changed[str(index)] = {'=': value}
+                continue
+            sub = diff_json(base[index], value)
+            if sub is not None:
+                changed[str(index)] = sub
+        patch = {'a': changed, 'n': len(target)}
+
+    replace = {'=': target}
+    if patch is None or len(_compact(patch)) >= len(_compact(replace)):
+        return replace
+    return patch
+
+
+def apply_delta(base, delta):
+    """델타를 적용한 새 값 반환 (base는 변경하지 않음)"""
+    if delta is None:
+        return base
+    if '=' in delta:
+        return delta['=']
+    if 'o' in delta:
+        result = dict(base)
+        for key in delta.get('-', []):
+            result.pop(key, None)
+        for key, sub in delta['o'].items():
+            result[key] = apply_delta(base.get(key), sub)
+        if 'k' in delta:
+            result = {key: result[key] for key in delta['k']}
+        return result
+    if 'a' in delta:
+        result = list(base[:delta['n']])
+        result.extend([None] * (delta['n'] - len(result)))
+        for index, sub in delta['a'].items():
+            index = int(index)
+            result[index] = apply_delta(base[index] if index < len(base) else None, sub)
+        return result
+    raise ValueError(f"알 수 없는 델타 형식: {list(delta)[:3]}")
+
+
+def period_file_path(region, period, dashboard_dir=DASHBOARD_DIR):
+    """Period별 대시보드 파일 경로"""
+    return os.path.join(dashboard_dir, f"{region}-dashboard-data-{period}.json")
+
+
+def bundle_file_path(region, dashboard_dir=DASHBOARD_DIR):
+    """번들 파일 경로"""
+    return os.path.join(dashboard_dir, f"{region}-dashboard-bundle.json")
+
+
+def find_periods(region, dashboard_dir=DASHBOARD_DIR):
+    """public/dashboard에 존재하는 Period 목록 (오름차순)"""
+    pattern = re.compile(rf'^{region}-dashboard-data-(\d{{4}})\.json$')
+    periods = [m.group(1) for m in map(pattern.match, os.listdir(dashboard_dir)) if m]
+    return sorted(periods, key=int)
+
+
+def build_bundle(period_data, base_period=None):
+    """
+    Period별 JSON dict로 번들 생성
+
+    Args:
+        period_data: {period: dashboard_json}
+        base_period: 기준 Period (None이면 최신 Period)
+    """
+    periods = sorted(period_data, key=int)
+    if not periods:
+        raise ValueError("번들에 포함할 Period가 없습니다.")
+    base_period = base_period or periods[-1]
+    base = period_data[base_period]
+
+    deltas = {}
+    for period in periods:
+        if period == base_period:
+            continue
+        delta = diff_json(base, period_data[period])
+        deltas[period] = delta if delta is not None else {'o': {}}
+
+    return {
+        'version': BUNDLE_VERSION,
+        'periods': periods,
+        'base_period': base_period,
+        'base': base,
+        'deltas': deltas,
+    }
+
+
+def read_bundle_period(bundle, period):
+    """번들에서 특정 Period의 전체 JSON 복원"""
+    if period == bundle['base_period']:
+        return bundle['base']
+    if period not in bundle['deltas']:
+        raise KeyError(f"번들에 {period} Period가 없습니다: {bundle['periods']}")
+    return apply_delta(bundle['base'], bundle['deltas'][period])
+
+
+def write_bundle(region, periods=None, base_period=None, dashboard_dir=DASHBOARD_DIR):
+    """
+    public/dashboard의 Period별 파일을 읽어 번들 파일 작성
+
+    Returns:
+        번들 파일 경로
+    """
+    periods = periods or find_periods(region, dashboard_dir)
+    period_data = {}
+    for period in periods:
+        with open(period_file_path(region, period, dashboard_dir), 'r', encoding='utf-8') as f:
+            period_data[period] = json.load(f)
+
+    bundle = build_bundle(period_data, base_period)
+
+    # 복원 결과가 원본과 동일한지 검증 후 저장 (직렬화 결과 비교 — 키 순서 포함)
+    for period in periods:
+        if _compact(read_bundle_period(bundle, period)) != _compact(period_data[period]):
+            raise ValueError(f"번들 복원 결과가 원본과 다릅니다: {period}")
+
+    output_path = bundle_file_path(region, dashboard_dir)
+    text = _compact(bundle)
+    if not is_unchanged(output_path, text):
+        atomic_write_text(output_path, text)
+    return output_path
+
+
+if __name__ == '__main__':
+    import sys
+    import io
+
+    # Windows 콘솔 인코딩 문제 해결
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    region = sys.argv[1] if len(sys.argv) > 1 else 'hongkong'
+    periods = sys.argv[2:] or None
+
+    print("=" * 80)
+    print(f"{region} 대시보드 델타 번들 생성")
+    print("=" * 80)
+
+    output_path = write_bundle(region, periods)
+
+    with open(output_path, 'r', encoding='utf-8') as f:
+        bundle = json.load(f)
+    original_bytes = sum(os.path.getsize(period_file_path(region, p)) for p in bundle['periods'])
+    bundle_bytes = os.path.getsize(output_path)
+    print(f"  - Period: {', '.join(bundle['periods'])} (기준: {bundle['base_period']})")
+    print(f"  - 기준 크기: {len(_compact(bundle['base'])) / 1024:,.0f} KB")
+    for period, delta in bundle['deltas'].items():
+        print(f"  - {period} 델타: {len(_compact(delta)) / 1024:,.0f} KB")
+    print(f"  - 원본 합계: {original_bytes / 1024:,.0f} KB → 번들: {bundle_bytes / 1024:,.0f} KB")
+    print(f"  저장 완료: {output_path}")
+
+    from dashboard_manifest import update_manifest
+    update_manifest([output_path])
+    print("=" * 80)
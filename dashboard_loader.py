@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+대시보드 원천 CSV 공용 로더 (검증 단계 내장)
+
+- CSV를 청크 단위로 스트리밍 로드하면서 csv_validation 규칙 통계(Period별 행 수 / NULL / 0 / 합계,
+  필수 컬럼, 키 중복)를 같은 청크에서 누적 → 별도 검증 단계의 재로드/재파싱 없음
+- 값은 문자열 그대로 보관하므로 records()는 csv.DictReader와 같은 행 dict를 반환
+- 검증 실패 시 DataValidationError 발생 + dashboard_writer 저장 차단 (이후 산출물 저장 불가)
+
+사용 예:
+    from dashboard_loader import load_source_csv
+
+    loaded = load_source_csv(csv_file, 'hongkong', period='2512')
+    rows = loaded.records()
+    mlb_rows = loaded.records(loaded.frame['Brand'] == 'MLB')
+"""
+import pandas as pd
+
+from csv_validation import ValidationStats, rule_columns, stats_report, print_report
+from dashboard_writer import block_writes
+from stage_profiler import staged
+
+CHUNK_SIZE = 200000
+
+
+class DataValidationError(Exception):
+    """원천 데이터 검증 실패"""
+
+    def __init__(self, report):
+        failures = [c['message'] for c in report['checks'] if c['status'] == 'fail']
+        super().__init__(f"[{report['label']}] {report['file']} 검증 실패: " + "; ".join(failures))
+        self.report = report
+
+
+class LoadedSource:
+    """로드된 CSV (문자열 컬럼 프레임) + 검증 리포트"""
+
+    def __init__(self, source, path, frame, stats, report):
+        self.source = source
+        self.path = path
+        self.frame = frame
+        self.stats = stats
+        self.report = report
+
+    @property
+    def periods(self):
+        """데이터에 있는 Period 목록 (문자열, 숫자 순 정렬)"""
+        column = self.stats.spec['period_column']
+        if column not in self.frame.columns:
+            return []
+        return sorted(self.frame[column].unique(), key=lambda x: int(x) if x.isdigit() else 0)
+
+    def records(self, mask=None):
+        """행 dict 목록 (mask: 행 필터 bool Series)"""
+        frame = self.frame if mask is None else self.frame[mask]
+        return frame.to_dict('records')
+
+
+@staged(rows=lambda loaded: len(loaded.frame))
+def load_source_csv(path, source, period=None, chunksize=CHUNK_SIZE, strict=True):
+    """
+    CSV 스트리밍 로드 + 검증
+
+    Args:
+        path: CSV 경로
+        source: csv_validation.SOURCES 키 ('hongkong', 'taiwan', 'pl')
+        period: 검증 기준 Period (YYMM). None이면 데이터의 마지막 Period
+        strict: True면 검증 실패 시 저장 차단 후 DataValidationError
+
+    Returns:
+        LoadedSource
+    """
+    stats = ValidationStats(source)
+    wanted = rule_columns(stats.spec)
+    chunks = []
+    reader = pd.read_csv(path, encoding='utf-8-sig', dtype=str, keep_default_na=False, chunksize=chunksize)
+    for chunk in reader:
+        stats.update(stats.prepare(chunk[[c for c in chunk.columns if c in wanted]].copy()))
+        chunks.append(chunk)
+    frame = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=list(wanted))
+
+    report = stats_report(stats, period, path)
+    if not report['passed']:
+        print_report(report)
+        if strict:
+            error = DataValidationError(report)
+            block_writes(str(error))
+            raise error
+    else:
+        warnings = [c['message'] for c in report['checks'] if c['status'] == 'warning']
+        print(f"  검증 통과 ({report['period']})" + (f", 경고: {'; '.join(warnings)}" if warnings else ""))
+    return LoadedSource(source, path, frame, stats, report)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+대시보드 JSON 매니페스트 생성 (public/dashboard/manifest.json)
+
+- (region, kind, period) → 콘텐츠 해시 URL, 파일명, 바이트 크기 매핑
+- region/kind별로 존재하는 Period 목록 제공 (클라이언트 404 폴백 체인 제거용)
+- 해시 URL(/dashboard/v/{hash}/{file})은 app/dashboard/v/[hash]/[file]/route.ts가 현재 파일 해시와 일치할 때만
+  원본 파일을 영구 캐시 헤더로 응답 (?_=Date.now() 캐시 무효화 불필요, 불일치 시 404)
+
+사용법:
+    python dashboard_manifest.py            # public/dashboard 전체 스캔 후 재생성
+    (생성 스크립트에서) update_manifest([public_output])
+"""
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+
+DASHBOARD_DIR = 'public/dashboard'
+MANIFEST_FILE = 'manifest.json'
+MANIFEST_VERSION = 1
+HASH_LENGTH = 12
+
+# 파일명 앞부분이 region인 경우 (나머지는 'common': bs-data, cf-data 등)
+REGIONS = ('hongkong', 'taiwan', 'discovery')
+
+# {region}-{kind}-{period}[-cumulative].json / {region}-{kind}.json (기본 파일)
+PERIOD_FILE_PATTERN = re.compile(r'^(?P<stem>[a-z]+(?:-[a-z]+)*)-(?P<period>\d{4})(?P<suffix>-cumulative)?\.json$')
+DEFAULT_FILE_PATTERN = re.compile(r'^(?P<stem>[a-z]+(?:-[a-z]+)*)\.json$')
+
+DEFAULT_PERIOD = 'default'
+
+
+def parse_artifact_name(file_name):
+    """
+    파일명을 (region, kind, period)로 파싱
+    - hongkong-dashboard-data-2512.json → ('hongkong', 'dashboard-data', '2512')
+    - hongkong-store-status-2512-cumulative.json → ('hongkong', 'store-status-cumulative', '2512')
+    - bs-data-2512.json → ('common', 'bs-data', '2512')
+    - hongkong-pl-data.json → ('hongkong', 'pl-data', 'default')
+    - 백업/중복 파일(-backup, -2510-2510 등)은 None
+    """
+    if file_name == MANIFEST_FILE:
+        return None
+
+    match = PERIOD_FILE_PATTERN.match(file_name)
+    if match:
+        stem = match.group('stem')
+        period = match.group('period')
+        if match.group('suffix'):
+            stem += match.group('suffix')
+    else:
+        match = DEFAULT_FILE_PATTERN.match(file_name)
+        if not match:
+            return None
+        stem = match.group('stem')
+        period = DEFAULT_PERIOD
+
+    region, _, kind = stem.partition('-')
+    if region not in REGIONS or not kind:
+        region, kind = 'common', stem
+    return region, kind, period
+
+
+def artifact_key(region, kind, period):
+    """매니페스트 키 (클라이언트 조회용): 'hongkong/dashboard-data/2512'"""
+    return f"{region}/{kind}/{period}"
+
+
+def hash_file(file_path):
+    """파일 내용의 sha256 해시 (앞 HASH_LENGTH자리)와 바이트 크기 반환"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest()[:HASH_LENGTH], size
+
+
+def build_entry(file_path):
+    """단일 파일의 매니페스트 항목 생성 (매니페스트 대상이 아니면 None)"""
+    file_name = os.path.basename(file_path)
+    parsed = parse_artifact_name(file_name)
+    if parsed is None or not os.path.isfile(file_path):
+        return None
+
+    region, kind, period = parsed
+    content_hash, size = hash_file(file_path)
+    return {
+        'region': region,
+        'kind': kind,
+        'period': period,
+        'file': file_name,
+        'hash': content_hash,
+        'bytes': size,
+        'url': f"/dashboard/v/{content_hash}/{file_name}",
+    }
+
+
+def load_manifest(dashboard_dir=DASHBOARD_DIR):
+    """기존 매니페스트 로드 (없거나 손상되면 빈 매니페스트)"""
+    manifest_path = os.path.join(dashboard_dir, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError) as e:
+            print(f"  경고: 매니페스트 로드 실패, 재생성합니다 ({e})")
+    return {'version': MANIFEST_VERSION, 'artifacts': {}, 'periods': {}}
+
+
+def _index_periods(artifacts):
+    """region/kind별 존재하는 Period 목록 (기본 파일 제외, 오름차순)"""
+    periods = {}
+    for entry in artifacts.values():
+        if entry['period'] == DEFAULT_PERIOD:
+            continue
+        periods.setdefault(f"{entry['region']}/{entry['kind']}", []).append(entry['period'])
+    return {key: sorted(values, key=int) for key, values in sorted(periods.items())}
+
+
+def save_manifest(manifest, dashboard_dir=DASHBOARD_DIR):
+    """매니페스트 저장 (임시 파일 작성 후 교체)"""
+    manifest['artifacts'] = dict(sorted(manifest['artifacts'].items()))
+    manifest['periods'] = _index_periods(manifest['artifacts'])
+    manifest['generated_at'] = datetime.now().isoformat(timespec='seconds')
+
+    manifest_path = os.path.join(dashboard_dir, MANIFEST_FILE)
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path)
+    return manifest_path
+
+
+def update_manifest(file_paths, dashboard_dir=DASHBOARD_DIR):
+    """
+    생성된 파일들의 매니페스트 항목만 갱신
+
+    Args:
+        file_paths: 방금 작성한 public/dashboard 파일 경로 목록
+        dashboard_dir: 매니페스트가 위치한 디렉토리
+    """
+    manifest = load_manifest(dashboard_dir)
+    artifacts = manifest['artifacts']
+
+    # 삭제된 파일 항목 정리
+    for key in [k for k, e in artifacts.items() if not os.path.exists(os.path.join(dashboard_dir, e['file']))]:
+        del artifacts[key]
+
+    for file_path in file_paths:
+        if os.path.abspath(os.path.dirname(file_path)) != os.path.abspath(dashboard_dir):
+            continue
+        entry = build_entry(file_path)
+        if entry is None:
+            continue
+        artifacts[artifact_key(entry['region'], entry['kind'], entry['period'])] = entry
+
+    manifest_path = save_manifest(manifest, dashboard_dir)
+    print(f"  매니페스트 갱신: {manifest_path} ({len(artifacts)}개 항목)")
+    return manifest
+
+
+def rebuild_manifest(dashboard_dir=DASHBOARD_DIR):
+    """public/dashboard 전체를 스캔하여 매니페스트 재생성"""
+    artifacts = {}
+    for file_name in sorted(os.listdir(dashboard_dir)):
+        entry = build_entry(os.path.join(dashboard_dir, file_name))
+        if entry is None:
+            continue
+        artifacts[artifact_key(entry['region'], entry['kind'], entry['period'])] = entry
+
+    manifest = {'version': MANIFEST_VERSION, 'artifacts': artifacts, 'periods': {}}
+    save_manifest(manifest, dashboard_dir)
+    return manifest
+
+
+if __name__ == '__main__':
+    import sys
+    import io
+
+    # Windows 콘솔 인코딩 문제 해결
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    dashboard_dir = sys.argv[1] if len(sys.argv) > 1 else DASHBOARD_DIR
+
+    print("=" * 80)
+    print(f"대시보드 매니페스트 생성: {dashboard_dir}")
+    print("=" * 80)
+
+    manifest = rebuild_manifest(dashboard_dir)
+    total_bytes = sum(e['bytes'] for e in manifest['artifacts'].values())
+    print(f"  - 항목 수: {len(manifest['artifacts'])}")
+    print(f"  - 전체 크기: {total_bytes / 1024 / 1024:.1f} MB")
+    for key, periods in manifest['periods'].items():
+        print(f"  - {key}: {', '.join(periods)}")
+    print("=" * 80)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+대시보드 JSON 섹션 패치 파이프라인
+
+CSV 결과를 기존 대시보드 JSON의 일부 섹션에만 반영하는 스크립트들
+(integrate_tw_csv_to_json, convert_sales_rate_to_json, update_acc_weeks, ...)은
+각자 JSON 전체를 로드/저장하는 대신 build_patches()로 "파일 + 섹션 경로 → 새 값"만 선언하고,
+이 모듈이 모든 패치를 모아 파일별 1회 로드/저장으로 적용한다.
+
+- 충돌 감지: 서로 다른 스크립트가 같은 섹션(또는 상위/하위 섹션)에 다른 값을 쓰면 PatchConflictError
+- --last-wins: 충돌 시 나중 스크립트 값 사용 (기존처럼 스크립트를 순서대로 실행한 결과와 동일)
+
+사용법:
+    python dashboard_patch.py                      # PATCH_SCRIPTS 전체
+    python dashboard_patch.py update_acc_weeks update_tag_with_ytd
+    python dashboard_patch.py --last-wins
+"""
+import importlib
+import os
+from collections import namedtuple
+
+from dashboard_writer import ArtifactWriter, split_section
+
+# 실행 순서 = 기존 수동 실행 순서 (--last-wins 시 뒤쪽 스크립트 우선)
+PATCH_SCRIPTS = [
+    'integrate_tw_csv_to_json',
+    'convert_sales_rate_to_json',
+    'update_acc_weeks',
+    'update_tag_ytd_from_csv',
+    'update_tag_with_ytd',
+    'update_season_sales_detail',
+    'update_hongkong_tag_summary_2512',
+]
+
+SectionPatch = namedtuple('SectionPatch', ['file', 'section', 'value', 'source'])
+
+_MISSING = object()
+
+
+class PatchConflictError(ValueError):
+    """같은 섹션에 서로 다른 값을 쓰는 패치가 있는 경우"""
+
+    def __init__(self, conflicts):
+        self.conflicts = conflicts
+        lines = [
+            f"  {a.file}: {'.'.join(a.section)} ({a.source}) ↔ {'.'.join(b.section)} ({b.source})"
+            for a, b in conflicts
+        ]
+        super().__init__("섹션 패치 충돌:\n" + "\n".join(lines))
+
+
+def section_patch(file, section, value, source=None):
+    """SectionPatch 생성 (section은 'a.b' 문자열 또는 튜플)"""
+    # './public/...', 'public\\...' 등 표기가 달라도 같은 파일로 인식 (충돌 감지용)
+    file = os.path.normpath(str(file)).replace('\\', '/')
+    return SectionPatch(file, split_section(section), value, source)
+
+
+def _sub_value(value, keys):
+    """value 안의 하위 경로 값 (없으면 _MISSING)"""
+    for key in keys:
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def _is_conflict(a, b):
+    """두 패치가 겹치는 섹션에 서로 다른 값을 쓰는지 확인"""
+    if a.file != b.file:
+        return False
+    if len(a.section) > len(b.section):
+        a, b = b, a
+    if b.section[:len(a.section)] != a.section:
+        return False
+    # a가 상위(또는 같은) 섹션: a 값 안의 해당 위치가 b 값과 같으면 충돌 아님
+    return _sub_value(a.value, b.section[len(a.section):]) != b.value
+
+
+class PatchSet:
+    """여러 스크립트의 섹션 패치 모음 (선언 순서 유지)"""
+
+    def __init__(self, patches=None):
+        self.patches = []
+        if patches:
+            self.extend(patches)
+
+    def add(self, file, section, value, source=None):
+        self.patches.append(section_patch(file, section, value, source))
+
+    def extend(self, patches, source=None):
+        for patch in patches:
+            if source is not None and patch.source is None:
+                patch = patch._replace(source=source)
+            self.patches.append(patch)
+
+    def files(self):
+        return sorted({patch.file for patch in self.patches})
+
+    def conflicts(self):
+        """서로 다른 소스 간 충돌 목록 [(앞 패치, 뒤 패치), ...]"""
+        found = []
+        for i, a in enumerate(self.patches):
+            for b in self.patches[i + 1:]:
+                if a.source != b.source and _is_conflict(a, b):
+                    found.append((a, b))
+        return found
+
+    def apply(self, last_wins=False, writer=None):
+        """
+        파일별 1회 로드/저장으로 모든 패치 적용
+
+        Args:
+            last_wins: True면 충돌 시 나중 패치 값 사용 (경고만 출력)
+            writer: 외부 ArtifactWriter (None이면 내부에서 생성 후 flush)
+        """
+        conflicts = self.conflicts()
+        if conflicts:
+            if not last_wins:
+                raise PatchConflictError(conflicts)
+            print(f"  경고: {PatchConflictError(conflicts)}")
+            print("  → 나중 패치 값으로 덮어씁니다 (--last-wins)")
+
+        if writer is not None:
+            for patch in self.patches:
+                writer.patch(patch.file, patch.section, patch.value)
+            return
+        with ArtifactWriter() as own_writer:
+            for patch in self.patches:
+                own_writer.patch(patch.file, patch.section, patch.value)
+
+
+def collect_patches(script_names=PATCH_SCRIPTS):
+    """각 스크립트의 build_patches()를 호출하여 PatchSet 생성"""
+    patch_set = PatchSet()
+    for name in script_names:
+        print(f"\n[{name}] 패치 생성")
+        module = importlib.import_module(name)
+        patch_set.extend(module.build_patches(), source=name)
+    return patch_set
+
+
+def apply_script_patches(patches, source=None):
+    """단일 스크립트 실행용: 해당 스크립트의 패치만 적용"""
+    patch_set = PatchSet()
+    patch_set.extend(patches, source=source)
+    patch_set.apply()
+
+
+if __name__ == '__main__':
+    import sys
+    import io
+
+    # Windows 콘솔 인코딩 문제 해결
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    args = sys.argv[1:]
+    last_wins = '--last-wins' in args
+    scripts = [a for a in args if not a.startswith('--')] or PATCH_SCRIPTS
+
+    print("=" * 80)
+    print("대시보드 섹션 패치 일괄 적용")
+    print("=" * 80)
+
+    patch_set = collect_patches(scripts)
+
+    print("\n" + "=" * 80)
+    print(f"패치 {len(patch_set.patches)}개 → 파일 {len(patch_set.files())}개")
+    for patch in patch_set.patches:
+        print(f"  - {patch.file}: {'.'.join(patch.section)} ({patch.source})")
+
+    try:
+        patch_set.apply(last_wins=last_wins)
+    except PatchConflictError as e:
+        print(f"\n❌ {e}")
+        print("충돌을 확인한 뒤 --last-wins 옵션으로 실행 순서대로 덮어쓸 수 있습니다.")
+        sys.exit(1)
+    print("=" * 80)
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+대시보드 조회 API 서버 (로컬, 읽기 전용, 표준 라이브러리만 사용)
+
+- public/dashboard의 집계 JSON에서 화면에 필요한 부분만 잘라서 응답
+  (페이지가 전체 JSON을 받아 클라이언트에서 필터링하지 않도록)
+- 파일은 (mtime, 크기)가 바뀔 때만 다시 읽음 → 생성 스크립트 실행 후 재시작 불필요
+- 조회 결과는 LRU 캐시(QUERY_CACHE_SIZE개), ETag = 조회 조건 + 사용한 파일 버전의 해시
+  → If-None-Match 일치 시 304 (본문 없음)
+
+엔드포인트 (GET, 여러 값은 쉼표 구분):
+    /api/artifacts                                            지역/종류별 Period 목록 (manifest.json)
+    /api/stores?region=hongkong&period=2511,2512              매장 × Period
+        [&store=M01,M02][&channel=Retail][&country=HK][&fields=net_sales,discount_rate]
+    /api/category-season?region=taiwan&period=2512            카테고리 / 시즌 요약
+        [&category=BAG,HEA][&season=25F][&season_type=과시즌F]
+    /api/pl?region=taiwan&period=2512                         채널별 PL 계정
+        [&scope=current_month|prev_month|cumulative][&channel=retail,online][&account=net_sales]
+    /api/slice?region=hongkong&kind=dashboard-data&period=2512&path=store_summary.M01.current
+                                                              임의 경로 (점 구분)
+
+사용법:
+    python dashboard_query_server.py                  # http://127.0.0.1:8765
+    python dashboard_query_server.py --port 9000 --dir public/dashboard
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import io
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from dashboard_manifest import DASHBOARD_DIR, MANIFEST_FILE
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32' and __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+QUERY_CACHE_SIZE = 256
+NAME_PATTERN = re.compile(r'^[a-z]+(?:-[a-z]+)*$')
+PERIOD_PATTERN = re.compile(r'^\d{4}$')
+PL_SCOPES = ('current_month', 'prev_month', 'cumulative')
+
+
+class QueryError(Exception):
+    """잘못된 조회 조건 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class ArtifactStore:
+    """public/dashboard JSON 로더 (파일 버전이 바뀔 때만 재로드)"""
+
+    def __init__(self, dashboard_dir=DASHBOARD_DIR):
+        self.dashboard_dir = dashboard_dir
+        self._documents = {}  # 파일명 → (버전, 데이터)
+        self._lock = threading.Lock()
+
+    def file_name(self, region, kind, period):
+        if not NAME_PATTERN.match(region) or not NAME_PATTERN.match(kind):
+            raise QueryError(f"잘못된 region/kind: {region}/{kind}")
+        if not PERIOD_PATTERN.match(period):
+            raise QueryError(f"잘못된 period: {period} (YYMM)")
+        return f"{region}-{kind}-{period}.json"
+
+    def version(self, file_name):
+        """파일 버전 (mtime_ns, 크기), 없으면 None"""
+        try:
+            stat = os.stat(os.path.join(self.dashboard_dir, file_name))
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self, file_name, version=None):
+        """JSON 로드 (캐시된 버전과 같으면 재사용)"""
+        version = version or self.version(file_name)
+        if version is None:
+            raise QueryError(f"파일 없음: {file_name}", status=404)
+        with self._lock:
+            cached = self._documents.get(file_name)
+        if cached and cached[0] == version:
+            return cached[1]
+        with open(os.path.join(self.dashboard_dir, file_name), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        with self._lock:
+            self._documents[file_name] = (version, data)
+        return data
+
+
+class QueryCache:
+    """조회 결과 LRU (키: 조회 조건 + 파일 버전)"""
+
+    def __init__(self, size=QUERY_CACHE_SIZE):
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+def _values(params, name, required=False):
+    """쿼리 파라미터 → 값 목록 (쉼표 구분, 중복 파라미터 허용)"""
+    values = [v for raw in params.get(name, []) for v in raw.split(',') if v]
+    if required and not values:
+        raise QueryError(f"{name} 파라미터 필요")
+    return values
+
+
+def _one(params, name, default=None):
+    values = _values(params, name)
+    if not values and default is None:
+        raise QueryError(f"{name} 파라미터 필요")
+    return values[0] if values else default
+
+
+def _pick(values, fields):
+    """dict에서 fields만 (fields 없으면 전체)"""
+    if not fields or not isinstance(values, dict):
+        return values
+    return {k: values[k] for k in fields if k in values}
+
+
+def query_stores(load, params):
+    """매장 × Period (dashboard-data store_summary)"""
+    region = _one(params, 'region')
+    stores = set(_values(params, 'store'))
+    channels = set(_values(params, 'channel'))
+    countries = set(_values(params, 'country'))
+    fields = _values(params, 'fields')
+    rows = []
+    for period in _values(params, 'period', required=True):
+        summary = load(region, 'dashboard-data', period).get('store_summary', {})
+        for store_code, store in summary.items():
+            if stores and store_code not in stores:
+                continue
+            if channels and store.get('channel') not in channels:
+                continue
+            if countries and store.get('country') not in countries:
+                continue
+            row = {k: v for k, v in store.items() if not isinstance(v, dict)}
+            row['period'] = period
+            for side in ('current', 'previous'):
+                if side in store:
+                    row[side] = _pick(store[side], fields)
+            rows.append(row)
+    return {'rows': rows}
+
+
+def query_category_season(load, params):
+    """카테고리 / 시즌 요약 (dashboard-data category_summary, season_summary)"""
+    region = _one(params, 'region')
+    categories = set(_values(params, 'category'))
+    seasons = set(_values(params, 'season'))
+    season_types = set(_values(params, 'season_type'))
+    result = {'categories': [], 'seasons': []}
+    for period in _values(params, 'period', required=True):
+        data = load(region, 'dashboard-data', period)
+        for code, category in data.get('category_summary', {}).items():
+            if not categories or code in categories:
+                result['categories'].append({'period': period, **category})
+        for season in data.get('season_summary', {}).values():
+            if seasons and season.get('season_code') not in seasons:
+                continue
+            if season_types and season.get('season_type') not in season_types:
+                continue
+            result['seasons'].append({'period': period, **season})
+    return result
+
+
+def query_pl(load, params):
+    """채널별 PL 계정 (pl-data의 current_month / prev_month / cumulative)"""
+    region = _one(params, 'region')
+    scope = _one(params, 'scope', 'current_month')
+    if scope not in PL_SCOPES:
+        raise QueryError(f"scope는 {PL_SCOPES} 중 하나")
+    channels = _values(params, 'channel')
+    accounts = _values(params, 'account')
+    result = {}
+    for period in _values(params, 'period', required=True):
+        section = load(region, 'pl-data', period).get(scope, {})
+        # 채널 = 계정 dict (net_sales 포함), yoy/change/prev_cumulative 등은 제외
+        available = {name: values for name, values in section.items()
+                     if isinstance(values, dict) and 'net_sales' in values}
+        selected = channels or list(available)
+        result[period] = {name: _pick(available[name], accounts) for name in selected if name in available}
+    return {'scope': scope, 'periods': result}
+
+
+def query_slice(load, params):
+    """임의 경로 값 (점 구분 경로, 리스트는 숫자 인덱스)"""
+    value = load(_one(params, 'region'), _one(params, 'kind'), _one(params, 'period'))
+    path = _one(params, 'path', '')
+    for part in path.split('.') if path else []:
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            raise QueryError(f"경로 없음: {path}", status=404)
+    return {'path': path, 'value': value}
+
+
+# 엔드포인트 → (사용 파일 종류, 조회 함수) — 종류 None이면 kind 파라미터
+ENDPOINTS = {
+    '/api/stores': ('dashboard-data', query_stores),
+    '/api/category-season': ('dashboard-data', query_category_season),
+    '/api/pl': ('pl-data', query_pl),
+    '/api/slice': (None, query_slice),
+}
+
+
+class QueryService:
+    """조회 실행 + 결과 캐시 (HTTP와 분리 — 스크립트에서도 직접 사용 가능)"""
+
+    def __init__(self, dashboard_dir=DASHBOARD_DIR, cache_size=QUERY_CACHE_SIZE):
+        self.store = ArtifactStore(dashboard_dir)
+        self.cache = QueryCache(cache_size)
+
+    def execute(self, endpoint, params):
+        """
+        조회 실행 (같은 조건 + 같은 파일 버전이면 캐시 응답)
+
+        Returns:
+            (ETag, 응답 본문 bytes)
+        """
+        if endpoint == '/api/artifacts':
+            files, query = [MANIFEST_FILE], None
+        elif endpoint in ENDPOINTS:
+            kind, query = ENDPOINTS[endpoint]
+            kind = kind or _one(params, 'kind')
+            region = _one(params, 'region')
+            files = [self.store.file_name(region, kind, period) for period in _values(params, 'period', required=True)]
+        else:
+            raise QueryError(f"알 수 없는 엔드포인트: {endpoint}", status=404)
+
+        # 캐시 키: 조회 조건 + 파일 버전 (stat만 — 파일이 바뀌면 키도 바뀜)
+        versions = []
+        for file_name in files:
+            version = self.store.version(file_name)
+            if version is None:
+                raise QueryError(f"파일 없음: {file_name}", status=404)
+            versions.append((file_name, version))
+        normalized = json.dumps({k: _values(params, k) for k in sorted(params)}, ensure_ascii=False)
+        key = (endpoint, normalized, tuple(versions))
+        cached = self.cache.get(key)
+        if cached:
+            return cached
+
+        if query is None:
+            result = {'periods': self.store.load(MANIFEST_FILE, versions[0][1]).get('periods', {})}
+        else:
+            result = query(lambda r, k, p: self.store.load(self.store.file_name(r, k, p)), params)
+        body = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        etag = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()[:20]
+        self.cache.put(key, (etag, body))
+        return etag, body
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """GET/HEAD만 허용 (읽기 전용)"""
+
+    service = None  # serve()에서 설정
+    server_version = 'DashboardQuery/1'
+
+    def _send(self, status, body=b'', etag=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if etag:
+            self.send_header('ETag', f'"{etag}"')
+            # 매번 재검증 (파일이 바뀌면 ETag가 바뀜)
+            self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        try:
+            etag, body = self.service.execute(url.path.rstrip('/'), parse_qs(url.query))
+        except QueryError as e:
+            self._send(e.status, json.dumps({'error': str(e)}, ensure_ascii=False).encode('utf-8'))
+            return
+        if_none_match = self.headers.get('If-None-Match', '')
+        if etag in [tag.strip().strip('"').removeprefix('W/"') for tag in if_none_match.split(',')]:
+            self._send(304, etag=etag)
+            return
+        self._send(200, body, etag)
+
+    do_HEAD = do_GET
+
+    def _reject(self):
+        self._send(405, json.dumps({'error': '읽기 전용 (GET만 지원)'}, ensure_ascii=False).encode('utf-8'))
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = _reject
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, dashboard_dir=DASHBOARD_DIR, cache_size=QUERY_CACHE_SIZE,
+          verbose=False):
+    """서버 실행 (Ctrl+C로 종료)"""
+    handler = type('Handler', (QueryHandler,), {'service': QueryService(dashboard_dir, cache_size)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.verbose = verbose
+    print(f"대시보드 조회 API: http://{host}:{port}/api/ (데이터: {dashboard_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        cache = handler.service.cache
+        print(f"\n종료 (캐시 적중 {cache.hits:,} / 미적중 {cache.misses:,})")
+        server.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='대시보드 조회 API 서버 (읽기 전용)')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--dir', default=DASHBOARD_DIR, help='대시보드 JSON 폴더')
+    parser.add_argument('--cache-size', type=int, default=QUERY_CACHE_SIZE)
+    parser.add_argument('--verbose', action='store_true', help='요청 로그 출력')
+    args = parser.parse_args()
+    serve(args.host, args.port, args.dir, args.cache_size, args.verbose)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+대시보드 JSON 공용 저장 모듈
+
+- 원자적 저장: 임시 파일 작성 후 os.replace (중간에 중단되어도 반쪽짜리 JSON이 남지 않음)
+- 변경 없으면 저장 생략: 기존 파일과 직렬화 결과(바이트)가 같으면 디스크/캐시를 건드리지 않음
+  (키 순서만 바뀐 경우도 저장 — 대시보드는 dict를 키 순서대로 표시, dashboard_bundle.same_json과 동일 기준)
+- 파일 권한: 기존 파일 권한 유지, 새 파일은 0o666 & ~umask (mkstemp 기본 0600 그대로 두지 않음)
+- 백그라운드 직렬화: ArtifactWriter로 여러 파일을 스레드에서 동시에 직렬화/저장
+- 섹션 패치 일괄 적용: 같은 파일에 대한 여러 섹션 변경을 한 번의 로드/저장으로 처리
+- public/dashboard 파일은 저장 후 manifest.json 자동 갱신
+- 저장 차단: 입력 데이터 검증 실패 시(block_writes) 이후 모든 저장이 WriteBlockedError로 중단
+
+사용 예:
+    from dashboard_writer import ArtifactWriter, write_json
+
+    write_json('public/dashboard/hongkong-opex-2512.json', data)
+
+    with ArtifactWriter() as writer:
+        writer.write('components/dashboard/hongkong-dashboard-data-2512.json', result)
+        writer.write('public/dashboard/hongkong-dashboard-data-2512.json', result)
+        writer.patch('public/dashboard/taiwan-dashboard-data-2512.json', 'season_sales_rate', rate)
+"""
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from dashboard_manifest import DASHBOARD_DIR, update_manifest
+
+
+_WRITE_BLOCKS = []
+
+
+def _current_umask():
+    # umask는 조회 시 변경이 필요하므로 모듈 로드 시 1회만 (저장 스레드에서 변경하지 않음)
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _current_umask()
+
+
+class WriteBlockedError(RuntimeError):
+    """입력 데이터 검증 실패로 산출물 저장이 차단됨"""
+
+
+def block_writes(reason):
+    """이 프로세스의 이후 모든 산출물 저장 차단 (검증 실패 등)"""
+    _WRITE_BLOCKS.append(reason)
+
+
+def ensure_writable(path):
+    if _WRITE_BLOCKS:
+        raise WriteBlockedError(f"저장 차단 ({path}): " + "; ".join(_WRITE_BLOCKS))
+
+
+def serialize_json(data, indent=2):
+    """저장 형식 직렬화 (기존 스크립트와 동일: ensure_ascii=False, indent=2)"""
+    return json.dumps(data, ensure_ascii=False, indent=indent)
+
+
+def target_mode(path):
+    """저장 파일 권한: 기존 파일 권한, 새 파일은 0o666 & ~umask (일반 open과 동일)"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write_text(path, text):
+    """임시 파일에 작성 후 교체 (같은 디렉토리 내 rename이므로 원자적)"""
+    ensure_writable(path)
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def is_unchanged(path, text):
+    """기존 파일과 내용이 같은지 확인 (직렬화 결과 비교 — 키 순서 변경도 변경으로 처리)"""
+    if not os.path.exists(path):
+        return False
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read() == text
+
+
+def write_json(path, data, indent=2, force=False):
+    """
+    JSON 원자적 저장 (내용이 같으면 생략)
+
+    Returns:
+        True: 저장함, False: 변경 없어 생략
+    """
+    ensure_writable(path)
+    text = serialize_json(data, indent)
+    if not force and is_unchanged(path, text):
+        return False
+    atomic_write_text(path, text)
+    return True
+
+
+def load_json(path):
+    """JSON 로드"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def split_section(section):
+    """'ending_inventory.by_season' 또는 ('ending_inventory', 'by_season') → 튜플"""
+    if isinstance(section, str):
+        return tuple(section.split('.'))
+    return tuple(section)
+
+
+def set_section(data, section, value):
+    """중첩 dict의 섹션 값 교체 (중간 경로가 없으면 생성)"""
+    keys = split_section(section)
+    node = data
+    for key in keys[:-1]:
+        node = node.setdefault(key, {})
+    node[keys[-1]] = value
+
+
+class ArtifactWriter:
+    """
+    여러 JSON 파일을 백그라운드에서 직렬화/저장하고, 섹션 패치를 파일별로 모아 한 번에 저장
+
+    with 블록 종료(또는 flush) 시 모든 저장이 끝날 때까지 대기하며,
+    저장 중 오류가 있으면 첫 번째 오류를 다시 발생시킴
+    """
+
+    def __init__(self, max_workers=4, manifest=True, indent=2):
+        self.indent = indent
+        self.manifest = manifest
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = []
+        self._patches = {}
+        self._pending = {}  # 경로별 마지막 예약 작업 (같은 파일의 저장/패치는 예약 순서대로 실행)
+        self.written = []
+        self.skipped = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+        return False
+
+    def _write_task(self, path, data):
+        if write_json(path, data, self.indent):
+            self.written.append(path)
+        else:
+            self.skipped.append(path)
+
+    def _submit(self, path, task, *args):
+        """작업 예약 — 같은 경로에 먼저 예약된 작업이 있으면 그 작업이 끝난 뒤 실행"""
+        key = os.path.abspath(path)
+        previous = self._pending.get(key)
+
+        def run():
+            if previous is not None:
+                previous.result()  # 앞 작업 실패 시 같은 오류로 중단
+            task(path, *args)
+
+        future = self._executor.submit(run)
+        self._pending[key] = future
+        self._futures.append(future)
+
+    def write(self, path, data):
+        """파일 전체 저장 예약 (flush 전까지 data를 수정하지 말 것)"""
+        self._submit(path, self._write_task, data)
+
+    def patch(self, path, section, value):
+        """파일의 섹션 변경 예약 (같은 파일의 패치는 flush 시 한 번에 적용)"""
+        self._patches.setdefault(path, []).append((split_section(section), value))
+
+    def _patch_task(self, path, patches):
+        data = load_json(path)
+        for section, value in patches:
+            set_section(data, section, value)
+        self._write_task(path, data)
+
+    def flush(self):
+        """예약된 패치/저장을 모두 완료하고 매니페스트 갱신"""
+        # 같은 경로의 write가 있으면 그 저장이 끝난 파일에 패치 적용
+        for path, patches in self._patches.items():
+            self._submit(path, self._patch_task, patches)
+        self._patches = {}
+
+        futures, self._futures = self._futures, []
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        self._pending = {}
+
+        for path in self.written:
+            print(f"  저장 완료: {path}")
+        for path in self.skipped:
+            print(f"  변경 없음, 저장 생략: {path}")
+
+        dashboard_dir = os.path.abspath(DASHBOARD_DIR)
+        public_written = [p for p in self.written if os.path.abspath(os.path.dirname(p)) == dashboard_dir]
+        if self.manifest and public_written:
+            update_manifest(public_written)
+        self.written, self.skipped = [], []
+
+        if errors:
+            raise errors[0]
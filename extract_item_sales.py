@@ -9,12 +9,16 @@ import json
 import sys
 import io
 
+from item_classifier import ITEM_KEYS, assign_item_keys
+
 # Windows 콘솔 인코딩 문제 해결
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-# CSV 파일 읽기
+# CSV 파일 읽기 (분류 컬럼은 사전 인코딩)
 print("📂 CSV 파일 읽는 중...")
-df = pd.read_csv('../Dashboard_Raw_Data/HKMC/2511/HKMC_Inventory_2511.csv', encoding='utf-8')
+df = pd.read_csv('../Dashboard_Raw_Data/HKMC/2511/HKMC_Inventory_2511.csv', encoding='utf-8',
+                 dtype={'Season_Code': 'category', 'Season_Type': 'category', 'Category': 'category'})
 
 print(f"✅ 총 {len(df):,}개 행 로드됨")
 print(f"📊 컬럼: {list(df.columns)}")
@@ -24,6 +28,9 @@ print(f"📊 컬럼: {list(df.columns)}")
 df['Period_int'] = df['Period'].fillna(0).astype(float).astype(int)
 df['Month_num'] = df['Period_int'] % 100
 
+# 아이템 분류 (대시보드 공통 규칙 테이블, 전체 행 1회 분류)
+df['Item'] = assign_item_keys(df, period_col='Period_int')
+
 df_2025 = df[(df['Year'] == 2025) & (df['Month_num'].between(1, 10))].copy()
 
 print(f"\n✅ 2025년 1-10월 데이터: {len(df_2025):,}개 행")
@@ -39,39 +46,6 @@ print(df_2025['Season_Type'].value_counts())
 print(f"\n📋 Category 고유값:")
 print(df_2025['Category'].value_counts())
 
-# 아이템 분류 함수
-def classify_item(row):
-    season_type = str(row['Season_Type']).lower()
-    season_code = str(row['Season_Code']).upper()
-    category = str(row['Category']).upper()
-    
-    # 모자
-    if category == 'HEA':
-        return '모자'
-    # 신발
-    elif category == 'SHO':
-        return '신발'
-    # 가방외 (악세사리)
-    elif category in ['BAG', 'ATC']:
-        return '가방외'
-    # 당시즌F (25F 또는 24F 후반)
-    elif '당시즌f' in season_type or season_code.startswith('25F') or season_code == '24F':
-        return '당시즌F'
-    # 당시즌S (25S)
-    elif '당시즌s' in season_type or season_code.startswith('25S'):
-        return '당시즌S'
-    # 과시즌의류 (의류 카테고리이면서 과시즌)
-    elif category in ['BOT', 'INN', 'OUT', 'WTC'] and ('과시즌' in season_type or season_code < '24F'):
-        return '과시즌의류'
-    # 기타 의류 - 과시즌으로 분류
-    elif category in ['BOT', 'INN', 'OUT', 'WTC']:
-        return '과시즌의류'
-    else:
-        return '기타'
-
-# 아이템 분류 적용
-df_2025['Item'] = df_2025.apply(classify_item, axis=1)
-
 print(f"\n📊 아이템 분류 결과:")
 print(df_2025['Item'].value_counts())
 
@@ -92,7 +66,7 @@ gross_sales_pivot = (gross_sales_pivot / 1000).round(0).astype(int)  # 1K HKD 
 result['net_sales'] = {}
 result['gross_sales'] = {}
 
-items = ['당시즌F', '당시즌S', '과시즌의류', '모자', '신발', '가방외']
+items = ITEM_KEYS
 months = list(range(1, 11))
 
 for item in items:
@@ -109,7 +83,6 @@ for item in items:
 # YOY 계산 (2024년 데이터와 비교)
 df_2024 = df[(df['Year'] == 2024) & (df['Month_num'].between(1, 10))].copy()
 df_2024['Month'] = df_2024['Month_num']
-df_2024['Item'] = df_2024.apply(classify_item, axis=1)
 
 net_sales_2024 = df_2024.groupby(['Month', 'Item'])['Net_Sales'].sum().reset_index()
 net_sales_2024_pivot = net_sales_2024.pivot(index='Month', columns='Item', values='Net_Sales').fillna(0)
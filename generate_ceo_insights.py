@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+CEO 인사이트 데이터 생성 (전 지역 / 전 Period)
+
+- 입력: KPI 테이블(public/dashboard/kpi-table.json)만 사용 — 대시보드/PL JSON을 다시 읽지 않음
+- 지역별 템플릿(INSIGHT_TEMPLATES)의 {지표} 자리에 KPI 값을 채움
+  (필요한 지표가 없는 항목은 생략)
+- Period별 정성 문구(주요 이슈/기회 요인)는 INSIGHT_NOTES에 기록, 없으면 지역 기본 문구
+- 출력: public/dashboard/{region}-ceo-insights-{period}.json
+- 직접 작성/수정한 인사이트 파일(source 표시 없음)은 보존, --overwrite 시에만 교체
+
+사용법:
+    python generate_ceo_insights.py                  # KPI 테이블의 모든 지역/Period
+    python generate_ceo_insights.py 2512             # 특정 Period
+    python generate_ceo_insights.py 2512 taiwan      # 특정 Period/지역
+    python generate_ceo_insights.py --overwrite      # 직접 작성한 파일도 교체
+"""
+import os
+import string
+import sys
+import io
+
+from dashboard_manifest import DASHBOARD_DIR
+from dashboard_writer import ArtifactWriter, load_json
+from kpi_table import KPI_TABLE_FILE, kpi_frame, load_kpi_table
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+OUTPUT_FILE = DASHBOARD_DIR + '/{region}-ceo-insights-{period}.json'
+GENERATED_SOURCE = 'kpi-table'
+REQUIRED_METRIC = 'net_sales'  # PL KPI가 있는 지역/Period만 생성
+
+INSIGHT_TEMPLATES = {
+    'hongkong': {
+        'executive_summary': {
+            'title': '📊 핵심성과',
+            'items': [
+                "• {month_name} 매출 성장: 실판매출 {net_sales:,.0f}K (YOY {net_sales_yoy:.0f}%), 전년 동월 대비 {net_sales_change:+,.0f}K",
+                "• 당월 영업이익: {operating_profit:,.0f}K (영업이익률 {operating_profit_rate:.1f}%)",
+                "• 매장 운영: 총 {store_count:.0f}개 매장 운영 중",
+                "• 할인율 관리: {discount_rate:.1f}% (전년 동월 대비 관리 중)",
+            ],
+        },
+        'warnings': {'title': '⚠️ 주요 이슈'},
+        'opportunities': {'title': '🎯 기회 요인'},
+    },
+    'taiwan': {
+        'executive_summary': {
+            'title': '💡 핵심 성과',
+            'items': [
+                "**당월 매출개선**: {tag_sales_total:,.0f}K YOY {tag_sales_total_yoy:.0f}%",
+                "**누적 매출개선**: {tag_sales_ytd:,.0f}K YOY {tag_sales_ytd_yoy:.0f}%",
+                "**당월 영업이익 {operating_profit_status}**: {operating_profit:,.0f}K (이익률 {operating_profit_rate:.1f}%, 전년비 {operating_profit_rate_change:+.1f}%p)",
+                "**누적 영업이익 {cumulative_operating_profit_status}**: {cumulative_operating_profit:,.0f}K (이익률 {cumulative_operating_profit_rate:.1f}% 전년비 {cumulative_operating_profit_rate_change:+.1f}%p)",
+                "**총재고**: {tag_stock:,.0f}K, YOY {tag_stock_yoy:.0f}%",
+            ],
+        },
+        'warnings': {
+            'title': '⚠️ 주요 리스크',
+            'items': [
+                "**DJ 입고** {season_f_stock_yoy:.0f}%, **판매** {season_f_sales_ytd_yoy:.0f}%로 판매율 제고 필요",
+            ],
+        },
+        'opportunities': {'title': '🎯 CEO 전략 방향'},
+    },
+}
+
+# 기본 정성 문구 (Period별 문구가 없을 때)
+DEFAULT_NOTES = {
+    'hongkong': {
+        'warnings': ["• {month_name} 운영 현황 점검", "• 직접비 최적화 진행 중", "• 매장별 수익성 모니터링"],
+        'opportunities': ["• 흑자 매장 모범 사례 확산", "• 온라인 채널 확대"],
+    },
+    'taiwan': {
+        'warnings': ["• {month_name} 운영 현황 모니터링"],
+        'opportunities': ["• 신규 시즌 판매율 극대화"],
+    },
+}
+
+# Period별 정성 문구 (템플릿 항목 뒤에 추가)
+INSIGHT_NOTES = {
+    ('hongkong', '2510'): {
+        'warnings': ["• 직접비 관리: 임차료 및 인건비 비중 모니터링 필요", "• 적자 매장 관리: 일부 매장 개선 필요"],
+        'opportunities': ["• 흑자 매장 성장세 유지", "• 평당매출 효율화 가능", "• 재고 최적화 기회"],
+    },
+    ('hongkong', '2511'): {
+        'warnings': ["• 11월 운영 현황 점검", "• 직접비 최적화 진행 중", "• 매장별 수익성 모니터링"],
+        'opportunities': ["• 연말 시즌 대비 전략", "• 흑자 매장 모범 사례 확산", "• 온라인 채널 확대"],
+    },
+    ('hongkong', '2512'): {
+        'warnings': ["• 12월 연말 시즌 운영 점검", "• 직접비 최적화 진행 중", "• 매장별 수익성 모니터링"],
+        'opportunities': ["• 연말 시즌 매출 극대화", "• 흑자 매장 모범 사례 확산", "• 온라인 채널 확대"],
+    },
+    ('taiwan', '2511'): {
+        'warnings': ["• 11월 운영 현황 모니터링", "• 연말 시즌 재고 관리", "• Discovery 브랜드 성장 전략"],
+        'opportunities': ["• 온라인 성장 모멘텀 유지", "• 신규 시즌 판매율 극대화", "• 아울렛 효율성 제고"],
+    },
+    ('taiwan', '2512'): {
+        'warnings': [
+            "**Discovery 25년 누적 영업손실** -2,344K<br/>  • 온라인2개, 오프라인 3개점<br/>  • 26년 5월 10월 총 2개점 오픈 예정",
+        ],
+        'opportunities': [
+            "**1-2월 합계 매출** YOY 105% 목표 (춘절 당년 2월, 전년 1월)",
+            "**2026년 연간 매출목표** YOY 106%",
+            "**2026년 MLB매장 신규오픈** (빅시티, A11, 한신아레나 타이중점)",
+            "**2026년 과시즌2년차(23F)재고** 집중 소진 예정",
+        ],
+    },
+}
+
+_FORMATTER = string.Formatter()
+
+
+def template_fields(template):
+    """템플릿이 참조하는 지표 이름"""
+    return {field for _, field, _, _ in _FORMATTER.parse(template) if field}
+
+
+def build_context(period, metrics):
+    """KPI + 표시용 파생값 (월 이름, 흑자/적자, 전년비 변화)"""
+    context = dict(metrics)
+    context['month_name'] = f"{int(period) % 100}월"
+    for prefix in ['operating_profit', 'cumulative_operating_profit']:
+        if prefix in metrics:
+            context[f'{prefix}_status'] = '흑자' if metrics[prefix] >= 0 else '적자'
+        if f'{prefix}_rate' in metrics and f'{prefix}_rate_prev' in metrics:
+            context[f'{prefix}_rate_change'] = metrics[f'{prefix}_rate'] - metrics[f'{prefix}_rate_prev']
+    return context
+
+
+def render_items(templates, context):
+    """필요한 값이 모두 있는 템플릿만 렌더링"""
+    return [t.format(**context) for t in templates if template_fields(t) <= context.keys()]
+
+
+def render_insights(region, period, metrics):
+    """지역/Period KPI → CEO 인사이트 dict"""
+    context = build_context(period, metrics)
+    notes = INSIGHT_NOTES.get((region, period), DEFAULT_NOTES[region])
+    insights = {'period': period, 'month_name': context['month_name'], 'source': GENERATED_SOURCE}
+    for section, template in INSIGHT_TEMPLATES[region].items():
+        items = render_items(template.get('items', []) + notes.get(section, []), context)
+        insights[section] = {'title': template['title'], 'items': items}
+    return insights
+
+
+def is_manual(path):
+    """직접 작성한 인사이트 파일인지 (생성기 source 표시 없음)"""
+    return os.path.exists(path) and load_json(path).get('source') != GENERATED_SOURCE
+
+
+def generate_insights(periods=None, regions=None, kpi_file=KPI_TABLE_FILE, overwrite=False):
+    """KPI 테이블의 지역/Period별 인사이트 생성 후 저장"""
+    grouped = kpi_frame(load_kpi_table(kpi_file))
+    targets = [
+        (region, period) for region, period in sorted(grouped)
+        if region in INSIGHT_TEMPLATES and REQUIRED_METRIC in grouped[(region, period)]
+        and (not periods or period in periods)
+        and (not regions or region in regions)
+    ]
+    with ArtifactWriter() as writer:
+        for region, period in targets:
+            output_file = OUTPUT_FILE.format(region=region, period=period)
+            if not overwrite and is_manual(output_file):
+                print(f"  [{region} {period}] 직접 작성된 파일 보존: {output_file}")
+                continue
+            insights = render_insights(region, period, grouped[(region, period)])
+            writer.write(output_file, insights)
+            print(f"  [{region} {period}] 핵심성과 {len(insights['executive_summary']['items'])}개")
+    return targets
+
+
+if __name__ == '__main__':
+    overwrite = '--overwrite' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--overwrite']
+    periods = args[0:1]
+    regions = args[1:2]
+
+    print("=" * 80)
+    print("CEO 인사이트 데이터 생성")
+    print("=" * 80)
+
+    targets = generate_insights(periods, regions, overwrite=overwrite)
+    if not targets:
+        print(f"KPI 데이터가 없습니다: {KPI_TABLE_FILE} (python kpi_table.py 로 재구성)")
+        sys.exit(1)
+
+    print(f"\n[OK] CEO 인사이트 {len(targets)}개 생성 완료")
+    print("\n" + "=" * 80)
@@ -732,6 +732,10 @@ else:
 with open(output_file, 'w', encoding='utf-8') as f:
     json.dump(pl_data, f, ensure_ascii=False, indent=2)
 
+# 매니페스트 갱신 (콘텐츠 해시 URL)
+from dashboard_manifest import update_manifest
+update_manifest([output_file])
+
 print(f"\n[OK] 완전한 손익요약 표 데이터 생성 완료: {output_file}")
 print(f"\n당월 데이터 (2512) - HK+MC:")
 print(f"  - Tag매출액: {current_month_total['tag_sales']:,.0f}K HKD")
@@ -9,6 +9,8 @@ import os
 from collections import defaultdict
 from datetime import datetime
 
+from stage_profiler import instrument_cli, staged
+
 # Store Code 분류
 OUTLET_CODES = {'M07', 'M13', 'M15', 'M21'}
 ONLINE_MLB_CODES = {'HE1', 'HE2'}
@@ -83,6 +85,7 @@ def calculate_discount_rate(gross_sales, net_sales):
         return 0
     return ((gross_sales - net_sales) / gross_sales) * 100
 
+@staged()
 def read_csv_data(file_path):
     """CSV 파일 읽기"""
     data = []
@@ -96,6 +99,7 @@ def read_csv_data(file_path):
     
     return data, sorted(periods)
 
+@staged(rows=None)
 def generate_cumulative_dashboard_data(csv_file_path, output_file_path, target_period='2511'):
     """누적 대시보드용 데이터 생성 (1월~target_period 누적)
     
@@ -906,6 +910,10 @@ def generate_cumulative_dashboard_data(csv_file_path, output_file_path, target_p
     with open(output_file_path, 'w', encoding='utf-8') as f:
         json.dump(result, f, ensure_ascii=False, indent=2)
     
+    # 매니페스트 갱신 (콘텐츠 해시 URL)
+    from dashboard_manifest import update_manifest
+    update_manifest([output_file_path])
+    
     print("완료!")
     print(f"  - 누적 기간: {start_period} ~ {target_period} ({len(cumulative_periods)}개월)")
     print(f"  - Store 수: {len(store_summary)}")
@@ -916,6 +924,7 @@ def generate_cumulative_dashboard_data(csv_file_path, output_file_path, target_p
     print(f"  - 추세 데이터 포인트: {len(trend_data)}")
 
 if __name__ == '__main__':
+    instrument_cli()
     csv_file = '../Dashboard_Raw_Data/HKMC/2512/HKMC_Inventory_2512.csv'
     output_file = 'public/dashboard/hongkong-dashboard-cumulative-2512.json'
     
@@ -149,6 +149,10 @@ with open('public/dashboard/hongkong-ceo-insights-2512.json', 'w', encoding='utf
 with open('public/dashboard/hongkong-dashboard-summary-2512.json', 'w', encoding='utf-8') as f:
     json.dump(dashboard_summary, f, ensure_ascii=False, indent=2)
 
+# 매니페스트 갱신 (콘텐츠 해시 URL)
+from dashboard_manifest import update_manifest
+update_manifest(['public/dashboard/hongkong-ceo-insights-2512.json', 'public/dashboard/hongkong-dashboard-summary-2512.json'])
+
 print("완료: public/dashboard/hongkong-ceo-insights-2512.json")
 print("완료: public/dashboard/hongkong-dashboard-summary-2512.json")
 if mlb_summary:
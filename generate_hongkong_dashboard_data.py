@@ -441,6 +441,10 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
     with open(output_file_path, 'w', encoding='utf-8') as f:
         json.dump(result, f, ensure_ascii=False, indent=2)
     
+    # 매니페스트 갱신 (콘텐츠 해시 URL)
+    from dashboard_manifest import update_manifest
+    update_manifest([output_file_path])
+    
     print("완료!")
     print(f"  - Store 수: {len(store_summary)}")
     print(f"  - 시즌 수: {len(season_summary)}")
@@ -1,83 +1,41 @@
-import pandas as pd
-import json
-from decimal import Decimal
+from dashboard_writer import ArtifactWriter
+from opex_engine import HK_OPEX_TREE, PL_SUMMARY_TREE, OpexEngine
+from pl_table import load_pl_table
 
-# CSV 파일 읽기
-csv_file = r"D:\Cursor_work_space\HKMCTW_Dashboard\Dashboard_Raw_Data\HKMC\2512\HKMC PL MLB 2512.csv"
-df = pd.read_csv(csv_file, encoding='utf-8-sig')
+RAW_DIR = r"D:\Cursor_work_space\HKMCTW_Dashboard\Dashboard_Raw_Data"
 
-# VALUE를 숫자로 변환
-df['VALUE'] = pd.to_numeric(df['VALUE'], errors='coerce').fillna(0)
-df['PERIOD'] = pd.to_numeric(df['PERIOD'], errors='coerce').astype('Int64')
+# 영업비 범위: (PL CSV, 계정 트리, 오피스 필터, 통화) — MLB / DX (HK M99, 1K HKD), TW (T99, 1K TWD)
+OPEX_SCOPES = {
+    'MLB': (RAW_DIR + r"\HKMC\2512\HKMC PL MLB 2512.csv", HK_OPEX_TREE, {'country': 'HK', 'brand': 'M', 'shops': 'M99'}, 'HKD'),
+    'DX': (RAW_DIR + r"\HKMC\2512\HKMC PL Discovery 2512.csv", HK_OPEX_TREE, {'country': 'HK', 'brand': 'X', 'shops': 'M99'}, 'HKD'),
+    'TW': (RAW_DIR + r"\TW\2512\TW_PL_2512.csv", PL_SUMMARY_TREE, {'country': 'TW', 'brand': 'M', 'shops': 'T99'}, 'TWD'),
+}
+
+# CSV 파일 읽기 (파일별 1회 → PL 팩트 테이블, 계정 트리별 엔진)
+tables = {}
+engines = {}
+for scope, (csv_file, tree, _, _) in OPEX_SCOPES.items():
+    if csv_file not in tables:
+        tables[csv_file] = load_pl_table(csv_file)
+    engines[scope] = OpexEngine(tables[csv_file], tree)
 
 # HK 국가, 브랜드 M, M99 매장만 사용
-df_hk = df[(df['CNTRY_CD'] == 'HK') & (df['BRD_CD'] == 'M') & (df['SHOP_CD'] == 'M99')].copy()
+hk_engine = engines['MLB']
+hk_filters = OPEX_SCOPES['MLB'][2]
 
 print(f'필터링: HK 국가, 브랜드 M, M99 매장만')
-print(f'필터링 후 행 수: {len(df_hk)}')
+print(f'필터링 후 행 수: {hk_engine.table.rows(**hk_filters)}')
 
 print('\n=== 영업비 재계산 시작 ===\n')
 
-# 계정 매핑 - 이미지 리스트의 계정들만 사용
-ACCOUNT_MAPPING = {
-    'salary': ['1. 급 여'],
-    'marketing': ['9. 광고선전비'],
-    'fee': ['10. 지급수수료', '12. 기타 수수료(매장관리비 외)'],
-    'rent': ['4. 임차료'],
-    'insurance': ['13. 보험료'],
-    'travel': ['2. TRAVEL & MEAL'],
-}
-
-# 기타에 포함될 계정들
-OTHER_ACCOUNTS = [
-    '3. 피복비(유니폼)',
-    '5. 유지보수비',
-    '6. 수도광열비',
-    '7. 소모품비',
-    '8. 통신비',
-    '11. 운반비',
-    '14. 감가상각비'
-]
-
-def calculate_expense(df_filtered, account_list):
-    """특정 계정 리스트의 합계 계산"""
-    total = 0
-    for account in account_list:
-        value = df_filtered[df_filtered['ACCOUNT_NM'] == account]['VALUE'].sum()
-        total += value
-    return total
-
-def calculate_expenses_for_period(df_data, period_start, period_end):
-    """특정 기간의 영업비 계산"""
-    df_period = df_data[(df_data['PERIOD'] >= period_start) & (df_data['PERIOD'] <= period_end)]
-    
-    expenses = {}
+def calculate_expenses_for_period(period_start, period_end):
+    """특정 기간의 영업비 계산 (계정 트리 카테고리 + 기타 상세)"""
+    breakdown = hk_engine.breakdown(period_start, period_end, **hk_filters)
     
-    # 각 항목 계산
-    for key, accounts in ACCOUNT_MAPPING.items():
-        expenses[key] = calculate_expense(df_period, accounts)
+    expenses = {key: breakdown[key] for key in ['salary', 'marketing', 'fee', 'rent', 'insurance', 'travel', 'other']}
     
-    # 기타 계산
-    expenses['other'] = calculate_expense(df_period, OTHER_ACCOUNTS)
-    
-    # 기타 상세
-    expenses['other_detail'] = {}
-    other_detail_labels = {
-        '11. 운반비': '물류비',
-        '14. 감가상각비': '감가상각비',
-        '5. 유지보수비': '유지보수비',
-        '6. 수도광열비': '수도광열비',
-        '7. 소모품비': '소모품비',
-        '8. 통신비': '통신비',
-        '3. 피복비(유니폼)': '피복비'
-    }
-    
-    for account in OTHER_ACCOUNTS:
-        value = df_period[df_period['ACCOUNT_NM'] == account]['VALUE'].sum()
-        if value != 0:
-            # 한글 라벨 사용
-            label = other_detail_labels.get(account, account.strip().replace('.', '').replace(' ', '_').replace('-', '').lower())
-            expenses['other_detail'][label] = round(value, 2)
+    # 기타 상세 (0이 아닌 항목만, 한글 라벨)
+    expenses['other_detail'] = {label: round(value, 2) for label, value in breakdown['other_detail'].items() if value != 0}
     
     # 전체 영업비
     expenses['total'] = sum([expenses[k] for k in ['salary', 'marketing', 'fee', 'rent', 'insurance', 'travel', 'other']])
@@ -86,19 +44,19 @@ def calculate_expenses_for_period(df_data, period_start, period_end):
 
 # 당월 계산 (202512)
 print('당월 202512 계산 중...')
-current_month = calculate_expenses_for_period(df_hk, 202512, 202512)
+current_month = calculate_expenses_for_period(202512, 202512)
 
 # 전년 당월 (202412)
 print('전년 당월 202412 계산 중...')
-prev_month = calculate_expenses_for_period(df_hk, 202412, 202412)
+prev_month = calculate_expenses_for_period(202412, 202412)
 
 # 누적 계산 (202501-202512)
 print('누적 202501-202512 계산 중...')
-cumulative = calculate_expenses_for_period(df_hk, 202501, 202512)
+cumulative = calculate_expenses_for_period(202501, 202512)
 
 # 전년 누적 (202401-202412)
 print('전년 누적 202401-202412 계산 중...')
-prev_cumulative = calculate_expenses_for_period(df_hk, 202401, 202412)
+prev_cumulative = calculate_expenses_for_period(202401, 202412)
 
 # 결과 출력
 print('\n=== 당월 (202512) ===')
@@ -207,9 +165,20 @@ output_data = {
     }
 }
 
-# JSON 파일로 저장
-output_file = 'public/dashboard/hongkong-opex-2512.json'
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(output_data, f, ensure_ascii=False, indent=2)
+# MLB / DX / TW 영업비 상세 (당월 / 누적 / 전년 / YOY) 통합
+# 범위마다 통화가 다르므로(HKD / TWD) 범위별 currency / unit 표기, 범위 간 합산 없음
+combined = {
+    scope: {'currency': currency, 'unit': f'1K {currency}', **engines[scope].report(202512, **filters)}
+    for scope, (_, _, filters, currency) in OPEX_SCOPES.items()
+}
+
+# JSON 파일로 저장 (원자적 저장 / 변경 없으면 생략 / 매니페스트 갱신)
+print()
+with ArtifactWriter() as writer:
+    writer.write('public/dashboard/hongkong-opex-2512.json', output_data)
+    writer.write('public/dashboard/opex-breakdown-2512.json', combined)
 
-print(f'\n저장 완료: {output_file}')
+for scope, report in combined.items():
+    current_total = sum(v for k, v in report['current_month'].items() if k != 'other_detail')
+    cumulative_total = sum(v for k, v in report['cumulative'].items() if k != 'other_detail')
+    print(f"  {scope} 영업비 ({report['unit']}): 당월 {current_total:,.0f} / 누적 {cumulative_total:,.0f}")
@@ -234,6 +234,10 @@ os.makedirs(os.path.dirname(output_file), exist_ok=True)
 with open(output_file, 'w', encoding='utf-8') as f:
     json.dump(pl_data, f, ensure_ascii=False, indent=2)
 
+# 매니페스트 갱신 (콘텐츠 해시 URL)
+from dashboard_manifest import update_manifest
+update_manifest([output_file])
+
 print(f"\n[OK] 손익요약 표 데이터 생성 완료: {output_file}")
 print(f"\n당월 데이터:")
 print(f"  - Tag매출액: {tag_cur:,.0f}K HKD")
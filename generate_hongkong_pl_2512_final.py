@@ -7,6 +7,10 @@ import json
 from collections import defaultdict
 from datetime import datetime
 
+from channel_sums import CHANNEL_SALES_TREE, HKMC_CHANNEL_KEYS, ChannelSums, hkmc_channel
+from dashboard_manifest import update_manifest
+from pl_table import load_pl_table
+
 def clean_number(value):
     """숫자 문자열에서 쉼표와 공백 제거 후 float 변환"""
     if value is None or value == '':
@@ -211,88 +215,50 @@ def aggregate_pl_by_period(csv_file, period, country_filter='HK'):
     
     return result
 
-def aggregate_pl_by_country_channel(csv_file, period, country_channel):
-    """국가-채널별 손익 데이터 집계 (특정 기간)
-    
-    country_channel: 'HK_Retail', 'HK_Outlet', 'HK_Online', 'MC_Retail', 'MC_Outlet'
-    """
+def channel_result(tag_sales, net_sales):
+    """채널 Tag / 실판매출 → {'tag_sales', 'net_sales', 'discount_rate'}"""
     result = {
-        'tag_sales': 0.0,
-        'net_sales': 0.0,
+        'tag_sales': tag_sales,
+        'net_sales': net_sales,
         'discount_rate': 0.0
     }
     
-    # 채널 필터 정의
-    channel_filters = {
-        'HK_Retail': lambda row: row['CNTRY_CD'] == 'HK' and row['CHNL_CD'] == 'A',
-        'HK_Outlet': lambda row: row['CNTRY_CD'] == 'HK' and row['CHNL_CD'] == 'F',
-        'HK_Online': lambda row: row['CNTRY_CD'] == 'HK' and row['CHNL_CD'] == 'O',
-        'MC_Retail': lambda row: row['CNTRY_CD'] == 'MO' and row['CHNL_CD'] == 'A',
-        'MC_Outlet': lambda row: row['CNTRY_CD'] == 'MO' and row['CHNL_CD'] == 'F'
-    }
-    
-    channel_filter = channel_filters.get(country_channel)
-    if not channel_filter:
-        return result
-    
-    with open(csv_file, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row['BRD_CD'] != 'M':  # MLB만
-                continue
-            if int(row['PERIOD']) != period:
-                continue
-            if not channel_filter(row):
-                continue
-            
-            account_nm = row['ACCOUNT_NM'].strip()
-            value = clean_number(row['VALUE'])
-            
-            if account_nm in ['실판매출', '실매출액']:
-                result['net_sales'] += value
-            elif account_nm == 'Tag매출액':
-                result['tag_sales'] += value
-    
     # 할인율 계산
-    if result['tag_sales'] > 0:
-        result['discount_rate'] = (1 - result['net_sales'] / result['tag_sales']) * 100
+    if tag_sales > 0:
+        result['discount_rate'] = (1 - net_sales / tag_sales) * 100
     
     return result
 
+_channel_sums = {}
+
+def get_channel_sums(csv_file):
+    """MLB 국가-채널 × Tag / 실판매출 누적합 (PL 파일당 1회 로드)"""
+    if csv_file not in _channel_sums:
+        _channel_sums[csv_file] = ChannelSums.from_table(load_pl_table(csv_file), hkmc_channel, CHANNEL_SALES_TREE, brand='M')
+    return _channel_sums[csv_file]
+
+def aggregate_pl_by_country_channel(csv_file, period, country_channel):
+    """국가-채널별 손익 데이터 집계 (특정 기간)
+    
+    country_channel: 'HK_Retail', 'HK_Outlet', 'HK_Online', 'MC_Retail', 'MC_Outlet'
+    """
+    if country_channel not in HKMC_CHANNEL_KEYS:
+        return channel_result(0.0, 0.0)
+    
+    month_data = get_channel_sums(csv_file).window(period)[country_channel]
+    return channel_result(month_data['tag_sales'], month_data['net_sales'])
+
 def aggregate_cumulative_channels(csv_file, start_year_month, end_year_month):
-    """누적 기간의 채널별 데이터 집계
+    """누적 기간의 채널별 데이터 집계 (채널 누적합 차이)
     
     start_year_month: 202501 (2025년 1월)
     end_year_month: 202512 (2025년 12월)
     """
-    channels = {
-        'HK_Retail': {'tag_sales': 0.0, 'net_sales': 0.0, 'discount_rate': 0.0},
-        'HK_Outlet': {'tag_sales': 0.0, 'net_sales': 0.0, 'discount_rate': 0.0},
-        'HK_Online': {'tag_sales': 0.0, 'net_sales': 0.0, 'discount_rate': 0.0},
-        'MC_Retail': {'tag_sales': 0.0, 'net_sales': 0.0, 'discount_rate': 0.0},
-        'MC_Outlet': {'tag_sales': 0.0, 'net_sales': 0.0, 'discount_rate': 0.0}
+    window = get_channel_sums(csv_file).window(start_year_month, end_year_month)
+    return {
+        channel_name: channel_result(data['tag_sales'], data['net_sales'])
+        for channel_name, data in window.items()
     }
-    
-    # 연도와 시작/종료 월 추출
-    start_year = start_year_month // 100
-    end_year = end_year_month // 100
-    start_month = start_year_month % 100
-    end_month = end_year_month % 100
-    
-    # 각 월별로 데이터 수집
-    for month in range(start_month, end_month + 1):
-        period = start_year * 100 + month
-        for channel_name in channels.keys():
-            month_data = aggregate_pl_by_country_channel(csv_file, period, channel_name)
-            channels[channel_name]['tag_sales'] += month_data['tag_sales']
-            channels[channel_name]['net_sales'] += month_data['net_sales']
-    
-    # 할인율 재계산
-    for channel_name, data in channels.items():
-        if data['tag_sales'] > 0:
-            data['discount_rate'] = (1 - data['net_sales'] / data['tag_sales']) * 100
-    
-    return channels
 
 # PL CSV 파일 경로
 pl_file = r"D:\Cursor_work_space\HKMCTW_Dashboard\Dashboard_Raw_Data\HKMC\2512\HKMC PL 2512.csv"
@@ -1176,6 +1142,9 @@ os.makedirs(os.path.dirname(output_file), exist_ok=True)
 with open(output_file, 'w', encoding='utf-8') as f:
     json.dump(pl_data, f, ensure_ascii=False, indent=2)
 
+# 매니페스트 갱신 (콘텐츠 해시 URL)
+update_manifest([output_file])
+
 print(f"\n[OK] 손익요약 표 데이터 생성 완료: {output_file}")
 print(f"\n당월 데이터 (2512):")
 print(f"  [홍콩]")
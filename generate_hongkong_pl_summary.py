@@ -6,7 +6,11 @@ import csv
 import json
 from collections import defaultdict
 from datetime import datetime
-import re
+
+from channel_sums import get_store_channel
+from opex_engine import PL_SUMMARY_TREE, OpexEngine
+from pl_table import PLTable
+from stage_profiler import instrument_cli, staged
 
 def parse_period(period_str):
     """Period 문자열을 파싱 (예: 202510 -> 2025, 10)"""
@@ -20,36 +24,7 @@ def parse_period(period_str):
         return year, month
     return None, None
 
-# Store Code 분류 (대만)
-def is_mlb_retail(store_code):
-    """MLB 리테일 (T로 시작하는 숫자)"""
-    return bool(re.match(r'^T\d+$', store_code))
-
-def is_mlb_online(store_code):
-    """MLB 온라인 (TE로 시작)"""
-    return store_code.startswith('TE')
-
-def is_mlb_outlet(store_code):
-    """MLB 아울렛 (TU로 시작)"""
-    return store_code.startswith('TU')
-
-def is_discovery_retail(store_code):
-    """Discovery 리테일 (D로 시작하는 숫자)"""
-    return bool(re.match(r'^D\d+$', store_code))
-
-def is_discovery_online(store_code):
-    """Discovery 온라인 (DE로 시작)"""
-    return store_code.startswith('DE')
-
-def get_store_channel(store_code):
-    """Store Code를 기반으로 채널 반환"""
-    if is_mlb_outlet(store_code) or is_discovery_retail(store_code):  # 아울렛은 없을 수도 있음
-        return 'Outlet'
-    elif is_mlb_online(store_code) or is_discovery_online(store_code):
-        return 'Online'
-    else:
-        return 'Retail'
-
+@staged()
 def read_pl_database(csv_file, brand_filter=None, include_office=False):
     """손익 데이터베이스 읽기"""
     pl_data = []
@@ -108,76 +83,18 @@ def get_dx_sg_a(pl_data, period):
             sg_a += clean_number(row['VALUE'])
     return sg_a
 
-def get_mlb_expense_detail(pl_data, period):
-    """MLB 영업비 상세 항목 추출 (T99 오피스, BRD_CD='M'만)"""
-    expense_detail = {
-        'salary': 0.0,      # 급여 (SAL_EXP)
-        'marketing': 0.0,   # 광고선전비 (AD_EXP)
-        'fee': 0.0,         # 지급수수료 (COMM_EXP)
-        'rent': 0.0,        # 임차료 (FIX_RENT)
-        'insurance': 0.0,    # 보험료 (INS_EXP)
-        'travel': 0.0,      # 여비교통비 (TRVL_MEAL_EXP)
-        'other': 0.0,       # 기타
-        'other_detail': {}  # 기타 상세 항목
-    }
-    
-    # 기타 항목 계정 정의
-    other_accounts = {
-        'depreciation': {'code': 'DEPR_EXP', 'name': '14. 감가상각비', 'label': '감가상각비'},
-        'duty_free': {'code': 'DUTY_FREE_EXP', 'name': '15. 면세점 직접비', 'label': '면세점 직접비'},
-        'govt_license': {'code': 'GOVT_LICEN_FEES', 'name': ' - Government Rate & License Fee', 'label': '정부세금 및 라이센스'},
-        'logistics': {'code': 'LGT_EXP', 'name': '11. 운반비', 'label': '운반비'},
-        'maintenance': {'code': 'MAINT_EXP', 'name': '5. 유지보수비', 'label': '유지보수비'},
-        'other_fee': {'code': 'OTHER_FEE_EXP', 'name': '12. 기타 수수료(매장관리비 외)', 'label': '기타 수수료'},
-        'rent_free': {'code': 'RENT_FREE_CONC', 'name': ' - Rent free / Rent concession', 'label': '임대료 면제/할인'},
-        'retirement': {'code': 'RET_PEN_EXP', 'name': ' - EMPLOYEE BENEFIT PROGRAMS', 'label': '퇴직연금'},
-        'supplies': {'code': 'SUPPLIES_EXP', 'name': '7. 소모품비', 'label': '소모품비'},
-        'transport': {'code': 'TRANS_EXP', 'name': '운반비', 'label': '운반비(기타)'},
-        'uniform': {'code': 'UNIFORM_EXP', 'name': '3. 피복비(유니폼)', 'label': '피복비(유니폼)'},
-        'utilities': {'code': 'UTILITIES_EXP', 'name': '6. 수도광열비', 'label': '수도광열비'},
-        'var_rent': {'code': 'VAR_RENT', 'name': ' - Turnover Rates', 'label': '매출연동 임대료'},
-        'communication': {'code': 'COMMUNI_EXP', 'name': '8. 통신비', 'label': '통신비'},
-        'bonus': {'code': 'BON_EXP', 'name': ' - Final Payment', 'label': '최종지급금'}
-    }
-    
-    # 기타 상세 초기화
-    for key in other_accounts:
-        expense_detail['other_detail'][key] = 0.0
-    
-    for row in pl_data:
-        if (row['PERIOD'] == period and 
-            row['SHOP_CD'] == 'T99' and 
-            row['BRD_CD'] == 'M'):  # MLB만
-            
-            account_cd = row['ACCOUNT_CD'].strip()
-            account_nm = row['ACCOUNT_NM'].strip()
-            value = clean_number(row['VALUE'])
-            
-            # 계정 코드 또는 계정명으로 매핑
-            if account_cd == '급여' or account_nm == ' - Payroll' or account_nm == '1. 급 여':
-                expense_detail['salary'] += value
-            elif account_cd == '광고비' or account_nm == '9. 광고선전비':
-                expense_detail['marketing'] += value
-            elif account_cd == '지급수수료 일반' or account_nm == '10. 지급수수료':
-                expense_detail['fee'] += value
-            elif account_cd == '임차료' or account_nm == ' - Base Rent' or account_nm == '4. 임차료':
-                expense_detail['rent'] += value
-            elif account_cd == '보험료' or account_nm == '13. 보험료':
-                expense_detail['insurance'] += value
-            elif account_cd == '여비교통비' or account_nm == '2. TRAVEL & MEAL':
-                expense_detail['travel'] += value
-            else:
-                # 기타 항목들 분류
-                for key, account_info in other_accounts.items():
-                    if account_cd == account_info['code'] or account_nm == account_info['name']:
-                        expense_detail['other_detail'][key] += value
-                        break
-    
-    # 기타 항목 합계 계산
-    expense_detail['other'] = sum(expense_detail['other_detail'].values())
-    
-    return expense_detail
+@staged(rows=None)
+def get_mlb_expense_detail(pl_data, period, end_period=None, opex=None):
+    """MLB 영업비 상세 항목 추출 (T99 오피스, BRD_CD='M'만)
+
+    계정 매핑은 opex_engine.PL_SUMMARY_TREE (계정 코드 또는 계정명), period ~ end_period 구간 합계
+    opex: pl_data로 만든 OpexEngine (여러 Period 조회 시 재사용, 없으면 새로 집계)
+    """
+    if opex is None:
+        opex = OpexEngine(PLTable(pl_data), PL_SUMMARY_TREE)
+    return opex.breakdown(period, end_period, brand='M', shops='T99')
 
+@staged(rows=None)
 def aggregate_pl_by_period(pl_data, period, country=None, channel=None):
     """특정 Period의 손익 데이터 집계"""
     result = defaultdict(float)
@@ -224,6 +141,7 @@ def aggregate_pl_by_period(pl_data, period, country=None, channel=None):
     
     return result
 
+@staged(rows=None)
 def calculate_store_direct_profit(pl_data, latest_period, prev_period):
     """매장별 영업이익 계산 (직접이익으로 표시하지만 실제로는 영업이익 사용)"""
     stores = {}
@@ -386,6 +304,7 @@ def calculate_store_direct_profit(pl_data, latest_period, prev_period):
     
     return stores
 
+@staged(rows=None)
 def calculate_cumulative_store_data(pl_data, periods):
     """매장별 누적 데이터 계산 (급여, 임차료, 감가상각비 등 모든 직접비 항목)"""
     stores = {}
@@ -453,6 +372,7 @@ def calculate_cumulative_store_data(pl_data, periods):
     
     return stores
 
+@staged(rows=None)
 def calculate_pl_summary(pl_data, latest_period, prev_period):
     """손익요약 계산"""
     
@@ -655,6 +575,7 @@ def calculate_pl_summary(pl_data, latest_period, prev_period):
         },
     }
 
+@staged(rows=None)
 def main(target_period_short=None):
     """PL Summary 생성
     
@@ -752,8 +673,10 @@ def main(target_period_short=None):
     print(f"  전년 ({prev_period_full}): {mlb_sg_a_prev:,.2f}")
     
     # 영업비 상세 항목 추출
-    expense_detail = get_mlb_expense_detail(pl_data_with_office, latest_period_full)
-    expense_detail_prev = get_mlb_expense_detail(pl_data_with_office, prev_period_full)
+    # 계정 트리 × Period 1회 집계 (당월 / 전년 / 누적 상세 공용)
+    opex = OpexEngine(PLTable(pl_data_with_office), PL_SUMMARY_TREE)
+    expense_detail = get_mlb_expense_detail(pl_data_with_office, latest_period_full, opex=opex)
+    expense_detail_prev = get_mlb_expense_detail(pl_data_with_office, prev_period_full, opex=opex)
     print(f"\n영업비 상세 항목 (당월):")
     for key, value in expense_detail.items():
         if key != 'other_detail':
@@ -779,51 +702,11 @@ def main(target_period_short=None):
     print(f"  누적 (1~{latest_month}월): {cum_sg_a:,.2f}")
     print(f"  전년 누적 (1~{prev_month}월): {cum_sg_a_prev:,.2f}")
     
-    # 누적 영업비 상세 항목 계산
-    # 기타 상세 항목 키 초기화
-    other_accounts = ['depreciation', 'duty_free', 'govt_license', 'logistics', 'maintenance', 
-                     'other_fee', 'rent_free', 'retirement', 'supplies', 'transport', 
-                     'uniform', 'utilities', 'var_rent', 'communication', 'bonus']
-    
-    cum_expense_detail = {
-        'salary': 0.0,
-        'marketing': 0.0,
-        'fee': 0.0,
-        'rent': 0.0,
-        'insurance': 0.0,
-        'travel': 0.0,
-        'other': 0.0,
-        'other_detail': {}
-    }
-    cum_expense_detail_prev = {
-        'salary': 0.0,
-        'marketing': 0.0,
-        'fee': 0.0,
-        'rent': 0.0,
-        'insurance': 0.0,
-        'travel': 0.0,
-        'other': 0.0,
-        'other_detail': {}
-    }
-    
-    # 기타 상세 항목 초기화
-    for key in other_accounts:
-        cum_expense_detail['other_detail'][key] = 0.0
-        cum_expense_detail_prev['other_detail'][key] = 0.0
-    
-    for period in cumulative_periods:
-        period_detail = get_mlb_expense_detail(pl_data_with_office, period)
-        for key in ['salary', 'marketing', 'fee', 'rent', 'insurance', 'travel', 'other']:
-            cum_expense_detail[key] += period_detail[key]
-        for key in other_accounts:
-            cum_expense_detail['other_detail'][key] += period_detail.get('other_detail', {}).get(key, 0.0)
-    
-    for period in prev_cumulative_periods:
-        period_detail = get_mlb_expense_detail(pl_data_with_office, period)
-        for key in ['salary', 'marketing', 'fee', 'rent', 'insurance', 'travel', 'other']:
-            cum_expense_detail_prev[key] += period_detail[key]
-        for key in other_accounts:
-            cum_expense_detail_prev['other_detail'][key] += period_detail.get('other_detail', {}).get(key, 0.0)
+    # 누적 영업비 상세 항목 계산 (Period 누적합 구간)
+    cum_expense_detail = get_mlb_expense_detail(
+        pl_data_with_office, cumulative_periods[0], cumulative_periods[-1], opex=opex)
+    cum_expense_detail_prev = get_mlb_expense_detail(
+        pl_data_with_office, prev_cumulative_periods[0], prev_cumulative_periods[-1], opex=opex)
     
     print(f"\n영업비 상세 항목 (누적):")
     for key, value in cum_expense_detail.items():
@@ -1558,7 +1441,6 @@ def main(target_period_short=None):
     }
     
     # JSON 파일 저장 (period별 + 기본 파일)
-    import shutil
     if target_period_short:
         output_file = f'components/dashboard/hongkong-pl-data-{target_period_short}.json'
         public_file = f'public/dashboard/hongkong-pl-data-{target_period_short}.json'
@@ -1566,11 +1448,16 @@ def main(target_period_short=None):
         output_file = 'components/dashboard/hongkong-pl-data.json'
         public_file = 'public/dashboard/hongkong-pl-data.json'
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(pl_json_data, f, ensure_ascii=False, indent=2)
+    # public 폴더에도 저장 (원자적 저장, 변경 없으면 생략, 매니페스트 자동 갱신)
+    from dashboard_writer import ArtifactWriter
+    with ArtifactWriter() as writer:
+        writer.write(output_file, pl_json_data)
+        writer.write(public_file, pl_json_data)
     
-    # public 폴더에도 복사
-    shutil.copy(output_file, public_file)
+    # KPI 테이블 갱신 (CEO 인사이트 입력)
+    if target_period_short:
+        from kpi_table import pl_kpis, record_kpis
+        record_kpis('hongkong', target_period_short, pl_kpis(pl_json_data))
     
     print(f"\nP&L 데이터가 {output_file}에 저장되었습니다.")
     print(f"Public 폴더에도 복사: {public_file}")
@@ -1585,6 +1472,7 @@ def main(target_period_short=None):
     print("기본 파일 복사 생략 (Period별 독립 데이터 유지)")
 
 if __name__ == '__main__':
+    instrument_cli()
     import sys
     # 명령줄 인자로 period 받기
     target_period = sys.argv[1] if len(sys.argv) > 1 else None
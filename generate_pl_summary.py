@@ -29,7 +29,7 @@ def is_discovery_online(store_code):
     return store_code.startswith('XE')
 
 def get_store_channel(store_code):
-    """Store Code를 기반으로 채널 반환"""
+    """Store Code를 기반으로 채널 반환 (홍콩 매장 코드 목록 기준 — channel_sums.get_store_channel은 대만 코드 패턴)"""
     if store_code in OUTLET_CODES:
         return 'Outlet'
     elif store_code in ONLINE_MLB_CODES or store_code in ONLINE_DX_CODES or is_discovery_online(store_code):
@@ -1591,6 +1591,10 @@ def main(target_period_short=None):
     # public 폴더에도 복사
     shutil.copy(output_file, public_file)
     
+    # 매니페스트 갱신 (콘텐츠 해시 URL)
+    from dashboard_manifest import update_manifest
+    update_manifest([public_file])
+    
     print(f"\nP&L 데이터가 {output_file}에 저장되었습니다.")
     print(f"Public 폴더에도 복사: {public_file}")
     
@@ -2,11 +2,14 @@
 """
 오프라인 매장별 현황 데이터 생성
 """
-import csv
 import json
 from collections import defaultdict
 from datetime import datetime
 
+import numpy as np
+
+from pl_tensor import STORE_PL_TREE, load_pl_tensor, store_profit
+
 def parse_period(period_str):
     """Period 문자열을 파싱 (예: 202510 -> 2025, 10)"""
     if len(period_str) == 6:
@@ -28,60 +31,21 @@ def is_offline_store(store_code):
     return store_code not in ONLINE_CODES and store_code != 'M99'
 
 def read_pl_database(csv_file):
-    """손익 데이터베이스 읽기"""
-    pl_data = []
-    with open(csv_file, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # HK와 MC만, MLB만
-            if row['CNTRY_CD'] not in ['HK', 'MC'] or row['BRD_CD'] != 'M':
-                continue
-            # 오프라인 매장만
-            if not is_offline_store(row['SHOP_CD']):
-                continue
-            pl_data.append(row)
-    return pl_data
+    """손익 텐서 로드 → (텐서, HK와 MC만 · MLB만 · 오프라인 매장만 마스크)"""
+    tensor = load_pl_tensor(csv_file)
+    offline = np.array([is_offline_store(store[2]) for store in tensor.stores], dtype=bool)
+    return tensor, tensor.store_mask(brand='M', country=['HK', 'MC']) & offline
 
-def get_store_data(pl_data, period, shop_cd):
-    """특정 매장의 특정 기간 데이터 추출"""
-    store_data = defaultdict(float)
-    
-    for row in pl_data:
-        if row['PERIOD'] != period or row['SHOP_CD'] != shop_cd:
-            continue
-        
-        account_nm = row['ACCOUNT_NM'].strip()
-        account_cd = row['ACCOUNT_CD'].strip()
-        value = float(row['VALUE'] or 0)
-        
-        # 계정별 집계
-        if account_nm == '실매출액' or account_cd == 'ACT_SALE_AMT':
-            store_data['net_sales'] += value
-        elif account_nm == 'Tag매출액' or account_cd == 'TAG_SALE_AMT':
-            store_data['tag_sales'] += value
-        elif account_nm == '매출원가' or account_cd == 'COGS':
-            store_data['cogs'] += value
-        elif account_nm == '매출총이익':
-            store_data['gross_profit'] += value
-        elif account_nm == '판매관리비':
-            store_data['selling_expense'] += value
-        elif account_nm in ['1. 급여', '1. 급 여'] or account_cd == 'LABOR_EXP':
-            store_data['labor_cost'] += value
-        elif account_nm == '4. 임차료':  # '4. 임차료' 계정 사용 (임차료율 표시용)
-            store_data['rent'] += value
-        elif account_nm == '영업이익':
-            store_data['operating_profit'] += value
-    
-    # 직접이익 = 매출총이익 - 판매관리비 (CSV 기준)
-    store_data['direct_profit'] = store_data['gross_profit'] - store_data['selling_expense']
-    
-    # 임차료/인건비율 = (임차료 + 인건비) / 실매출액 * 100
-    if store_data['net_sales'] > 0:
-        store_data['rent_labor_ratio'] = ((store_data['rent'] + store_data['labor_cost']) / store_data['net_sales']) * 100
-    else:
-        store_data['rent_labor_ratio'] = 0
-    
-    return store_data
+def get_period_data(pl_data, period):
+    """특정 기간의 매장별 데이터 추출 {SHOP_CD: 지표} (텐서 슬라이스 1회)"""
+    tensor, mask = pl_data
+    # 직접이익 = 매출총이익 - 판매관리비 (CSV 기준), 임차료/인건비율 = (임차료 + 인건비) / 실매출액 * 100
+    return {shop_cd: store_profit(measures)
+            for shop_cd, measures in tensor.shop_measures(STORE_PL_TREE, period, mask=mask).items()}
+
+def get_store_data(period_data, shop_cd):
+    """특정 매장의 기간 데이터 (행이 없으면 0)"""
+    return defaultdict(float, period_data.get(shop_cd) or store_profit({}))
 
 def calculate_yoy(current_value, previous_value):
     """YOY 계산"""
@@ -154,10 +118,11 @@ def main():
     pl_data = read_pl_database(csv_file)
     
     # 모든 오프라인 매장 목록 수집
+    tensor, offline = pl_data
     stores = set()
-    for row in pl_data:
-        if row['PERIOD'] == last_period:
-            stores.add((row['SHOP_CD'], row['SHOP_NM'], row['CNTRY_CD']))
+    for store, active in zip(tensor.stores, offline & tensor.active(last_period)):
+        if active:
+            stores.add((store[2], store[3], store[1]))
     
     # 제외 매장 정의 (분석에서 제외하되 별도 표시)
     EXCLUDED_STORES = {
@@ -169,15 +134,20 @@ def main():
     store_list = []
     excluded_store_list = []  # 제외 매장 별도 저장
     
+    # 기간별 매장 데이터 (텐서 슬라이스 1회씩)
+    current_period_data = get_period_data(pl_data, last_period)
+    previous_period_data = get_period_data(pl_data, prev_period)
+    prev_prev_period_data = get_period_data(pl_data, prev_prev_period)
+    
     for shop_cd, shop_nm, country in stores:
-        current_data = get_store_data(pl_data, last_period, shop_cd)
+        current_data = get_store_data(current_period_data, shop_cd)
 
         # 폐점 매장(최근 실매출 0) 제외
         if current_data['net_sales'] == 0:
             continue
 
-        previous_data = get_store_data(pl_data, prev_period, shop_cd)
-        prev_prev_data = get_store_data(pl_data, prev_prev_period, shop_cd)
+        previous_data = get_store_data(previous_period_data, shop_cd)
+        prev_prev_data = get_store_data(prev_prev_period_data, shop_cd)
         
         # YOY 계산 (현재년도 대비 전년도)
         yoy = calculate_yoy(current_data['net_sales'], previous_data['net_sales'])
@@ -2,11 +2,14 @@
 """
 오프라인 매장별 누적 현황 데이터 생성 - 2512용
 """
-import csv
 import json
 from collections import defaultdict
 from datetime import datetime
 
+import numpy as np
+
+from pl_tensor import STORE_PL_TREE, load_pl_tensor, names_only, store_profit
+
 def parse_period(period_str):
     """Period 문자열을 파싱 (예: 202511 -> 2025, 11)"""
     if len(period_str) == 6:
@@ -29,103 +32,28 @@ def is_offline_store(store_code):
     return store_code not in ONLINE_CODES and store_code != 'M99' and store_code not in EXCLUDED_STORES
 
 def read_pl_database(csv_file):
-    """손익 데이터베이스 읽기"""
-    pl_data = []
-    with open(csv_file, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # HK와 MC만, MLB만
-            if row['CNTRY_CD'] not in ['HK', 'MC'] or row['BRD_CD'] != 'M':
-                continue
-            # 오프라인 매장만
-            if not is_offline_store(row['SHOP_CD']):
-                continue
-            pl_data.append(row)
-    return pl_data
+    """손익 텐서 로드 → (텐서, HK와 MC만 · MLB만 · 오프라인 매장만 마스크)"""
+    tensor = load_pl_tensor(csv_file)
+    offline = np.array([is_offline_store(store[2]) for store in tensor.stores], dtype=bool)
+    return tensor, tensor.store_mask(brand='M', country=['HK', 'MC']) & offline
 
-def get_cumulative_data(pl_data, year, shop_cd):
-    """특정 매장의 연간 누적 데이터 추출 (2501-2512)"""
-    store_data = defaultdict(float)
-    
-    # 1월부터 12월까지 합계
-    for month in range(1, 13):
-        period = f"{year}{month:02d}"
-        
-        for row in pl_data:
-            if row['PERIOD'] != period or row['SHOP_CD'] != shop_cd:
-                continue
-            
-            account_nm = row['ACCOUNT_NM'].strip()
-            value = float(row['VALUE'] or 0)
-            
-            # 계정별 집계
-            if account_nm == '실매출액':
-                store_data['net_sales'] += value
-            elif account_nm == 'Tag매출액':
-                store_data['tag_sales'] += value
-            elif account_nm == '매출원가':
-                store_data['cogs'] += value
-            elif account_nm == '매출총이익':
-                store_data['gross_profit'] += value
-            elif account_nm == '판매관리비':
-                store_data['selling_expense'] += value
-            elif account_nm in ['1. 급여', '1. 급 여']:
-                store_data['labor_cost'] += value
-            elif account_nm == '4. 임차료':
-                store_data['rent'] += value
-            elif account_nm == '영업이익':
-                store_data['operating_profit'] += value
-    
-    # 직접이익 = 매출총이익 - 판매관리비
-    store_data['direct_profit'] = store_data['gross_profit'] - store_data['selling_expense']
-    
-    # 임차료/인건비율 = (임차료 + 인건비) / 실매출액 * 100
-    if store_data['net_sales'] > 0:
-        store_data['rent_labor_ratio'] = ((store_data['rent'] + store_data['labor_cost']) / store_data['net_sales']) * 100
-    else:
-        store_data['rent_labor_ratio'] = 0
-    
-    return store_data
+# 계정명만으로 지표 집계 (계정코드 매칭 없음)
+STORE_PL_NAME_TREE = names_only(STORE_PL_TREE)
 
-def get_monthly_data(pl_data, period, shop_cd):
-    """특정 매장의 특정 기간 데이터 추출 (당월용)"""
-    store_data = defaultdict(float)
-    
-    for row in pl_data:
-        if row['PERIOD'] != period or row['SHOP_CD'] != shop_cd:
-            continue
-        
-        account_nm = row['ACCOUNT_NM'].strip()
-        value = float(row['VALUE'] or 0)
-        
-        # 계정별 집계
-        if account_nm == '실매출액':
-            store_data['net_sales'] += value
-        elif account_nm == 'Tag매출액':
-            store_data['tag_sales'] += value
-        elif account_nm == '매출원가':
-            store_data['cogs'] += value
-        elif account_nm == '매출총이익':
-            store_data['gross_profit'] += value
-        elif account_nm == '판매관리비':
-            store_data['selling_expense'] += value
-        elif account_nm in ['1. 급여', '1. 급 여']:
-            store_data['labor_cost'] += value
-        elif account_nm == '4. 임차료':
-            store_data['rent'] += value
-        elif account_nm == '영업이익':
-            store_data['operating_profit'] += value
-    
-    # 직접이익 = 매출총이익 - 판매관리비
-    store_data['direct_profit'] = store_data['gross_profit'] - store_data['selling_expense']
-    
-    # 임차료/인건비율
-    if store_data['net_sales'] > 0:
-        store_data['rent_labor_ratio'] = ((store_data['rent'] + store_data['labor_cost']) / store_data['net_sales']) * 100
-    else:
-        store_data['rent_labor_ratio'] = 0
-    
-    return store_data
+def get_period_data(pl_data, start_period, end_period=None):
+    """특정 기간(start ~ end, 생략 시 당월)의 매장별 데이터 추출 {SHOP_CD: 지표} (텐서 슬라이스 1회)"""
+    tensor, mask = pl_data
+    # 직접이익 = 매출총이익 - 판매관리비, 임차료/인건비율 = (임차료 + 인건비) / 실매출액 * 100
+    return {shop_cd: store_profit(measures)
+            for shop_cd, measures in tensor.shop_measures(STORE_PL_NAME_TREE, start_period, end_period, mask).items()}
+
+def get_cumulative_data(pl_data, year):
+    """매장별 연간 누적 데이터 추출 (1월~12월)"""
+    return get_period_data(pl_data, f"{year}01", f"{year}12")
+
+def get_store_data(period_data, shop_cd):
+    """특정 매장의 기간 데이터 (행이 없으면 0)"""
+    return defaultdict(float, period_data.get(shop_cd) or store_profit({}))
 
 def calculate_yoy(current_value, previous_value):
     """YOY 계산"""
@@ -168,34 +96,36 @@ def main():
         print(f"\n오류: CSV 파일을 찾을 수 없습니다: {csv_file}")
         return
     
-    print(f"\n총 {len(pl_data)}개 PL 레코드 읽음")
+    tensor, offline = pl_data
+    print(f"\n총 {int(tensor.rows[offline].sum())}개 PL 레코드 읽음")
     
     # 모든 오프라인 매장 목록 수집 (2512 기준)
-    stores = set()
-    for row in pl_data:
-        if row['PERIOD'] == '202512':
-            stores.add((row['SHOP_CD'], row['SHOP_NM'], row['CNTRY_CD']))
-    
     # 추가로 2501-2511 기간 중 매출이 있었던 매장도 포함 (폐점 매장)
-    for row in pl_data:
-        period_year = int(row['PERIOD'][:4])
-        if period_year == 2025:
-            stores.add((row['SHOP_CD'], row['SHOP_NM'], row['CNTRY_CD']))
+    stores = set()
+    for store, active in zip(tensor.stores, offline & tensor.active(f"{current_year}01", f"{current_year}12")):
+        if active:
+            stores.add((store[2], store[3], store[1]))
     
     print(f"총 매장 수: {len(stores)}")
     
     # 매장별 데이터 수집
     store_list = []
     
+    # 기간별 매장 데이터 (텐서 슬라이스 1회씩)
+    current_cumulative_data = get_cumulative_data(pl_data, current_year)
+    previous_cumulative_data = get_cumulative_data(pl_data, previous_year)
+    previous_previous_cumulative_data = get_cumulative_data(pl_data, previous_year - 1)
+    current_monthly_data = get_period_data(pl_data, '202512')
+    
     for shop_cd, shop_nm, country in stores:
         # 당년 누적 (2501-2512)
-        current_cumulative = get_cumulative_data(pl_data, current_year, shop_cd)
+        current_cumulative = get_store_data(current_cumulative_data, shop_cd)
         
         # 전년 누적 (2401-2412)
-        previous_cumulative = get_cumulative_data(pl_data, previous_year, shop_cd)
+        previous_cumulative = get_store_data(previous_cumulative_data, shop_cd)
         
         # 당월 데이터 (2512)
-        current_monthly = get_monthly_data(pl_data, '202512', shop_cd)
+        current_monthly = get_store_data(current_monthly_data, shop_cd)
         
         # 폐점 매장 확인: 누적 매출은 있지만 2512 매출이 0
         is_closed = current_cumulative['net_sales'] > 0 and current_monthly['net_sales'] == 0
@@ -212,7 +142,7 @@ def main():
         category = categorize_store(current_cumulative['direct_profit'], cumulative_yoy)
         
         # 전년도 카테고리 계산 (2401-2412 vs 2301-2312)
-        previous_previous_cumulative = get_cumulative_data(pl_data, previous_year - 1, shop_cd)
+        previous_previous_cumulative = get_store_data(previous_previous_cumulative_data, shop_cd)
         previous_yoy = calculate_yoy(previous_cumulative['net_sales'], previous_previous_cumulative['net_sales'])
         previous_category = categorize_store(previous_cumulative['direct_profit'], previous_yoy) if previous_cumulative['net_sales'] > 0 else None
         
@@ -59,6 +59,12 @@ try:
     print(f"\n대만 대시보드 2512 데이터 생성 완료!")
     print(f"Public 폴더 복사 완료: {public_output}")
     
+    # 델타 번들 갱신 (Period 전환/전년 비교용) 및 매니페스트 갱신 (콘텐츠 해시 URL)
+    from dashboard_bundle import write_bundle
+    from dashboard_manifest import update_manifest
+    bundle_path = write_bundle('taiwan')
+    update_manifest([public_output, bundle_path])
+    
 except Exception as e:
     print(f"\n❌ 에러: {e}")
     import traceback
@@ -13,7 +13,8 @@ import json
 import os
 from collections import defaultdict
 from datetime import datetime
-import re
+
+from channel_sums import is_mlb_online, is_mlb_outlet, is_mlb_retail
 
 # TWD to HKD 환산환율 (동적으로 변경됨)
 TWD_TO_HKD_RATE = 4.03
@@ -40,18 +41,6 @@ def read_exchange_rate(csv_dir, period):
     print(f"환율 파일 없음, 기본값 사용: 4.03")
     return 4.03
 
-def is_mlb_retail(store_code):
-    """MLB 리테일 (T로 시작하는 숫자)"""
-    return bool(re.match(r'^T\d+$', store_code))
-
-def is_mlb_online(store_code):
-    """MLB 온라인 (TE로 시작)"""
-    return store_code.startswith('TE')
-
-def is_mlb_outlet(store_code):
-    """MLB 아울렛 (TU로 시작)"""
-    return store_code.startswith('TU')
-
 def get_store_category(store_code):
     """Store Code를 기반으로 카테고리 반환"""
     if is_mlb_outlet(store_code):
@@ -13,9 +13,11 @@ import json
 import os
 from collections import defaultdict
 from datetime import datetime
-import re
 import pandas as pd
 
+from channel_sums import is_mlb_online, is_mlb_outlet, is_mlb_retail
+from stage_profiler import instrument_cli, staged
+
 # TWD to HKD 환산환율 (동적으로 변경됨)
 TWD_TO_HKD_RATE = 4.02
 
@@ -41,18 +43,6 @@ def read_exchange_rate(csv_dir, period):
     print(f"환율 파일 없음, 기본값 사용: 4.02")
     return 4.02
 
-def is_mlb_retail(store_code):
-    """MLB 리테일 (T로 시작하는 숫자)"""
-    return bool(re.match(r'^T\d+$', store_code))
-
-def is_mlb_online(store_code):
-    """MLB 온라인 (TE로 시작)"""
-    return store_code.startswith('TE')
-
-def is_mlb_outlet(store_code):
-    """MLB 아울렛 (TU로 시작)"""
-    return store_code.startswith('TU')
-
 def get_store_category(store_code):
     """Store Code를 기반으로 카테고리 반환"""
     if is_mlb_outlet(store_code):
@@ -119,6 +109,7 @@ def calculate_discount_rate(gross_sales, net_sales):
         return 0
     return ((gross_sales - net_sales) / gross_sales) * 100
 
+@staged()
 def read_csv_data(file_path):
     """CSV 파일 읽기 (MLB 브랜드만)"""
     data = []
@@ -133,6 +124,7 @@ def read_csv_data(file_path):
     
     return data, sorted(periods)
 
+@staged(rows=None)
 def generate_cumulative_dashboard_data(csv_file_path, output_file_path, target_period='2512'):
     """누적 대시보드용 데이터 생성 (1월~target_period 누적)"""
     global TWD_TO_HKD_RATE
@@ -471,6 +463,7 @@ def generate_cumulative_dashboard_data(csv_file_path, output_file_path, target_p
     print(f"  - 추세 데이터 포인트: {len(trend_data)}")
 
 if __name__ == '__main__':
+    instrument_cli()
     csv_file = '../Dashboard_Raw_Data/TW/2512/TW_Inventory_2312_2512_v5_2_updated.csv'
     tag_summary_file = '../Dashboard_Raw_Data/TW/2512/processed/TW_Inventory_TAG_Summary (3).csv'
     output_file = 'public/dashboard/taiwan-dashboard-cumulative-2512.json'
@@ -510,5 +503,9 @@ if __name__ == '__main__':
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(dashboard_data, f, ensure_ascii=False, indent=2)
     
+    # 매니페스트 갱신 (콘텐츠 해시 URL)
+    from dashboard_manifest import update_manifest
+    update_manifest([output_file])
+    
     print(f"TAG Summary 데이터 추가 완료: {len(tag_inventory_summary)}개 TAG")
 
@@ -8,15 +8,23 @@
 - 환율은 매달 업데이트 시 변경 필요
 """
 import csv
-import json
 import os
-import shutil
 from collections import defaultdict
 from datetime import datetime
-import re
 import sys
 import io
 
+from aging_cube import AgingCube
+from channel_sums import is_discovery_online, is_discovery_retail, is_mlb_online, is_mlb_outlet, is_mlb_retail
+from dashboard_loader import load_source_csv
+from dashboard_writer import ArtifactWriter
+from item_classifier import ITEM_LABELS, ItemBucketTable
+from kpi_table import dashboard_kpis, record_kpis
+from sell_through import SellThrough
+from stage_profiler import instrument_cli, staged
+from stock_weeks import ROW_COUNT, period_sums
+from trend_series import TrendSeries, yoy_percent
+
 # Windows 콘솔 인코딩 문제 해결
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -32,6 +40,21 @@ TWD_TO_HKD_RATE = 4.03  # 기본값 (동적으로 변경됨)
 # hmd_pl_database (1).csv는 이미 V-로 되어있음
 VAT_EXCLUSION_RATE = 1.05
 
+# 당시즌 F 시작 월: 대만은 6월부터 F시즌 판매 (1~5월은 전년 F가 당시즌F)
+F_SEASON_START_MONTH = 6
+
+# 아이템 버킷(item_classifier) → 대만 월별 매출 / 재고 아이템 키
+# - ACC 가방/기타ACC와 미분류는 '가방외'로 합산, 가방/기타ACC는 그래프용으로 별도 집계 (GRAPH_ACC_KEYS)
+ITEM_SALES_KEYS = {
+    'F당시즌': '당시즌F', 'S당시즌': '당시즌S', '과시즌FW': '과시즌F', '과시즌SS': '과시즌S',
+    '모자': '모자', '신발': '신발', '가방': '가방외', '기타ACC': '가방외', '': '가방외',
+}
+ITEM_INVENTORY_KEYS = {
+    'F당시즌': 'F당시즌', 'S당시즌': 'S당시즌', '과시즌FW': '과시즌FW', '과시즌SS': '과시즌SS',
+    '모자': '모자', '신발': '신발', '가방': '가방외', '기타ACC': '가방외', '': '가방외',
+}
+GRAPH_ACC_KEYS = ('가방', '기타ACC')
+
 def read_exchange_rate(csv_dir, period):
     """
     환율 파일에서 해당 period의 환율 읽기
@@ -68,27 +91,6 @@ def read_exchange_rate(csv_dir, period):
     print(f"환율 파일 없음 또는 매칭 실패, 기본값 사용: {TWD_TO_HKD_RATE}")
     return TWD_TO_HKD_RATE
 
-# Store Code 분류 (대만)
-def is_mlb_retail(store_code):
-    """MLB 리테일 (T로 시작하는 숫자)"""
-    return bool(re.match(r'^T\d+$', store_code))
-
-def is_mlb_online(store_code):
-    """MLB 온라인 (TE로 시작)"""
-    return store_code.startswith('TE')
-
-def is_mlb_outlet(store_code):
-    """MLB 아울렛 (TU로 시작)"""
-    return store_code.startswith('TU')
-
-def is_discovery_retail(store_code):
-    """Discovery 리테일 (D로 시작하는 숫자)"""
-    return bool(re.match(r'^D\d+$', store_code))
-
-def is_discovery_online(store_code):
-    """Discovery 온라인 (DE로 시작)"""
-    return store_code.startswith('DE')
-
 def get_store_category(store_code):
     """Store Code를 기반으로 카테고리 반환"""
     if is_mlb_outlet(store_code):
@@ -171,21 +173,22 @@ def calculate_discount_rate(gross_sales, net_sales):
         return 0
     return ((gross_sales - net_sales) / gross_sales) * 100
 
-def read_csv_data(file_path):
-    """CSV 파일 읽기 (MLB 브랜드만 필터링)"""
-    data = []
-    periods = set()
-    
-    with open(file_path, 'r', encoding='utf-8-sig') as f:  # BOM 제거를 위해 utf-8-sig 사용
-        reader = csv.DictReader(f)
-        for row in reader:
-            # MLB 브랜드만 포함 (DX 제외)
-            if row.get('Brand') == 'MLB':
-                data.append(row)
-                periods.add(row['Period'])
+@staged()
+def read_csv_data(file_path, target_period=None):
+    """CSV 파일 읽기 (전체 브랜드 기준 데이터 검증 후 MLB 브랜드만 필터링)"""
+    loaded = load_source_csv(file_path, 'taiwan', period=target_period)
+    if 'Brand' not in loaded.frame.columns:
+        return [], []
+    # 아이템 버킷 (행의 Period 기준, 로드 시 1회 조인)
+    loaded.frame['Item_Bucket'] = ItemBucketTable(F_SEASON_START_MONTH).ids(loaded.frame)
+    # MLB 브랜드만 포함 (DX 제외)
+    mlb = loaded.frame['Brand'] == 'MLB'
+    data = loaded.records(mlb)
+    periods = set(loaded.frame.loc[mlb, 'Period'])
     
     return data, sorted(periods)
 
+@staged(rows=None)
 def generate_dashboard_data(csv_file_path, output_file_path, target_period=None):
     """대시보드용 데이터 생성
     
@@ -207,7 +210,7 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
         print(f"=" * 80)
     
     print("CSV 파일 읽는 중...")
-    data, periods = read_csv_data(csv_file_path)
+    data, periods = read_csv_data(csv_file_path, target_period)
     
     if not periods:
         print("데이터가 없습니다.")
@@ -550,331 +553,86 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
     start_period = f"{last_year % 100:02d}01"  # 해당 년도 1월
     recent_periods = sorted([p for p in periods if start_period <= p <= last_period])
     
-    # 월별 채널별 데이터 생성
-    monthly_channel_data = []
-    monthly_channel_yoy = {
-        'TW_Retail': [],
-        'TW_Outlet': [],
-        'TW_Online': []
-    }
-    
-    for period in recent_periods:
-        period_data = [row for row in data if row['Period'] == period and row['Brand'] == 'MLB' and row['Country'] == 'TW']
-        # CSV는 TWD 단위이므로 HKD로 환산
-        period_gross = sum(float(row['Gross_Sales'] or 0) for row in period_data) / TWD_TO_HKD_RATE
-        period_net = sum(float(row['Net_Sales'] or 0) for row in period_data) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE  # V- 적용
-        period_qty = sum(float(row['Sales_Qty'] or 0) for row in period_data)  # 수량은 환율 적용 안 함
-        period_discount = calculate_discount_rate(period_gross, period_net)
-        
+    # 추세 시계열 (아이템 버킷 × 채널 × Period, MLB 대만) - 원천 1회 순회, 모든 추세 / YOY 배열 공용
+    trends = TrendSeries(
+        data,
+        {'item': lambda row: ITEM_LABELS[row['Item_Bucket']],
+         'channel': lambda row: get_channel_from_store_code(row.get('Store_Code', ''))},
+        ['Gross_Sales', 'Net_Sales', 'Sales_Qty'],
+        include=lambda row: row['Brand'] == 'MLB' and row['Country'] == 'TW',
+        periods=periods,
+    )
+    
+    # CSV는 TWD 단위이므로 HKD로 환산 (실판매출은 V- 적용, 수량은 환율 적용 안 함)
+    period_gross = (trends.series('Gross_Sales', recent_periods) / TWD_TO_HKD_RATE).tolist()
+    period_net = (trends.series('Net_Sales', recent_periods) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE).tolist()
+    period_qty = trends.series('Sales_Qty', recent_periods).tolist()
+    for i, period in enumerate(recent_periods):
         trend_data[period] = {
             'period': period,
-            'gross_sales': period_gross,
-            'net_sales': period_net,
-            'sales_qty': period_qty,
-            'discount_rate': period_discount,
+            'gross_sales': period_gross[i],
+            'net_sales': period_net[i],
+            'sales_qty': period_qty[i],
+            'discount_rate': calculate_discount_rate(period_gross[i], period_net[i]),
         }
-        
-        # 채널별 매출 집계
-        tw_retail = 0
-        tw_outlet = 0
-        tw_online = 0
-        
-        for row in period_data:
-            store_code = row.get('Store_Code', '')
-            channel = get_channel_from_store_code(store_code)
-            net_sales = float(row['Net_Sales'] or 0) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE  # V- 적용
-            
-            if channel == 'Retail':
-                tw_retail += net_sales
-            elif channel == 'Outlet':
-                tw_outlet += net_sales
-            elif channel == 'Online':
-                tw_online += net_sales
-        
-        total = tw_retail + tw_outlet + tw_online
-        
+    
+    # 월별 채널별 데이터 생성 (실판매출 V- 적용) + 전년 동월 대비 YOY
+    channel_sales = {}
+    monthly_channel_yoy = {}
+    for channel in ['Retail', 'Outlet', 'Online']:
+        current, previous = trends.yoy_pair('Net_Sales', recent_periods, channel=channel)
+        channel_sales[f'TW_{channel}'] = (current / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE).tolist()
+        monthly_channel_yoy[f'TW_{channel}'] = [round(yoy) for yoy in yoy_percent(current, previous).tolist()]
+    
+    monthly_channel_data = []
+    for i, period in enumerate(recent_periods):
         monthly_channel_data.append({
             'period': period,
-            'TW_Retail': tw_retail,
-            'TW_Outlet': tw_outlet,
-            'TW_Online': tw_online,
-            'total': total
+            'TW_Retail': channel_sales['TW_Retail'][i],
+            'TW_Outlet': channel_sales['TW_Outlet'][i],
+            'TW_Online': channel_sales['TW_Online'][i],
+            'total': channel_sales['TW_Retail'][i] + channel_sales['TW_Outlet'][i] + channel_sales['TW_Online'][i]
         })
-        
-        # 전년 동월 대비 YOY 계산
-        prev_year, prev_month = parse_period(period)
-        if prev_year and prev_month:
-            prev_period = f"{(prev_year - 1) % 100:02d}{prev_month:02d}"
-            prev_period_data = [row for row in data if row['Period'] == prev_period and row['Brand'] == 'MLB' and row['Country'] == 'TW']
-            
-            prev_tw_retail = 0
-            prev_tw_outlet = 0
-            prev_tw_online = 0
-            
-            for row in prev_period_data:
-                store_code = row.get('Store_Code', '')
-                channel = get_channel_from_store_code(store_code)
-                net_sales = float(row['Net_Sales'] or 0) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE  # V- 적용
-                
-                if channel == 'Retail':
-                    prev_tw_retail += net_sales
-                elif channel == 'Outlet':
-                    prev_tw_outlet += net_sales
-                elif channel == 'Online':
-                    prev_tw_online += net_sales
-            
-            # YOY 계산
-            tw_retail_yoy = (tw_retail / prev_tw_retail * 100) if prev_tw_retail > 0 else 0
-            tw_outlet_yoy = (tw_outlet / prev_tw_outlet * 100) if prev_tw_outlet > 0 else 0
-            tw_online_yoy = (tw_online / prev_tw_online * 100) if prev_tw_online > 0 else 0
-            
-            monthly_channel_yoy['TW_Retail'].append(round(tw_retail_yoy))
-            monthly_channel_yoy['TW_Outlet'].append(round(tw_outlet_yoy))
-            monthly_channel_yoy['TW_Online'].append(round(tw_online_yoy))
     
     # 월별 아이템별 데이터 생성
     print("월별 아이템별 데이터 생성 중...")
+    # 아이템 키 → 아이템 버킷 (가방외 = 가방 + 기타ACC + 미분류, 그래프용 가방 / 기타ACC는 별도)
+    item_buckets = {}
+    for label, item in ITEM_SALES_KEYS.items():
+        item_buckets.setdefault(item, []).append(label)
+    item_buckets.update({item: [item] for item in GRAPH_ACC_KEYS})
+    
+    item_gross = {}
+    item_net = {}
+    item_prev_net = {}
+    for item, labels in item_buckets.items():
+        item_gross[item] = (trends.series('Gross_Sales', recent_periods, item=labels) / TWD_TO_HKD_RATE).tolist()
+        current, previous = trends.yoy_pair('Net_Sales', recent_periods, item=labels)
+        item_net[item] = (current / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE).tolist()
+        item_prev_net[item] = (previous / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE).tolist()
+    
     monthly_item_data = []
+    for i, period in enumerate(recent_periods):
+        monthly_item = {'period': period}
+        for item in item_buckets:
+            monthly_item[item] = {
+                'gross_sales': item_gross[item][i],
+                'net_sales': item_net[item][i]
+            }
+        monthly_item_data.append(monthly_item)
+    
+    # 전년 동월 대비 YOY 계산
+    # 1~6월의 경우 24F(당시즌F)를 과시즌F로 이동시킨 후 계산 (현재 / 전년 모두)
+    for i, period in enumerate(recent_periods):
+        if 1 <= int(period[2:4]) <= 6:
+            for sales in (item_net, item_prev_net):
+                sales['과시즌F'][i] += sales['당시즌F'][i]
+                sales['당시즌F'][i] = 0
     monthly_item_yoy = {
-        '당시즌F': [],
-        '당시즌S': [],
-        '과시즌F': [],
-        '과시즌S': [],
-        '모자': [],
-        '신발': [],
-        '가방외': [],
-        '가방': [],
-        '기타ACC': []
+        item: [round(yoy) for yoy in yoy_percent(item_net[item], item_prev_net[item]).tolist()]
+        for item in item_buckets
     }
     
-    # Category를 아이템으로 매핑
-    def get_item_from_category_and_season(category, season_code, period_year, period_month):
-        """Category와 Season Code를 기반으로 아이템 분류"""
-        
-        # 악세사리 판단: Season_Code가 'N'으로 끝나면 악세사리
-        is_accessory = season_code.endswith('N') if season_code else False
-        
-        if is_accessory:
-            # 악세사리인 경우 Category로 세부 분류
-            if category == 'HEA':
-                return '모자'
-            elif category == 'SHO':
-                return '신발'
-            elif category == 'BAG':
-                return '가방외'  # 기본적으로는 가방외, 별도로 '가방'에도 추가됨
-            else:
-                # ATC, BOT, WTC 등
-                return '가방외'  # 기본적으로는 가방외, 별도로 '기타ACC'에도 추가됨
-        
-        # 의류는 Season Code로 판단 (악세사리가 아닌 경우)
-        if len(season_code) >= 3:
-            season_year = int(season_code[:2])
-            season_type = season_code[2]  # F or S
-            current_year_2digit = period_year % 100
-            
-            # 당시즌 판단
-            # F시즌: 6월부터 판매 시작
-            # - 1-5월: 전년 F를 당시즌F (예: 2025년 1-5월은 24F)
-            # - 6-12월: 올해 F를 당시즌F (예: 2025년 6-12월은 25F)
-            if season_type == 'F':
-                if period_month >= 1 and period_month <= 5:
-                    # 1-5월: 전년 F를 당시즌F
-                    if season_year == (current_year_2digit - 1):
-                        return '당시즌F'
-                elif period_month >= 6 and period_month <= 12:
-                    # 6-12월: 올해 F를 당시즌F
-                    if season_year == current_year_2digit:
-                        return '당시즌F'
-            
-            # S시즌: 올해 S만 당시즌으로 분류
-            # - 올해 S는 1년 내내 당시즌S (예: 2025년 1-12월 모두 25S는 당시즌S)
-            # - 전년 S는 과시즌S (예: 2024년 데이터에서 24S는 과시즌S, 2025년 데이터에서 24S는 과시즌S)
-            if season_type == 'S':
-                # 올해 S만 당시즌S
-                if season_year == current_year_2digit:
-                    return '당시즌S'
-            
-            # 과시즌 판단 (당시즌이 아닌 F/S 시즌)
-            # 당시즌으로 분류된 것은 여기서 제외됨
-            if season_type == 'F':
-                return '과시즌F'
-            elif season_type == 'S':
-                # 당시즌S가 아닌 S 시즌은 과시즌S (예: 23S, 22S 등)
-                return '과시즌S'
-        
-        # 나머지는 가방외
-        return '가방외'
-    
-    for period in recent_periods:
-        period_data = [row for row in data if row['Period'] == period and row['Brand'] == 'MLB' and row['Country'] == 'TW']
-        period_year, period_month = parse_period(period)
-        
-        if not period_year or not period_month:
-            continue
-        
-        # 아이템별 집계
-        item_sales = {
-            '당시즌F': {'gross_sales': 0, 'net_sales': 0},
-            '당시즌S': {'gross_sales': 0, 'net_sales': 0},
-            '과시즌F': {'gross_sales': 0, 'net_sales': 0},
-            '과시즌S': {'gross_sales': 0, 'net_sales': 0},
-            '모자': {'gross_sales': 0, 'net_sales': 0},
-            '신발': {'gross_sales': 0, 'net_sales': 0},
-            '가방외': {'gross_sales': 0, 'net_sales': 0},
-            # 그래프용: 가방(BAG)과 기타ACC(ATC+BOT+WTC) 분리
-            '가방': {'gross_sales': 0, 'net_sales': 0},
-            '기타ACC': {'gross_sales': 0, 'net_sales': 0}
-        }
-        
-        for row in period_data:
-            category = row.get('Category', '')
-            season_code = row.get('Season_Code', '')
-            
-            # 악세사리 여부 확인
-            is_accessory = season_code.endswith('N') if season_code else False
-            
-            # CSV는 TWD 단위이므로 HKD로 환산
-            gross_sales = float(row['Gross_Sales'] or 0) / TWD_TO_HKD_RATE
-            net_sales = float(row['Net_Sales'] or 0) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE  # V- 적용
-            
-            if is_accessory:
-                # 악세사리: Season_Code가 'N'으로 끝나는 경우
-                # Category로 세부 분류
-                if category == 'HEA':
-                    # 모자
-                    item_sales['모자']['gross_sales'] += gross_sales
-                    item_sales['모자']['net_sales'] += net_sales
-                elif category == 'SHO':
-                    # 신발
-                    item_sales['신발']['gross_sales'] += gross_sales
-                    item_sales['신발']['net_sales'] += net_sales
-                elif category == 'BAG':
-                    # 가방
-                    item_sales['가방']['gross_sales'] += gross_sales
-                    item_sales['가방']['net_sales'] += net_sales
-                    # 가방외에도 추가 (다른 섹션 호환성)
-                    item_sales['가방외']['gross_sales'] += gross_sales
-                    item_sales['가방외']['net_sales'] += net_sales
-                else:
-                    # 기타ACC (ATC, BOT, WTC 등)
-                    item_sales['기타ACC']['gross_sales'] += gross_sales
-                    item_sales['기타ACC']['net_sales'] += net_sales
-                    # 가방외에도 추가 (다른 섹션 호환성)
-                    item_sales['가방외']['gross_sales'] += gross_sales
-                    item_sales['가방외']['net_sales'] += net_sales
-            else:
-                # 의류: Season Code로 판단
-                item = get_item_from_category_and_season(category, season_code, period_year, period_month)
-                item_sales[item]['gross_sales'] += gross_sales
-                item_sales[item]['net_sales'] += net_sales
-        
-        monthly_item_data.append({
-            'period': period,
-            '당시즌F': {
-                'gross_sales': item_sales['당시즌F']['gross_sales'],
-                'net_sales': item_sales['당시즌F']['net_sales']
-            },
-            '당시즌S': {
-                'gross_sales': item_sales['당시즌S']['gross_sales'],
-                'net_sales': item_sales['당시즌S']['net_sales']
-            },
-            '과시즌F': {
-                'gross_sales': item_sales['과시즌F']['gross_sales'],
-                'net_sales': item_sales['과시즌F']['net_sales']
-            },
-            '과시즌S': {
-                'gross_sales': item_sales['과시즌S']['gross_sales'],
-                'net_sales': item_sales['과시즌S']['net_sales']
-            },
-            '모자': {
-                'gross_sales': item_sales['모자']['gross_sales'],
-                'net_sales': item_sales['모자']['net_sales']
-            },
-            '신발': {
-                'gross_sales': item_sales['신발']['gross_sales'],
-                'net_sales': item_sales['신발']['net_sales']
-            },
-            '가방외': {
-                'gross_sales': item_sales['가방외']['gross_sales'],
-                'net_sales': item_sales['가방외']['net_sales']
-            },
-            # 그래프용: 가방(BAG)과 기타ACC(ATC+BOT+WTC) 분리
-            '가방': {
-                'gross_sales': item_sales['가방']['gross_sales'],
-                'net_sales': item_sales['가방']['net_sales']
-            },
-            '기타ACC': {
-                'gross_sales': item_sales['기타ACC']['gross_sales'],
-                'net_sales': item_sales['기타ACC']['net_sales']
-            }
-        })
-        
-        # 전년 동월 대비 YOY 계산
-        if period_year and period_month:
-            prev_year = period_year - 1
-            prev_month = period_month
-            prev_period = f"{(prev_year) % 100:02d}{prev_month:02d}"
-            prev_period_data = [row for row in data if row['Period'] == prev_period and row['Brand'] == 'MLB' and row['Country'] == 'TW']
-            
-            prev_item_sales = {
-                '당시즌F': {'net_sales': 0},
-                '당시즌S': {'net_sales': 0},
-                '과시즌F': {'net_sales': 0},
-                '과시즌S': {'net_sales': 0},
-                '모자': {'net_sales': 0},
-                '신발': {'net_sales': 0},
-                '가방외': {'net_sales': 0},
-                '가방': {'net_sales': 0},
-                '기타ACC': {'net_sales': 0}
-            }
-            
-            for row in prev_period_data:
-                category = row.get('Category', '')
-                season_code = row.get('Season_Code', '')
-                
-                # 악세사리 여부 확인
-                is_accessory = season_code.endswith('N') if season_code else False
-                net_sales = float(row['Net_Sales'] or 0) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE
-                
-                if is_accessory:
-                    # 악세사리: Season_Code가 'N'으로 끝나는 경우
-                    if category == 'HEA':
-                        prev_item_sales['모자']['net_sales'] += net_sales
-                    elif category == 'SHO':
-                        prev_item_sales['신발']['net_sales'] += net_sales
-                    elif category == 'BAG':
-                        prev_item_sales['가방']['net_sales'] += net_sales
-                        prev_item_sales['가방외']['net_sales'] += net_sales
-                    else:
-                        # 기타ACC
-                        prev_item_sales['기타ACC']['net_sales'] += net_sales
-                        prev_item_sales['가방외']['net_sales'] += net_sales
-                else:
-                    # 의류: Season Code로 판단
-                    item = get_item_from_category_and_season(category, season_code, prev_year, prev_month)
-                    prev_item_sales[item]['net_sales'] += net_sales
-            
-            # YOY 계산
-            # 1~6월의 경우 24F(당시즌F)를 과시즌F로 이동시킨 후 계산
-            period_month = int(period[2:4])
-            
-            # 현재와 전년 데이터를 복사 (원본 유지)
-            current_sales = {k: v['net_sales'] for k, v in item_sales.items()}
-            prev_sales = {k: v['net_sales'] for k, v in prev_item_sales.items()}
-            
-            # 1~6월: 24F를 과시즌F로 이동
-            if period_month >= 1 and period_month <= 6:
-                current_sales['과시즌F'] += current_sales['당시즌F']
-                current_sales['당시즌F'] = 0
-                prev_sales['과시즌F'] += prev_sales['당시즌F']
-                prev_sales['당시즌F'] = 0
-            
-            for item in ['당시즌F', '당시즌S', '과시즌F', '과시즌S', '모자', '신발', '가방외', '가방', '기타ACC']:
-                current_net = current_sales[item]
-                prev_net = prev_sales[item]
-                yoy = (current_net / prev_net * 100) if prev_net > 0 else 0
-                monthly_item_yoy[item].append(round(yoy))
-    
     # 전년 동일매장 기준 계산 (폐점 매장 제외)
     print("전년 동일매장 기준 계산 중...")
     for store_code in store_summary:
@@ -895,22 +653,18 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
     
     # 재고주수 계산 (최근 6개월 매출 필요)
     print("재고주수 계산 중...")
-    # 최근 6개월 Period 찾기
-    recent_6m_periods = sorted([p for p in periods if p <= last_period])[-6:]
+    # Category × Period N시즌 판매수량/매출 합계 (원천 1회 순회 + Period 누적합, ACC 재고주수와 공용)
+    n_season_sums = period_sums(
+        data,
+        lambda row: (row['Category'] if row['Brand'] == 'MLB' and row['Country'] == 'TW'
+                     and row['Season_Code'].endswith('N') else None),
+        ['Sales_Qty', 'Gross_Sales'],
+        periods,
+    )
     
     for category in category_summary:
-        # 최근 6개월 매출 합계
-        sales_6m = 0
-        for period in recent_6m_periods:
-            period_data = [row for row in data 
-                          if row['Period'] == period 
-                          and row['Brand'] == 'MLB'
-                          and row['Country'] == 'TW'
-                          and row['Category'] == category
-                          and row['Season_Code'].endswith('N')]
-            sales_6m += sum(float(row['Sales_Qty'] or 0) for row in period_data)
-        
-        category_summary[category]['current']['sales_qty_6m'] = sales_6m
+        # 최근 6개월 매출 합계 (last_period 이하 최근 6개 Period)
+        category_summary[category]['current']['sales_qty_6m'] = n_season_sums['Sales_Qty'].last_n_sum(category, last_period, 6)
         
         # 재고주수 계산
         stock_price = category_summary[category]['current']['stock_price']
@@ -1026,33 +780,30 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
         prev_subcategory_sales[subcat_code]['net_sales'] += net_sales
     prev_total_net_sales_october = sum(s['net_sales'] for s in prev_subcategory_sales.values())
     
-    # 누적 데이터 (25F 7~10월) - 모든 카테고리 포함
-    # 주의: CSV의 Net_AcP_P와 AC_Sales_Gross는 이미 누적값이므로 마지막 Period(2510)만 사용
-    accumulated_periods = sorted([p for p in periods if f"{last_year % 100:02d}07" <= p <= last_period])
-    accumulated_f_data = [row for row in data 
-                         if row['Period'] in accumulated_periods
-                         and row['Brand'] == 'MLB' 
-                         and row['Country'] == 'TW'
-                         and row['Season_Code'] == current_season_f_code]
+    # 당시즌 판매율 엔진 (시즌 × Subcategory × Period 누적 배열, MLB 대만) - 모든 카테고리 포함
+    # 주의: CSV의 Net_AcP_P와 AC_Sales_Gross는 이미 누적값이므로 마지막 Period 값만 사용
+    sell_through = SellThrough(data, include=lambda row: row['Brand'] == 'MLB' and row['Country'] == 'TW', periods=periods)
+    
+    def season_as_of(column, season, period, since, **filters):
+        """누적 구간(since ~ period)이 있으면 기준 Period 값 (HKD), 없으면 0"""
+        if since > period:
+            return 0
+        return sell_through.as_of(column, season, period, **filters) / TWD_TO_HKD_RATE
     
-    # Net_AcP_P (누적 입고금액), AC_Sales_Gross (누적 판매금액) - 마지막 Period만 사용 (이미 누적값)
+    # 누적 데이터 (25F 7~10월): Net_AcP_P (누적 입고금액), AC_Sales_Gross (누적 판매금액)
     # Stock_Price는 당월 재고이므로 current_f_data 사용
-    net_acp_p = sum(float(row['Net_AcP_P'] or 0) for row in accumulated_f_data if row['Period'] == last_period) / TWD_TO_HKD_RATE
-    ac_sales_gross = sum(float(row['AC_Sales_Gross'] or 0) for row in accumulated_f_data if row['Period'] == last_period) / TWD_TO_HKD_RATE
+    f_since = f"{last_year % 100:02d}07"
+    net_acp_p = season_as_of('Net_AcP_P', current_season_f_code, last_period, f_since)
+    ac_sales_gross = season_as_of('AC_Sales_Gross', current_season_f_code, last_period, f_since)
     stock_price_f = sum(float(row['Stock_Price'] or 0) for row in current_f_data) / TWD_TO_HKD_RATE
     
     # 판매율 계산
     sales_rate = (ac_sales_gross / net_acp_p * 100) if net_acp_p > 0 else 0
     
-    # 전년 누적 데이터 - 마지막 Period만 사용 (이미 누적값) - 모든 카테고리 포함
-    prev_accumulated_periods = sorted([p for p in periods if f"{prev_year % 100:02d}07" <= p <= prev_period])
-    prev_accumulated_f_data = [row for row in data 
-                              if row['Period'] in prev_accumulated_periods
-                              and row['Brand'] == 'MLB' 
-                              and row['Country'] == 'TW'
-                              and row['Season_Code'] == prev_season_f_code]
-    prev_net_acp_p = sum(float(row['Net_AcP_P'] or 0) for row in prev_accumulated_f_data if row['Period'] == prev_period) / TWD_TO_HKD_RATE
-    prev_ac_sales_gross = sum(float(row['AC_Sales_Gross'] or 0) for row in prev_accumulated_f_data if row['Period'] == prev_period) / TWD_TO_HKD_RATE
+    # 전년 누적 데이터 - 마지막 Period만 사용 (이미 누적값)
+    prev_f_since = f"{prev_year % 100:02d}07"
+    prev_net_acp_p = season_as_of('Net_AcP_P', prev_season_f_code, prev_period, prev_f_since)
+    prev_ac_sales_gross = season_as_of('AC_Sales_Gross', prev_season_f_code, prev_period, prev_f_since)
     prev_sales_rate = (prev_ac_sales_gross / prev_net_acp_p * 100) if prev_net_acp_p > 0 else 0
     sales_rate_change = sales_rate - prev_sales_rate
     
@@ -1063,20 +814,14 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
     # Subcategory별 상세 데이터 생성 (입고YOY/판매YOY/판매율)
     subcategory_detail = []
     for subcat_code, subcat_data in subcategory_sales.items():
-        # 해당 subcategory의 누적 입고금액, 판매금액 계산 - 마지막 Period만 사용 (이미 누적값)
-        subcat_accumulated = [row for row in accumulated_f_data 
-                             if row['Period'] == last_period
-                             and row['Subcategory_Code'].strip() == subcat_code]
-        subcat_net_acp_p = sum(float(row['Net_AcP_P'] or 0) for row in subcat_accumulated) / TWD_TO_HKD_RATE
-        subcat_ac_sales_gross = sum(float(row['AC_Sales_Gross'] or 0) for row in subcat_accumulated) / TWD_TO_HKD_RATE
+        # 해당 subcategory의 누적 입고금액, 판매금액 - 마지막 Period만 사용 (이미 누적값)
+        subcat_net_acp_p = season_as_of('Net_AcP_P', current_season_f_code, last_period, f_since, subcategory=subcat_code)
+        subcat_ac_sales_gross = season_as_of('AC_Sales_Gross', current_season_f_code, last_period, f_since, subcategory=subcat_code)
         subcat_sales_rate = (subcat_ac_sales_gross / subcat_net_acp_p * 100) if subcat_net_acp_p > 0 else 0
         
         # 전년 데이터 - 마지막 Period만 사용
-        subcat_prev_accumulated = [row for row in prev_accumulated_f_data 
-                                  if row['Period'] == prev_period
-                                  and row['Subcategory_Code'].strip() == subcat_code]
-        subcat_prev_net_acp_p = sum(float(row['Net_AcP_P'] or 0) for row in subcat_prev_accumulated) / TWD_TO_HKD_RATE
-        subcat_prev_ac_sales_gross = sum(float(row['AC_Sales_Gross'] or 0) for row in subcat_prev_accumulated) / TWD_TO_HKD_RATE
+        subcat_prev_net_acp_p = season_as_of('Net_AcP_P', prev_season_f_code, prev_period, prev_f_since, subcategory=subcat_code)
+        subcat_prev_ac_sales_gross = season_as_of('AC_Sales_Gross', prev_season_f_code, prev_period, prev_f_since, subcategory=subcat_code)
         subcat_net_acp_p_yoy = (subcat_net_acp_p / subcat_prev_net_acp_p * 100) if subcat_prev_net_acp_p > 0 else 0
         
         # 누적 판매 YOY 계산 (누적 판매금액 기준)
@@ -1158,38 +903,20 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
     current_season_s_code = f"{last_year % 100}S"
     prev_season_s_code = f"{prev_year % 100}S"
     
-    # 누적 데이터 (25S 1~10월 또는 해당 기간)
-    # 주의: CSV의 Net_AcP_P와 AC_Sales_Gross는 이미 누적값이므로 마지막 Period만 사용
-    accumulated_s_periods = sorted([p for p in periods if f"{last_year % 100:02d}01" <= p <= last_period])
-    accumulated_s_data = [row for row in data 
-                         if row['Period'] in accumulated_s_periods
-                         and row['Brand'] == 'MLB' 
-                         and row['Country'] == 'TW'
-                         and row['Season_Code'] == current_season_s_code 
-                         and row['Category'] != 'HEA' 
-                         and row['Category'] != 'SHO']
-    
-    # 25S 누적 데이터
-    # Net_AcP_P와 AC_Sales_Gross는 누적값이므로 마지막 Period(2510)만 사용
-    s_net_acp_p = sum(float(row['Net_AcP_P'] or 0) for row in accumulated_s_data if row['Period'] == last_period) / TWD_TO_HKD_RATE
-    s_ac_sales_gross = sum(float(row['AC_Sales_Gross'] or 0) for row in accumulated_s_data if row['Period'] == last_period) / TWD_TO_HKD_RATE
-    # Net_Sales는 월별 합산
-    s_total_net_sales = sum(float(row['Net_Sales'] or 0) for row in accumulated_s_data) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE  # V- 적용
+    # 누적 데이터 (25S 1월 ~ 마지막 Period, 모자/신발 제외)
+    # Net_AcP_P와 AC_Sales_Gross는 누적값이므로 마지막 Period 값만 사용, Net_Sales는 월별 합산
+    s_since, prev_s_since = f"{last_year % 100:02d}01", f"{prev_year % 100:02d}01"
+    s_excluded = ['HEA', 'SHO']
+    s_net_acp_p = season_as_of('Net_AcP_P', current_season_s_code, last_period, s_since, exclude_categories=s_excluded)
+    s_ac_sales_gross = season_as_of('AC_Sales_Gross', current_season_s_code, last_period, s_since, exclude_categories=s_excluded)
+    s_total_net_sales = sell_through.season_to_date(
+        'Net_Sales', current_season_s_code, s_since, last_period, exclude_categories=s_excluded) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE  # V- 적용
     
     # 전년 누적 데이터 (24S) - 전년 Period 사용
-    prev_accumulated_s_periods = sorted([p for p in periods if f"{prev_year % 100:02d}01" <= p <= prev_period])
-    prev_accumulated_s_data = [row for row in data 
-                              if row['Period'] in prev_accumulated_s_periods
-                              and row['Brand'] == 'MLB' 
-                              and row['Country'] == 'TW'
-                              and row['Season_Code'] == prev_season_s_code 
-                              and row['Category'] != 'HEA' 
-                              and row['Category'] != 'SHO']
-    # Net_AcP_P와 AC_Sales_Gross는 누적값이므로 마지막 Period(2410)만 사용
-    prev_s_net_acp_p = sum(float(row['Net_AcP_P'] or 0) for row in prev_accumulated_s_data if row['Period'] == prev_period) / TWD_TO_HKD_RATE
-    prev_s_ac_sales_gross = sum(float(row['AC_Sales_Gross'] or 0) for row in prev_accumulated_s_data if row['Period'] == prev_period) / TWD_TO_HKD_RATE
-    # Net_Sales는 월별 합산
-    prev_s_total_net_sales = sum(float(row['Net_Sales'] or 0) for row in prev_accumulated_s_data) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE  # V- 적용
+    prev_s_net_acp_p = season_as_of('Net_AcP_P', prev_season_s_code, prev_period, prev_s_since, exclude_categories=s_excluded)
+    prev_s_ac_sales_gross = season_as_of('AC_Sales_Gross', prev_season_s_code, prev_period, prev_s_since, exclude_categories=s_excluded)
+    prev_s_total_net_sales = sell_through.season_to_date(
+        'Net_Sales', prev_season_s_code, prev_s_since, prev_period, exclude_categories=s_excluded) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE  # V- 적용
     
     season_sales['current_season_s'] = {
         'season_code': current_season_s_code,
@@ -1215,9 +942,8 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
     print("acc_stock_summary 데이터 생성 중...")
     acc_stock_summary = {'total': {}, 'by_category': {}, 'october_sales': {}}
     
-    # N시즌 Category별 재고주수 계산
-    recent_6m_periods = sorted([p for p in periods if p <= last_period])[-6:]
-    prev_recent_6m_periods = sorted([p for p in periods if p <= prev_period])[-6:]
+    # N시즌 Category별 재고주수 계산 (6개월 매출: 재고주수 계산 단계의 Category × Period 누적합)
+    n_season_sales = n_season_sums['Gross_Sales']
     
     total_stock_weeks_current = 0
     total_stock_weeks_previous = 0
@@ -1227,27 +953,9 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
         cat_data = category_summary[category]
         category_name = cat_data['category_name']
         
-        # 최근 6개월 매출 (Gross_Sales 기준)
-        gross_sales_6m = 0
-        for period in recent_6m_periods:
-            period_data = [row for row in data 
-                          if row['Period'] == period 
-                          and row['Brand'] == 'MLB'
-                          and row['Country'] == 'TW'
-                          and row['Category'] == category
-                          and row['Season_Code'].endswith('N')]
-            gross_sales_6m += sum(float(row['Gross_Sales'] or 0) for row in period_data) / TWD_TO_HKD_RATE
-        
-        # 전년 최근 6개월 매출
-        prev_gross_sales_6m = 0
-        for period in prev_recent_6m_periods:
-            period_data = [row for row in data 
-                          if row['Period'] == period 
-                          and row['Brand'] == 'MLB'
-                          and row['Country'] == 'TW'
-                          and row['Category'] == category
-                          and row['Season_Code'].endswith('N')]
-            prev_gross_sales_6m += sum(float(row['Gross_Sales'] or 0) for row in period_data) / TWD_TO_HKD_RATE
+        # 최근 6개월 / 전년 최근 6개월 매출 (Gross_Sales 기준, 기준월 이하 최근 6개 Period)
+        gross_sales_6m = n_season_sales.last_n_sum(category, last_period, 6) / TWD_TO_HKD_RATE
+        prev_gross_sales_6m = n_season_sales.last_n_sum(category, prev_period, 6) / TWD_TO_HKD_RATE
         
         stock_price = cat_data['current']['stock_price']
         prev_stock_price = sum(float(row['Stock_Price'] or 0) for row in prev_data 
@@ -1476,63 +1184,22 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
         else:
             etc_acc['yoy'] = 0
     
-    # 과시즌 FW 재고 (년차별)
-    past_season_fw_data = [row for row in current_data 
-                          if row['Season_Code'].endswith('F') and int(row['Season_Code'][:2]) < last_year % 100]
-    past_season_fw_total = sum(float(row['Stock_Price'] or 0) for row in past_season_fw_data) / TWD_TO_HKD_RATE
-    prev_past_season_fw_data = [row for row in prev_data 
-                               if row['Season_Code'].endswith('F') and int(row['Season_Code'][:2]) < prev_year % 100]
-    prev_past_season_fw_total = sum(float(row['Stock_Price'] or 0) for row in prev_past_season_fw_data) / TWD_TO_HKD_RATE
-    past_season_fw_yoy = (past_season_fw_total / prev_past_season_fw_total * 100) if prev_past_season_fw_total > 0 else 0
+    # 과시즌 에이징 큐브 (시즌 연차 × Subcategory × Period, MLB 대만) - 과시즌 재고 / 판매 카드 공통
+    # 연차 = 기준 Period 연도 - 시즌 연도 (당월 2512: 24FW = 1년차, 전년 동월 2412: 23FW = 1년차)
+    aging = AgingCube(data, include=lambda row: row['Brand'] == 'MLB' and row['Country'] == 'TW', periods=periods)
     
-    # 년차별 분류 (1년차: 24FW, 2년차: 23FW, 3년차 이상: 22FW~)
-    by_year_current = {}
-    by_year_previous = {}
-    
-    # 현재 데이터 년차별 집계
-    for row in past_season_fw_data:
-        season_code = row['Season_Code']
-        if season_code.endswith('F'):
-            season_year = int(season_code[:2])
-            years_ago = last_year % 100 - season_year
-            if years_ago == 1:
-                year_key = '1년차'
-            elif years_ago == 2:
-                year_key = '2년차'
-            elif years_ago >= 3:
-                year_key = '3년차 이상'
-            else:
-                continue
-            
-            if year_key not in by_year_current:
-                by_year_current[year_key] = 0
-            by_year_current[year_key] += float(row['Stock_Price'] or 0) / TWD_TO_HKD_RATE
-    
-    # 전년 데이터 년차별 집계
-    for row in prev_past_season_fw_data:
-        season_code = row['Season_Code']
-        if season_code.endswith('F'):
-            season_year = int(season_code[:2])
-            years_ago = prev_year % 100 - season_year
-            if years_ago == 1:
-                year_key = '1년차'
-            elif years_ago == 2:
-                year_key = '2년차'
-            elif years_ago >= 3:
-                year_key = '3년차 이상'
-            else:
-                continue
-            
-            if year_key not in by_year_previous:
-                by_year_previous[year_key] = 0
-            by_year_previous[year_key] += float(row['Stock_Price'] or 0) / TWD_TO_HKD_RATE
+    # 과시즌 FW 재고 (1년차 이상)
+    past_season_fw_total = aging.total('Stock_Price', last_period, min_age=1) / TWD_TO_HKD_RATE
+    prev_past_season_fw_total = aging.total('Stock_Price', prev_period, min_age=1) / TWD_TO_HKD_RATE
+    past_season_fw_yoy = (past_season_fw_total / prev_past_season_fw_total * 100) if prev_past_season_fw_total > 0 else 0
     
-    # by_year 구조 생성
+    # 년차별 분류 (1년차: 24FW, 2년차: 23FW, 3년차 이상: 22FW~) - 당월 / 전년 동월 중 행이 있는 년차만
     by_year = {}
-    all_year_keys = set(list(by_year_current.keys()) + list(by_year_previous.keys()))
-    for year_key in all_year_keys:
-        current_stock = by_year_current.get(year_key, 0) / 1000  # 1K HKD
-        previous_stock = by_year_previous.get(year_key, 0) / 1000  # 1K HKD
+    for year_key, bucket in [('1년차', '1년차'), ('2년차', '2년차'), ('3년차 이상', '3년차_이상')]:
+        if not (aging.bucket(ROW_COUNT, last_period, bucket) or aging.bucket(ROW_COUNT, prev_period, bucket)):
+            continue
+        current_stock = aging.bucket('Stock_Price', last_period, bucket) / TWD_TO_HKD_RATE / 1000  # 1K HKD
+        previous_stock = aging.bucket('Stock_Price', prev_period, bucket) / TWD_TO_HKD_RATE / 1000  # 1K HKD
         stock_yoy = (current_stock / previous_stock * 100) if previous_stock > 0 else 0
         
         by_year[year_key] = {
@@ -1545,141 +1212,41 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
             'yoy': stock_yoy
         }
     
-    # 1년차(24FW) subcategory별 집계 (재고금액 높은순 top5)
-    if '1년차' in by_year:
-        # 현재 데이터에서 1년차(24FW) subcategory별 집계
-        year1_subcategory_current = defaultdict(lambda: {'stock_price': 0, 'subcategory_code': '', 'subcategory_name': ''})
-        for row in past_season_fw_data:
-            season_code = row['Season_Code']
-            if season_code.endswith('F'):
-                season_year = int(season_code[:2])
-                years_ago = last_year % 100 - season_year
-                if years_ago == 1:  # 1년차 (24FW)
-                    subcat_code = row['Subcategory_Code'].strip()
-                    subcat_name = row['Subcategory'].strip()
-                    stock_price = float(row['Stock_Price'] or 0) / TWD_TO_HKD_RATE  # V- 적용 안 함 (택재고)
-                    year1_subcategory_current[subcat_code]['subcategory_code'] = subcat_code
-                    year1_subcategory_current[subcat_code]['subcategory_name'] = subcat_name
-                    year1_subcategory_current[subcat_code]['stock_price'] += stock_price
-        
-        # 전년 데이터에서 1년차(23FW) subcategory별 집계
-        # 전년 기준으로 1년차는 23FW (prev_year=24, season_year=23)
-        year1_subcategory_previous = defaultdict(lambda: {'stock_price': 0, 'subcategory_code': '', 'subcategory_name': ''})
-        for row in prev_past_season_fw_data:
-            season_code = row['Season_Code']
-            if season_code.endswith('F'):
-                season_year = int(season_code[:2])
-                # 전년 기준으로 1년차는 23FW (prev_year=24, season_year=23)
-                # 현재 기준으로 1년차는 24FW (last_year=25, season_year=24)
-                # 따라서 전년 데이터에서 1년차를 찾을 때는 season_year == 23
-                if season_year == 23:  # 전년 기준 1년차 (23FW)
-                    subcat_code = row['Subcategory_Code'].strip()
-                    subcat_name = row['Subcategory'].strip()
-                    stock_price = float(row['Stock_Price'] or 0) / TWD_TO_HKD_RATE  # V- 적용 안 함 (택재고)
-                    year1_subcategory_previous[subcat_code]['subcategory_code'] = subcat_code
-                    year1_subcategory_previous[subcat_code]['subcategory_name'] = subcat_name
-                    year1_subcategory_previous[subcat_code]['stock_price'] += stock_price
-        
-        # Top 5 정렬 (재고금액 높은순)
-        year1_subcategory_list = []
-        for subcat_code, subcat_data in year1_subcategory_current.items():
-            current_stock = subcat_data['stock_price'] / 1000  # 1K HKD
-            prev_data = year1_subcategory_previous.get(subcat_code, {})
-            previous_stock = prev_data.get('stock_price', 0) / 1000  # 1K HKD
-            stock_yoy = (current_stock / previous_stock * 100) if previous_stock > 0 else 0
-            
-            year1_subcategory_list.append({
-                'subcategory_code': subcat_code,
-                'subcategory_name': subcat_data['subcategory_name'],
-                'stock_price': current_stock,
-                'yoy': stock_yoy
-            })
-        
-        # 재고금액 높은순으로 정렬하고 top 7 선택 (JP, DJ 포함)
-        year1_subcategory_list.sort(key=lambda x: x['stock_price'], reverse=True)
-        # Top7로 확장 (JP, DJ 포함)
-        by_year['1년차']['subcategory_top5'] = year1_subcategory_list[:7]
-        
-        # Top7를 제외한 나머지 합계 계산 및 상세 내역
-        top7_codes = {item['subcategory_code'] for item in year1_subcategory_list[:7]}
-        others_list = [item for item in year1_subcategory_list if item['subcategory_code'] not in top7_codes]
-        others_list.sort(key=lambda x: x['stock_price'], reverse=True)  # 재고금액 큰 순으로 정렬
-        others_current = sum(item['stock_price'] for item in others_list)
-        others_previous = sum(year1_subcategory_previous.get(subcat_code, {}).get('stock_price', 0) / 1000 
-                             for subcat_code, subcat_data in year1_subcategory_current.items() 
-                             if subcat_code not in top7_codes)
-        others_yoy = (others_current / others_previous * 100) if others_previous > 0 else 0
-        by_year['1년차']['others'] = {
-            'stock_price': others_current,
-            'yoy': others_yoy,
-            'subcategory_top5': others_list[:5]  # 기타 항목 중 재고금액 큰 순으로 5개
-        }
-    
-    # 2년차(23FW) subcategory별 집계 (재고금액 높은순 top5)
-    if '2년차' in by_year:
-        # 현재 데이터에서 2년차(23FW) subcategory별 집계
-        year2_subcategory_current = defaultdict(lambda: {'stock_price': 0, 'subcategory_code': '', 'subcategory_name': ''})
-        for row in past_season_fw_data:
-            season_code = row['Season_Code']
-            if season_code.endswith('F'):
-                season_year = int(season_code[:2])
-                years_ago = last_year % 100 - season_year
-                if years_ago == 2:  # 2년차 (23FW)
-                    subcat_code = row['Subcategory_Code'].strip()
-                    subcat_name = row['Subcategory'].strip()
-                    stock_price = float(row['Stock_Price'] or 0) / TWD_TO_HKD_RATE  # V- 적용 안 함 (택재고)
-                    year2_subcategory_current[subcat_code]['subcategory_code'] = subcat_code
-                    year2_subcategory_current[subcat_code]['subcategory_name'] = subcat_name
-                    year2_subcategory_current[subcat_code]['stock_price'] += stock_price
+    # 1년차(24FW) / 2년차(23FW) subcategory별 집계 (재고금액 높은순 top7, 1년차는 JP, DJ 포함)
+    # 전년 비교는 전년 동월 기준 같은 년차 (1년차 23FW, 2년차 22FW)
+    for age, year_key in [(1, '1년차'), (2, '2년차')]:
+        if year_key not in by_year:
+            continue
         
-        # 전년 데이터에서 2년차(22FW) subcategory별 집계
-        # 전년 기준으로 2년차는 22FW (prev_year=24, season_year=22)
-        year2_subcategory_previous = defaultdict(lambda: {'stock_price': 0, 'subcategory_code': '', 'subcategory_name': ''})
-        for row in prev_past_season_fw_data:
-            season_code = row['Season_Code']
-            if season_code.endswith('F'):
-                season_year = int(season_code[:2])
-                # 전년 기준으로 2년차는 22FW (prev_year=24, season_year=22)
-                # 현재 기준으로 2년차는 23FW (last_year=25, season_year=23)
-                # 따라서 전년 데이터에서 2년차를 찾을 때는 season_year == 22
-                if season_year == 22:  # 전년 기준 2년차 (22FW)
-                    subcat_code = row['Subcategory_Code'].strip()
-                    subcat_name = row['Subcategory'].strip()
-                    stock_price = float(row['Stock_Price'] or 0) / TWD_TO_HKD_RATE  # V- 적용 안 함 (택재고)
-                    year2_subcategory_previous[subcat_code]['subcategory_code'] = subcat_code
-                    year2_subcategory_previous[subcat_code]['subcategory_name'] = subcat_name
-                    year2_subcategory_previous[subcat_code]['stock_price'] += stock_price
+        def subcat_stock(period, subcat_code):
+            """해당 년차 subcategory 재고 (1K HKD, V- 적용 안 함 - 택재고)"""
+            return aging.total('Stock_Price', period, min_age=age, max_age=age, subcategory=subcat_code) / TWD_TO_HKD_RATE / 1000
         
-        # Top 5 정렬 (재고금액 높은순)
-        year2_subcategory_list = []
-        for subcat_code, subcat_data in year2_subcategory_current.items():
-            current_stock = subcat_data['stock_price'] / 1000  # 1K HKD
-            prev_data = year2_subcategory_previous.get(subcat_code, {})
-            previous_stock = prev_data.get('stock_price', 0) / 1000  # 1K HKD
+        subcategory_list = []
+        previous_stocks = {}
+        for subcat_code in aging.subcategories(last_period, min_age=age, max_age=age):
+            current_stock = subcat_stock(last_period, subcat_code)
+            previous_stocks[subcat_code] = previous_stock = subcat_stock(prev_period, subcat_code)
             stock_yoy = (current_stock / previous_stock * 100) if previous_stock > 0 else 0
             
-            year2_subcategory_list.append({
+            subcategory_list.append({
                 'subcategory_code': subcat_code,
-                'subcategory_name': subcat_data['subcategory_name'],
+                'subcategory_name': aging.subcategory_name(last_period, subcat_code, age),
                 'stock_price': current_stock,
                 'yoy': stock_yoy
             })
         
         # 재고금액 높은순으로 정렬하고 top 7 선택
-        year2_subcategory_list.sort(key=lambda x: x['stock_price'], reverse=True)
-        # Top7로 확장
-        by_year['2년차']['subcategory_top5'] = year2_subcategory_list[:7]
+        subcategory_list.sort(key=lambda x: x['stock_price'], reverse=True)
+        by_year[year_key]['subcategory_top5'] = subcategory_list[:7]
         
         # Top7를 제외한 나머지 합계 계산 및 상세 내역
-        top7_codes = {item['subcategory_code'] for item in year2_subcategory_list[:7]}
-        others_list = [item for item in year2_subcategory_list if item['subcategory_code'] not in top7_codes]
-        others_list.sort(key=lambda x: x['stock_price'], reverse=True)  # 재고금액 큰 순으로 정렬
+        top7_codes = {item['subcategory_code'] for item in subcategory_list[:7]}
+        others_list = [item for item in subcategory_list if item['subcategory_code'] not in top7_codes]
         others_current = sum(item['stock_price'] for item in others_list)
-        others_previous = sum(year2_subcategory_previous.get(subcat_code, {}).get('stock_price', 0) / 1000 
-                             for subcat_code, subcat_data in year2_subcategory_current.items() 
-                             if subcat_code not in top7_codes)
+        others_previous = sum(previous_stocks[item['subcategory_code']] for item in others_list)
         others_yoy = (others_current / others_previous * 100) if others_previous > 0 else 0
-        by_year['2년차']['others'] = {
+        by_year[year_key]['others'] = {
             'stock_price': others_current,
             'yoy': others_yoy,
             'subcategory_top5': others_list[:5]  # 기타 항목 중 재고금액 큰 순으로 5개
@@ -1694,157 +1261,26 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
         'by_year': by_year
     }
     
-    # past_season_sales 생성 (과시즌 판매 데이터)
+    # past_season_sales 생성 (과시즌 판매 데이터, 택매출 V- 적용)
     print("past_season_sales 데이터 생성 중...")
-    # prev_data를 로컬 변수로 저장 (다른 곳에서 재정의될 수 있으므로)
-    prev_data_for_sales = [row for row in data if row['Period'] == prev_period and row['Brand'] == 'MLB' and row['Country'] == 'TW']
-    current_data_for_sales = [row for row in data if row['Period'] == last_period and row['Brand'] == 'MLB' and row['Country'] == 'TW']
-    past_season_sales_by_year = {
-        '1년차': {
-            'current': {'gross_sales': 0},
-            'previous': {'gross_sales': 0},
-        },
-        '2년차': {
-            'current': {'gross_sales': 0},
-            'previous': {'gross_sales': 0},
-        },
-        '3년차_이상': {
-            'current': {'gross_sales': 0},
-            'previous': {'gross_sales': 0},
-        },
-    }
-    past_season_sales_ss = {
-        'current': {'gross_sales': 0},
-        'previous': {'gross_sales': 0},
-    }
-    
-    # 현재 시즌 코드 계산
-    current_season_f = f"{last_year % 100:02d}F"
-    current_season_s = f"{last_year % 100:02d}S"
-    previous_season_f = f"{prev_year % 100:02d}F"
-    previous_season_s = f"{prev_year % 100:02d}S"
-    prev_prev_season_f = f"{(prev_year - 1) % 100:02d}F" if prev_year > 0 else None
-    prev_prev_prev_season_f = f"{(prev_year - 2) % 100:02d}F" if prev_year > 1 else None
-    
-    # 현재 Period 과시즌 판매 계산
-    current_fw_count = 0
-    current_ss_count = 0
-    current_season_codes = {}
-    
-    for row in current_data_for_sales:
-        season_code = row.get('Season_Code', '')
-        if season_code:
-            current_season_codes[season_code] = current_season_codes.get(season_code, 0) + 1
-        gross_sales = float(row.get('Gross_Sales', 0) or 0) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE  # TWD → HKD, V- 적용
-        
-        if season_code.endswith('F') and season_code != current_season_f:
-            # 과시즌F
-            if len(season_code) >= 2:
-                try:
-                    season_year = int(season_code[:2])
-                    year_diff = last_year % 100 - season_year
-                    
-                    if season_code == previous_season_f:  # 24F (1년차)
-                        past_season_sales_by_year['1년차']['current']['gross_sales'] += gross_sales
-                        current_fw_count += 1
-                    elif prev_prev_season_f and season_code == prev_prev_season_f:  # 23F (2년차)
-                        past_season_sales_by_year['2년차']['current']['gross_sales'] += gross_sales
-                        current_fw_count += 1
-                    elif season_year < prev_year % 100 - 1:  # 22F 이하 (3년차 이상)
-                        past_season_sales_by_year['3년차_이상']['current']['gross_sales'] += gross_sales
-                        current_fw_count += 1
-                except ValueError:
-                    continue
-        elif season_code.endswith('S') and season_code != current_season_s:
-            # 과시즌S
-            past_season_sales_ss['current']['gross_sales'] += gross_sales
-            current_ss_count += 1
-    
-    print(f"현재 Period 과시즌 판매 계산:")
-    print(f"  현재 Period 당시즌: {current_season_f}, {current_season_s}")
-    print(f"  현재 Period 기준 1년차: {previous_season_f}")
-    print(f"  현재 Period 기준 2년차: {prev_prev_season_f}")
-    print(f"  현재 Period 데이터의 시즌 코드 분포:")
-    for sc, count in sorted(current_season_codes.items()):
-        print(f"    {sc}: {count}건")
-    print(f"  현재 Period 과시즌F 데이터 건수: {current_fw_count}")
-    print(f"  현재 Period 과시즌S 데이터 건수: {current_ss_count}")
-    print(f"  현재 Period 1년차 판매: {past_season_sales_by_year['1년차']['current']['gross_sales']:.2f} HKD")
-    print(f"  현재 Period 2년차 판매: {past_season_sales_by_year['2년차']['current']['gross_sales']:.2f} HKD")
-    print(f"  현재 Period 3년차 이상 판매: {past_season_sales_by_year['3년차_이상']['current']['gross_sales']:.2f} HKD")
-    print(f"  현재 Period 과시즌S 판매: {past_season_sales_ss['current']['gross_sales']:.2f} HKD")
-    
-    # 전년 동월 과시즌 판매 계산
-    # 전년 동월 기준으로 시즌 코드 재계산
-    prev_year_for_prev_period = prev_year  # 2024
-    prev_prev_year_for_prev_period = prev_year - 1  # 2023
-    prev_prev_prev_year_for_prev_period = prev_year - 2  # 2022
-    prev_period_previous_season_f = f"{prev_year_for_prev_period % 100:02d}F"  # 24F (전년 동월의 당시즌)
-    prev_period_previous_season_s = f"{prev_year_for_prev_period % 100:02d}S"  # 24S (전년 동월의 당시즌)
-    prev_period_prev_prev_season_f = f"{prev_prev_year_for_prev_period % 100:02d}F" if prev_prev_year_for_prev_period > 0 else None  # 23F (전년 동월 기준 1년차)
-    prev_period_prev_prev_prev_season_f = f"{prev_prev_prev_year_for_prev_period % 100:02d}F" if prev_prev_prev_year_for_prev_period > 0 else None  # 22F (전년 동월 기준 2년차)
-    
-    print(f"전년 동월 과시즌 판매 계산:")
-    print(f"  전년 동월 당시즌: {prev_period_previous_season_f}, {prev_period_previous_season_s}")
-    print(f"  전년 동월 기준 1년차: {prev_period_prev_prev_season_f}")
-    print(f"  전년 동월 기준 2년차: {prev_period_prev_prev_prev_season_f}")
-    print(f"  전년 동월 데이터 건수: {len(prev_data)}건")
-    
-    # 전년 동월 데이터의 시즌 코드 확인
-    prev_season_codes = {}
-    prev_gross_sales_by_season = {}
-    for row in prev_data:
-        sc = row.get('Season_Code', '')
-        gross_sales = float(row.get('Gross_Sales', 0) or 0)
-        if sc:
-            prev_season_codes[sc] = prev_season_codes.get(sc, 0) + 1
-            if gross_sales > 0:
-                if sc not in prev_gross_sales_by_season:
-                    prev_gross_sales_by_season[sc] = 0
-                prev_gross_sales_by_season[sc] += gross_sales
-    print(f"  전년 동월 데이터의 시즌 코드 분포:")
-    if prev_season_codes:
-        for sc, count in sorted(prev_season_codes.items()):
-            gross = prev_gross_sales_by_season.get(sc, 0)
-            print(f"    {sc}: {count}건 (Gross_Sales 합계: {gross:.2f})")
-    else:
-        print(f"    (시즌 코드 없음)")
-    
-    prev_fw_count = 0
-    prev_ss_count = 0
-    
-    for row in prev_data_for_sales:
-        season_code = row.get('Season_Code', '')
-        gross_sales = float(row.get('Gross_Sales', 0) or 0) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE  # TWD → HKD, V- 적용
-        
-        if season_code.endswith('F') and season_code != prev_period_previous_season_f:
-            # 과시즌F (전년 동월 기준)
-            if len(season_code) >= 2:
-                try:
-                    season_year = int(season_code[:2])
-                    # 전년 동월 기준으로 시즌별 분류
-                    if prev_period_prev_prev_season_f and season_code == prev_period_prev_prev_season_f:  # 23F (전년 동월 기준 1년차)
-                        past_season_sales_by_year['1년차']['previous']['gross_sales'] += gross_sales
-                        prev_fw_count += 1
-                    elif prev_period_prev_prev_prev_season_f and season_code == prev_period_prev_prev_prev_season_f:  # 22F (전년 동월 기준 2년차)
-                        past_season_sales_by_year['2년차']['previous']['gross_sales'] += gross_sales
-                        prev_fw_count += 1
-                    elif season_year < prev_year_for_prev_period % 100 - 2:  # 21F 이하 (전년 동월 기준 3년차 이상)
-                        past_season_sales_by_year['3년차_이상']['previous']['gross_sales'] += gross_sales
-                        prev_fw_count += 1
-                except ValueError:
-                    continue
-        elif season_code.endswith('S') and season_code != prev_period_previous_season_s:
-            # 과시즌S (전년 동월 기준)
-            past_season_sales_ss['previous']['gross_sales'] += gross_sales
-            prev_ss_count += 1
-    
-    print(f"  전년 동월 과시즌F 데이터 건수: {prev_fw_count}")
-    print(f"  전년 동월 과시즌S 데이터 건수: {prev_ss_count}")
-    print(f"  전년 동월 1년차 판매: {past_season_sales_by_year['1년차']['previous']['gross_sales']:.2f} HKD")
-    print(f"  전년 동월 2년차 판매: {past_season_sales_by_year['2년차']['previous']['gross_sales']:.2f} HKD")
-    print(f"  전년 동월 3년차 이상 판매: {past_season_sales_by_year['3년차_이상']['previous']['gross_sales']:.2f} HKD")
-    print(f"  전년 동월 과시즌S 판매: {past_season_sales_ss['previous']['gross_sales']:.2f} HKD")
+    past_season_sales_by_year = {}
+    past_season_sales_ss = {}
+    for period, side in [(last_period, 'current'), (prev_period, 'previous')]:
+        for year_key in ['1년차', '2년차', '3년차_이상']:
+            gross_sales = aging.bucket('Gross_Sales', period, year_key) / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE
+            past_season_sales_by_year.setdefault(year_key, {})[side] = {'gross_sales': gross_sales}
+        # 과시즌S: 당시즌 S(연차 0)를 제외한 S 시즌 (차기 시즌 포함)
+        ss_gross_sales = (aging.total('Gross_Sales', period, 'S', max_age=-1)
+                          + aging.total('Gross_Sales', period, 'S', min_age=1))
+        past_season_sales_ss[side] = {'gross_sales': ss_gross_sales / TWD_TO_HKD_RATE / VAT_EXCLUSION_RATE}
+        
+        fw_count = aging.total(ROW_COUNT, period, min_age=1)
+        ss_count = aging.total(ROW_COUNT, period, 'S', max_age=-1) + aging.total(ROW_COUNT, period, 'S', min_age=1)
+        print(f"{period} 과시즌 판매 계산:")
+        print(f"  과시즌F 데이터 건수: {fw_count:.0f}, 과시즌S 데이터 건수: {ss_count:.0f}")
+        for year_key in ['1년차', '2년차', '3년차_이상']:
+            print(f"  {year_key} 판매: {past_season_sales_by_year[year_key][side]['gross_sales']:.2f} HKD")
+        print(f"  과시즌S 판매: {past_season_sales_ss[side]['gross_sales']:.2f} HKD")
     
     # YOY 및 증감 계산
     for year_key in past_season_sales_by_year:
@@ -1919,33 +1355,13 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
             inv_items[key] = {'stock_price': 0, 'stock_weeks': 0}
         
         for row in period_rows:
-            cat = row.get('Category', '')
-            sc = row.get('Season_Code', '')
-            item = get_item_from_category_and_season(cat, sc, p_year, p_month)
-            
+            item = ITEM_LABELS[row['Item_Bucket']]
             stock_price = float(row['Stock_Price'] or 0) / TWD_TO_HKD_RATE
             
-            # 대시보드 키로 매핑
-            inv_key = None
-            if item == '당시즌F':
-                inv_key = 'F당시즌'
-            elif item == '당시즌S':
-                inv_key = 'S당시즌'
-            elif item == '과시즌F':
-                inv_key = '과시즌FW'
-            elif item == '과시즌S':
-                inv_key = '과시즌SS'
-            elif item in ['모자', '신발', '가방외']:
-                inv_key = item
-            
-            if inv_key:
-                inv_items[inv_key]['stock_price'] += stock_price
-            
-            # BAG와 기타ACC 분리 (그래프용)
-            if cat == 'BAG':
-                inv_items['가방']['stock_price'] += stock_price
-            elif cat in ['ATC', 'BOT', 'WTC']:
-                inv_items['기타ACC']['stock_price'] += stock_price
+            # 대시보드 키로 매핑 (가방과 기타ACC는 그래프용으로 분리)
+            inv_items[ITEM_INVENTORY_KEYS[item]]['stock_price'] += stock_price
+            if item in GRAPH_ACC_KEYS:
+                inv_items[item]['stock_price'] += stock_price
         
         # 재고주수 계산은 생략 (복잡하므로 추후 구현)
         
@@ -1974,33 +1390,13 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
                 prev_inv_items[key] = {'stock_price': 0}
             
             for row in prev_period_rows:
-                cat = row.get('Category', '')
-                sc = row.get('Season_Code', '')
-                # YOY 계산 시 전년도 데이터는 전년도 기준으로 분류
-                item = get_item_from_category_and_season(cat, sc, prev_year, prev_month)
-                
+                # YOY 계산 시 전년도 데이터는 전년도 기준으로 분류 (Item_Bucket은 행의 Period 기준)
+                item = ITEM_LABELS[row['Item_Bucket']]
                 stock_price = float(row['Stock_Price'] or 0) / TWD_TO_HKD_RATE
                 
-                inv_key = None
-                if item == '당시즌F':
-                    inv_key = 'F당시즌'
-                elif item == '당시즌S':
-                    inv_key = 'S당시즌'
-                elif item == '과시즌F':
-                    inv_key = '과시즌FW'
-                elif item == '과시즌S':
-                    inv_key = '과시즌SS'
-                elif item in ['모자', '신발', '가방외']:
-                    inv_key = item
-                
-                if inv_key:
-                    prev_inv_items[inv_key]['stock_price'] += stock_price
-                
-                # BAG와 기타ACC 분리 (그래프용)
-                if cat == 'BAG':
-                    prev_inv_items['가방']['stock_price'] += stock_price
-                elif cat in ['ATC', 'BOT', 'WTC']:
-                    prev_inv_items['기타ACC']['stock_price'] += stock_price
+                prev_inv_items[ITEM_INVENTORY_KEYS[item]]['stock_price'] += stock_price
+                if item in GRAPH_ACC_KEYS:
+                    prev_inv_items[item]['stock_price'] += stock_price
             
             # YOY 계산
             # 1~6월: 24F(F당시즌)를 과시즌FW로 이동시킨 후 계산
@@ -2135,23 +1531,23 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
     
     # JSON 저장 (Period별 파일명)
     print(f"결과 저장 중: {period_output_path}")
-    with open(period_output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    public_dir = 'public/dashboard'
+    public_period_file = os.path.join(public_dir, period_file)
+    # public/dashboard 폴더에도 저장 (Next.js에서 동적 로드용, 원자적 저장 + 매니페스트 자동 갱신)
+    with ArtifactWriter() as writer:
+        writer.write(period_output_path, result)
+        writer.write(public_period_file, result)
+    
+    # KPI 테이블 갱신 (CEO 인사이트 입력)
+    record_kpis('taiwan', period, dashboard_kpis(result))
     
     # 기본 파일명으로도 복사 - 비활성화 (Period별 파일만 사용하여 이전 데이터 보호)
     # shutil.copy2(period_output_path, output_file_path)
     # print(f"기본 파일로도 복사: {output_file_path}")
     print(f"Period별 파일 생성 완료: {period_output_path}")
     
-    # public/dashboard 폴더에도 복사 (Next.js에서 동적 로드용)
-    public_dir = 'public/dashboard'
-    if not os.path.exists(public_dir):
-        os.makedirs(public_dir)
-    public_period_file = os.path.join(public_dir, period_file)
-    public_default_file = os.path.join(public_dir, os.path.basename(output_file_path))
-    shutil.copy2(period_output_path, public_period_file)
     # 기본 파일 복사도 비활성화
-    # shutil.copy2(period_output_path, public_default_file)
+    # shutil.copy2(period_output_path, os.path.join(public_dir, os.path.basename(output_file_path)))
     print(f"public 폴더로 복사 완료: {public_period_file}")
     print(f"기본 파일 복사 생략 (Period별 독립 데이터 유지)")
     
@@ -2162,6 +1558,7 @@ def generate_dashboard_data(csv_file_path, output_file_path, target_period=None)
     print(f"  - 추세 데이터 포인트: {len(trend_data)}")
 
 if __name__ == '__main__':
+    instrument_cli()
     import sys
     import glob
     
@@ -6,7 +6,8 @@ import csv
 import json
 from collections import defaultdict
 from datetime import datetime
-import re
+
+from channel_sums import get_store_channel
 
 def parse_period(period_str):
     """Period 문자열을 파싱 (예: 202510 -> 2025, 10)"""
@@ -20,36 +21,6 @@ def parse_period(period_str):
         return year, month
     return None, None
 
-# Store Code 분류 (대만)
-def is_mlb_retail(store_code):
-    """MLB 리테일 (T로 시작하는 숫자)"""
-    return bool(re.match(r'^T\d+$', store_code))
-
-def is_mlb_online(store_code):
-    """MLB 온라인 (TE로 시작)"""
-    return store_code.startswith('TE')
-
-def is_mlb_outlet(store_code):
-    """MLB 아울렛 (TU로 시작)"""
-    return store_code.startswith('TU')
-
-def is_discovery_retail(store_code):
-    """Discovery 리테일 (D로 시작하는 숫자)"""
-    return bool(re.match(r'^D\d+$', store_code))
-
-def is_discovery_online(store_code):
-    """Discovery 온라인 (DE로 시작)"""
-    return store_code.startswith('DE')
-
-def get_store_channel(store_code):
-    """Store Code를 기반으로 채널 반환"""
-    if is_mlb_outlet(store_code) or is_discovery_retail(store_code):  # 아울렛은 없을 수도 있음
-        return 'Outlet'
-    elif is_mlb_online(store_code) or is_discovery_online(store_code):
-        return 'Online'
-    else:
-        return 'Retail'
-
 def read_pl_database(csv_file, brand_filter=None, include_office=False):
     """손익 데이터베이스 읽기"""
     pl_data = []
@@ -1694,6 +1665,10 @@ def main(target_period_short=None):
     # public 폴더에도 복사
     shutil.copy(output_file, public_file)
     
+    # 매니페스트 갱신 (콘텐츠 해시 URL)
+    from dashboard_manifest import update_manifest
+    update_manifest([public_file])
+    
     print(f"\nP&L 데이터가 {output_file}에 저장되었습니다.")
     print(f"Public 폴더에도 복사: {public_file}")
     
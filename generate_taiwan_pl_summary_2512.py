@@ -4,14 +4,24 @@
 """
 import csv
 import json
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import re
+
+from channel_sums import get_store_channel
+from opex_engine import PL_SUMMARY_TREE, OpexEngine
+from pl_table import PLTable
+from stage_profiler import instrument_cli, staged
 
 # 대상 Period 설정
 CURRENT_PERIOD = 202512  # 2025년 12월
 PREVIOUS_PERIOD = 202412  # 2024년 12월 (전년 동월)
 
+# 월별 부분 집계 병렬 실행 (누적 블록)
+PL_CHANNELS = ['Retail', 'Outlet', 'Online']
+PARALLEL_MIN_ROWS = 50000  # 이보다 적은 행은 프로세스 풀 기동 비용이 더 커서 순차 실행
+
 def parse_period(period_str):
     """Period 문자열을 파싱 (예: 202510 -> 2025, 10)"""
     if len(period_str) == 6:
@@ -24,36 +34,7 @@ def parse_period(period_str):
         return year, month
     return None, None
 
-# Store Code 분류 (대만)
-def is_mlb_retail(store_code):
-    """MLB 리테일 (T로 시작하는 숫자)"""
-    return bool(re.match(r'^T\d+$', store_code))
-
-def is_mlb_online(store_code):
-    """MLB 온라인 (TE로 시작)"""
-    return store_code.startswith('TE')
-
-def is_mlb_outlet(store_code):
-    """MLB 아울렛 (TU로 시작)"""
-    return store_code.startswith('TU')
-
-def is_discovery_retail(store_code):
-    """Discovery 리테일 (D로 시작하는 숫자)"""
-    return bool(re.match(r'^D\d+$', store_code))
-
-def is_discovery_online(store_code):
-    """Discovery 온라인 (DE로 시작)"""
-    return store_code.startswith('DE')
-
-def get_store_channel(store_code):
-    """Store Code를 기반으로 채널 반환"""
-    if is_mlb_outlet(store_code) or is_discovery_retail(store_code):  # 아울렛은 없을 수도 있음
-        return 'Outlet'
-    elif is_mlb_online(store_code) or is_discovery_online(store_code):
-        return 'Online'
-    else:
-        return 'Retail'
-
+@staged()
 def read_pl_database(csv_file, brand_filter=None, include_office=False):
     """손익 데이터베이스 읽기"""
     pl_data = []
@@ -112,76 +93,18 @@ def get_dx_sg_a(pl_data, period):
             sg_a += clean_number(row['VALUE'])
     return sg_a
 
-def get_mlb_expense_detail(pl_data, period):
-    """MLB 영업비 상세 항목 추출 (T99 오피스, BRD_CD='M'만)"""
-    expense_detail = {
-        'salary': 0.0,      # 급여 (SAL_EXP)
-        'marketing': 0.0,   # 광고선전비 (AD_EXP)
-        'fee': 0.0,         # 지급수수료 (COMM_EXP)
-        'rent': 0.0,        # 임차료 (FIX_RENT)
-        'insurance': 0.0,    # 보험료 (INS_EXP)
-        'travel': 0.0,      # 여비교통비 (TRVL_MEAL_EXP)
-        'other': 0.0,       # 기타
-        'other_detail': {}  # 기타 상세 항목
-    }
-    
-    # 기타 항목 계정 정의
-    other_accounts = {
-        'depreciation': {'code': 'DEPR_EXP', 'name': '14. 감가상각비', 'label': '감가상각비'},
-        'duty_free': {'code': 'DUTY_FREE_EXP', 'name': '15. 면세점 직접비', 'label': '면세점 직접비'},
-        'govt_license': {'code': 'GOVT_LICEN_FEES', 'name': ' - Government Rate & License Fee', 'label': '정부세금 및 라이센스'},
-        'logistics': {'code': 'LGT_EXP', 'name': '11. 운반비', 'label': '운반비'},
-        'maintenance': {'code': 'MAINT_EXP', 'name': '5. 유지보수비', 'label': '유지보수비'},
-        'other_fee': {'code': 'OTHER_FEE_EXP', 'name': '12. 기타 수수료(매장관리비 외)', 'label': '기타 수수료'},
-        'rent_free': {'code': 'RENT_FREE_CONC', 'name': ' - Rent free / Rent concession', 'label': '임대료 면제/할인'},
-        'retirement': {'code': 'RET_PEN_EXP', 'name': ' - EMPLOYEE BENEFIT PROGRAMS', 'label': '퇴직연금'},
-        'supplies': {'code': 'SUPPLIES_EXP', 'name': '7. 소모품비', 'label': '소모품비'},
-        'transport': {'code': 'TRANS_EXP', 'name': '운반비', 'label': '운반비(기타)'},
-        'uniform': {'code': 'UNIFORM_EXP', 'name': '3. 피복비(유니폼)', 'label': '피복비(유니폼)'},
-        'utilities': {'code': 'UTILITIES_EXP', 'name': '6. 수도광열비', 'label': '수도광열비'},
-        'var_rent': {'code': 'VAR_RENT', 'name': ' - Turnover Rates', 'label': '매출연동 임대료'},
-        'communication': {'code': 'COMMUNI_EXP', 'name': '8. 통신비', 'label': '통신비'},
-        'bonus': {'code': 'BON_EXP', 'name': ' - Final Payment', 'label': '최종지급금'}
-    }
-    
-    # 기타 상세 초기화
-    for key in other_accounts:
-        expense_detail['other_detail'][key] = 0.0
-    
-    for row in pl_data:
-        if (row['PERIOD'] == period and 
-            row['SHOP_CD'] == 'T99' and 
-            row['BRD_CD'] == 'M'):  # MLB만
-            
-            account_cd = row.get('ACCOUNT_CD', '').strip() if 'ACCOUNT_CD' in row else ''
-            account_nm = row['ACCOUNT_NM'].strip()
-            value = clean_number(row['VALUE'])
-            
-            # 계정 코드 또는 계정명으로 매핑
-            if account_cd == '급여' or account_nm == ' - Payroll' or account_nm == '1. 급 여':
-                expense_detail['salary'] += value
-            elif account_cd == '광고비' or account_nm == '9. 광고선전비':
-                expense_detail['marketing'] += value
-            elif account_cd == '지급수수료 일반' or account_nm == '10. 지급수수료':
-                expense_detail['fee'] += value
-            elif account_cd == '임차료' or account_nm == ' - Base Rent' or account_nm == '4. 임차료':
-                expense_detail['rent'] += value
-            elif account_cd == '보험료' or account_nm == '13. 보험료':
-                expense_detail['insurance'] += value
-            elif account_cd == '여비교통비' or account_nm == '2. TRAVEL & MEAL':
-                expense_detail['travel'] += value
-            else:
-                # 기타 항목들 분류
-                for key, account_info in other_accounts.items():
-                    if account_cd == account_info['code'] or account_nm == account_info['name']:
-                        expense_detail['other_detail'][key] += value
-                        break
-    
-    # 기타 항목 합계 계산
-    expense_detail['other'] = sum(expense_detail['other_detail'].values())
-    
-    return expense_detail
+@staged(rows=None)
+def get_mlb_expense_detail(pl_data, period, end_period=None, opex=None):
+    """MLB 영업비 상세 항목 추출 (T99 오피스, BRD_CD='M'만)
+
+    계정 매핑은 opex_engine.PL_SUMMARY_TREE (계정 코드 또는 계정명), period ~ end_period 구간 합계
+    opex: pl_data로 만든 OpexEngine (여러 Period 조회 시 재사용, 없으면 새로 집계)
+    """
+    if opex is None:
+        opex = OpexEngine(PLTable(pl_data), PL_SUMMARY_TREE)
+    return opex.breakdown(period, end_period, brand='M', shops='T99')
 
+@staged(rows=None)
 def aggregate_pl_by_period(pl_data, period, country=None, channel=None):
     """특정 Period의 손익 데이터 집계"""
     result = defaultdict(float)
@@ -230,6 +153,7 @@ def aggregate_pl_by_period(pl_data, period, country=None, channel=None):
     
     return result
 
+@staged(rows=None)
 def calculate_store_direct_profit(pl_data, latest_period, prev_period):
     """매장별 영업이익 계산 (직접이익으로 표시하지만 실제로는 영업이익 사용)"""
     stores = {}
@@ -392,128 +316,170 @@ def calculate_store_direct_profit(pl_data, latest_period, prev_period):
     
     return stores
 
-def calculate_cumulative_store_data(pl_data, periods):
-    """매장별 누적 데이터 계산 (실판매출, 직접이익 포함)"""
+STORE_COST_KEYS = ['labor_cost', 'rent', 'depreciation', 'logistics', 'other_fee', 'marketing', 'fee',
+                   'maintenance', 'insurance', 'utilities', 'supplies', 'travel', 'communication', 'uniform']
+
+def aggregate_store_period(period_rows):
+    """한 Period의 매장별 실판매출 / 매출총이익 / 직접비 항목 합계 (오피스 제외)"""
     stores = {}
     
+    for row in period_rows:
+        if row['CNTRY_CD'] != 'TW':
+            continue
+        
+        store_code = row['SHOP_CD']
+        if store_code == 'T99':  # 오피스 제외
+            continue
+        
+        if store_code not in stores:
+            stores[store_code] = {'net_sales': 0, 'gross_profit': 0, 'direct_profit': 0}
+            stores[store_code].update({key: 0 for key in STORE_COST_KEYS})
+        
+        account_nm = row['ACCOUNT_NM'].strip()
+        account_cd = row.get('ACCOUNT_CD', '').strip() if 'ACCOUNT_CD' in row else ''
+        value = clean_number(row['VALUE'])
+        
+        # 실매출액, 매출총이익 계산
+        if account_nm == '실매출액':
+            stores[store_code]['net_sales'] += value
+        elif account_nm == '매출총이익':
+            stores[store_code]['gross_profit'] += value
+        
+        # 각 계정 매핑 (직접비)
+        if account_nm == '1. 급 여':
+            stores[store_code]['labor_cost'] += value
+        elif account_nm == '4. 임차료':
+            stores[store_code]['rent'] += value
+        elif account_nm in ['14. 감가상각비'] or account_cd == 'DEPR_EXP':
+            stores[store_code]['depreciation'] += value
+        elif account_nm == '11. 운반비':
+            stores[store_code]['logistics'] += value
+        elif account_nm == '12. 기타 수수료(매장관리비 외)':
+            stores[store_code]['other_fee'] += value
+        elif account_nm == '9. 광고선전비':
+            stores[store_code]['marketing'] += value
+        elif account_nm == '10. 지급수수료':
+            stores[store_code]['fee'] += value
+        elif account_nm == '5. 유지보수비':
+            stores[store_code]['maintenance'] += value
+        elif account_nm == '13. 보험료':
+            stores[store_code]['insurance'] += value
+        elif account_nm == '6. 수도광열비':
+            stores[store_code]['utilities'] += value
+        elif account_nm == '7. 소모품비':
+            stores[store_code]['supplies'] += value
+        elif account_nm == '2. TRAVEL & MEAL':
+            stores[store_code]['travel'] += value
+        elif account_nm == '8. 통신비':
+            stores[store_code]['communication'] += value
+        elif account_nm == '3. 피복비(유니폼)':
+            stores[store_code]['uniform'] += value
+    
+    return stores
+
+# 워커 공유 PL 테이블 (Period → 행 목록, 읽기 전용)
+_SHARED_PERIOD_ROWS = {}
+
+def _share_period_rows(period_rows):
+    """프로세스 풀 워커 초기화: Period별 PL 행 공유"""
+    global _SHARED_PERIOD_ROWS
+    _SHARED_PERIOD_ROWS = period_rows
+
+def aggregate_period_partial(period, period_rows=None):
+    """
+    한 Period의 부분 집계 (월별 독립 작업)
+    
+    Returns:
+        {'Retail' / 'Outlet' / 'Online': 계정 합계 dict, 'stores': 매장별 항목 합계}
+    """
+    rows = (_SHARED_PERIOD_ROWS if period_rows is None else period_rows).get(period, [])
+    partial = {channel: dict(aggregate_pl_by_period(rows, period, 'TW', channel)) for channel in PL_CHANNELS}
+    partial['stores'] = aggregate_store_period(rows)
+    return partial
+
+@staged(rows=None)
+def aggregate_period_partials(pl_data, periods, max_workers=None):
+    """
+    Period별 부분 집계 (누적 블록용) - 월별 작업을 프로세스 풀에서 병렬 실행
+    
+    - PL 행은 Period별로 1회 분할해 워커 초기화 시 공유 (읽기 전용)
+    - 결과는 periods 순서 dict → 누적 합산(reduce) 순서가 실행 순서와 무관하게 고정 (재현 가능)
+    - 행이 PARALLEL_MIN_ROWS 미만이거나 워커 1개면 순차 실행
+    
+    Args:
+        pl_data: PL 행 목록
+        periods: Period 목록 (YYYYMM)
+        max_workers: 워커 수 (기본: CPU 코어 수)
+    """
+    periods = list(dict.fromkeys(periods))
+    wanted = set(periods)
+    period_rows = defaultdict(list)
+    for row in pl_data:
+        if row['PERIOD'] in wanted:
+            period_rows[row['PERIOD']].append(row)
+    period_rows = dict(period_rows)
+    
+    workers = min(max_workers or os.cpu_count() or 1, len(periods))
+    if workers <= 1 or sum(len(rows) for rows in period_rows.values()) < PARALLEL_MIN_ROWS:
+        return {period: aggregate_period_partial(period, period_rows) for period in periods}
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_share_period_rows,
+                             initargs=(period_rows,)) as executor:
+        return dict(zip(periods, executor.map(aggregate_period_partial, periods)))
+
+def period_channel_data(partials, period, channel):
+    """부분 집계의 Period × 채널 계정 합계 (aggregate_pl_by_period와 같은 새 defaultdict)"""
+    return defaultdict(float, partials[period][channel])
+
+@staged(rows=None)
+def calculate_cumulative_store_data(pl_data, periods, partials=None):
+    """매장별 누적 데이터 계산 (실판매출, 직접이익 포함) - 월별 부분 집계를 Period 순서로 합산"""
+    if partials is None:
+        partials = aggregate_period_partials(pl_data, periods)
+    
+    stores = {}
     for period in periods:
-        for row in pl_data:
-            if row['PERIOD'] != period or row['CNTRY_CD'] != 'TW':
-                continue
-            
-            store_code = row['SHOP_CD']
-            if store_code == 'T99':  # 오피스 제외
-                continue
-            
+        for store_code, values in partials[period]['stores'].items():
             if store_code not in stores:
-                stores[store_code] = {
-                    'net_sales': 0,
-                    'gross_profit': 0,
-                    'direct_profit': 0,
-                    'labor_cost': 0,
-                    'rent': 0,
-                    'depreciation': 0,
-                    'logistics': 0,
-                    'other_fee': 0,
-                    'marketing': 0,
-                    'fee': 0,
-                    'maintenance': 0,
-                    'insurance': 0,
-                    'utilities': 0,
-                    'supplies': 0,
-                    'travel': 0,
-                    'communication': 0,
-                    'uniform': 0
-                }
-            
-            account_nm = row['ACCOUNT_NM'].strip()
-            account_cd = row.get('ACCOUNT_CD', '').strip() if 'ACCOUNT_CD' in row else ''
-            value = clean_number(row['VALUE'])
-            
-            # 실매출액, 매출총이익 계산
-            if account_nm == '실매출액':
-                stores[store_code]['net_sales'] += value
-            elif account_nm == '매출총이익':
-                stores[store_code]['gross_profit'] += value
-            
-            # 각 계정 매핑 (직접비)
-            if account_nm == '1. 급 여':
-                stores[store_code]['labor_cost'] += value
-            elif account_nm == '4. 임차료':
-                stores[store_code]['rent'] += value
-            elif account_nm in ['14. 감가상각비'] or account_cd == 'DEPR_EXP':
-                stores[store_code]['depreciation'] += value
-            elif account_nm == '11. 운반비':
-                stores[store_code]['logistics'] += value
-            elif account_nm == '12. 기타 수수료(매장관리비 외)':
-                stores[store_code]['other_fee'] += value
-            elif account_nm == '9. 광고선전비':
-                stores[store_code]['marketing'] += value
-            elif account_nm == '10. 지급수수료':
-                stores[store_code]['fee'] += value
-            elif account_nm == '5. 유지보수비':
-                stores[store_code]['maintenance'] += value
-            elif account_nm == '13. 보험료':
-                stores[store_code]['insurance'] += value
-            elif account_nm == '6. 수도광열비':
-                stores[store_code]['utilities'] += value
-            elif account_nm == '7. 소모품비':
-                stores[store_code]['supplies'] += value
-            elif account_nm == '2. TRAVEL & MEAL':
-                stores[store_code]['travel'] += value
-            elif account_nm == '8. 통신비':
-                stores[store_code]['communication'] += value
-            elif account_nm == '3. 피복비(유니폼)':
-                stores[store_code]['uniform'] += value
+                stores[store_code] = dict.fromkeys(values, 0)
+            for key, value in values.items():
+                stores[store_code][key] += value
     
     # 직접이익 계산: 매출총이익 - 직접비 합계
     for store_code in stores:
-        total_direct_cost = (
-            stores[store_code]['labor_cost'] +
-            stores[store_code]['rent'] +
-            stores[store_code]['depreciation'] +
-            stores[store_code]['logistics'] +
-            stores[store_code]['other_fee'] +
-            stores[store_code]['marketing'] +
-            stores[store_code]['fee'] +
-            stores[store_code]['maintenance'] +
-            stores[store_code]['insurance'] +
-            stores[store_code]['utilities'] +
-            stores[store_code]['supplies'] +
-            stores[store_code]['travel'] +
-            stores[store_code]['communication'] +
-            stores[store_code]['uniform']
-        )
+        total_direct_cost = sum(stores[store_code][key] for key in STORE_COST_KEYS)
         stores[store_code]['direct_profit'] = stores[store_code]['gross_profit'] - total_direct_cost
     
     return stores
 
-def calculate_pl_summary(pl_data, latest_period, prev_period):
-    """손익요약 계산"""
+@staged(rows=None)
+def calculate_pl_summary(pl_data, latest_period, prev_period, partials=None):
+    """손익요약 계산 (partials: aggregate_period_partials 결과, 없으면 여기서 계산)"""
+    latest_year, latest_month = parse_period(latest_period)
+    prev_year, prev_month = parse_period(prev_period)
+    
+    cumulative_periods = [f"{latest_year}{m:02d}" for m in range(1, latest_month + 1)]
+    prev_cumulative_periods = [f"{prev_year}{m:02d}" for m in range(1, prev_month + 1)]
+    if partials is None:
+        partials = aggregate_period_partials(pl_data, cumulative_periods + prev_cumulative_periods)
     
     # 당월 데이터 (대만은 TW 전체)
-    current_month_tw_retail = aggregate_pl_by_period(pl_data, latest_period, 'TW', 'Retail')
-    current_month_tw_outlet = aggregate_pl_by_period(pl_data, latest_period, 'TW', 'Outlet')
-    current_month_tw_online = aggregate_pl_by_period(pl_data, latest_period, 'TW', 'Online')
+    current_month_tw_retail = period_channel_data(partials, latest_period, 'Retail')
+    current_month_tw_outlet = period_channel_data(partials, latest_period, 'Outlet')
+    current_month_tw_online = period_channel_data(partials, latest_period, 'Online')
     current_month_total = defaultdict(float)
     for key in set(list(current_month_tw_retail.keys()) + list(current_month_tw_outlet.keys()) + list(current_month_tw_online.keys())):
         current_month_total[key] = current_month_tw_retail[key] + current_month_tw_outlet[key] + current_month_tw_online[key]
     
     # 전년 동월 데이터
-    prev_month_tw_retail = aggregate_pl_by_period(pl_data, prev_period, 'TW', 'Retail')
-    prev_month_tw_outlet = aggregate_pl_by_period(pl_data, prev_period, 'TW', 'Outlet')
-    prev_month_tw_online = aggregate_pl_by_period(pl_data, prev_period, 'TW', 'Online')
+    prev_month_tw_retail = period_channel_data(partials, prev_period, 'Retail')
+    prev_month_tw_outlet = period_channel_data(partials, prev_period, 'Outlet')
+    prev_month_tw_online = period_channel_data(partials, prev_period, 'Online')
     prev_month_total = defaultdict(float)
     for key in set(list(prev_month_tw_retail.keys()) + list(prev_month_tw_outlet.keys()) + list(prev_month_tw_online.keys())):
         prev_month_total[key] = prev_month_tw_retail[key] + prev_month_tw_outlet[key] + prev_month_tw_online[key]
     
-    # 누적 데이터 계산 (1월부터 현재 Period까지)
-    latest_year, latest_month = parse_period(latest_period)
-    prev_year, prev_month = parse_period(prev_period)
-    
-    cumulative_periods = [f"{latest_year}{m:02d}" for m in range(1, latest_month + 1)]
-    prev_cumulative_periods = [f"{prev_year}{m:02d}" for m in range(1, prev_month + 1)]
-    
+    # 누적 데이터 계산 (1월부터 현재 Period까지, 월별 부분 집계를 Period 순서로 합산)
     cumulative_total = defaultdict(float)
     prev_cumulative_total = defaultdict(float)
     
@@ -527,9 +493,9 @@ def calculate_pl_summary(pl_data, latest_period, prev_period):
     
     for period in cumulative_periods:
         # 대만 누적 (리테일+아울렛+온라인)
-        period_data_tw_retail = aggregate_pl_by_period(pl_data, period, 'TW', 'Retail')
-        period_data_tw_outlet = aggregate_pl_by_period(pl_data, period, 'TW', 'Outlet')
-        period_data_tw_online = aggregate_pl_by_period(pl_data, period, 'TW', 'Online')
+        period_data_tw_retail = period_channel_data(partials, period, 'Retail')
+        period_data_tw_outlet = period_channel_data(partials, period, 'Outlet')
+        period_data_tw_online = period_channel_data(partials, period, 'Online')
         for key in set(list(period_data_tw_retail.keys()) + list(period_data_tw_outlet.keys()) + list(period_data_tw_online.keys())):
             cumulative_total[key] += period_data_tw_retail[key] + period_data_tw_outlet[key] + period_data_tw_online[key]
             cumulative_tw_retail[key] += period_data_tw_retail[key]
@@ -538,9 +504,9 @@ def calculate_pl_summary(pl_data, latest_period, prev_period):
     
     for period in prev_cumulative_periods:
         # 전년 대만 누적 (리테일+아울렛+온라인)
-        period_data_tw_retail = aggregate_pl_by_period(pl_data, period, 'TW', 'Retail')
-        period_data_tw_outlet = aggregate_pl_by_period(pl_data, period, 'TW', 'Outlet')
-        period_data_tw_online = aggregate_pl_by_period(pl_data, period, 'TW', 'Online')
+        period_data_tw_retail = period_channel_data(partials, period, 'Retail')
+        period_data_tw_outlet = period_channel_data(partials, period, 'Outlet')
+        period_data_tw_online = period_channel_data(partials, period, 'Online')
         for key in set(list(period_data_tw_retail.keys()) + list(period_data_tw_outlet.keys()) + list(period_data_tw_online.keys())):
             prev_cumulative_total[key] += period_data_tw_retail[key] + period_data_tw_outlet[key] + period_data_tw_online[key]
             prev_cumulative_tw_retail[key] += period_data_tw_retail[key]
@@ -745,6 +711,7 @@ def calculate_pl_summary(pl_data, latest_period, prev_period):
         },
     }
 
+@staged(rows=None)
 def main(target_period_short=None):
     """PL Summary 생성
     
@@ -842,8 +809,10 @@ def main(target_period_short=None):
     print(f"  전년 ({prev_period_full}): {mlb_sg_a_prev:,.2f}")
     
     # 영업비 상세 항목 추출
-    expense_detail = get_mlb_expense_detail(pl_data_with_office, latest_period_full)
-    expense_detail_prev = get_mlb_expense_detail(pl_data_with_office, prev_period_full)
+    # 계정 트리 × Period 1회 집계 (당월 / 전년 / 누적 상세 공용)
+    opex = OpexEngine(PLTable(pl_data_with_office), PL_SUMMARY_TREE)
+    expense_detail = get_mlb_expense_detail(pl_data_with_office, latest_period_full, opex=opex)
+    expense_detail_prev = get_mlb_expense_detail(pl_data_with_office, prev_period_full, opex=opex)
     print(f"\n영업비 상세 항목 (당월):")
     for key, value in expense_detail.items():
         if key != 'other_detail':
@@ -869,51 +838,11 @@ def main(target_period_short=None):
     print(f"  누적 (1~{latest_month}월): {cum_sg_a:,.2f}")
     print(f"  전년 누적 (1~{prev_month}월): {cum_sg_a_prev:,.2f}")
     
-    # 누적 영업비 상세 항목 계산
-    # 기타 상세 항목 키 초기화
-    other_accounts = ['depreciation', 'duty_free', 'govt_license', 'logistics', 'maintenance', 
-                     'other_fee', 'rent_free', 'retirement', 'supplies', 'transport', 
-                     'uniform', 'utilities', 'var_rent', 'communication', 'bonus']
-    
-    cum_expense_detail = {
-        'salary': 0.0,
-        'marketing': 0.0,
-        'fee': 0.0,
-        'rent': 0.0,
-        'insurance': 0.0,
-        'travel': 0.0,
-        'other': 0.0,
-        'other_detail': {}
-    }
-    cum_expense_detail_prev = {
-        'salary': 0.0,
-        'marketing': 0.0,
-        'fee': 0.0,
-        'rent': 0.0,
-        'insurance': 0.0,
-        'travel': 0.0,
-        'other': 0.0,
-        'other_detail': {}
-    }
-    
-    # 기타 상세 항목 초기화
-    for key in other_accounts:
-        cum_expense_detail['other_detail'][key] = 0.0
-        cum_expense_detail_prev['other_detail'][key] = 0.0
-    
-    for period in cumulative_periods:
-        period_detail = get_mlb_expense_detail(pl_data_with_office, period)
-        for key in ['salary', 'marketing', 'fee', 'rent', 'insurance', 'travel', 'other']:
-            cum_expense_detail[key] += period_detail[key]
-        for key in other_accounts:
-            cum_expense_detail['other_detail'][key] += period_detail.get('other_detail', {}).get(key, 0.0)
-    
-    for period in prev_cumulative_periods:
-        period_detail = get_mlb_expense_detail(pl_data_with_office, period)
-        for key in ['salary', 'marketing', 'fee', 'rent', 'insurance', 'travel', 'other']:
-            cum_expense_detail_prev[key] += period_detail[key]
-        for key in other_accounts:
-            cum_expense_detail_prev['other_detail'][key] += period_detail.get('other_detail', {}).get(key, 0.0)
+    # 누적 영업비 상세 항목 계산 (Period 누적합 구간)
+    cum_expense_detail = get_mlb_expense_detail(
+        pl_data_with_office, cumulative_periods[0], cumulative_periods[-1], opex=opex)
+    cum_expense_detail_prev = get_mlb_expense_detail(
+        pl_data_with_office, prev_cumulative_periods[0], prev_cumulative_periods[-1], opex=opex)
     
     print(f"\n영업비 상세 항목 (누적):")
     for key, value in cum_expense_detail.items():
@@ -926,12 +855,14 @@ def main(target_period_short=None):
     
     # 누적 매장별 데이터 계산
     print("\n누적 매장별 데이터 계산 중...")
-    cumulative_store_data = calculate_cumulative_store_data(pl_data, cumulative_periods)
-    prev_cumulative_store_data = calculate_cumulative_store_data(pl_data, prev_cumulative_periods)
+    # 월별 부분 집계 (채널별 계정 + 매장별 항목) 1회 - 누적 매장 / 손익요약 / 채널별 누적 공용
+    partials = aggregate_period_partials(pl_data, cumulative_periods + prev_cumulative_periods)
+    cumulative_store_data = calculate_cumulative_store_data(pl_data, cumulative_periods, partials)
+    prev_cumulative_store_data = calculate_cumulative_store_data(pl_data, prev_cumulative_periods, partials)
     
     # 손익요약 계산
     print("\n손익요약 계산 중...")
-    pl_summary = calculate_pl_summary(pl_data, latest_period_full, prev_period_full)
+    pl_summary = calculate_pl_summary(pl_data, latest_period_full, prev_period_full, partials)
     
     # 결과 출력
     print("\n" + "=" * 100)
@@ -1021,21 +952,21 @@ def main(target_period_short=None):
     print("=" * 100)
     
     # TW 오프라인 (리테일 + 아울렛) - 당월
-    current_tw_offline_retail = aggregate_pl_by_period(pl_data, latest_period_full, 'TW', 'Retail')
-    current_tw_offline_outlet = aggregate_pl_by_period(pl_data, latest_period_full, 'TW', 'Outlet')
+    current_tw_offline_retail = period_channel_data(partials, latest_period_full, 'Retail')
+    current_tw_offline_outlet = period_channel_data(partials, latest_period_full, 'Outlet')
     current_tw_offline = defaultdict(float)
     for key in set(list(current_tw_offline_retail.keys()) + list(current_tw_offline_outlet.keys())):
         current_tw_offline[key] = current_tw_offline_retail[key] + current_tw_offline_outlet[key]
     
-    prev_tw_offline_retail = aggregate_pl_by_period(pl_data, prev_period_full, 'TW', 'Retail')
-    prev_tw_offline_outlet = aggregate_pl_by_period(pl_data, prev_period_full, 'TW', 'Outlet')
+    prev_tw_offline_retail = period_channel_data(partials, prev_period_full, 'Retail')
+    prev_tw_offline_outlet = period_channel_data(partials, prev_period_full, 'Outlet')
     prev_tw_offline = defaultdict(float)
     for key in set(list(prev_tw_offline_retail.keys()) + list(prev_tw_offline_outlet.keys())):
         prev_tw_offline[key] = prev_tw_offline_retail[key] + prev_tw_offline_outlet[key]
     
     # TW 온라인 - 당월
-    current_tw_online = aggregate_pl_by_period(pl_data, latest_period_full, 'TW', 'Online')
-    prev_tw_online = aggregate_pl_by_period(pl_data, prev_period_full, 'TW', 'Online')
+    current_tw_online = period_channel_data(partials, latest_period_full, 'Online')
+    prev_tw_online = period_channel_data(partials, prev_period_full, 'Online')
     
     # 누적 데이터 - 오프라인
     cumulative_tw_offline_retail = defaultdict(float)
@@ -1046,16 +977,16 @@ def main(target_period_short=None):
     prev_cumulative_tw_offline = defaultdict(float)
     
     for period in cumulative_periods:
-        period_data_retail = aggregate_pl_by_period(pl_data, period, 'TW', 'Retail')
-        period_data_outlet = aggregate_pl_by_period(pl_data, period, 'TW', 'Outlet')
+        period_data_retail = period_channel_data(partials, period, 'Retail')
+        period_data_outlet = period_channel_data(partials, period, 'Outlet')
         for key in set(list(period_data_retail.keys()) + list(period_data_outlet.keys())):
             cumulative_tw_offline_retail[key] += period_data_retail[key]
             cumulative_tw_offline_outlet[key] += period_data_outlet[key]
             cumulative_tw_offline[key] += period_data_retail[key] + period_data_outlet[key]
     
     for period in prev_cumulative_periods:
-        period_data_retail = aggregate_pl_by_period(pl_data, period, 'TW', 'Retail')
-        period_data_outlet = aggregate_pl_by_period(pl_data, period, 'TW', 'Outlet')
+        period_data_retail = period_channel_data(partials, period, 'Retail')
+        period_data_outlet = period_channel_data(partials, period, 'Outlet')
         for key in set(list(period_data_retail.keys()) + list(period_data_outlet.keys())):
             prev_cumulative_tw_offline_retail[key] += period_data_retail[key]
             prev_cumulative_tw_offline_outlet[key] += period_data_outlet[key]
@@ -1066,12 +997,12 @@ def main(target_period_short=None):
     prev_cumulative_tw_online = defaultdict(float)
     
     for period in cumulative_periods:
-        period_data_online = aggregate_pl_by_period(pl_data, period, 'TW', 'Online')
+        period_data_online = period_channel_data(partials, period, 'Online')
         for key in period_data_online.keys():
             cumulative_tw_online[key] += period_data_online[key]
     
     for period in prev_cumulative_periods:
-        period_data_online = aggregate_pl_by_period(pl_data, period, 'TW', 'Online')
+        period_data_online = period_channel_data(partials, period, 'Online')
         for key in period_data_online.keys():
             prev_cumulative_tw_online[key] += period_data_online[key]
     
@@ -1727,7 +1658,6 @@ def main(target_period_short=None):
                 stores_obj[store_code]['cumulative_direct_profit_prev'] = prev_cumul_stores[store_code].get('direct_profit', 0)
     
     # JSON 파일 저장 (period별 + 기본 파일)
-    import shutil
     if target_period_short:
         output_file = f'components/dashboard/taiwan-pl-data-{target_period_short}.json'
         public_file = f'public/dashboard/taiwan-pl-data-{target_period_short}.json'
@@ -1735,11 +1665,16 @@ def main(target_period_short=None):
         output_file = 'components/dashboard/taiwan-pl-data.json'
         public_file = 'public/dashboard/taiwan-pl-data.json'
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(pl_json_data, f, ensure_ascii=False, indent=2)
+    # public 폴더에도 저장 (원자적 저장, 변경 없으면 생략, 매니페스트 자동 갱신)
+    from dashboard_writer import ArtifactWriter
+    with ArtifactWriter() as writer:
+        writer.write(output_file, pl_json_data)
+        writer.write(public_file, pl_json_data)
     
-    # public 폴더에도 복사
-    shutil.copy(output_file, public_file)
+    # KPI 테이블 갱신 (CEO 인사이트 입력)
+    if target_period_short:
+        from kpi_table import pl_kpis, record_kpis
+        record_kpis('taiwan', target_period_short, pl_kpis(pl_json_data))
     
     print(f"\nP&L 데이터가 {output_file}에 저장되었습니다.")
     print(f"Public 폴더에도 복사: {public_file}")
@@ -1754,6 +1689,7 @@ def main(target_period_short=None):
     print("기본 파일 복사 생략 (Period별 독립 데이터 유지)")
 
 if __name__ == '__main__':
+    instrument_cli()
     import sys
     # 명령줄 인자로 period 받기
     target_period = sys.argv[1] if len(sys.argv) > 1 else None
@@ -10,6 +10,8 @@ import csv
 import json
 import glob
 
+from channel_sums import get_store_channel
+
 # 현재 디렉토리 설정
 script_dir = os.path.dirname(os.path.abspath(__file__))
 os.chdir(script_dir)
@@ -29,15 +31,6 @@ def clean_number(value):
     except:
         return 0.0
 
-def get_store_channel(store_code):
-    """매장 코드로 채널 판단"""
-    if store_code.startswith('TU'):
-        return 'Outlet'
-    elif store_code.startswith('TE'):
-        return 'Online'
-    else:
-        return 'Retail'
-
 def find_pl_csv(period):
     """PL CSV 파일 찾기"""
     possible_paths = [
@@ -551,6 +544,10 @@ def calculate_cumulative_store_data(target_period='2512'):
         with open(pl_json_path, 'w', encoding='utf-8') as f:
             json.dump(pl_data, f, ensure_ascii=False, indent=2)
         
+        # 매니페스트 갱신 (콘텐츠 해시 URL)
+        from dashboard_manifest import update_manifest
+        update_manifest([pl_json_path])
+        
         print(f"[완료] JSON 업데이트 완료")
     else:
         print(f"⚠️  JSON 파일 없음: {pl_json_path}")
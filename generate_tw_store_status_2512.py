@@ -5,6 +5,8 @@
 import json
 import os
 
+from store_area_index import TW_STORE_META
+
 # TWPL JSON에서 매장별 데이터 추출하여 상태 파일 생성
 def generate_taiwan_store_status(period='2512'):
     """대만 매장별 상태 생성"""
@@ -23,21 +25,8 @@ def generate_taiwan_store_status(period='2512'):
     stores_current = pl_data.get('channel_direct_profit', {}).get('stores', {})
     stores_cumulative = pl_data.get('channel_direct_profit', {}).get('cumulative_stores', {})
     
-    # 매장 메타데이터 (면적, 채널 등)
-    # 기존 store-status 파일이나 별도 매핑에서 가져와야 함
-    # 일단 하드코딩으로 주요 매장 정보 설정
-    store_meta = {
-        'T01': {'name': '台北101', 'area': 70, 'channel': '정규점'},
-        'T02': {'name': '新光三越信義A11', 'area': 60, 'channel': '정규점'},
-        'T03': {'name': '微風南京', 'area': 50, 'channel': '정규점'},
-        'T04': {'name': '新光三越台北站前', 'area': 45, 'channel': '정규점'},
-        'T05': {'name': '微風信義', 'area': 55, 'channel': '정규점'},
-        'T06': {'name': '誠品信義', 'area': 40, 'channel': '정규점'},
-        'T07': {'name': '台中大遠百', 'area': 45, 'channel': '정규점'},
-        'T08': {'name': '高雄大遠百', 'area': 40, 'channel': '정규점'},
-        'T09': {'name': 'Gloria Outlet 華泰名品城', 'area': 35, 'channel': '아웃렛'},
-        'T10': {'name': 'Online', 'area': 0, 'channel': '온라인'},
-    }
+    # 매장 메타데이터 (면적, 채널 등) - store_area_index 공용 정의
+    store_meta = TW_STORE_META
     
     # Store status 생성
     store_status = []
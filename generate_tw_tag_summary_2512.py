@@ -69,6 +69,10 @@ def generate_tag_summary(period='2512'):
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(output, f, ensure_ascii=False, indent=2)
     
+    # 매니페스트 갱신 (콘텐츠 해시 URL)
+    from dashboard_manifest import update_manifest
+    update_manifest([output_file])
+    
     print(f"[OK] TAG 재고 요약 생성 완료: {output_file}")
     print(f"  - 기말재고(TAG): {ending_inventory['current']:,.0f}K HKD (YOY {ending_inventory['yoy']:.1f}%)")
     print(f"  - 과시즌재고(TAG): {past_season_inventory['current']:,.0f}K HKD (YOY {past_season_inventory['yoy']:.1f}%)")
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+아이템 분류 규칙 테이블 (대시보드 공통)
+
+대시보드 아이템 키:
+    F당시즌, S당시즌, 과시즌FW, 과시즌SS, 신발, 모자, 가방, 기타ACC
+
+시즌 규칙 (위에서부터 첫 번째로 맞는 규칙 적용):
+    F당시즌   Period 기준 당시즌 F (1~6월: 전년 F, 7~12월: 당년 F)  예) 2503 → 24F, 2509 → 25F
+              (F 시즌 시작 월은 f_season_start로 변경 가능 — 대만: 6월)
+    S당시즌   Period 기준 당시즌 S (당년 S)                          예) 2503 → 25S
+    과시즌FW  나머지 F로 끝나는 시즌
+    과시즌SS  나머지 S로 끝나는 시즌
+    ACC       N으로 끝나는 시즌 → Category 규칙 (SHO 신발, HEA 모자, BAG 가방, 나머지 기타ACC)
+    그 외      '' (미분류)
+
+- DataFrame: classify_items() — 시즌/카테고리/Period를 사전 인코딩(factorize)한 뒤
+  고유값에만 규칙을 계산하고 np.select로 행 전체에 한 번에 적용
+- 행 단위 루프: classify_item() — 같은 규칙 테이블 사용 (조합별 캐시)
+- 실행 단위: ItemBucketTable — (기준 Period, 시즌 코드, Category) → 버킷 ID 테이블을 한 번 만들어
+  로드된 프레임에 조인 (버킷 ID = ITEM_KEYS 인덱스, 미분류 = UNCLASSIFIED)
+
+    buckets = ItemBucketTable()
+    frame['Item_Bucket'] = buckets.ids(frame)
+    ITEM_LABELS[frame['Item_Bucket']]   # 아이템 키 ('' = 미분류)
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+ITEM_KEYS = ['F당시즌', 'S당시즌', '과시즌FW', '과시즌SS', '신발', '모자', '가방', '기타ACC']
+SEASON_ITEM_KEYS = ITEM_KEYS[:4]
+ACC_ITEM_KEYS = ITEM_KEYS[4:]
+
+# 버킷 ID → 아이템 키 (마지막 '' = 미분류)
+ITEM_LABELS = np.array(ITEM_KEYS + [''], dtype=object)
+UNCLASSIFIED = len(ITEM_KEYS)
+
+# 당시즌 F 시작 월 (이전 월은 전년 F가 당시즌)
+F_SEASON_START_MONTH = 7
+
+# Category 코드 포함 여부로 ACC 카테고리 결정 (순서대로 첫 매칭)
+ACC_CATEGORY_RULES = [('SHO', '신발'), ('HEA', '모자'), ('BAG', '가방')]
+ACC_DEFAULT = '기타ACC'
+
+# 시즌 규칙 테이블: (조건, 아이템) — 'acc'는 ACC_CATEGORY_RULES로 세분화
+SEASON_RULES = [
+    ('current_f', 'F당시즌'),
+    ('current_s', 'S당시즌'),
+    ('suffix_F', '과시즌FW'),
+    ('suffix_S', '과시즌SS'),
+    ('suffix_N', 'acc'),
+]
+
+
+def get_acc_category(category):
+    """Category 코드 → ACC 카테고리 (신발/모자/가방/기타ACC)"""
+    category_upper = '' if pd.isna(category) else str(category).upper()
+    for code, item in ACC_CATEGORY_RULES:
+        if code in category_upper:
+            return item
+    return ACC_DEFAULT
+
+
+def item_seasons(period, f_season_start=F_SEASON_START_MONTH):
+    """
+    Period(YYMM) 기준 당시즌 F/S 코드
+
+    Returns:
+        (season_f, season_s) 예) '2503' → ('24F', '25S'), '2509' → ('25F', '25S')
+    """
+    year, month = divmod(int(period) % 10000, 100)
+    season_f_year = year - 1 if month < f_season_start else year
+    return f"{season_f_year % 100:02d}F", f"{year % 100:02d}S"
+
+
+def _encode(values):
+    """
+    사전 인코딩: (행별 코드, 정규화된 고유값)
+
+    categorical이면 기존 코드 사용, 아니면 factorize 후 고유값만 strip/upper 정규화 (결측은 '')
+    """
+    if isinstance(getattr(values, 'dtype', None), pd.CategoricalDtype):
+        codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    normalized = [str(u).strip().upper() for u in uniques] + ['']  # 결측(-1) → 마지막 ''
+    merged_codes, merged_uniques = pd.factorize(np.array(normalized, dtype=object))
+    return merged_codes[codes], list(merged_uniques)
+
+
+def classify_item_ids(season_codes, categories, periods, f_season_start=F_SEASON_START_MONTH):
+    """
+    아이템 버킷 ID 벡터 분류
+
+    Args:
+        season_codes: 시즌 코드 배열/Series (categorical 권장)
+        categories: Category 배열/Series (categorical 권장)
+        periods: Period 배열/Series 또는 단일 Period (YYMM)
+        f_season_start: 당시즌 F 시작 월
+
+    Returns:
+        np.ndarray (int) — ITEM_KEYS 인덱스, 미분류는 UNCLASSIFIED
+    """
+    season_idx, season_uniques = _encode(season_codes)
+    category_idx, category_uniques = _encode(categories)
+    if np.ndim(periods) == 0:
+        period_idx, period_uniques = np.zeros(len(season_idx), dtype=int), [periods]
+    else:
+        period_idx, period_uniques = pd.factorize(np.asarray(periods))
+
+    # 규칙은 고유값 단위로만 계산하고 코드로 전개
+    suffix = np.array([code[-1:] for code in season_uniques], dtype='<U1')[season_idx]
+    acc_codes = np.array([ITEM_KEYS.index(get_acc_category(c)) for c in category_uniques])[category_idx]
+    seasons = [item_seasons(p, f_season_start) for p in period_uniques]
+    season_lookup = pd.Index(season_uniques)
+    current_f = season_lookup.get_indexer([f for f, _ in seasons])[period_idx]
+    current_s = season_lookup.get_indexer([s for _, s in seasons])[period_idx]
+
+    masks = {
+        'current_f': season_idx == current_f,
+        'current_s': season_idx == current_s,
+        'suffix_F': suffix == 'F',
+        'suffix_S': suffix == 'S',
+        'suffix_N': suffix == 'N',
+    }
+    conditions = [masks[name] for name, _ in SEASON_RULES]
+    choices = [acc_codes if item == 'acc' else ITEM_KEYS.index(item) for _, item in SEASON_RULES]
+    return np.select(conditions, choices, default=UNCLASSIFIED)
+
+
+def classify_items(season_codes, categories, periods, f_season_start=F_SEASON_START_MONTH):
+    """아이템 키 벡터 분류 (np.ndarray object, 미분류는 '')"""
+    return ITEM_LABELS[classify_item_ids(season_codes, categories, periods, f_season_start)]
+
+
+def assign_item_keys(df, period_col='Period', season_col='Season_Code', category_col='Category', period=None):
+    """DataFrame 행별 아이템 키 Series (period를 주면 모든 행에 같은 기준 Period 적용)"""
+    periods = period if period is not None else df[period_col]
+    return pd.Series(classify_items(df[season_col], df[category_col], periods), index=df.index)
+
+
+class ItemBucketTable:
+    """
+    (기준 Period, 시즌 코드, Category) → 아이템 버킷 ID 테이블
+
+    - 실행당 1개 생성, 처음 보는 조합만 classify_item_ids로 계산해 추가
+    - ids(): 프레임 행을 고유 조합으로 factorize → 고유 조합만 테이블 조인 → 행 전체로 전개
+    - bucket(): 단일 조합 조회 (행 dict 루프용)
+    """
+
+    def __init__(self, f_season_start=F_SEASON_START_MONTH):
+        self.f_season_start = f_season_start
+        self.keys = pd.MultiIndex.from_arrays([[], [], []], names=['Period', 'Season_Code', 'Category'])
+        self.bucket_ids = np.empty(0, dtype=np.int64)
+        self._lookup = {}
+
+    def __len__(self):
+        return len(self.bucket_ids)
+
+    def _add(self, keys):
+        """새 조합(MultiIndex) 분류 후 테이블에 추가"""
+        ids = classify_item_ids(keys.get_level_values(1), keys.get_level_values(2),
+                                keys.get_level_values(0), self.f_season_start)
+        self.keys = self.keys.append(keys)
+        self.bucket_ids = np.concatenate([self.bucket_ids, ids])
+        self._lookup.update(zip(keys, ids.tolist()))
+
+    def ids(self, frame, period=None, period_col='Period', season_col='Season_Code', category_col='Category'):
+        """
+        프레임 행별 버킷 ID (np.ndarray int)
+
+        period를 주면 모든 행에 같은 기준 Period 적용 (기본: 행의 Period)
+        """
+        periods = [str(period)] * len(frame) if period is not None else frame[period_col].astype(str)
+        codes, uniques = pd.MultiIndex.from_arrays(
+            [periods, frame[season_col].astype(str), frame[category_col].astype(str)]).factorize()
+        position = self.keys.get_indexer(uniques) if len(self) else np.full(len(uniques), -1)
+        if (position < 0).any():
+            self._add(uniques[position < 0])
+            position = self.keys.get_indexer(uniques)
+        return self.bucket_ids[position][codes]
+
+    def bucket(self, period, season_code, category):
+        """단일 조합 버킷 ID"""
+        key = (str(period), str(season_code), str(category))
+        if key not in self._lookup:
+            self._add(pd.MultiIndex.from_tuples([key]))
+        return self._lookup[key]
+
+
+@lru_cache(maxsize=None)
+def classify_item(season_code, category, period, f_season_start=F_SEASON_START_MONTH):
+    """단일 행 아이템 키 (classify_items와 동일 규칙 테이블, 미분류는 '')"""
+    season = '' if pd.isna(season_code) else str(season_code).strip().upper()
+    season_f, season_s = item_seasons(period, f_season_start)
+    matches = {
+        'current_f': season == season_f,
+        'current_s': season == season_s,
+        'suffix_F': season.endswith('F'),
+        'suffix_S': season.endswith('S'),
+        'suffix_N': season.endswith('N'),
+    }
+    for name, item in SEASON_RULES:
+        if matches[name]:
+            return get_acc_category(category) if item == 'acc' else item
+    return ''
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+KPI 테이블 (지역 × Period × 지표)
+
+- 생성 스크립트가 결과 저장 시 record_kpis()로 주요 지표를 같이 기록
+  (PL: generate_hongkong_pl_summary / generate_taiwan_pl_summary_2512,
+   대시보드: update_hongkong_dashboard / generate_taiwan_dashboard_data,
+   TAG Summary: convert_taiwan_tag_summary_2512)
+- YOY / 할인율 / 영업이익률 / 매장 수는 여기서 한 번만 계산 (CEO 인사이트 등은 이 테이블만 읽음)
+- 저장 형식: {"columns": ["region", "period", "metric", "value"], "rows": [[...], ...]}
+
+사용법:
+    python kpi_table.py            # 기존 public/dashboard 산출물에서 KPI 테이블 재구성
+"""
+import glob
+import os
+import sys
+import io
+
+from dashboard_manifest import DASHBOARD_DIR, parse_artifact_name
+from dashboard_writer import load_json, write_json
+from item_classifier import item_seasons
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32' and __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+KPI_TABLE_FILE = os.path.join(DASHBOARD_DIR, 'kpi-table.json')
+KPI_COLUMNS = ['region', 'period', 'metric', 'value']
+
+
+def _ratio(numerator, denominator):
+    """비율(%) — 분모가 0이면 0"""
+    return numerator / denominator * 100 if denominator else 0
+
+
+def pl_kpis(pl_data):
+    """
+    PL JSON → KPI (1K HKD)
+
+    current_month / prev_month(전년 동월) / cumulative(누적) / cumulative.prev_cumulative(전년 누적)
+    """
+    current = pl_data.get('current_month', {}).get('total', {})
+    prev = pl_data.get('prev_month', {}).get('total', {})
+    cumulative = pl_data.get('cumulative', {})
+    cumulative_total = cumulative.get('total', {})
+    prev_cumulative = cumulative.get('prev_cumulative', {}).get('total', {})
+
+    net_sales = current.get('net_sales', 0)
+    net_sales_prev = prev.get('net_sales', 0)
+    tag_sales = current.get('tag_sales', 0)
+    operating_profit = current.get('operating_profit', 0)
+    operating_profit_prev = prev.get('operating_profit', 0)
+    cumulative_net_sales = cumulative_total.get('net_sales', 0)
+    cumulative_net_sales_prev = prev_cumulative.get('net_sales', 0)
+    cumulative_operating_profit = cumulative_total.get('operating_profit', 0)
+
+    kpis = {
+        'net_sales': net_sales,
+        'net_sales_prev': net_sales_prev,
+        'net_sales_yoy': _ratio(net_sales, net_sales_prev),
+        'net_sales_change': net_sales - net_sales_prev,
+        'tag_sales': tag_sales,
+        'discount_rate': _ratio(tag_sales - net_sales, tag_sales),
+        'operating_profit': operating_profit,
+        'operating_profit_rate': _ratio(operating_profit, net_sales),
+        'operating_profit_prev': operating_profit_prev,
+        'operating_profit_rate_prev': _ratio(operating_profit_prev, net_sales_prev),
+        'direct_profit': current.get('direct_profit', 0),
+        'cumulative_net_sales': cumulative_net_sales,
+        'cumulative_net_sales_yoy': _ratio(cumulative_net_sales, cumulative_net_sales_prev),
+        'cumulative_operating_profit': cumulative_operating_profit,
+        'cumulative_operating_profit_rate': _ratio(cumulative_operating_profit, cumulative_net_sales),
+    }
+    if prev_cumulative:
+        kpis['cumulative_operating_profit_rate_prev'] = _ratio(prev_cumulative.get('operating_profit', 0),
+                                                               cumulative_net_sales_prev)
+    return kpis
+
+
+def dashboard_kpis(dashboard_data):
+    """대시보드 JSON → KPI (매장 수)"""
+    return {'store_count': len(dashboard_data.get('store_summary') or {})}
+
+
+def tag_summary_kpis(tag_summary, period):
+    """
+    대만 TAG Summary JSON → KPI (1K HKD)
+
+    TOTAL 행: TAG 매출 / 누적 TAG 매출 / TAG 재고, 당시즌 F: 재고 YOY / 누적 판매 YOY
+    """
+    tags = tag_summary.get('tag_detail', {})
+    total = tags.get('TOTAL', {})
+    season_f = tags.get(item_seasons(period)[0], {})
+    kpis = {
+        'tag_sales_total': total.get('sales_current'),
+        'tag_sales_total_yoy': total.get('sales_yoy'),
+        'tag_sales_ytd': total.get('sales_ytd_current'),
+        'tag_sales_ytd_yoy': total.get('sales_ytd_yoy'),
+        'tag_stock': total.get('stock_current'),
+        'tag_stock_yoy': total.get('stock_yoy'),
+        'season_f_stock_yoy': season_f.get('stock_yoy'),
+        'season_f_sales_ytd_yoy': season_f.get('sales_ytd_yoy'),
+    }
+    return {metric: value for metric, value in kpis.items() if value is not None}
+
+
+def load_kpi_table(path=KPI_TABLE_FILE):
+    """KPI 테이블 → {(region, period, metric): value}"""
+    if not os.path.exists(path):
+        return {}
+    table = load_json(path)
+    return {(region, str(period), metric): value for region, period, metric, value in table.get('rows', [])}
+
+
+def save_kpi_table(kpis, path=KPI_TABLE_FILE):
+    rows = [[region, period, metric, value] for (region, period, metric), value in sorted(kpis.items())]
+    return write_json(path, {'columns': KPI_COLUMNS, 'rows': rows})
+
+
+def record_kpis(region, period, metrics, path=KPI_TABLE_FILE):
+    """지역/Period 지표 기록 (같은 지표는 덮어씀)"""
+    kpis = load_kpi_table(path)
+    for metric, value in metrics.items():
+        kpis[(region, str(period), metric)] = round(float(value), 6)
+    save_kpi_table(kpis, path)
+
+
+def kpi_frame(kpis):
+    """{(region, period, metric): value} → {(region, period): {metric: value}}"""
+    grouped = {}
+    for (region, period, metric), value in kpis.items():
+        grouped.setdefault((region, period), {})[metric] = value
+    return grouped
+
+
+# 산출물 kind → KPI 추출 함수
+ARTIFACT_EXTRACTORS = {
+    'pl-data': lambda data, period: pl_kpis(data),
+    'dashboard-data': lambda data, period: dashboard_kpis(data),
+    'tag-summary': tag_summary_kpis,
+}
+
+
+def rebuild_kpi_table(dashboard_dir=DASHBOARD_DIR, path=KPI_TABLE_FILE):
+    """public/dashboard의 Period별 산출물을 한 번씩 읽어 KPI 테이블 재구성"""
+    kpis = {}
+    for file_path in sorted(glob.glob(os.path.join(dashboard_dir, '*.json'))):
+        parsed = parse_artifact_name(os.path.basename(file_path))
+        if not parsed or parsed[0] == 'common' or not parsed[2].isdigit():
+            continue
+        region, kind, period = parsed
+        if kind not in ARTIFACT_EXTRACTORS:
+            continue
+        for metric, value in ARTIFACT_EXTRACTORS[kind](load_json(file_path), period).items():
+            kpis[(region, period, metric)] = round(float(value), 6)
+    save_kpi_table(kpis, path)
+    return kpis
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("KPI 테이블 재구성")
+    print("=" * 80)
+    kpis = rebuild_kpi_table()
+    for (region, period), metrics in sorted(kpi_frame(kpis).items()):
+        print(f"  {region} {period}: 지표 {len(metrics)}개")
+    print(f"\n저장 완료: {KPI_TABLE_FILE}")
@@ -0,0 +1,76 @@
+// 델타 인코딩 대시보드 번들 로더 ({region}-dashboard-bundle.json, dashboard_bundle.py 생성)
+// - 기준 Period 전체 JSON + 나머지 Period는 기준 대비 델타
+// - 번들을 한 번 받으면 Period 전환/전년 비교 시 추가 요청 없이 복원
+
+import { fetchDashboardJson, type DashboardRegion } from '@/lib/dashboard-manifest';
+
+type Delta =
+  | { '=': any }
+  | { o: { [key: string]: Delta }; '-'?: string[]; k?: string[] }
+  | { a: { [index: string]: Delta }; n: number };
+
+export interface DashboardBundle {
+  version: number;
+  periods: string[];
+  base_period: string;
+  base: any;
+  deltas: { [period: string]: Delta };
+}
+
+// dashboard_bundle.apply_delta와 동일한 규칙 (base는 변경하지 않음)
+export function applyDelta(base: any, delta: Delta): any {
+  if ('=' in delta) {
+    return delta['='];
+  }
+  if ('o' in delta) {
+    const result = { ...base };
+    for (const key of delta['-'] ?? []) {
+      delete result[key];
+    }
+    for (const [key, sub] of Object.entries(delta.o)) {
+      result[key] = applyDelta(base?.[key], sub);
+    }
+    if (delta.k) {
+      // 키 순서가 기준과 다른 경우 (매장 목록 등 키 순서대로 렌더링)
+      const ordered: any = {};
+      for (const key of delta.k) {
+        ordered[key] = result[key];
+      }
+      return ordered;
+    }
+    return result;
+  }
+  const result = (base as any[]).slice(0, delta.n);
+  while (result.length < delta.n) {
+    result.push(null);
+  }
+  for (const [index, sub] of Object.entries(delta.a)) {
+    const i = Number(index);
+    result[i] = applyDelta(i < base.length ? base[i] : null, sub);
+  }
+  return result;
+}
+
+const bundlePromises: { [region: string]: Promise<DashboardBundle | null> } = {};
+
+export function loadDashboardBundle(region: DashboardRegion): Promise<DashboardBundle | null> {
+  if (!bundlePromises[region]) {
+    bundlePromises[region] = fetchDashboardJson<DashboardBundle>(region, 'dashboard-bundle', 'default');
+  }
+  return bundlePromises[region];
+}
+
+// Period 대시보드 데이터 로드: 번들에 있으면 번들에서 복원, 없으면 Period 파일 로드
+// (복원 결과는 복사본이므로 호출부에서 수정해도 번들에 영향 없음)
+export async function fetchDashboardData<T = any>(
+  region: DashboardRegion,
+  period: string,
+  options: { fallbackToDefault?: boolean } = {}
+): Promise<T | null> {
+  const bundle = await loadDashboardBundle(region);
+  if (bundle && bundle.periods.includes(period)) {
+    const data = period === bundle.base_period ? bundle.base : applyDelta(bundle.base, bundle.deltas[period]);
+    return structuredClone(data) as T;
+  }
+  return fetchDashboardJson<T>(region, 'dashboard-data', period, options);
+}
@@ -0,0 +1,93 @@
+// public/dashboard/manifest.json 기반 대시보드 JSON 로더
+// - dashboard_manifest.py가 생성한 (region, kind, period) → 콘텐츠 해시 URL 매핑 사용
+// - 해시 URL은 내용이 바뀌면 URL도 바뀌므로 브라우저 캐시를 그대로 사용 (캐시 무효화 쿼리 불필요)
+// - 해시가 현재 파일과 다르면 서버가 404 (app/dashboard/v/[hash]/[file]/route.ts) → 원본 URL로 재요청
+// - 존재하는 Period를 매니페스트로 먼저 확인하므로 404 후 기본 파일 재요청 없음
+
+export interface DashboardArtifact {
+  region: string;
+  kind: string;
+  period: string;
+  file: string;
+  hash: string;
+  bytes: number;
+  url: string;
+}
+
+export interface DashboardManifest {
+  version: number;
+  generated_at: string;
+  artifacts: { [key: string]: DashboardArtifact };
+  periods: { [key: string]: string[] };
+}
+
+export type DashboardRegion = 'hongkong' | 'taiwan' | 'discovery' | 'common';
+
+const DEFAULT_PERIOD = 'default';
+const HASHED_URL_PREFIX = '/dashboard/v/';
+
+let manifestPromise: Promise<DashboardManifest | null> | null = null;
+
+// 매니페스트는 작은 파일이므로 매번 재검증(ETag), 세션 내에서는 1회만 로드
+export function loadDashboardManifest(): Promise<DashboardManifest | null> {
+  if (!manifestPromise) {
+    manifestPromise = fetch('/dashboard/manifest.json', { cache: 'no-cache' })
+      .then(res => (res.ok ? res.json() : null))
+      .catch(() => null);
+  }
+  return manifestPromise;
+}
+
+// 매니페스트가 없을 때 사용하는 기존 파일명 규칙
+const legacyUrl = (region: DashboardRegion, kind: string, period: string) => {
+  const prefix = region === 'common' ? '' : `${region}-`;
+  const suffix = period === DEFAULT_PERIOD ? '' : `-${period}`;
+  return `/dashboard/${prefix}${kind}${suffix}.json`;
+};
+
+// (region, kind, period) → 요청할 URL (매니페스트에 없으면 null)
+export async function resolveDashboardUrl(
+  region: DashboardRegion,
+  kind: string,
+  period: string,
+  options: { fallbackToDefault?: boolean } = {}
+): Promise<string | null> {
+  const manifest = await loadDashboardManifest();
+  if (!manifest) {
+    return legacyUrl(region, kind, period);
+  }
+  const entry =
+    manifest.artifacts[`${region}/${kind}/${period}`] ||
+    (options.fallbackToDefault ? manifest.artifacts[`${region}/${kind}/${DEFAULT_PERIOD}`] : undefined);
+  return entry ? entry.url : null;
+}
+
+// 대시보드 JSON 로드 (파일이 없으면 null)
+export async function fetchDashboardJson<T = any>(
+  region: DashboardRegion,
+  kind: string,
+  period: string,
+  options: { fallbackToDefault?: boolean } = {}
+): Promise<T | null> {
+  const url = await resolveDashboardUrl(region, kind, period, options);
+  if (!url) {
+    return null;
+  }
+  try {
+    let res = await fetch(url);
+    if (res.status === 404 && url.startsWith(HASHED_URL_PREFIX)) {
+      // 매니페스트 해시가 현재 파일과 다름 (매니페스트 미갱신) → 원본 파일 재검증 요청
+      res = await fetch(`/dashboard/${url.split('/').pop()}`, { cache: 'no-cache' });
+    }
+    return res.ok ? ((await res.json()) as T) : null;
+  } catch (e) {
+    console.warn(`대시보드 데이터 로드 실패 (${url})`, e);
+    return null;
+  }
+}
+
+// region/kind별 생성된 Period 목록
+export async function getAvailablePeriods(region: DashboardRegion, kind: string): Promise<string[]> {
+  const manifest = await loadDashboardManifest();
+  return manifest?.periods[`${region}/${kind}`] ?? [];
+}
@@ -0,0 +1,64 @@
+// 로컬 대시보드 조회 API (dashboard_query_server.py) 클라이언트
+// - 화면에 필요한 조각(매장 × Period, 카테고리/시즌, 채널별 PL)만 요청
+// - NEXT_PUBLIC_DASHBOARD_QUERY_URL (예: http://127.0.0.1:8765) 이 설정된 경우에만 사용
+// - 미설정/서버 미실행/오류 시 null → 호출부에서 fetchDashboardJson(전체 JSON)으로 폴백
+// - 서버가 ETag를 주므로 브라우저 캐시 재검증(304)은 자동
+
+const QUERY_BASE_URL = process.env.NEXT_PUBLIC_DASHBOARD_QUERY_URL;
+
+export type QueryParams = { [key: string]: string | string[] | undefined };
+
+export const isDashboardQueryEnabled = () => Boolean(QUERY_BASE_URL);
+
+// 조회 실행 (배열 값은 쉼표로 연결)
+export async function queryDashboard<T = any>(endpoint: string, params: QueryParams): Promise<T | null> {
+  if (!QUERY_BASE_URL) {
+    return null;
+  }
+  const search = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value.length > 0) {
+      search.set(key, Array.isArray(value) ? value.join(',') : value);
+    }
+  });
+  const url = `${QUERY_BASE_URL.replace(/\/$/, '')}/api/${endpoint}?${search.toString()}`;
+  try {
+    const res = await fetch(url, { cache: 'no-cache' });
+    return res.ok ? ((await res.json()) as T) : null;
+  } catch (e) {
+    console.warn(`조회 API 요청 실패 (${url})`, e);
+    return null;
+  }
+}
+
+// 매장 × Period (store_summary 행, fields로 current/previous 항목 제한)
+export const queryStores = (params: {
+  region: string;
+  period: string | string[];
+  store?: string[];
+  channel?: string[];
+  country?: string[];
+  fields?: string[];
+}) => queryDashboard<{ rows: any[] }>('stores', params);
+
+// 카테고리 / 시즌 요약
+export const queryCategorySeason = (params: {
+  region: string;
+  period: string | string[];
+  category?: string[];
+  season?: string[];
+  season_type?: string[];
+}) => queryDashboard<{ categories: any[]; seasons: any[] }>('category-season', params);
+
+// 채널별 PL 계정 (scope: current_month / prev_month / cumulative)
+export const queryPl = (params: {
+  region: string;
+  period: string | string[];
+  scope?: 'current_month' | 'prev_month' | 'cumulative';
+  channel?: string[];
+  account?: string[];
+}) => queryDashboard<{ scope: string; periods: { [period: string]: { [channel: string]: any } } }>('pl', params);
+
+// 임의 경로 값 (예: path='store_summary.M01.current')
+export const querySlice = <T = any>(params: { region: string; kind: string; period: string; path?: string }) =>
+  queryDashboard<{ path: string; value: T }>('slice', params);
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+영업비(Opex) 상세 엔진 (카테고리 → 계정 트리, 전 Period 1회 집계)
+
+- 계정 트리: [(카테고리, [(세부 항목, 계정코드 목록, 계정명 목록), ...]), ...]
+  PL 테이블 키(계정코드, 계정명)마다 트리 순서대로 첫 번째로 맞는 세부 항목 1개에 배정
+  → 기존 if / elif 계정 매핑과 같은 우선순위 (계정명은 앞뒤 공백 제거 후 비교)
+- 범위(브랜드 / 국가 / 매장)별로 세부 항목 × Period 행렬을 한 번만 집계(np.add.at)하고 Period 축 누적합 보관
+  → 당월 / 누적(YTD) / 전년 동기 상세가 모두 누적합 차이 (Period · 계정마다 재집계 없음)
+- 'other' 카테고리는 세부 항목을 other_detail로 함께 반환
+
+사용 예:
+    from opex_engine import OpexEngine, PL_SUMMARY_TREE
+    from pl_table import load_pl_table
+
+    opex = OpexEngine(load_pl_table('TW_PL_2512.csv'), PL_SUMMARY_TREE)
+    opex.breakdown('202512', brand='M', shops='T99')                     # 당월 상세
+    opex.breakdown('202501', '202512', brand='M', shops='T99')           # 누적 상세
+    opex.report('202512', brand='M', shops='T99')                        # 당월 / 누적 / 전년 / YOY
+"""
+import numpy as np
+
+from pl_table import KEY_INDEX
+
+DETAIL_CATEGORY = 'other'
+
+# PL 요약 (generate_*_pl_summary) 영업비 상세: 계정코드 또는 계정명
+PL_SUMMARY_TREE = [
+    ('salary', [('salary', ['급여'], [' - Payroll', '1. 급 여'])]),
+    ('marketing', [('marketing', ['광고비'], ['9. 광고선전비'])]),
+    ('fee', [('fee', ['지급수수료 일반'], ['10. 지급수수료'])]),
+    ('rent', [('rent', ['임차료'], [' - Base Rent', '4. 임차료'])]),
+    ('insurance', [('insurance', ['보험료'], ['13. 보험료'])]),
+    ('travel', [('travel', ['여비교통비'], ['2. TRAVEL & MEAL'])]),
+    ('other', [
+        ('depreciation', ['DEPR_EXP'], ['14. 감가상각비']),
+        ('duty_free', ['DUTY_FREE_EXP'], ['15. 면세점 직접비']),
+        ('govt_license', ['GOVT_LICEN_FEES'], [' - Government Rate & License Fee']),
+        ('logistics', ['LGT_EXP'], ['11. 운반비']),
+        ('maintenance', ['MAINT_EXP'], ['5. 유지보수비']),
+        ('other_fee', ['OTHER_FEE_EXP'], ['12. 기타 수수료(매장관리비 외)']),
+        ('rent_free', ['RENT_FREE_CONC'], [' - Rent free / Rent concession']),
+        ('retirement', ['RET_PEN_EXP'], [' - EMPLOYEE BENEFIT PROGRAMS']),
+        ('supplies', ['SUPPLIES_EXP'], ['7. 소모품비']),
+        ('transport', ['TRANS_EXP'], ['운반비']),
+        ('uniform', ['UNIFORM_EXP'], ['3. 피복비(유니폼)']),
+        ('utilities', ['UTILITIES_EXP'], ['6. 수도광열비']),
+        ('var_rent', ['VAR_RENT'], [' - Turnover Rates']),
+        ('communication', ['COMMUNI_EXP'], ['8. 통신비']),
+        ('bonus', ['BON_EXP'], [' - Final Payment']),
+    ]),
+]
+
+# 홍콩 영업비 (generate_hongkong_opex): 한글 본계정명만, 기타 수수료는 지급수수료에 포함
+HK_OPEX_TREE = [
+    ('salary', [('salary', [], ['1. 급 여'])]),
+    ('marketing', [('marketing', [], ['9. 광고선전비'])]),
+    ('fee', [('fee', [], ['10. 지급수수료', '12. 기타 수수료(매장관리비 외)'])]),
+    ('rent', [('rent', [], ['4. 임차료'])]),
+    ('insurance', [('insurance', [], ['13. 보험료'])]),
+    ('travel', [('travel', [], ['2. TRAVEL & MEAL'])]),
+    ('other', [
+        ('피복비', [], ['3. 피복비(유니폼)']),
+        ('유지보수비', [], ['5. 유지보수비']),
+        ('수도광열비', [], ['6. 수도광열비']),
+        ('소모품비', [], ['7. 소모품비']),
+        ('통신비', [], ['8. 통신비']),
+        ('물류비', [], ['11. 운반비']),
+        ('감가상각비', [], ['14. 감가상각비']),
+    ]),
+]
+
+
+def classify_account(tree, account_code, account_name):
+    """(계정코드, 계정명) → 트리 세부 항목 위치 (트리 순서 첫 매칭, 없으면 -1)"""
+    position = 0
+    for _, leaves in tree:
+        for _, codes, names in leaves:
+            if account_code in codes or account_name in names:
+                return position
+            position += 1
+    return -1
+
+
+def previous_year(period):
+    """YYYYMM → 전년 동월 YYYYMM"""
+    period = str(period)
+    return f"{int(period[:4]) - 1}{period[4:]}"
+
+
+def calc_yoy(current, previous):
+    """YOY (%) = 당해 / 전년 × 100 (전년 0 이하면 0)"""
+    return (current / previous * 100) if previous > 0 else 0
+
+
+class OpexEngine:
+    """계정 트리 × Period 영업비 상세"""
+
+    def __init__(self, table, tree):
+        """
+        Args:
+            table: pl_table.PLTable
+            tree: 계정 트리 (PL_SUMMARY_TREE / HK_OPEX_TREE 형식)
+        """
+        self.table = table
+        self.tree = tree
+        self.leaves = [(category, leaf) for category, leaves in tree for leaf, _, _ in leaves]
+        # 세부 항목 위치 (PL 테이블 키 순서) — 계정 분류는 원천 행이 아니라 키마다 1회
+        code, name = KEY_INDEX['account_code'], KEY_INDEX['account']
+        self._leaf = np.array([classify_account(tree, key[code], key[name]) for key in table.values.keys], dtype=np.int64)
+        self._scopes = {}
+
+    def _scope(self, filters):
+        """범위별 (세부 항목 × Period 행렬, Period 축 누적합) — 최초 1회 집계 후 재사용"""
+        scope_key = tuple(sorted((name, tuple(value) if isinstance(value, (list, tuple, set)) else value)
+                                 for name, value in filters.items()))
+        if scope_key not in self._scopes:
+            values = self.table.values
+            mask = self.table.mask(**filters) & (self._leaf >= 0)
+            matrix = np.zeros((len(self.leaves), len(values.periods)))
+            np.add.at(matrix, self._leaf[mask], values.matrix[mask])
+            prefix = np.zeros((len(self.leaves), len(values.periods) + 1))
+            np.cumsum(matrix, axis=1, out=prefix[:, 1:])
+            self._scopes[scope_key] = (matrix, prefix)
+        return self._scopes[scope_key]
+
+    def leaf_totals(self, start, end=None, **filters):
+        """start ~ end(YYYYMM, 생략 시 당월) 세부 항목별 합계 배열 (self.leaves 순서)"""
+        matrix, prefix = self._scope(filters)
+        lo, hi = self.table.values.positions(start, start if end is None else end)
+        if hi <= lo:
+            return np.zeros(len(self.leaves))
+        if hi - lo == 1:
+            return matrix[:, lo].copy()
+        return prefix[:, hi] - prefix[:, lo]
+
+    def breakdown(self, start, end=None, **filters):
+        """{카테고리: 합계, ..., 'other_detail': {세부 항목: 합계}} (트리 순서)"""
+        totals = self.leaf_totals(start, end, **filters)
+        result = {category: 0.0 for category, _ in self.tree}
+        detail = {}
+        for (category, leaf), total in zip(self.leaves, totals):
+            result[category] += float(total)
+            if category == DETAIL_CATEGORY:
+                detail[leaf] = float(total)
+        result['other_detail'] = detail
+        return result
+
+    def report(self, period, **filters):
+        """당월 / 전년 동월 / 누적(1월~당월) / 전년 누적 상세와 카테고리별 YOY"""
+        period = str(period)
+        prev_period = previous_year(period)
+        current = self.breakdown(period, **filters)
+        prev = self.breakdown(prev_period, **filters)
+        cumulative = self.breakdown(period[:4] + '01', period, **filters)
+        prev_cumulative = self.breakdown(prev_period[:4] + '01', prev_period, **filters)
+        categories = [category for category, _ in self.tree]
+        return {
+            'period': int(period),
+            'prev_period': int(prev_period),
+            'current_month': current,
+            'prev_month': prev,
+            'cumulative': cumulative,
+            'prev_cumulative': prev_cumulative,
+            'yoy': {
+                'current_month': {c: calc_yoy(current[c], prev[c]) for c in categories},
+                'cumulative': {c: calc_yoy(cumulative[c], prev_cumulative[c]) for c in categories},
+            },
+        }
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+PL 팩트 테이블 (브랜드 × 국가 × 매장 × 계정 × Period, Period 축 누적합)
+
+- PL CSV를 한 번만 읽어 (BRD_CD, CNTRY_CD, SHOP_CD, SHOP_NM, CHNL_CD, ACCOUNT_CD, ACCOUNT_NM) × PERIOD 합계 행렬 생성
+  (stock_weeks.PeriodPrefixSums) — 브랜드 필터 없이 로드하므로 MLB / Discovery가 같은 테이블 사용
+- 당월 / 누적(YTD) / 임의 구간 합계 = 키 마스크 + 누적합 차이 (Period · 계정마다 전체 행 재필터 없음)
+- 계정명 / 계정코드는 앞뒤 공백 제거 후 비교, 오피스(가상점)는 SHOP_CD에 '99' 포함 (H99 / M99 / T99)
+
+사용 예:
+    from pl_table import load_pl_table
+
+    table = load_pl_table('HKMC_PL_2512.csv')
+    table.sum('202512', brand='X', country='HK', account='실매출액')                 # 당월
+    table.sum('202501', '202512', brand='X', country='HK', account='실매출액')       # 누적
+    table.sum('202512', brand='X', country='HK', office=True, account='판매관리비')  # M99 영업비
+    table.group_sum('account', '202501', '202512', brand='M', shops=['H99', 'M99'])
+    table.shops('202512', brand='X', country='HK', office=False)                     # 매장 목록
+"""
+import csv
+
+import numpy as np
+
+from stage_profiler import staged
+from stock_weeks import ROW_COUNT, period_sums
+
+VALUE = 'VALUE'
+OFFICE_MARK = '99'
+DIMENSIONS = ['brand', 'country', 'shop', 'shop_name', 'channel_code', 'account_code', 'account']
+KEY_INDEX = {name: i for i, name in enumerate(DIMENSIONS)}  # 테이블 키 튜플 내 위치
+
+
+def parse_value(value):
+    """VALUE 문자열 → float (쉼표 / 공백 제거, 숫자가 아니면 0)"""
+    if value is None:
+        return 0.0
+    try:
+        return float(str(value).strip().replace(',', '').replace(' ', ''))
+    except ValueError:
+        return 0.0
+
+
+def is_office(shop_code):
+    """오피스(가상점) 여부 — SHOP_CD에 '99' 포함"""
+    return OFFICE_MARK in shop_code
+
+
+class PLTable:
+    """브랜드 × 국가 × 매장 × 계정 × Period PL 합계"""
+
+    def __init__(self, rows, periods=None):
+        """
+        Args:
+            rows: PL 행 dict 목록 (PERIOD, CNTRY_CD, SHOP_CD, BRD_CD, ACCOUNT_CD, ACCOUNT_NM, VALUE)
+            periods: Period 축 (기본: 행에 있는 PERIOD, YYYYMM)
+        """
+        self.row_count = 0
+        self._shops = {}
+
+        def facts():
+            for row in rows:
+                period = str(row['PERIOD']).strip()
+                brand = (row.get('BRD_CD') or '').strip()
+                shop = (row.get('SHOP_CD') or '').strip()
+                country = (row.get('CNTRY_CD') or '').strip()
+                shop_info = (shop, (row.get('SHOP_NM') or '').strip(), (row.get('CHNL_CD') or '').strip(), country)
+                self._shops.setdefault((brand, period), {})[shop_info] = None
+                self.row_count += 1
+                yield {
+                    'Period': period,
+                    VALUE: parse_value(row.get(VALUE)),
+                    '_key': (brand, country, shop, shop_info[1], shop_info[2],
+                             (row.get('ACCOUNT_CD') or '').strip(), (row.get('ACCOUNT_NM') or '').strip()),
+                }
+
+        self.sums = period_sums(facts(), lambda fact: fact['_key'], [VALUE, ROW_COUNT], periods)
+        self.values = self.sums[VALUE]
+        self.periods = self.values.periods
+        keys = self.values.keys
+        self._members = {name: np.array([k[i] for k in keys], dtype=object) for i, name in enumerate(DIMENSIONS)}
+        self._office = np.array([is_office(k[KEY_INDEX['shop']]) for k in keys], dtype=bool)
+        self._all = np.ones(len(keys), dtype=bool)
+
+    def __len__(self):
+        return self.row_count
+
+    def mask(self, brand=None, country=None, shops=None, office=None, account=None, account_code=None,
+             channel_code=None):
+        """필터에 맞는 키 bool 마스크 (self.values.keys 순서)"""
+        mask = self._all.copy()
+        filters = {'brand': brand, 'country': country, 'shop': shops, 'account': account, 'account_code': account_code,
+                   'channel_code': channel_code}
+        for name, value in filters.items():
+            if value is None:
+                continue
+            values = self._members[name]
+            if isinstance(value, (list, tuple, set)):
+                mask &= np.isin(values, [str(v).strip() for v in value])
+            else:
+                mask &= values == str(value).strip()
+        if office is not None:
+            mask &= self._office if office else ~self._office
+        return mask
+
+    def _positions(self, start, end):
+        return self.values.positions(start, start if end is None else end)
+
+    def sum(self, start, end=None, **filters):
+        """start ~ end(YYYYMM, 양끝 포함, 생략 시 start 당월) 합계
+
+        filters: brand / country / shops / channel_code / account / account_code (값 또는 값 목록), office (True / False)
+        """
+        return self.values.keys_sum(self.mask(**filters), *self._positions(start, end))
+
+    def rows(self, start=None, end=None, **filters):
+        """start ~ end 원천 행 수 (start 생략 시 전체 Period)"""
+        counts = self.sums[ROW_COUNT]
+        lo, hi = (0, len(self.periods)) if start is None else self._positions(start, end)
+        return int(counts.keys_sum(self.mask(**filters), lo, hi))
+
+    def group_sum(self, by, start, end=None, **filters):
+        """{차원 값: 합계} — by: DIMENSIONS 중 하나 (처음 나온 순)"""
+        mask = self.mask(**filters)
+        totals = self.values.key_totals(*self._positions(start, end))
+        result = {}
+        for member, total in zip(self._members[by][mask], totals[mask]):
+            result[member] = result.get(member, 0.0) + float(total)
+        return result
+
+    def shops(self, period, brand=None, country=None, office=None):
+        """Period에 행이 있는 매장 (SHOP_CD, SHOP_NM, CHNL_CD, CNTRY_CD) 목록 (중복 제거, 처음 나온 순)"""
+        period = str(period)
+        result = {}
+        for (row_brand, row_period), shop_infos in self._shops.items():
+            if row_period != period or (brand is not None and row_brand != brand):
+                continue
+            for shop_info in shop_infos:
+                if country is not None and shop_info[3] != country:
+                    continue
+                if office is not None and is_office(shop_info[0]) != office:
+                    continue
+                result[shop_info] = None
+        return list(result)
+
+
+@staged()
+def load_pl_table(csv_file, periods=None):
+    """PL CSV 1회 로드 → PLTable (브랜드 / 국가 필터 없이 전체)"""
+    with open(csv_file, 'r', encoding='utf-8-sig') as f:
+        return PLTable(csv.DictReader(f), periods)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+매장 × 계정 × Period PL 텐서 (PL 갱신 시 1회 생성 후 .npz 저장)
+
+- PL 팩트 테이블(pl_table.PLTable) 키를 매장(BRD_CD, CNTRY_CD, SHOP_CD, SHOP_NM) × 계정(ACCOUNT_CD, ACCOUNT_NM)
+  축으로 펼친 dense 배열 values[매장, 계정, Period] + 매장별 행 수 rows[매장, Period]
+- 매장 / 계정 / Period 사전(목록 + 위치)과 함께 PL CSV 옆에 .npz로 저장, CSV 크기 / 수정시각이 같으면 재사용
+  → 매장 직접이익 · 임차료/인건비율 · 누적 직접이익은 배열 슬라이스 (스크립트마다 PL 재로드 / SHOP_CD 재집계 없음)
+- 계정 → 지표 매핑은 계정 트리(opex_engine 형식)로 계정 축에 1회 투영 (트리 순서 첫 매칭 = 기존 if / elif 우선순위)
+
+사용 예:
+    from pl_tensor import STORE_PL_TREE, load_pl_tensor, store_profit
+
+    tensor = load_pl_tensor('../Dashboard_Raw_Data/HKMC/2512/HKMC_PL_2512.csv')
+    mask = tensor.store_mask(brand='M', country=['HK', 'MC'], office=False)
+    by_shop = tensor.shop_measures(STORE_PL_TREE, '202501', '202512', mask)     # {SHOP_CD: {지표: 누적}}
+    store_profit(by_shop['M01'])                                              # 직접이익 / 임차료·인건비율
+    python pl_tensor.py ../Dashboard_Raw_Data/HKMC/2512/HKMC_PL_2512.csv 202512   # 생성 / 저장 + 매장 직접이익 요약
+"""
+import os
+import sys
+
+import numpy as np
+
+from opex_engine import classify_account
+from pl_table import KEY_INDEX, is_office, load_pl_table
+from stock_weeks import ROW_COUNT, period_ordinal
+
+if sys.platform == 'win32' and __name__ == '__main__':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+STORE_FIELDS = ['brand', 'country', 'shop', 'shop_name']
+ACCOUNT_FIELDS = ['account_code', 'account']
+TENSOR_VERSION = 2  # 텐서 생성 방식 변경 시 증가 (이전 버전 .npz는 재생성)
+
+# 매장 손익 지표 (generate_store_status.get_store_data 계정 매핑): 계정코드 또는 계정명
+STORE_PL_TREE = [
+    ('net_sales', [('net_sales', ['ACT_SALE_AMT'], ['실매출액'])]),
+    ('tag_sales', [('tag_sales', ['TAG_SALE_AMT'], ['Tag매출액'])]),
+    ('cogs', [('cogs', ['COGS'], ['매출원가'])]),
+    ('gross_profit', [('gross_profit', [], ['매출총이익'])]),
+    ('selling_expense', [('selling_expense', [], ['판매관리비'])]),
+    ('labor_cost', [('labor_cost', ['LABOR_EXP'], ['1. 급여', '1. 급 여'])]),
+    ('rent', [('rent', [], ['4. 임차료'])]),
+    ('operating_profit', [('operating_profit', [], ['영업이익'])]),
+]
+
+# 매장 직접비 계정 (직접이익 = 매출총이익 - 직접비 합계 방식)
+DIRECT_COST_ACCOUNTS = [
+    '1. 급 여', '2. TRAVEL & MEAL', '3. 피복비(유니폼)', '4. 임차료',
+    '5. 유지보수비', '6. 수도광열비', '7. 소모품비', '8. 통신비',
+    '9. 광고선전비', '10. 지급수수료', '11. 운반비', '12. 기타 수수료(매장관리비 외)',
+    '13. 보험료', '14. 감가상각비', '15. 면세점 직접비'
+]
+
+
+def names_only(tree):
+    """계정코드 매칭을 뺀 트리 (계정명만 비교하는 스크립트용)"""
+    return [(category, [(leaf, [], names) for leaf, _, names in leaves]) for category, leaves in tree]
+
+
+def store_profit(measures):
+    """지표 dict에 직접이익(매출총이익 - 판매관리비) / 임차료·인건비율(%) 추가"""
+    data = dict(measures)
+    data['direct_profit'] = data.get('gross_profit', 0.0) - data.get('selling_expense', 0.0)
+    net_sales = data.get('net_sales', 0.0)
+    rent_labor = data.get('rent', 0.0) + data.get('labor_cost', 0.0)
+    data['rent_labor_ratio'] = (rent_labor / net_sales * 100) if net_sales > 0 else 0
+    return data
+
+
+def source_fingerprint(csv_file):
+    """PL CSV 식별값 (텐서 버전, 크기, 수정시각 ns) — 저장된 텐서 재사용 판단용"""
+    stat = os.stat(csv_file)
+    return np.array([TENSOR_VERSION, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+
+class PLTensor:
+    """매장 × 계정 × Period PL 텐서"""
+
+    def __init__(self, stores, accounts, periods, values, rows):
+        """
+        Args:
+            stores: 매장 축 [(BRD_CD, CNTRY_CD, SHOP_CD, SHOP_NM), ...]
+            accounts: 계정 축 [(ACCOUNT_CD, ACCOUNT_NM), ...]
+            periods: Period 축 (YYYYMM, 오름차순)
+            values: (매장, 계정, Period) 합계
+            rows: (매장, Period) 원천 행 수
+        """
+        self.stores = [tuple(store) for store in stores]
+        self.accounts = [tuple(account) for account in accounts]
+        self.periods = list(periods)
+        self.store_index = {store: i for i, store in enumerate(self.stores)}
+        self.account_index = {account: j for j, account in enumerate(self.accounts)}
+        self.period_index = {period: k for k, period in enumerate(self.periods)}
+        self.values = values
+        self.rows = rows
+        self._ordinals = np.array([period_ordinal(p) for p in self.periods], dtype=np.int64)
+        self._prefix = np.zeros(values.shape[:2] + (len(self.periods) + 1,))
+        np.cumsum(values, axis=2, out=self._prefix[:, :, 1:])
+        self._members = {name: np.array([s[i] for s in self.stores], dtype=object) for i, name in enumerate(STORE_FIELDS)}
+        self._leaves = {}
+
+    @classmethod
+    def from_table(cls, table):
+        """PLTable 키 × Period 행렬 → 매장 × 계정 × Period 텐서"""
+        keys = table.values.keys
+        store_of = [tuple(key[KEY_INDEX[f]] for f in STORE_FIELDS) for key in keys]
+        account_of = [tuple(key[KEY_INDEX[f]] for f in ACCOUNT_FIELDS) for key in keys]
+        stores = list(dict.fromkeys(store_of))
+        accounts = list(dict.fromkeys(account_of))
+        store_index = {store: i for i, store in enumerate(stores)}
+        account_index = {account: j for j, account in enumerate(accounts)}
+        s = np.array([store_index[store] for store in store_of], dtype=np.int64)
+        a = np.array([account_index[account] for account in account_of], dtype=np.int64)
+
+        values = np.zeros((len(stores), len(accounts), len(table.periods)))
+        np.add.at(values, (s, a), table.values.matrix)  # 채널 코드만 다른 키는 같은 (매장, 계정)으로 합산
+        rows = np.zeros((len(stores), len(table.periods)), dtype=np.int64)
+        np.add.at(rows, s, table.sums[ROW_COUNT].matrix.astype(np.int64))
+        return cls(stores, accounts, table.periods, values, rows)
+
+    def save(self, path, source=None):
+        """.npz 저장 (임시 파일 → 교체)"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                stores=np.array(self.stores, dtype=str).reshape(len(self.stores), len(STORE_FIELDS)),
+                accounts=np.array(self.accounts, dtype=str).reshape(len(self.accounts), len(ACCOUNT_FIELDS)),
+                periods=np.array(self.periods, dtype=str),
+                values=self.values,
+                rows=self.rows,
+                source=source if source is not None else np.zeros(3, dtype=np.int64),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """.npz 로드 → (PLTensor, 원천 식별값)"""
+        with np.load(path, allow_pickle=False) as data:
+            tensor = cls(data['stores'].tolist(), data['accounts'].tolist(), data['periods'].tolist(),
+                         data['values'], data['rows'])
+            return tensor, data['source']
+
+    def positions(self, start, end=None):
+        """달력 구간 start ~ end (YYYYMM, 양끝 포함, 생략 시 당월) → Period 위치 [lo, hi)"""
+        end = start if end is None else end
+        lo = int(np.searchsorted(self._ordinals, period_ordinal(start), side='left'))
+        hi = int(np.searchsorted(self._ordinals, period_ordinal(end), side='right'))
+        return lo, hi
+
+    def window(self, start, end=None):
+        """(매장, 계정) 구간 합계"""
+        lo, hi = self.positions(start, end)
+        if hi <= lo:
+            return np.zeros(self.values.shape[:2])
+        if hi - lo == 1:
+            return self.values[:, :, lo]
+        return self._prefix[:, :, hi] - self._prefix[:, :, lo]
+
+    def store_mask(self, brand=None, country=None, shops=None, office=None):
+        """매장 축 bool 마스크 (값 또는 값 목록, office: True / False)"""
+        mask = np.ones(len(self.stores), dtype=bool)
+        for name, value in (('brand', brand), ('country', country), ('shop', shops)):
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                mask &= np.isin(self._members[name], list(value))
+            else:
+                mask &= self._members[name] == value
+        if office is not None:
+            offices = np.array([is_office(shop) for shop in self._members['shop']], dtype=bool)
+            mask &= offices if office else ~offices
+        return mask
+
+    def active(self, start, end=None):
+        """구간에 원천 행이 있는 매장 bool 마스크"""
+        lo, hi = self.positions(start, end)
+        return self.rows[:, lo:hi].sum(axis=1) > 0
+
+    def account_leaves(self, tree):
+        """계정 축 → 트리 세부 항목 위치 (-1: 해당 없음), 트리별 1회 계산"""
+        tree_id = id(tree)
+        if tree_id not in self._leaves:
+            self._leaves[tree_id] = (tree, np.array([classify_account(tree, code, name) for code, name in self.accounts],
+                                                    dtype=np.int64))
+        return self._leaves[tree_id][1]
+
+    def measures(self, tree, start, end=None):
+        """(매장, 세부 항목) 구간 합계 — 세부 항목은 트리 순서"""
+        leaves = self.account_leaves(tree)
+        projection = np.zeros((len(self.accounts), sum(len(items) for _, items in tree)))
+        matched = np.flatnonzero(leaves >= 0)
+        projection[matched, leaves[matched]] = 1.0
+        return self.window(start, end) @ projection
+
+    def shop_measures(self, tree, start, end=None, mask=None):
+        """{SHOP_CD: {세부 항목: 구간 합계}} (같은 SHOP_CD의 국가 / 매장명 행은 합산, 처음 나온 순)"""
+        names = [leaf for _, items in tree for leaf, _, _ in items]
+        values = self.measures(tree, start, end)
+        result = {}
+        for i in (np.flatnonzero(mask) if mask is not None else range(len(self.stores))):
+            shop = self.stores[i][2]
+            totals = result.setdefault(shop, dict.fromkeys(names, 0.0))
+            for name, value in zip(names, values[i]):
+                totals[name] += float(value)
+        return result
+
+    def shop_account_sum(self, shop, accounts, start, end=None, mask=None):
+        """매장 1곳의 계정명 목록 구간 합계"""
+        store_mask = self._members['shop'] == shop
+        if mask is not None:
+            store_mask &= mask
+        account_mask = np.isin([name for _, name in self.accounts], list(accounts))
+        return float(self.window(start, end)[np.ix_(store_mask, account_mask)].sum())
+
+
+def tensor_path(csv_file):
+    """PL CSV → 텐서 저장 경로 (같은 폴더)"""
+    return os.path.splitext(csv_file)[0] + '.pl_tensor.npz'
+
+
+def load_pl_tensor(csv_file, cache_file=None, rebuild=False):
+    """저장된 텐서가 PL CSV와 같으면 로드, 아니면 PL 1회 로드 후 생성 / 저장"""
+    cache_file = cache_file or tensor_path(csv_file)
+    source = source_fingerprint(csv_file)
+    if not rebuild and os.path.exists(cache_file):
+        tensor, saved_source = PLTensor.load(cache_file)
+        if np.array_equal(saved_source, source):
+            return tensor
+    tensor = PLTensor.from_table(load_pl_table(csv_file))
+    tensor.save(cache_file, source)
+    return tensor
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("사용법: python pl_tensor.py <PL CSV> [기준 Period YYYYMM]")
+        return
+    csv_file = sys.argv[1]
+    tensor = load_pl_tensor(csv_file, rebuild=True)
+    period = sys.argv[2] if len(sys.argv) > 2 else tensor.periods[-1]
+
+    print("=" * 80)
+    print(f"PL 텐서: 매장 {len(tensor.stores)} × 계정 {len(tensor.accounts)} × Period {len(tensor.periods)}")
+    print(f"저장: {tensor_path(csv_file)}")
+    print("=" * 80)
+
+    mask = tensor.store_mask(office=False) & tensor.active(period)
+    cumulative = tensor.shop_measures(STORE_PL_TREE, period[:4] + '01', period, mask)
+    print(f"\n매장별 누적 직접이익 ({period[:4]}01~{period}, 매출총이익 - 판매관리비)")
+    for shop, measures in sorted(cumulative.items(), key=lambda item: store_profit(item[1])['direct_profit']):
+        data = store_profit(measures)
+        print(f"  {shop:<8} 실매출 {data['net_sales']:>14,.0f}  직접이익 {data['direct_profit']:>14,.0f}"
+              f"  임차료/인건비율 {data['rent_labor_ratio']:>6.1f}%")
+
+
+if __name__ == '__main__':
+    main()
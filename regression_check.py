@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+생성 스크립트 회귀 검증 (기준 리비전 vs 작업 트리)
+
+- 같은 입력(합성 데이터 또는 실데이터 스냅샷)으로 기준 구현과 현재 구현을 각각 실행
+  (케이스/실행 방식은 benchmark_generators와 동일 — 케이스마다 별도 프로세스, 별도 작업 폴더)
+- 출력 JSON을 구조적으로 비교: 키 누락/추가, 타입, 리스트 길이, 숫자는 허용 오차(상대/절대) 적용
+  generated_at 등 실행 시각 필드와 manifest.json(해시)은 비교 제외
+- 파일별 바이트 동일 여부, 필드별 차이(건수 / 최대 절대·상대 오차), 속도 비교(speedup)를 함께 출력
+
+사용법:
+    python regression_check.py                                   # HEAD vs 작업 트리 (합성 데이터)
+    python regression_check.py --baseline HEAD~3 --cases hk_dashboard,tw_pl_summary
+    python regression_check.py --baseline-dir ../old_checkout    # 폴더의 구현과 비교
+    python regression_check.py --raw-dir ../Dashboard_Raw_Data --period 2512   # 실데이터 스냅샷
+    python regression_check.py --rel-tol 1e-6 --abs-tol 1e-4 --report regression_report.json
+
+종료 코드: 0 (모든 케이스 허용 오차 내 일치), 1 (차이 또는 실행 실패)
+"""
+import argparse
+import io
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+from benchmark_generators import CASES, REPO_DIR, make_sandbox, make_work_dir, run_case
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32' and __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+OUTPUT_DIRS = ['components/dashboard', 'public/dashboard']
+EXCLUDED_FILES = {'manifest.json'}
+IGNORED_KEYS = {'generated_at'}
+REL_TOL = 1e-9
+ABS_TOL = 1e-6
+MAX_LISTED_DIFFS = 10
+
+
+def export_revision(ref, dest):
+    """git 리비전의 파일을 dest에 풀기 (작업 트리는 건드리지 않음)"""
+    archive = subprocess.run(['git', 'archive', '--format=tar', ref], cwd=REPO_DIR,
+                             capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(dest)
+    return dest
+
+
+def link_raw_data(raw_dir, sandbox):
+    """실데이터 폴더를 샌드박스의 Dashboard_Raw_Data로 연결 (심볼릭 링크 불가 시 복사)"""
+    target = os.path.join(sandbox, 'Dashboard_Raw_Data')
+    try:
+        os.symlink(os.path.abspath(raw_dir), target, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        shutil.copytree(raw_dir, target)
+    return target
+
+
+def collect_outputs(work_dir):
+    """작업 폴더의 출력 JSON → {상대 경로: 절대 경로}"""
+    outputs = {}
+    for output_dir in OUTPUT_DIRS:
+        folder = os.path.join(work_dir, output_dir)
+        if not os.path.isdir(folder):
+            continue
+        for file_name in sorted(os.listdir(folder)):
+            if file_name.endswith('.json') and file_name not in EXCLUDED_FILES:
+                outputs[f'{output_dir}/{file_name}'] = os.path.join(folder, file_name)
+    return outputs
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def diff_json(baseline, candidate, path='', rel_tol=REL_TOL, abs_tol=ABS_TOL, ignored_keys=IGNORED_KEYS):
+    """
+    JSON 값 구조 비교
+
+    Returns:
+        차이 목록 [{'path', 'kind', 'baseline', 'candidate', 'abs_diff', 'rel_diff'}]
+        kind: missing(기준에만 있음) / added(현재에만 있음) / type / length / value / numeric
+    """
+    diffs = []
+
+    def add(kind, b, c, abs_diff=None, rel_diff=None):
+        diffs.append({'path': path or '$', 'kind': kind, 'baseline': b, 'candidate': c,
+                      'abs_diff': abs_diff, 'rel_diff': rel_diff})
+
+    if _is_number(baseline) and _is_number(candidate):
+        if math.isnan(baseline) and math.isnan(candidate):
+            return diffs
+        if not math.isclose(baseline, candidate, rel_tol=rel_tol, abs_tol=abs_tol):
+            abs_diff = abs(candidate - baseline)
+            add('numeric', baseline, candidate, abs_diff, abs_diff / abs(baseline) if baseline else None)
+    elif isinstance(baseline, dict) and isinstance(candidate, dict):
+        for key in baseline:
+            if key in ignored_keys:
+                continue
+            child = f'{path}.{key}' if path else str(key)
+            if key not in candidate:
+                diffs.append({'path': child, 'kind': 'missing', 'baseline': baseline[key], 'candidate': None,
+                              'abs_diff': None, 'rel_diff': None})
+            else:
+                diffs += diff_json(baseline[key], candidate[key], child, rel_tol, abs_tol, ignored_keys)
+        for key in candidate:
+            if key not in baseline and key not in ignored_keys:
+                child = f'{path}.{key}' if path else str(key)
+                diffs.append({'path': child, 'kind': 'added', 'baseline': None, 'candidate': candidate[key],
+                              'abs_diff': None, 'rel_diff': None})
+    elif isinstance(baseline, list) and isinstance(candidate, list):
+        if len(baseline) != len(candidate):
+            add('length', len(baseline), len(candidate))
+        for i, (b, c) in enumerate(zip(baseline, candidate)):
+            diffs += diff_json(b, c, f'{path}[{i}]', rel_tol, abs_tol, ignored_keys)
+    elif type(baseline) is not type(candidate) and not (_is_number(baseline) and _is_number(candidate)):
+        add('type', type(baseline).__name__, type(candidate).__name__)
+    elif baseline != candidate:
+        add('value', baseline, candidate)
+    return diffs
+
+
+def field_name(path):
+    """차이 경로 → 필드 이름 (리스트 인덱스를 제외한 마지막 키)"""
+    leaf = path.split('.')[-1]
+    return leaf.split('[')[0] or leaf
+
+
+def field_drift(diffs):
+    """필드별 차이 요약: {필드: {count, kinds, max_abs_diff, max_rel_diff}} (건수 많은 순)"""
+    drift = {}
+    for diff in diffs:
+        item = drift.setdefault(field_name(diff['path']), {
+            'count': 0, 'kinds': {}, 'max_abs_diff': None, 'max_rel_diff': None,
+        })
+        item['count'] += 1
+        item['kinds'][diff['kind']] = item['kinds'].get(diff['kind'], 0) + 1
+        for key, value in [('max_abs_diff', diff['abs_diff']), ('max_rel_diff', diff['rel_diff'])]:
+            if value is not None:
+                item[key] = max(item[key] or 0, value)
+    return dict(sorted(drift.items(), key=lambda kv: -kv[1]['count']))
+
+
+def compare_outputs(baseline_dir, candidate_dir, rel_tol=REL_TOL, abs_tol=ABS_TOL, ignored_keys=IGNORED_KEYS):
+    """두 작업 폴더의 출력 JSON 비교 → {상대 경로: 파일 결과}"""
+    baseline_files = collect_outputs(baseline_dir)
+    candidate_files = collect_outputs(candidate_dir)
+    files = {}
+    for rel_path in sorted(set(baseline_files) | set(candidate_files)):
+        if rel_path not in candidate_files:
+            files[rel_path] = {'status': 'missing'}
+            continue
+        if rel_path not in baseline_files:
+            files[rel_path] = {'status': 'added'}
+            continue
+        with open(baseline_files[rel_path], 'rb') as f:
+            baseline_bytes = f.read()
+        with open(candidate_files[rel_path], 'rb') as f:
+            candidate_bytes = f.read()
+        baseline_data, candidate_data = json.loads(baseline_bytes), json.loads(candidate_bytes)
+        diffs = diff_json(baseline_data, candidate_data, rel_tol=rel_tol, abs_tol=abs_tol, ignored_keys=ignored_keys)
+        identical_bytes = baseline_bytes == candidate_bytes
+        files[rel_path] = {
+            'status': 'changed' if diffs else 'match',
+            'identical_bytes': identical_bytes,
+            # 제외 키 외 값이 정확히 같은지 (허용 오차 0)
+            'identical_values': identical_bytes or (not diffs and not diff_json(
+                baseline_data, candidate_data, rel_tol=0, abs_tol=0, ignored_keys=ignored_keys)),
+            'diff_count': len(diffs),
+            'drift': field_drift(diffs),
+            'diffs': diffs[:MAX_LISTED_DIFFS],
+        }
+    return files
+
+
+def compare_case(name, period, sandbox, baseline_repo, **tolerances):
+    """케이스 1개: 기준/현재 구현 실행 → 출력 비교 + 속도"""
+    sides = {}
+    for side, repo_dir in [('baseline', baseline_repo), ('candidate', REPO_DIR)]:
+        # 작업 폴더는 Dashboard_Raw_Data와 같은 위치 (../Dashboard_Raw_Data 상대 경로)
+        work_dir = make_work_dir(os.path.join(sandbox, f'{side}-{name}'))
+        sides[side] = (work_dir, run_case(name, period, work_dir, os.path.join(work_dir, 'logs'), repo_dir))
+
+    (baseline_dir, baseline_run), (candidate_dir, candidate_run) = sides['baseline'], sides['candidate']
+    result = {'baseline': baseline_run, 'candidate': candidate_run}
+    if 'error' in baseline_run or 'error' in candidate_run:
+        result['status'] = 'error'
+        return result
+
+    result['files'] = compare_outputs(baseline_dir, candidate_dir, **tolerances)
+    result['status'] = 'match' if all(f['status'] == 'match' for f in result['files'].values()) else 'changed'
+    if not result['files']:
+        result['status'] = 'error'
+        result['error'] = '출력 파일 없음'
+    result['speedup'] = baseline_run['seconds'] / candidate_run['seconds'] if candidate_run['seconds'] else None
+    return result
+
+
+def _short(value, width=40):
+    text = json.dumps(value, ensure_ascii=False) if not isinstance(value, str) else value
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def print_case(name, result):
+    """케이스 결과 출력"""
+    icon = {'match': '✅', 'changed': '❌', 'error': '⚠️'}[result['status']]
+    timing = ''
+    if result.get('speedup'):
+        timing = (f" {result['baseline']['seconds']:.2f}s → {result['candidate']['seconds']:.2f}s"
+                  f" (x{result['speedup']:.2f})")
+    print(f"\n{icon} {name}{timing}")
+    for side in ['baseline', 'candidate']:
+        if 'error' in result[side]:
+            print(f"   {side} 실행 실패: {result[side]['error']} (로그: {result[side]['log']})")
+    if 'error' in result:
+        print(f"   {result['error']}")
+
+    for rel_path, file_result in result.get('files', {}).items():
+        if file_result['status'] in ('missing', 'added'):
+            print(f"   {rel_path}: {'현재 구현에서 생성 안 됨' if file_result['status'] == 'missing' else '현재 구현에서만 생성'}")
+            continue
+        if file_result['identical_bytes']:
+            same = '바이트 동일'
+        elif file_result['identical_values']:
+            same = '값 동일 (제외 키 외)'
+        else:
+            same = '허용 오차 내 일치'
+        if file_result['status'] == 'match':
+            print(f"   {rel_path}: {same}")
+            continue
+        print(f"   {rel_path}: 차이 {file_result['diff_count']:,}건")
+        for field, drift in list(file_result['drift'].items())[:MAX_LISTED_DIFFS]:
+            kinds = ', '.join(f'{k} {v}' for k, v in drift['kinds'].items())
+            scale = ''
+            if drift['max_abs_diff'] is not None:
+                scale = f", 최대 오차 {drift['max_abs_diff']:.6g}"
+                if drift['max_rel_diff'] is not None:
+                    scale += f" ({drift['max_rel_diff']:.2e})"
+            print(f"     - {field}: {drift['count']:,}건 ({kinds}{scale})")
+        for diff in file_result['diffs'][:3]:
+            print(f"       {diff['path']}: {_short(diff['baseline'])} → {_short(diff['candidate'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='생성 스크립트 회귀 검증 (기준 리비전 vs 작업 트리)')
+    parser.add_argument('--baseline', default='HEAD', help='기준 git 리비전 (기본: HEAD)')
+    parser.add_argument('--baseline-dir', help='기준 구현 폴더 (지정 시 --baseline 무시)')
+    parser.add_argument('--raw-dir', help='실데이터 원천 폴더 (없으면 합성 데이터)')
+    parser.add_argument('--period', default='2512')
+    parser.add_argument('--stores', type=int, default=20)
+    parser.add_argument('--years', type=int, default=2)
+    parser.add_argument('--rows', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--cases', default=','.join(CASES), help='실행할 케이스 (쉼표 구분)')
+    parser.add_argument('--rel-tol', type=float, default=REL_TOL)
+    parser.add_argument('--abs-tol', type=float, default=ABS_TOL)
+    parser.add_argument('--ignore', default='', help='추가로 비교 제외할 키 (쉼표 구분)')
+    parser.add_argument('--report', help='결과 JSON 저장 경로')
+    parser.add_argument('--keep', action='store_true', help='샌드박스 폴더 유지')
+    args = parser.parse_args()
+
+    cases = [c for c in args.cases.split(',') if c]
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"알 수 없는 케이스: {unknown} (가능: {list(CASES)})")
+    tolerances = {
+        'rel_tol': args.rel_tol,
+        'abs_tol': args.abs_tol,
+        'ignored_keys': IGNORED_KEYS | {k for k in args.ignore.split(',') if k},
+    }
+
+    print("=" * 80)
+    print("생성 스크립트 회귀 검증")
+    print("=" * 80)
+
+    if args.raw_dir:
+        sandbox = tempfile.mkdtemp(prefix='dashboard-regression-')
+        link_raw_data(args.raw_dir, sandbox)
+        print(f"입력: 실데이터 {args.raw_dir} (Period {args.period})")
+    else:
+        sandbox, dataset = make_sandbox(args.period, args.stores, args.years, args.rows, args.seed,
+                                        prefix='dashboard-regression-')
+        print(f"입력: 합성 데이터 매장 {args.stores}개, 이력 {args.years}년, 매장당 {args.rows}행 "
+              f"({dataset['bytes'] / 1024 / 1024:,.1f} MB)")
+
+    if args.baseline_dir:
+        baseline_repo = os.path.abspath(args.baseline_dir)
+        print(f"기준: {baseline_repo}")
+    else:
+        baseline_repo = export_revision(args.baseline, os.path.join(sandbox, 'baseline_repo'))
+        print(f"기준: git {args.baseline}")
+    print(f"현재: {REPO_DIR} (작업 트리)")
+    print(f"허용 오차: 상대 {args.rel_tol:g}, 절대 {args.abs_tol:g}")
+
+    results = {}
+    for name in cases:
+        results[name] = compare_case(name, args.period, sandbox, baseline_repo, **tolerances)
+        print_case(name, results[name])
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'baseline': args.baseline_dir or args.baseline, 'period': args.period,
+                       'tolerances': {'rel_tol': args.rel_tol, 'abs_tol': args.abs_tol},
+                       'results': results}, f, ensure_ascii=False, indent=2, default=str)
+        print(f"\n결과 저장: {args.report}")
+
+    if args.keep:
+        print(f"샌드박스 유지: {sandbox}")
+    else:
+        shutil.rmtree(sandbox, ignore_errors=True)
+
+    passed = all(r['status'] == 'match' for r in results.values())
+    print("\n" + "=" * 80)
+    print("✅ 모든 케이스 일치" if passed else "❌ 차이 또는 실행 실패 있음")
+    print("=" * 80)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,10 @@ import os
 import sys
 import re
 
+# 대시보드 매니페스트 갱신용 (상위 폴더의 dashboard_manifest.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dashboard_manifest import update_manifest
+
 def clean_number(value):
     """CSV의 숫자 문자열을 float로 변환"""
     if pd.isna(value) or value == '':
@@ -718,6 +722,7 @@ def generate_bs_json(period='2511'):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(output_data, f, ensure_ascii=False, indent=2)
+    update_manifest([output_path], os.path.dirname(output_path))
     
     print(f"JSON 생성 완료: {output_path}")
     print(f"총자산: {bs_data['assets']['total']['current_month']:,.0f} (25.11)")
@@ -11,6 +11,10 @@ import os
 import sys
 from pathlib import Path
 
+# 대시보드 매니페스트 갱신용 (상위 폴더의 dashboard_manifest.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dashboard_manifest import update_manifest
+
 # Windows 인코딩 문제 해결
 if sys.platform == 'win32':
     import io
@@ -414,6 +418,7 @@ def main():
     
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(cf_data, f, ensure_ascii=False, indent=2)
+    update_manifest([str(output_path)], str(output_dir))
     
     print(f"\n✅ 현금흐름표 데이터 생성 완료: {output_path}")
     print(f"   Period: {period}")
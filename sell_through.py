@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+당시즌 판매율 엔진 (시즌 × Category × Subcategory × Period 누적 배열)
+
+- 원천 행을 한 번만 순회해 (Season_Code, Category, Subcategory_Code) × Period 합계 행렬 생성
+  (stock_weeks.PeriodPrefixSums — Period 축 누적합)
+- Net_AcP_P(누적 입고) / AC_Sales_Gross(누적 판매)는 CSV에 이미 누적값으로 들어 있으므로
+  기준 Period 값 그대로 사용 (as_of), 월 매출(Net_Sales / Gross_Sales)은 월 구간 합 (season_to_date)
+- 판매율 = 누적 판매 / 누적 입고 × 100 — 시즌 / 기준 Period / Subcategory / 제외 Category 임의 조합을
+  키 마스크 + 누적합 차이로 계산 (Period × 시즌별 전체 데이터 재필터 없음)
+
+사용 예:
+    from sell_through import SellThrough
+
+    engine = SellThrough(data, include=lambda row: row['Brand'] == 'MLB')
+    engine.sales_rate('25F', '2512')                                   # 25F 판매율 (2512 기준)
+    engine.sales_rate('25F', '2512', subcategory='OUT1')
+    engine.as_of('Net_AcP_P', '25S', '2512', exclude_categories=['HEA', 'SHO'])
+    engine.season_to_date('Net_Sales', '25S', '2501', '2509')          # 1~9월 실판매출 합계
+"""
+import numpy as np
+
+from stock_weeks import ROW_COUNT, period_sums
+
+SNAPSHOT_COLUMNS = ['Net_AcP_P', 'AC_Sales_Gross', 'Stock_Price']  # 기준 Period 값 (누적 입고/판매, 기말 재고)
+FLOW_COLUMNS = ['Net_Sales', 'Gross_Sales']                        # 월 값 (구간 합)
+
+
+class SellThrough:
+    """시즌 × Category × Subcategory × Period 판매율 엔진"""
+
+    def __init__(self, rows, include=None, periods=None):
+        """
+        Args:
+            rows: 원천 행 dict 목록
+            include: 행 필터 (None이면 전체)
+            periods: Period 축 (기본: 행에 있는 Period)
+        """
+        self._names = {}
+
+        def key(row):
+            if include is not None and not include(row):
+                return None
+            subcategory = row['Subcategory_Code'].strip()
+            self._names[(row['Season_Code'], subcategory, row['Period'])] = row['Subcategory'].strip()
+            return row['Season_Code'], row['Category'], subcategory
+
+        self.sums = period_sums(rows, key, SNAPSHOT_COLUMNS + FLOW_COLUMNS + [ROW_COUNT], periods)
+        keys = self.sums[ROW_COUNT].keys
+        self._season = np.array([k[0] for k in keys], dtype=object)
+        self._category = np.array([k[1] for k in keys], dtype=object)
+        self._subcategory = np.array([k[2] for k in keys], dtype=object)
+
+    def _mask(self, season, subcategory=None, exclude_categories=()):
+        mask = self._season == season
+        if subcategory is not None:
+            mask &= self._subcategory == subcategory
+        if exclude_categories:
+            mask &= ~np.isin(self._category, list(exclude_categories))
+        return mask
+
+    def as_of(self, column, season, period, **filters):
+        """기준 Period 값 합계 (누적 입고/판매, 기말 재고, 당월 매출)"""
+        sums = self.sums[column]
+        return sums.keys_sum(self._mask(season, **filters), *sums.positions(period, period))
+
+    def season_to_date(self, column, season, start, end, **filters):
+        """start ~ end 월 값 합계 (월 매출 누적)"""
+        sums = self.sums[column]
+        return sums.keys_sum(self._mask(season, **filters), *sums.positions(start, end))
+
+    def sales_rate(self, season, period, **filters):
+        """판매율 (%) = 누적 판매 / 누적 입고 × 100 (입고 0이면 0)"""
+        inbound = self.as_of('Net_AcP_P', season, period, **filters)
+        sales = self.as_of('AC_Sales_Gross', season, period, **filters)
+        return (sales / inbound * 100) if inbound > 0 else 0
+
+    def subcategories(self, season, period):
+        """기준 Period에 행이 있는 Subcategory 코드 (원천 행에서 처음 나온 순)"""
+        period = str(period)
+        return [subcategory for (row_season, subcategory, row_period) in self._names
+                if row_season == season and row_period == period]
+
+    def subcategory_name(self, season, subcategory, period):
+        """Subcategory 이름 (기준 Period 행 기준, 없으면 '')"""
+        return self._names.get((season, subcategory, str(period)), '')
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+생성 스크립트 단계별 계측 (시간 / CPU / 메모리 / 처리 행 수)
+
+- stage(name): with 블록 단위 계측, @staged(): 함수 단위 계측 (중첩 가능, 항상 기록 — 호출당 오버헤드 수 µs)
+- 기록 항목: 벽시계 시간, CPU 시간, 종료 시점 최대 메모리(peak RSS), 처리 행 수
+  (행 수: stage 객체의 rows 지정, 또는 @staged 함수 반환값의 len — 튜플이면 첫 번째 값)
+- 출력은 요청 시에만: JSON trace / Chrome trace(chrome://tracing, Perfetto) / cProfile
+
+사용 예:
+    from stage_profiler import stage, staged
+
+    @staged()
+    def read_pl_database(csv_file): ...
+
+    with stage('집계') as s:
+        ...
+        s.rows = len(rows)
+
+스크립트 실행 옵션 (__main__에서 instrument_cli() 호출):
+    python generate_hongkong_pl_summary.py 2512 --trace                   # stage-trace.json
+    python generate_hongkong_pl_summary.py 2512 --trace=out.json --chrome-trace=out.trace.json
+    python generate_hongkong_pl_summary.py 2512 --profile                 # cProfile → profile.prof
+    (환경변수 DASHBOARD_TRACE / DASHBOARD_CHROME_TRACE / DASHBOARD_PROFILE 도 같은 의미)
+"""
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+DEFAULT_TRACE_FILE = 'stage-trace.json'
+DEFAULT_CHROME_TRACE_FILE = 'stage-trace.chrome.json'
+DEFAULT_PROFILE_FILE = 'profile.prof'
+CLI_OPTIONS = {
+    '--trace': ('DASHBOARD_TRACE', DEFAULT_TRACE_FILE),
+    '--chrome-trace': ('DASHBOARD_CHROME_TRACE', DEFAULT_CHROME_TRACE_FILE),
+    '--profile': ('DASHBOARD_PROFILE', DEFAULT_PROFILE_FILE),
+}
+
+_ORIGIN = time.perf_counter()
+_RECORDS = []  # 완료된 stage (종료 순)
+_STACK = []    # 진행 중인 stage
+
+
+def peak_rss_mb():
+    """현재까지 프로세스 최대 메모리 (MB, 측정 불가 시 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+class Stage:
+    """진행 중인 stage (rows는 블록 안에서 지정 가능)"""
+
+    def __init__(self, name, rows=None):
+        self.name = name
+        self.rows = rows
+        self.parent = _STACK[-1].name if _STACK else None
+        self.depth = len(_STACK)
+        self.start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+
+@contextmanager
+def stage(name, rows=None):
+    """with 블록 계측"""
+    current = Stage(name, rows)
+    _STACK.append(current)
+    try:
+        yield current
+    finally:
+        _STACK.pop()
+        end = time.perf_counter()
+        _RECORDS.append({
+            'name': current.name,
+            'parent': current.parent,
+            'depth': current.depth,
+            'start': current.start - _ORIGIN,
+            'seconds': end - current.start,
+            'cpu_seconds': time.process_time() - current.cpu_start,
+            'peak_rss_mb': peak_rss_mb(),
+            'rows': current.rows,
+        })
+
+
+def count_rows(result):
+    """반환값 → 행 수 (len 가능한 값, 튜플이면 첫 번째 값)"""
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def staged(name=None, rows=count_rows):
+    """
+    함수 계측 데코레이터
+
+    Args:
+        name: stage 이름 (기본: 파일명.함수명 — 스크립트 직접 실행 시에도 __main__ 대신 파일명)
+        rows: 반환값 → 행 수 함수 (None이면 기록 안 함)
+    """
+    def decorator(func):
+        source = func.__globals__.get('__file__')
+        module = os.path.splitext(os.path.basename(source))[0] if source else func.__module__
+        stage_name = name or f"{module}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(stage_name) as current:
+                result = func(*args, **kwargs)
+                if rows is not None and current.rows is None:
+                    current.rows = rows(result)
+                return result
+        return wrapper
+    return decorator
+
+
+def trace_records():
+    """완료된 stage 기록 (시작 순)"""
+    return sorted(_RECORDS, key=lambda r: r['start'])
+
+
+def summarize(records=None):
+    """stage 이름별 합계: 호출 수 / 시간 / CPU / 행 수 / 최대 메모리 (시간 큰 순)"""
+    summary = {}
+    for record in records if records is not None else _RECORDS:
+        item = summary.setdefault(record['name'], {
+            'calls': 0, 'seconds': 0.0, 'cpu_seconds': 0.0, 'rows': None, 'peak_rss_mb': None,
+        })
+        item['calls'] += 1
+        item['seconds'] += record['seconds']
+        item['cpu_seconds'] += record['cpu_seconds']
+        if record['rows'] is not None:
+            item['rows'] = (item['rows'] or 0) + record['rows']
+        if record['peak_rss_mb'] is not None:
+            item['peak_rss_mb'] = max(item['peak_rss_mb'] or 0, record['peak_rss_mb'])
+    for item in summary.values():
+        item['rows_per_second'] = item['rows'] / item['seconds'] if item['rows'] and item['seconds'] else None
+    return dict(sorted(summary.items(), key=lambda kv: -kv[1]['seconds']))
+
+
+def write_trace(path=DEFAULT_TRACE_FILE):
+    """JSON trace 저장: stage 목록 + 이름별 합계"""
+    data = {
+        'command': ' '.join(sys.argv),
+        'total_seconds': time.perf_counter() - _ORIGIN,
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': trace_records(),
+        'summary': summarize(),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def write_chrome_trace(path=DEFAULT_CHROME_TRACE_FILE):
+    """Chrome trace 형식 저장 (complete event, µs 단위)"""
+    pid = os.getpid()
+    events = [{
+        'name': record['name'],
+        'ph': 'X',
+        'ts': round(record['start'] * 1e6, 3),
+        'dur': round(record['seconds'] * 1e6, 3),
+        'pid': pid,
+        'tid': 0,
+        'args': {'rows': record['rows'], 'cpu_seconds': record['cpu_seconds'], 'peak_rss_mb': record['peak_rss_mb']},
+    } for record in trace_records()]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+    return path
+
+
+def print_summary(limit=15):
+    """이름별 합계 표 출력"""
+    summary = summarize()
+    if not summary:
+        return
+    print("\n[단계별 계측]")
+    print(f"  {'stage':60s} {'호출':>6s} {'시간(s)':>9s} {'CPU(s)':>9s} {'행 수':>12s} {'최대 MB':>8s}")
+    for name, item in list(summary.items())[:limit]:
+        rows = f"{item['rows']:,}" if item['rows'] is not None else '-'
+        memory = f"{item['peak_rss_mb']:.0f}" if item['peak_rss_mb'] is not None else '-'
+        print(f"  {name[:60]:60s} {item['calls']:6d} {item['seconds']:9.3f} {item['cpu_seconds']:9.3f} {rows:>12s} {memory:>8s}")
+
+
+def instrument_cli(argv=None):
+    """
+    --trace[=파일] / --chrome-trace[=파일] / --profile[=파일] 처리 (환경변수도 지원)
+
+    인식한 옵션은 argv(기본 sys.argv)에서 제거 → 기존 sys.argv 위치 인자 파싱은 그대로 동작.
+    출력은 프로세스 종료 시(atexit) 저장.
+    """
+    argv = sys.argv if argv is None else argv
+    outputs = {option: os.environ.get(env) for option, (env, _) in CLI_OPTIONS.items()}
+    for arg in list(argv[1:]):
+        option, _, value = arg.partition('=')
+        if option in CLI_OPTIONS:
+            outputs[option] = value or CLI_OPTIONS[option][1]
+            argv.remove(arg)
+
+    profiler = None
+    if outputs['--profile']:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    def finish():
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(outputs['--profile'])
+            print(f"cProfile 저장: {outputs['--profile']} (python -m pstats {outputs['--profile']})")
+        if outputs['--trace'] or outputs['--chrome-trace']:
+            print_summary()
+        if outputs['--trace']:
+            print(f"trace 저장: {write_trace(outputs['--trace'])}")
+        if outputs['--chrome-trace']:
+            print(f"Chrome trace 저장: {write_chrome_trace(outputs['--chrome-trace'])}")
+
+    if any(outputs.values()):
+        atexit.register(finish)
+    return outputs
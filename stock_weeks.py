@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+재고주수 엔진 (키 × Period 합계 + Period 축 누적합)
+
+- 원천 행을 한 번만 순회해 키(아이템 키 / Category) × Period 합계 행렬을 만들고 Period 축 누적합 보관
+- 당월 / 최근 N개월(달력 기준) / 최근 N개 Period(데이터에 있는 Period 기준) 합계 = 누적합 차이 (O(1))
+  → Period × 아이템마다 전체 데이터를 다시 훑던 재고주수 계산 대체
+- 재고주수 = 재고 / 월 매출 × 4주
+
+사용 예:
+    from stock_weeks import period_sums, stock_weeks
+
+    sums = period_sums(rows, lambda row: classify_item(row['Season_Code'], row['Category'], row['Period']) or None,
+                       ['Gross_Sales', 'Stock_Price'])
+    sales = sums['Gross_Sales']
+    sales.month('과시즌SS', '2512')              # 당월
+    sales.calendar_sum('과시즌SS', '2512', 6)    # 2507 ~ 2512 (데이터에 없는 월은 0)
+    sales.last_n_sum('SHO', '2512', 6)           # 2512 이하 최근 6개 Period
+    stock_weeks(sums['Stock_Price'].month('과시즌SS', '2512'), sales.month('과시즌SS', '2512'))
+"""
+import numpy as np
+
+WEEKS_PER_MONTH = 4
+ROW_COUNT = '_rows'  # period_sums 가상 컬럼: 행 수
+
+
+def period_ordinal(period):
+    """YYMM → 월 순번 (달력 구간 계산용)"""
+    year, month = divmod(int(period) % 10000, 100)
+    return year * 12 + month - 1
+
+
+class PeriodPrefixSums:
+    """키 × Period 합계 행렬과 Period 축 누적합"""
+
+    def __init__(self, cells, periods=None):
+        """
+        Args:
+            cells: {(키, Period): 합계}
+            periods: Period 축 (기본: cells에 있는 Period) — 원천 데이터의 Period 목록을 주면
+                     last_n_sum이 데이터 기준 '최근 N개 Period'와 같아짐
+        """
+        axis = set(periods or []) | {period for _, period in cells}
+        self.periods = sorted(axis, key=period_ordinal)
+        self.keys = list(dict.fromkeys(key for key, _ in cells))
+        self._key_index = {key: i for i, key in enumerate(self.keys)}
+        self._period_index = {period: j for j, period in enumerate(self.periods)}
+        self._ordinals = np.array([period_ordinal(p) for p in self.periods], dtype=np.int64)
+
+        self.matrix = np.zeros((len(self.keys), len(self.periods)))
+        for (key, period), value in cells.items():
+            self.matrix[self._key_index[key], self._period_index[period]] = value
+        self._prefix = np.zeros((len(self.keys), len(self.periods) + 1))
+        np.cumsum(self.matrix, axis=1, out=self._prefix[:, 1:])
+
+    def _range_sum(self, key, lo, hi):
+        """Period 위치 [lo, hi) 합계"""
+        row = self._key_index.get(key)
+        if row is None or hi <= lo:
+            return 0.0
+        if hi - lo == 1:
+            # 단일 Period는 누적합 차이 대신 원값 (부동소수 오차 없음)
+            return float(self.matrix[row, lo])
+        return float(self._prefix[row, hi] - self._prefix[row, lo])
+
+    def positions(self, start, end):
+        """달력 구간 start ~ end (YYMM, 양끝 포함) → Period 위치 [lo, hi)"""
+        lo = int(np.searchsorted(self._ordinals, period_ordinal(start), side='left'))
+        hi = int(np.searchsorted(self._ordinals, period_ordinal(end), side='right'))
+        return lo, hi
+
+    def keys_sum(self, mask, lo, hi):
+        """여러 키(self.keys 순서의 bool 마스크)의 Period 위치 [lo, hi) 합계"""
+        if hi <= lo or not mask.any():
+            return 0.0
+        if hi - lo == 1:
+            return float(self.matrix[mask, lo].sum())
+        return float((self._prefix[mask, hi] - self._prefix[mask, lo]).sum())
+
+    def key_totals(self, lo, hi):
+        """키별 Period 위치 [lo, hi) 합계 배열 (self.keys 순서)"""
+        if hi <= lo:
+            return np.zeros(len(self.keys))
+        if hi - lo == 1:
+            return self.matrix[:, lo].copy()
+        return self._prefix[:, hi] - self._prefix[:, lo]
+
+    def keys_series(self, mask, periods):
+        """여러 키(bool 마스크)의 Period별 합계 배열 (periods 순서, 축에 없는 Period는 0)"""
+        totals = self.matrix[mask].sum(axis=0)
+        return np.array([totals[self._period_index[p]] if p in self._period_index else 0.0 for p in periods])
+
+    def range_sum(self, key, start, end):
+        """달력 구간 start ~ end 합계"""
+        return self._range_sum(key, *self.positions(start, end))
+
+    def month(self, key, period):
+        """당월 합계"""
+        j = self._period_index.get(str(period))
+        return 0.0 if j is None else self._range_sum(key, j, j + 1)
+
+    def calendar_sum(self, key, period, months, include_current=True):
+        """달력 기준 최근 months개월 합계 (include_current=False면 직전 months개월)"""
+        end = period_ordinal(period) + (1 if include_current else 0)
+        hi = int(np.searchsorted(self._ordinals, end, side='left'))
+        lo = int(np.searchsorted(self._ordinals, end - months, side='left'))
+        return self._range_sum(key, lo, hi)
+
+    def last_n_sum(self, key, period, n):
+        """Period 축 기준 period 이하 최근 n개 Period 합계"""
+        hi = int(np.searchsorted(self._ordinals, period_ordinal(period), side='right'))
+        return self._range_sum(key, max(hi - n, 0), hi)
+
+
+def period_sums(rows, key_func, columns, periods=None):
+    """
+    원천 행 1회 순회 → {컬럼: PeriodPrefixSums}
+
+    Args:
+        rows: 행 dict 목록 (Period 컬럼 필요)
+        key_func: 행 → 키 (None이면 제외)
+        columns: 합계할 숫자 컬럼 목록 (ROW_COUNT는 행 수) — 결과의 키 순서는 컬럼 간 동일
+        periods: Period 축 (PeriodPrefixSums 참고)
+    """
+    cells = {column: {} for column in columns}
+    for row in rows:
+        key = key_func(row)
+        if key is None:
+            continue
+        cell = (key, row['Period'])
+        for column in columns:
+            bucket = cells[column]
+            bucket[cell] = bucket.get(cell, 0) + (1 if column == ROW_COUNT else float(row[column] or 0))
+    return {column: PeriodPrefixSums(cells[column], periods) for column in columns}
+
+
+def stock_weeks(stock, monthly_sales):
+    """재고주수 = 재고 / 월 매출 × 4주 (매출 0 이하면 0)"""
+    return (stock / monthly_sales) * WEEKS_PER_MONTH if monthly_sales > 0 else 0
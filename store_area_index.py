@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+매장 면적(평) 시계열 인덱스
+
+- 매장 × 월(YYMM) 면적 행렬 + 매장 메타(국가, 채널) + 영업 유효 구간(면적 > 0인 첫/마지막 월)
+- HK/MC: HKMC Store pyung CSV (Store code, country, channel, 2401 ~ 2512 월별 면적 컬럼)
+- TW: TW Store pyung CSV가 있으면 동일 형식으로 로드, 없으면 TW_STORE_META 고정 면적을 전 기간에 적용
+- 같은 파일은 프로세스 내에서 1회만 로드 (경로 + 수정시각 기준 캐시)
+
+사용 예:
+    from store_area_index import load_region_area_index
+
+    index = load_region_area_index('HKMC', '2512')
+    index.area_matrix([2501, 2502])      # 매장 × Period 면적
+    index.validity                       # 매장별 open_period / close_period
+"""
+import os
+import re
+
+import pandas as pd
+
+HKMC_AREA_CSV = '../Dashboard_Raw_Data/HKMC/{period}/HKMC Store pyung {period}.csv'
+TW_AREA_CSV = '../Dashboard_Raw_Data/TW/{period}/TW Store pyung {period}.csv'
+
+# 대만 매장 메타 (면적 CSV가 없을 때 사용하는 고정 면적)
+TW_STORE_META = {
+    'T01': {'name': '台北101', 'area': 70, 'channel': '정규점'},
+    'T02': {'name': '新光三越信義A11', 'area': 60, 'channel': '정규점'},
+    'T03': {'name': '微風南京', 'area': 50, 'channel': '정규점'},
+    'T04': {'name': '新光三越台北站前', 'area': 45, 'channel': '정규점'},
+    'T05': {'name': '微風信義', 'area': 55, 'channel': '정규점'},
+    'T06': {'name': '誠品信義', 'area': 40, 'channel': '정규점'},
+    'T07': {'name': '台中大遠百', 'area': 45, 'channel': '정규점'},
+    'T08': {'name': '高雄大遠百', 'area': 40, 'channel': '정규점'},
+    'T09': {'name': 'Gloria Outlet 華泰名品城', 'area': 35, 'channel': '아웃렛'},
+    'T10': {'name': 'Online', 'area': 0, 'channel': '온라인'},
+}
+
+# 면적 파일/메타의 채널 표기 → 공통 채널 코드
+CHANNEL_CODES = {
+    '정상': 'Retail', '정규점': 'Retail', 'Retail': 'Retail',
+    '아울렛': 'Outlet', '아웃렛': 'Outlet', 'Outlet': 'Outlet',
+    'Online': 'Online', '온라인': 'Online',
+}
+
+PERIOD_COLUMN = re.compile(r'^\d{4}$')
+
+_INDEX_CACHE = {}
+
+
+def to_short_period(period):
+    """202512 / '202512' / '2512' → 2512 (YYMM 정수)"""
+    period = int(period)
+    return period % 10000 if period >= 100000 else period
+
+
+def month_range(start, end):
+    """YYMM 시작~끝 (포함) 월 목록"""
+    periods = []
+    year, month = divmod(to_short_period(start), 100)
+    end_year, end_month = divmod(to_short_period(end), 100)
+    while (year, month) <= (end_year, end_month):
+        periods.append(year * 100 + month)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return periods
+
+
+class StoreAreaIndex:
+    """매장 × 월 면적 행렬과 매장 메타"""
+
+    def __init__(self, areas, stores):
+        """
+        Args:
+            areas: DataFrame (index=매장코드, columns=YYMM 정수, 값=면적)
+            stores: DataFrame (index=매장코드, columns=['country', 'channel'])
+        """
+        self.areas = areas.sort_index(axis=1).fillna(0).astype(float)
+        self.stores = stores.reindex(self.areas.index)
+        self.stores['channel'] = self.stores['channel'].map(lambda c: CHANNEL_CODES.get(c, c))
+
+    @property
+    def periods(self):
+        return list(self.areas.columns)
+
+    @property
+    def validity(self):
+        """매장별 영업 유효 구간 (면적 > 0인 첫/마지막 월, 없으면 NaN)"""
+        open_mask = self.areas > 0
+        has_area = open_mask.any(axis=1)
+        return pd.DataFrame({
+            'open_period': open_mask.idxmax(axis=1).where(has_area),
+            'close_period': open_mask.iloc[:, ::-1].idxmax(axis=1).where(has_area),
+        })
+
+    def area_matrix(self, periods=None, stores=None):
+        """매장 × Period 면적 (인덱스에 없는 매장/월은 0)"""
+        periods = self.periods if periods is None else [to_short_period(p) for p in periods]
+        stores = self.areas.index if stores is None else stores
+        return self.areas.reindex(index=stores, columns=periods, fill_value=0)
+
+    def combine(self, other):
+        """두 인덱스 합치기 (HKMC + TW 등)"""
+        return StoreAreaIndex(
+            pd.concat([self.areas, other.areas]),
+            pd.concat([self.stores, other.stores]),
+        )
+
+    @classmethod
+    def from_csv(cls, path):
+        """Store pyung CSV 로드 (Store code, country, channel, YYMM 컬럼)"""
+        df = pd.read_csv(path, encoding='utf-8-sig')
+        df = df.drop_duplicates('Store code', keep='last').set_index('Store code')
+        period_columns = [c for c in df.columns if PERIOD_COLUMN.match(str(c).strip())]
+        areas = df[period_columns].apply(pd.to_numeric, errors='coerce')
+        areas.columns = [int(str(c).strip()) for c in period_columns]
+        stores = df[['country', 'channel']]
+        return cls(areas, stores)
+
+    @classmethod
+    def from_constant(cls, store_meta, periods, country):
+        """고정 면적 메타({code: {'area', 'channel'}})를 전 기간에 적용"""
+        codes = list(store_meta)
+        periods = [to_short_period(p) for p in periods]
+        areas = pd.DataFrame(
+            [[store_meta[code]['area']] * len(periods) for code in codes],
+            index=codes, columns=periods,
+        )
+        stores = pd.DataFrame({
+            'country': country,
+            'channel': [store_meta[code]['channel'] for code in codes],
+        }, index=codes)
+        return cls(areas, stores)
+
+
+def load_store_area_index(path):
+    """면적 CSV 로드 (경로 + 수정시각이 같으면 캐시 반환)"""
+    key = (os.path.abspath(path), os.path.getmtime(path))
+    if key not in _INDEX_CACHE:
+        _INDEX_CACHE[key] = StoreAreaIndex.from_csv(path)
+    return _INDEX_CACHE[key]
+
+
+def load_region_area_index(region, period, periods=None):
+    """
+    지역별 면적 인덱스
+
+    Args:
+        region: 'HKMC' 또는 'TW'
+        period: 기준 Period (면적 파일 폴더, 예: '2512')
+        periods: TW 고정 면적 적용 기간 (기본: 전년 1월 ~ period)
+    """
+    period = str(to_short_period(period))
+    if region == 'HKMC':
+        return load_store_area_index(HKMC_AREA_CSV.format(period=period))
+
+    path = TW_AREA_CSV.format(period=period)
+    if os.path.exists(path):
+        return load_store_area_index(path)
+    if periods is None:
+        periods = month_range((int(period) // 100 - 1) * 100 + 1, period)
+    return StoreAreaIndex.from_constant(TW_STORE_META, periods, 'TW')
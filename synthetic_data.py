@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+합성 원천 데이터 생성기 (벤치마크/회귀 테스트용)
+
+실제 Dashboard_Raw_Data와 같은 스키마/폴더 구조로 가짜 데이터를 생성 (기밀 데이터 없이 파이프라인 실행 가능)
+- HKMC_Inventory / TW_Inventory: Period, Year, Brand, Store_Code, Store_Name, Season_Code, Season_Type,
+  Category, Subcategory, Subcategory_Code, Gross_Sales, Net_Sales, Sales_Qty, Stock_Price, Stock_Cost,
+  AC_Sales_Gross, Net_AcP_P, Country, Channel
+- PL (hmd_pl_database): PERIOD, CNTRY_CD, SHOP_CD, BRD_CD, ACCOUNT_CD, ACCOUNT_NM, VALUE
+- 매장 수 / 이력 연수 / 매장당 품목 행 수로 규모 조절, seed가 같으면 항상 같은 데이터
+
+생성 구조 (root = Dashboard_Raw_Data 역할):
+    {root}/HKMC/{period}/HKMC_Inventory_{period}.csv
+    {root}/HKMC/{period}/HKMC_PL_{period}.csv
+    {root}/TW/{period}/TW_Inventory_{period}.csv
+    {root}/TW/{period}/TW_PL_{period}.csv
+    {root}/TW/{period}/TW_Exchange Rate {period}.csv
+    {root}/hmd_pl_database.csv                      (HK/MC/TW 통합 PL)
+
+사용법:
+    python synthetic_data.py <root> [--period 2512] [--stores 20] [--years 2] [--rows 60] [--seed 7]
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from store_area_index import month_range
+
+INVENTORY_COLUMNS = [
+    'Period', 'Year', 'Brand', 'Store_Code', 'Store_Name', 'Season_Code', 'Season_Type',
+    'Category', 'Subcategory', 'Subcategory_Code', 'Gross_Sales', 'Net_Sales', 'Sales_Qty',
+    'Stock_Price', 'Stock_Cost', 'AC_Sales_Gross', 'Net_AcP_P', 'Country', 'Channel',
+]
+PL_COLUMNS = ['PERIOD', 'CNTRY_CD', 'SHOP_CD', 'BRD_CD', 'ACCOUNT_CD', 'ACCOUNT_NM', 'VALUE']
+
+# (Category, Subcategory 이름, 의류 여부)
+CATEGORIES = [
+    ('HEA', 'Headwear', False), ('SHO', 'Shoes', False), ('BAG', 'Bag', False), ('ATC', 'Acc etc', False),
+    ('OUT', 'Outer', True), ('INN', 'Inner', True), ('BOT', 'Bottom', True), ('WTC', 'Wear etc', True),
+]
+SUBCATEGORY_CODES = 3
+
+# 매장 PL 계정: (ACCOUNT_CD, ACCOUNT_NM, 실매출 대비 비율)
+STORE_ACCOUNTS = [
+    ('TAG_SALE_AMT', 'Tag매출액', 1.25),
+    ('ACT_SALE_AMT', '실매출액', 1.0),
+    ('COGS', '매출원가', 0.31),
+    ('', '매출총이익', 0.69),
+    ('급여', '1. 급 여', 0.12),
+    ('여비교통비', '2. TRAVEL & MEAL', 0.004),
+    ('', '3. 피복비(유니폼)', 0.002),
+    ('임차료', '4. 임차료', 0.22),
+    ('', '5. 유지보수비', 0.006),
+    ('', '6. 수도광열비', 0.008),
+    ('', '7. 소모품비', 0.003),
+    ('', '8. 통신비', 0.002),
+    ('광고비', '9. 광고선전비', 0.01),
+    ('지급수수료 일반', '10. 지급수수료', 0.02),
+    ('', '11. 운반비', 0.01),
+    ('', '12. 기타 수수료(매장관리비 외)', 0.015),
+    ('보험료', '13. 보험료', 0.002),
+    ('DEPR_EXP', '14. 감가상각비', 0.03),
+    ('', '영업이익', 0.2),
+]
+# 오피스 PL 계정 (판매관리비 + 상세)
+OFFICE_ACCOUNTS = [
+    ('', '판매관리비', 0.08),
+    ('급여', '1. 급 여', 0.04),
+    ('광고비', '9. 광고선전비', 0.02),
+    ('지급수수료 일반', '10. 지급수수료', 0.01),
+    ('임차료', '4. 임차료', 0.005),
+    ('보험료', '13. 보험료', 0.001),
+    ('여비교통비', '2. TRAVEL & MEAL', 0.002),
+    ('DEPR_EXP', '14. 감가상각비', 0.002),
+    ('', '영업이익', -0.08),
+]
+
+# 지역별 매장 코드 규칙: (코드, 국가, 채널, 브랜드)
+HKMC_FIXED_STORES = [
+    ('M07', 'HK', 'Outlet', 'MLB'), ('M13', 'HK', 'Outlet', 'MLB'),
+    ('HE1', 'HK', 'Online', 'MLB'), ('HE2', 'HK', 'Online', 'MLB'),
+    ('XE1', 'HK', 'Online', 'DISCOVERY'),
+]
+TW_FIXED_STORES = [
+    ('TU1', 'TW', 'Outlet', 'MLB'), ('TE1', 'TW', 'Online', 'MLB'),
+    ('DE1', 'TW', 'Online', 'DISCOVERY'), ('D01', 'TW', 'Retail', 'DISCOVERY'),
+]
+OFFICES = {'HKMC': [('H99', 'HK'), ('M99', 'MC')], 'TW': [('T99', 'TW')]}
+BRAND_CODES = {'MLB': 'M', 'DISCOVERY': 'X'}
+CURRENCY_SCALE = {'HKMC': 1.0, 'TW': 4.0}  # TW 재고수불은 TWD
+STORE_MONTHLY_GROSS = 500000  # 매장당 월 Gross 매출 (HKD) — 행 수와 무관하게 검증 최소 기준 이상
+
+
+def build_stores(region, n_stores):
+    """지역 매장 목록 DataFrame (Store_Code, Country, Channel, Brand)"""
+    if region == 'HKMC':
+        fixed = HKMC_FIXED_STORES
+        taken = {code for code, *_ in fixed}
+        retail = []
+        number = 1
+        while len(retail) < max(n_stores - len(fixed), 1):
+            code = f'M{number:02d}'
+            if code not in taken and code not in ('M99',):
+                country = 'MC' if len(retail) % 5 == 4 else 'HK'
+                retail.append((code, country, 'Retail', 'MLB'))
+            number += 1
+    else:
+        fixed = TW_FIXED_STORES
+        retail = [(f'T{number:02d}', 'TW', 'Retail', 'MLB') for number in range(1, max(n_stores - len(fixed), 1) + 1)]
+    return pd.DataFrame(retail + fixed, columns=['Store_Code', 'Country', 'Channel', 'Brand'])
+
+
+def season_pool(period):
+    """Period 기준 시즌 코드 후보 (당년+1 S ~ 4년 전 F/S, ACC N 시즌)"""
+    year = int(period) // 100
+    seasons = [f'{year + 1:02d}S']
+    for y in range(year, year - 4, -1):
+        seasons += [f'{y:02d}F', f'{y:02d}S', f'{y:02d}N']
+    return seasons
+
+
+def inventory_frame(region, period, n_stores=20, years=2, rows_per_store=60, seed=7):
+    """
+    재고수불 합성 데이터
+
+    각 Period × 매장마다 rows_per_store개 품목 행
+    (값은 난수, 매장 월 매출이 STORE_MONTHLY_GROSS 수준이 되도록 행 수로 나누고 통화 단위에 맞춤)
+    """
+    rng = np.random.default_rng(seed)
+    stores = build_stores(region, n_stores)
+    periods = history_periods(period, years)
+    n_rows = len(periods) * len(stores) * rows_per_store
+
+    period_idx = np.repeat(np.arange(len(periods)), len(stores) * rows_per_store)
+    store_idx = np.tile(np.repeat(np.arange(len(stores)), rows_per_store), len(periods))
+    category_idx = rng.integers(0, len(CATEGORIES), n_rows)
+    is_apparel = np.array([c[2] for c in CATEGORIES])[category_idx]
+
+    # 시즌: 의류는 F/S, ACC는 N 시즌 위주
+    season_codes = np.empty(n_rows, dtype=object)
+    for i, p in enumerate(periods):
+        pool = np.array(season_pool(p), dtype=object)
+        apparel_pool = pool[[not s.endswith('N') for s in pool]]
+        acc_pool = pool[[s.endswith('N') for s in pool]]
+        mask = period_idx == i
+        picks_apparel = apparel_pool[rng.integers(0, len(apparel_pool), mask.sum())]
+        picks_acc = acc_pool[rng.integers(0, len(acc_pool), mask.sum())]
+        season_codes[mask] = np.where(is_apparel[mask], picks_apparel, picks_acc)
+
+    scale = CURRENCY_SCALE[region] * STORE_MONTHLY_GROSS / rows_per_store
+    gross = np.round(rng.gamma(2.0, 0.5, n_rows) * scale, 2)
+    net = np.round(gross * rng.uniform(0.6, 0.95, n_rows), 2)
+    stock_price = np.round(rng.gamma(2.0, 2.0, n_rows) * scale, 2)
+
+    category = np.array([c[0] for c in CATEGORIES], dtype=object)[category_idx]
+    sub_number = rng.integers(1, SUBCATEGORY_CODES + 1, n_rows).astype(str)
+    period_values = np.array(periods)[period_idx]
+    df = pd.DataFrame({
+        'Period': period_values,
+        'Year': 2000 + period_values // 100,
+        'Brand': stores['Brand'].to_numpy()[store_idx],
+        'Store_Code': stores['Store_Code'].to_numpy()[store_idx],
+        'Store_Name': stores['Store_Code'].to_numpy()[store_idx] + ' Store',
+        'Season_Code': season_codes,
+        'Season_Type': '',
+        'Category': category,
+        'Subcategory': np.array([c[1] for c in CATEGORIES], dtype=object)[category_idx],
+        'Subcategory_Code': category + sub_number,
+        'Gross_Sales': gross,
+        'Net_Sales': net,
+        'Sales_Qty': rng.integers(0, 40, n_rows),
+        'Stock_Price': stock_price,
+        'Stock_Cost': np.round(stock_price * 0.3, 2),
+        'AC_Sales_Gross': np.round(gross * rng.uniform(3, 12, n_rows), 2),
+        'Net_AcP_P': np.round(stock_price * rng.uniform(1, 4, n_rows), 2),
+        'Country': stores['Country'].replace({'MC': 'MO'}).to_numpy()[store_idx],
+        'Channel': stores['Channel'].to_numpy()[store_idx],
+    })
+    return df[INVENTORY_COLUMNS]
+
+
+def pl_frame(region, period, n_stores=20, years=2, seed=7):
+    """PL 합성 데이터 (매장별 계정 + 오피스 판매관리비, 1 HKD 단위)"""
+    rng = np.random.default_rng(seed + 1)
+    stores = build_stores(region, n_stores)
+    periods = history_periods(period, years)
+
+    rows = []
+    for p in periods:
+        full_period = 200000 + p
+        base_sales = rng.gamma(3.0, 250000.0, len(stores))
+        for store, sales in zip(stores.itertuples(index=False), base_sales):
+            for account_cd, account_nm, ratio in STORE_ACCOUNTS:
+                rows.append((full_period, store.Country, store.Store_Code, BRAND_CODES[store.Brand],
+                             account_cd, account_nm, round(sales * ratio, 2)))
+        total_sales = base_sales.sum()
+        for office, country in OFFICES[region]:
+            for brand in BRAND_CODES.values():
+                for account_cd, account_nm, ratio in OFFICE_ACCOUNTS:
+                    rows.append((full_period, country, office, brand, account_cd, account_nm,
+                                 round(total_sales * ratio / len(OFFICES[region]), 2)))
+    return pd.DataFrame(rows, columns=PL_COLUMNS)
+
+
+def history_periods(period, years):
+    """period까지 years년(12 × years개월) Period 목록"""
+    year, month = divmod(int(period), 100)
+    start = (year - years) * 100 + month + 1 if month < 12 else (year - years + 1) * 100 + 1
+    return month_range(start, period)
+
+
+def write_dataset(root, period='2512', n_stores=20, years=2, rows_per_store=60, seed=7, exchange_rate=4.02):
+    """
+    합성 데이터셋 저장
+
+    Returns:
+        {'files': {이름: 경로}, 'rows': {이름: 행 수}, 'bytes': 총 바이트}
+    """
+    period = str(period)
+    frames = {
+        'hkmc_inventory': (inventory_frame('HKMC', period, n_stores, years, rows_per_store, seed),
+                           os.path.join(root, 'HKMC', period, f'HKMC_Inventory_{period}.csv')),
+        'tw_inventory': (inventory_frame('TW', period, n_stores, years, rows_per_store, seed + 10),
+                         os.path.join(root, 'TW', period, f'TW_Inventory_{period}.csv')),
+        'hkmc_pl': (pl_frame('HKMC', period, n_stores, years, seed),
+                    os.path.join(root, 'HKMC', period, f'HKMC_PL_{period}.csv')),
+        'tw_pl': (pl_frame('TW', period, n_stores, years, seed + 10),
+                  os.path.join(root, 'TW', period, f'TW_PL_{period}.csv')),
+    }
+    frames['pl_database'] = (pd.concat([frames['hkmc_pl'][0], frames['tw_pl'][0]], ignore_index=True),
+                             os.path.join(root, 'hmd_pl_database.csv'))
+    frames['tw_exchange_rate'] = (pd.DataFrame({'period': [period], 'rate': [exchange_rate]}),
+                                  os.path.join(root, 'TW', period, f'TW_Exchange Rate {period}.csv'))
+
+    result = {'files': {}, 'rows': {}, 'bytes': 0}
+    for name, (df, path) in frames.items():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+        result['files'][name] = path
+        result['rows'][name] = len(df)
+        result['bytes'] += os.path.getsize(path)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='합성 원천 데이터 생성')
+    parser.add_argument('root', help='출력 폴더 (Dashboard_Raw_Data 역할)')
+    parser.add_argument('--period', default='2512')
+    parser.add_argument('--stores', type=int, default=20)
+    parser.add_argument('--years', type=int, default=2)
+    parser.add_argument('--rows', type=int, default=60, help='Period × 매장당 재고 행 수')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    dataset = write_dataset(args.root, args.period, args.stores, args.years, args.rows, args.seed)
+    for name, path in dataset['files'].items():
+        print(f"  {name:18s} {dataset['rows'][name]:>10,}행  {path}")
+    print(f"  총 {dataset['bytes'] / 1024 / 1024:,.1f} MB")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+추세 시계열 빌더 (차원 조합 × Period 합계, 원천 1회 순회)
+
+- 원천 행을 한 번만 순회해 (차원 값 조합) × Period 합계 행렬 생성 (stock_weeks.period_sums)
+- 전체 / 채널별 / 아이템별 / 매장별 추세를 Period 목록 순서의 배열로 반환,
+  전년 동월 배열과 YOY도 같은 행렬에서 계산
+  → Period(및 아이템 / 채널)마다 data를 다시 필터링하던 추세 계산 대체 — 이력 월 수에 선형
+
+사용 예:
+    from trend_series import TrendSeries, yoy_percent
+
+    trends = TrendSeries(data, {'channel': channel_of, 'item': item_of}, ['Net_Sales'],
+                         include=lambda row: row['Brand'] == 'MLB')
+    trends.series('Net_Sales', ['2501', '2502'])                      # 전체
+    trends.series('Net_Sales', ['2501', '2502'], channel='HK_Retail')
+    trends.series('Net_Sales', ['2501', '2502'], item=['가방', '기타ACC'])
+    current, previous = trends.yoy_pair('Net_Sales', ['2501', '2502'], item='모자')
+    yoy_percent(current, previous)                                    # [YOY%, ...]
+"""
+import numpy as np
+
+from stock_weeks import ROW_COUNT, period_sums
+
+
+def previous_year_period(period):
+    """YYMM → 전년 동월 YYMM"""
+    return f"{(int(period[:2]) - 1) % 100:02d}{period[2:]}"
+
+
+def yoy_percent(current, previous):
+    """YOY (%) 배열 = 당해 / 전년 × 100 (전년 0 이하면 0)"""
+    current = np.asarray(current, dtype=float)
+    previous = np.asarray(previous, dtype=float)
+    safe = np.where(previous > 0, previous, 1.0)
+    return np.where(previous > 0, current / safe * 100, 0.0)
+
+
+class TrendSeries:
+    """차원 조합 × Period 추세 행렬"""
+
+    def __init__(self, rows, dimensions, columns, include=None, periods=None):
+        """
+        Args:
+            rows: 원천 행 dict 목록
+            dimensions: {차원 이름: 행 → 차원 값}
+            columns: 합계할 숫자 컬럼 목록
+            include: 행 필터 (None이면 전체)
+            periods: Period 축 (기본: 행에 있는 Period)
+        """
+        names = list(dimensions)
+        funcs = [dimensions[name] for name in names]
+
+        def key(row):
+            if include is not None and not include(row):
+                return None
+            return tuple(func(row) for func in funcs)
+
+        self.sums = period_sums(rows, key, list(columns) + [ROW_COUNT], periods)
+        keys = self.sums[ROW_COUNT].keys
+        self._members = {name: np.array([k[i] for k in keys], dtype=object) for i, name in enumerate(names)}
+        self._all = np.ones(len(keys), dtype=bool)
+
+    def _mask(self, members):
+        mask = self._all.copy()
+        for name, value in members.items():
+            values = self._members[name]
+            if isinstance(value, (list, tuple, set)):
+                mask &= np.isin(values, list(value))
+            else:
+                mask &= values == value
+        return mask
+
+    def members(self, name):
+        """차원 값 목록 (원천 행에서 처음 나온 순)"""
+        return list(dict.fromkeys(self._members[name]))
+
+    def series(self, column, periods, **members):
+        """periods 순서의 합계 배열 (members: 차원 이름=값 또는 값 목록)"""
+        return self.sums[column].keys_series(self._mask(members), periods)
+
+    def yoy_pair(self, column, periods, **members):
+        """(당해 배열, 전년 동월 배열)"""
+        return (self.series(column, periods, **members),
+                self.series(column, [previous_year_period(p) for p in periods], **members))
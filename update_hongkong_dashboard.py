@@ -4,8 +4,6 @@
 - 새로운 CSV 파일을 추가하면 자동으로 통합
 - 최신 Period를 자동 감지하여 전년 동월과 비교
 """
-import csv
-import json
 import os
 import glob
 from collections import defaultdict
@@ -13,6 +11,18 @@ from datetime import datetime
 import sys
 import io
 
+from aging_cube import AgingCube
+from dashboard_bundle import write_bundle
+from dashboard_loader import DataValidationError, load_source_csv
+from dashboard_manifest import update_manifest
+from dashboard_writer import ArtifactWriter
+from item_classifier import ITEM_KEYS, ITEM_LABELS, UNCLASSIFIED, ItemBucketTable, get_acc_category
+from kpi_table import dashboard_kpis, record_kpis
+from sell_through import SellThrough
+from stage_profiler import instrument_cli, staged
+from stock_weeks import ROW_COUNT, period_sums, stock_weeks
+from trend_series import TrendSeries, yoy_percent
+
 # Windows 콘솔 인코딩 문제 해결
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -30,24 +40,9 @@ CATEGORY_MAP = {
     # 나머지는 '기타ACC'
 }
 
-# ACC 카테고리 분류 (판매 데이터용)
-def get_acc_category(category):
-    """
-    Category 코드를 기반으로 ACC 카테고리 반환
-    - 신발: SHO
-    - 모자: HEA
-    - 가방: BAG
-    - 기타ACC: 나머지
-    """
-    category_upper = category.upper()
-    if 'SHO' in category_upper:
-        return '신발'
-    elif 'HEA' in category_upper:
-        return '모자'
-    elif 'BAG' in category_upper:
-        return '가방'
-    else:
-        return '기타ACC'
+# 추세 그래프 아이템 (F/S 세분화 의류 + ACC 4개 카테고리) / 채널
+TREND_ITEM_KEYS = ['당시즌F', '당시즌S', '과시즌F', '과시즌S', '신발', '모자', '가방', '기타ACC']
+TREND_CHANNEL_KEYS = ['HK_Retail', 'HK_Outlet', 'HK_Online', 'MC_Retail', 'MC_Outlet']
 
 def get_store_category(store_code):
     """Store Code를 기반으로 카테고리 반환"""
@@ -99,12 +94,31 @@ def get_season_type(season_code, current_year, current_month):
     
     return '기타'
 
+def get_trend_item(row):
+    """
+    추세 그래프 아이템 분류
+    - N시즌: ACC 4개 카테고리
+    - 의류: 행 Period 연도 기준 당시즌F/S, 과시즌F/S (분류 불가는 당시즌F에 포함)
+    """
+    season_code = row['Season_Code']
+    if season_code.endswith('N'):
+        return get_acc_category(row['Category'])
+    season_type = get_season_type(season_code, int(row['Period'][:2]), None)
+    return season_type if season_type in TREND_ITEM_KEYS else '당시즌F'
+
+def get_trend_channel(row):
+    """추세 그래프 채널 (Country MO → MC, Channel Outlet/Online 외는 Retail)"""
+    country = 'MC' if row['Country'] == 'MO' else row['Country']
+    channel = row['Channel'] if row['Channel'] in ('Outlet', 'Online') else 'Retail'
+    return f"{country}_{channel}"
+
 def calculate_discount_rate(gross_sales, net_sales):
     """할인율 계산"""
     if gross_sales == 0:
         return 0
     return ((gross_sales - net_sales) / gross_sales) * 100
 
+@staged()
 def read_all_csv_files(csv_dir, target_period=None):
     """CSV 디렉토리에서 모든 CSV 파일 읽기 및 통합"""
     # target_period가 지정되면 해당 파일만, 아니면 모든 파일 읽기
@@ -130,18 +144,20 @@ def read_all_csv_files(csv_dir, target_period=None):
     
     all_data = []
     all_periods = set()
+    # 아이템 버킷 테이블 (실행당 1회, 행의 Period 기준 → Item_Bucket 컬럼)
+    buckets = ItemBucketTable()
     
     for csv_file in sorted(csv_files):
         print(f"\n읽는 중: {os.path.basename(csv_file)}")
         try:
-            with open(csv_file, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                row_count = 0
-                for row in reader:
-                    all_data.append(row)
-                    all_periods.add(row['Period'])
-                    row_count += 1
-                print(f"  OK {row_count:,}행 읽음")
+            # 로드와 동시에 데이터 검증 (실패 시 이후 산출물 저장 차단)
+            loaded = load_source_csv(csv_file, 'hongkong', period=target_period)
+            loaded.frame['Item_Bucket'] = buckets.ids(loaded.frame)
+            all_data.extend(loaded.records())
+            all_periods.update(loaded.periods)
+            print(f"  OK {len(loaded.frame):,}행 읽음")
+        except DataValidationError:
+            raise
         except Exception as e:
             print(f"  ERROR: {e}")
             continue
@@ -150,6 +166,7 @@ def read_all_csv_files(csv_dir, target_period=None):
     periods_sorted = sorted(all_periods, key=lambda x: int(x) if x.isdigit() else 0)
     return all_data, periods_sorted
 
+@staged(rows=None)
 def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
     """대시보드용 데이터 생성
     
@@ -560,380 +577,90 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
     print("추세 데이터 생성 중...")
     start_period = f"{last_year % 100:02d}01"  # 해당 년도 1월
     recent_periods = sorted([p for p in periods if start_period <= p <= last_period])
+    prev_start_period = f"{prev_year % 100:02d}01"
+    prev_recent_periods = sorted([p for p in periods if prev_start_period <= p <= prev_period])
     
-    # 월별 채널별 데이터 생성
-    monthly_channel_data = defaultdict(lambda: {
-        'period': '',
-        'HK_Retail': 0,
-        'HK_Outlet': 0,
-        'HK_Online': 0,
-        'MC_Retail': 0,
-        'MC_Outlet': 0,
-        'total': 0,
-    })
-    
-    # 전년도 월별 채널별 데이터 (YOY 계산용)
-    prev_monthly_channel_data = defaultdict(lambda: {
-        'period': '',
-        'HK_Retail': 0,
-        'HK_Outlet': 0,
-        'HK_Online': 0,
-        'MC_Retail': 0,
-        'MC_Outlet': 0,
-        'total': 0,
-    })
-    
-    # 월별 아이템별 데이터 생성 (추세 그래프용)
-    # - 당시즌/과시즌을 F/S로 세분화 (대만 기준과 동일 로직)
-    monthly_item_data = defaultdict(lambda: {
-        'period': '',
-        # F/S로 나눈 의류
-        '당시즌F': {'gross_sales': 0, 'net_sales': 0},
-        '당시즌S': {'gross_sales': 0, 'net_sales': 0},
-        '과시즌F': {'gross_sales': 0, 'net_sales': 0},
-        '과시즌S': {'gross_sales': 0, 'net_sales': 0},
-        # 레거시 집계 (기존 그래프 호환용)
-        '당시즌의류': {'gross_sales': 0, 'net_sales': 0},
-        '과시즌의류': {'gross_sales': 0, 'net_sales': 0},
-        # ACC (4개 카테고리)
-        '신발': {'gross_sales': 0, 'net_sales': 0},
-        '모자': {'gross_sales': 0, 'net_sales': 0},
-        '가방': {'gross_sales': 0, 'net_sales': 0},
-        '기타ACC': {'gross_sales': 0, 'net_sales': 0},
-    })
+    # 추세 시계열 (아이템 × 채널 × 매장 × Period, MLB) - 원천 1회 순회, 모든 추세 / YOY 배열 공용
+    trends = TrendSeries(
+        data,
+        {'item': get_trend_item, 'channel': get_trend_channel, 'store': lambda row: row['Store_Code']},
+        ['Gross_Sales', 'Net_Sales', 'Sales_Qty'],
+        include=lambda row: row['Brand'] == 'MLB',
+        periods=periods,
+    )
     
-    for period in recent_periods:
-        period_data = [row for row in data if row['Period'] == period and row['Brand'] == 'MLB']
-        period_gross = sum(float(row['Gross_Sales'] or 0) for row in period_data)
-        period_net = sum(float(row['Net_Sales'] or 0) for row in period_data)
-        period_qty = sum(float(row['Sales_Qty'] or 0) for row in period_data)
-        period_discount = calculate_discount_rate(period_gross, period_net)
-        
+    period_gross = trends.series('Gross_Sales', recent_periods).tolist()
+    period_net = trends.series('Net_Sales', recent_periods).tolist()
+    period_qty = trends.series('Sales_Qty', recent_periods).tolist()
+    for i, period in enumerate(recent_periods):
         trend_data[period] = {
             'period': period,
-            'gross_sales': period_gross,
-            'net_sales': period_net,
-            'sales_qty': period_qty,
-            'discount_rate': period_discount,
+            'gross_sales': period_gross[i],
+            'net_sales': period_net[i],
+            'sales_qty': period_qty[i],
+            'discount_rate': calculate_discount_rate(period_gross[i], period_net[i]),
         }
-        
-        # 아이템별 분류
-        monthly_item_data[period]['period'] = period
-        for row in period_data:
-            category = row['Category']
-            season_code = row['Season_Code']
-            season_type = get_season_type(season_code, last_year, last_month)
-            
-            gross_sales = float(row['Gross_Sales'] or 0)
-            net_sales = float(row['Net_Sales'] or 0)
-            
-            # 아이템 분류 (N시즌 ACC는 4개 카테고리로 분류)
-            if season_code.endswith('N'):
-                # ACC (N시즌)
-                acc_category = get_acc_category(category)
-                monthly_item_data[period][acc_category]['gross_sales'] += gross_sales
-                monthly_item_data[period][acc_category]['net_sales'] += net_sales
-            else:
-                # 의류 (Category가 의류인 경우)
-                # 시즌 타입: 당시즌F, 당시즌S, 과시즌F, 과시즌S, N시즌/기타
-                if season_type == '당시즌F':
-                    monthly_item_data[period]['당시즌F']['gross_sales'] += gross_sales
-                    monthly_item_data[period]['당시즌F']['net_sales'] += net_sales
-                    monthly_item_data[period]['당시즌의류']['gross_sales'] += gross_sales
-                    monthly_item_data[period]['당시즌의류']['net_sales'] += net_sales
-                elif season_type == '당시즌S':
-                    monthly_item_data[period]['당시즌S']['gross_sales'] += gross_sales
-                    monthly_item_data[period]['당시즌S']['net_sales'] += net_sales
-                    monthly_item_data[period]['당시즌의류']['gross_sales'] += gross_sales
-                    monthly_item_data[period]['당시즌의류']['net_sales'] += net_sales
-                elif season_type == '과시즌F':
-                    monthly_item_data[period]['과시즌F']['gross_sales'] += gross_sales
-                    monthly_item_data[period]['과시즌F']['net_sales'] += net_sales
-                    monthly_item_data[period]['과시즌의류']['gross_sales'] += gross_sales
-                    monthly_item_data[period]['과시즌의류']['net_sales'] += net_sales
-                elif season_type == '과시즌S':
-                    monthly_item_data[period]['과시즌S']['gross_sales'] += gross_sales
-                    monthly_item_data[period]['과시즌S']['net_sales'] += net_sales
-                    monthly_item_data[period]['과시즌의류']['gross_sales'] += gross_sales
-                    monthly_item_data[period]['과시즌의류']['net_sales'] += net_sales
-                else:
-                    # 기타/미분류는 당시즌F에 포함 (보수적으로 처리)
-                    monthly_item_data[period]['당시즌F']['gross_sales'] += gross_sales
-                    monthly_item_data[period]['당시즌F']['net_sales'] += net_sales
-                    monthly_item_data[period]['당시즌의류']['gross_sales'] += gross_sales
-                    monthly_item_data[period]['당시즌의류']['net_sales'] += net_sales
-        
-        # 월별 채널별 집계
-        monthly_channel_data[period]['period'] = period
-        for row in period_data:
-            country = row['Country']
-            # Country 코드 표준화 (MO -> MC)
-            if country == 'MO':
-                country = 'MC'
-            
-            channel = row['Channel']
-            # Channel 표준화
-            if channel == 'Outlet':
-                channel_key = 'Outlet'
-            elif channel == 'Online':
-                channel_key = 'Online'
-            else:
-                channel_key = 'Retail'
-            
-            channel_name = f"{country}_{channel_key}"
-            net_sales = float(row['Net_Sales'] or 0)
-            
-            if channel_name in monthly_channel_data[period]:
-                monthly_channel_data[period][channel_name] += net_sales
-        
-        # Total 계산
-        monthly_channel_data[period]['total'] = (
-            monthly_channel_data[period]['HK_Retail'] +
-            monthly_channel_data[period]['HK_Outlet'] +
-            monthly_channel_data[period]['HK_Online'] +
-            monthly_channel_data[period]['MC_Retail'] +
-            monthly_channel_data[period]['MC_Outlet']
-        )
-    
-    # 전년도 월별 채널별 데이터 생성
-    prev_start_period = f"{prev_year % 100:02d}01"
-    prev_recent_periods = sorted([p for p in periods if prev_start_period <= p <= prev_period])
     
-    # 전년도 월별 아이템별 데이터 생성 (F/S 기준 세분화)
-    prev_monthly_item_data = defaultdict(lambda: {
-        'period': '',
-        '당시즌F': {'gross_sales': 0, 'net_sales': 0},
-        '당시즌S': {'gross_sales': 0, 'net_sales': 0},
-        '과시즌F': {'gross_sales': 0, 'net_sales': 0},
-        '과시즌S': {'gross_sales': 0, 'net_sales': 0},
-        '신발': {'gross_sales': 0, 'net_sales': 0},
-        '모자': {'gross_sales': 0, 'net_sales': 0},
-        '가방': {'gross_sales': 0, 'net_sales': 0},
-        '기타ACC': {'gross_sales': 0, 'net_sales': 0},
-    })
+    def build_monthly_channel_data(period_list):
+        """월별 채널별 실판매출 + total"""
+        channel_sales = {channel: trends.series('Net_Sales', period_list, channel=channel).tolist()
+                         for channel in TREND_CHANNEL_KEYS}
+        monthly = {}
+        for i, period in enumerate(period_list):
+            monthly[period] = {'period': period}
+            monthly[period].update({channel: channel_sales[channel][i] for channel in TREND_CHANNEL_KEYS})
+            monthly[period]['total'] = sum(channel_sales[channel][i] for channel in TREND_CHANNEL_KEYS)
+        return monthly
+    
+    def build_monthly_item_data(period_list, legacy=False):
+        """월별 아이템별 택매출 / 실판매출 (legacy: 당시즌의류 / 과시즌의류 합계 추가 - 기존 그래프 호환용)"""
+        item_sales = {
+            item: (trends.series('Gross_Sales', period_list, item=item).tolist(),
+                   trends.series('Net_Sales', period_list, item=item).tolist())
+            for item in TREND_ITEM_KEYS
+        }
+        monthly = {}
+        for i, period in enumerate(period_list):
+            monthly[period] = {'period': period}
+            for item, (gross, net) in item_sales.items():
+                monthly[period][item] = {'gross_sales': gross[i], 'net_sales': net[i]}
+            if legacy:
+                for legacy_key, season_keys in [('당시즌의류', ['당시즌F', '당시즌S']), ('과시즌의류', ['과시즌F', '과시즌S'])]:
+                    monthly[period][legacy_key] = {
+                        'gross_sales': sum(monthly[period][key]['gross_sales'] for key in season_keys),
+                        'net_sales': sum(monthly[period][key]['net_sales'] for key in season_keys),
+                    }
+        return monthly
     
-    for period in prev_recent_periods:
-        period_data = [row for row in data if row['Period'] == period and row['Brand'] == 'MLB']
-        
-        prev_monthly_channel_data[period]['period'] = period
-        for row in period_data:
-            country = row['Country']
-            # Country 코드 표준화 (MO -> MC)
-            if country == 'MO':
-                country = 'MC'
-            
-            channel = row['Channel']
-            # Channel 표준화
-            if channel == 'Outlet':
-                channel_key = 'Outlet'
-            elif channel == 'Online':
-                channel_key = 'Online'
-            else:
-                channel_key = 'Retail'
-            
-            channel_name = f"{country}_{channel_key}"
-            net_sales = float(row['Net_Sales'] or 0)
-            
-            if channel_name in prev_monthly_channel_data[period]:
-                prev_monthly_channel_data[period][channel_name] += net_sales
-        
-        # Total 계산
-        prev_monthly_channel_data[period]['total'] = (
-            prev_monthly_channel_data[period]['HK_Retail'] +
-            prev_monthly_channel_data[period]['HK_Outlet'] +
-            prev_monthly_channel_data[period]['HK_Online'] +
-            prev_monthly_channel_data[period]['MC_Retail'] +
-            prev_monthly_channel_data[period]['MC_Outlet']
-        )
-        
-        # 전년도 아이템별 분류
-        prev_monthly_item_data[period]['period'] = period
-        for row in period_data:
-            category = row['Category']
-            season_code = row['Season_Code']
-            # 전년도 데이터도 상세 시즌 분류 사용
-            season_type = get_season_type(season_code, prev_year, last_month)
-            
-            gross_sales = float(row['Gross_Sales'] or 0)
-            net_sales = float(row['Net_Sales'] or 0)
-            
-            # 아이템 분류 (N시즌 ACC는 4개 카테고리로 분류)
-            if season_code.endswith('N'):
-                # ACC (N시즌)
-                acc_category = get_acc_category(category)
-                prev_monthly_item_data[period][acc_category]['gross_sales'] += gross_sales
-                prev_monthly_item_data[period][acc_category]['net_sales'] += net_sales
-            else:
-                # 의류 - F/S 상세 시즌별 집계
-                if season_type == '당시즌F':
-                    prev_monthly_item_data[period]['당시즌F']['gross_sales'] += gross_sales
-                    prev_monthly_item_data[period]['당시즌F']['net_sales'] += net_sales
-                elif season_type == '당시즌S':
-                    prev_monthly_item_data[period]['당시즌S']['gross_sales'] += gross_sales
-                    prev_monthly_item_data[period]['당시즌S']['net_sales'] += net_sales
-                elif season_type == '과시즌F':
-                    prev_monthly_item_data[period]['과시즌F']['gross_sales'] += gross_sales
-                    prev_monthly_item_data[period]['과시즌F']['net_sales'] += net_sales
-                elif season_type == '과시즌S':
-                    prev_monthly_item_data[period]['과시즌S']['gross_sales'] += gross_sales
-                    prev_monthly_item_data[period]['과시즌S']['net_sales'] += net_sales
-                else:
-                    # 분류 불가한 경우는 당시즌F에 포함
-                    prev_monthly_item_data[period]['당시즌F']['gross_sales'] += gross_sales
-                    prev_monthly_item_data[period]['당시즌F']['net_sales'] += net_sales
+    # 월별 채널별 데이터 (당해) / 아이템별 데이터 (당해 + 전년도)
+    monthly_channel_data = build_monthly_channel_data(recent_periods)
+    monthly_item_data = build_monthly_item_data(recent_periods, legacy=True)
+    prev_monthly_item_data = build_monthly_item_data(prev_recent_periods)
     
-    # 월별 채널별 YOY 계산
+    # 월별 채널별 / 아이템별 YOY (전년 동월 대비 실판매출, F/S 기준 세분화 + 전체 합계)
     monthly_channel_yoy = {
-        'HK_Retail': [],
-        'HK_Outlet': [],
-        'HK_Online': [],
-        'MC_Retail': [],
-        'MC_Outlet': [],
+        channel: [round(yoy) for yoy in yoy_percent(*trends.yoy_pair('Net_Sales', recent_periods, channel=channel)).tolist()]
+        for channel in TREND_CHANNEL_KEYS
     }
-    
-    for period in recent_periods:
-        # 전년 동월 Period 찾기
-        period_year, period_month = parse_period(period)
-        if period_year and period_month:
-            prev_period_for_yoy = f"{(period_year - 1) % 100:02d}{period_month:02d}"
-            
-            current_hk_retail = monthly_channel_data[period]['HK_Retail']
-            prev_hk_retail = prev_monthly_channel_data.get(prev_period_for_yoy, {}).get('HK_Retail', 0)
-            yoy_hk_retail = (current_hk_retail / prev_hk_retail * 100) if prev_hk_retail > 0 else 0
-            monthly_channel_yoy['HK_Retail'].append(round(yoy_hk_retail))
-            
-            current_hk_outlet = monthly_channel_data[period]['HK_Outlet']
-            prev_hk_outlet = prev_monthly_channel_data.get(prev_period_for_yoy, {}).get('HK_Outlet', 0)
-            yoy_hk_outlet = (current_hk_outlet / prev_hk_outlet * 100) if prev_hk_outlet > 0 else 0
-            monthly_channel_yoy['HK_Outlet'].append(round(yoy_hk_outlet))
-            
-            current_hk_online = monthly_channel_data[period]['HK_Online']
-            prev_hk_online = prev_monthly_channel_data.get(prev_period_for_yoy, {}).get('HK_Online', 0)
-            yoy_hk_online = (current_hk_online / prev_hk_online * 100) if prev_hk_online > 0 else 0
-            monthly_channel_yoy['HK_Online'].append(round(yoy_hk_online))
-            
-            current_mc_retail = monthly_channel_data[period]['MC_Retail']
-            prev_mc_retail = prev_monthly_channel_data.get(prev_period_for_yoy, {}).get('MC_Retail', 0)
-            yoy_mc_retail = (current_mc_retail / prev_mc_retail * 100) if prev_mc_retail > 0 else 0
-            monthly_channel_yoy['MC_Retail'].append(round(yoy_mc_retail))
-            
-            current_mc_outlet = monthly_channel_data[period]['MC_Outlet']
-            prev_mc_outlet = prev_monthly_channel_data.get(prev_period_for_yoy, {}).get('MC_Outlet', 0)
-            yoy_mc_outlet = (current_mc_outlet / prev_mc_outlet * 100) if prev_mc_outlet > 0 else 0
-            monthly_channel_yoy['MC_Outlet'].append(round(yoy_mc_outlet))
-    
-    # 월별 아이템별 YOY 계산 (F/S 기준 세분화 + 전체 합계)
     monthly_item_yoy = {
-        '당시즌F': [],
-        '당시즌S': [],
-        '과시즌F': [],
-        '과시즌S': [],
-        '신발': [],
-        '모자': [],
-        '가방': [],
-        '기타ACC': [],
-        '전체합계': [],
+        item: [round(yoy) for yoy in yoy_percent(*trends.yoy_pair('Net_Sales', recent_periods, item=item)).tolist()]
+        for item in TREND_ITEM_KEYS
     }
-    
-    for period in recent_periods:
-        # 전년 동월 Period 찾기
-        period_year, period_month = parse_period(period)
-        if period_year and period_month:
-            prev_period_for_yoy = f"{(period_year - 1) % 100:02d}{period_month:02d}"
-            
-            # 당시즌F
-            current_net = monthly_item_data[period]['당시즌F']['net_sales']
-            prev_net = prev_monthly_item_data.get(prev_period_for_yoy, {}).get('당시즌F', {}).get('net_sales', 0)
-            yoy = (current_net / prev_net * 100) if prev_net > 0 else 0
-            monthly_item_yoy['당시즌F'].append(round(yoy))
-            
-            # 당시즌S
-            current_net = monthly_item_data[period]['당시즌S']['net_sales']
-            prev_net = prev_monthly_item_data.get(prev_period_for_yoy, {}).get('당시즌S', {}).get('net_sales', 0)
-            yoy = (current_net / prev_net * 100) if prev_net > 0 else 0
-            monthly_item_yoy['당시즌S'].append(round(yoy))
-            
-            # 과시즌F
-            current_net = monthly_item_data[period]['과시즌F']['net_sales']
-            prev_net = prev_monthly_item_data.get(prev_period_for_yoy, {}).get('과시즌F', {}).get('net_sales', 0)
-            yoy = (current_net / prev_net * 100) if prev_net > 0 else 0
-            monthly_item_yoy['과시즌F'].append(round(yoy))
-            
-            # 과시즌S
-            current_net = monthly_item_data[period]['과시즌S']['net_sales']
-            prev_net = prev_monthly_item_data.get(prev_period_for_yoy, {}).get('과시즌S', {}).get('net_sales', 0)
-            yoy = (current_net / prev_net * 100) if prev_net > 0 else 0
-            monthly_item_yoy['과시즌S'].append(round(yoy))
-            
-            # 모자
-            current_net = monthly_item_data[period]['모자']['net_sales']
-            prev_net = prev_monthly_item_data.get(prev_period_for_yoy, {}).get('모자', {}).get('net_sales', 0)
-            yoy = (current_net / prev_net * 100) if prev_net > 0 else 0
-            monthly_item_yoy['모자'].append(round(yoy))
-            
-            # 신발
-            current_net = monthly_item_data[period]['신발']['net_sales']
-            prev_net = prev_monthly_item_data.get(prev_period_for_yoy, {}).get('신발', {}).get('net_sales', 0)
-            yoy = (current_net / prev_net * 100) if prev_net > 0 else 0
-            monthly_item_yoy['신발'].append(round(yoy))
-            
-            # 모자 (이미 위에 있음, 중복 방지)
-            
-            # 가방
-            current_net = monthly_item_data[period]['가방']['net_sales']
-            prev_net = prev_monthly_item_data.get(prev_period_for_yoy, {}).get('가방', {}).get('net_sales', 0)
-            yoy = (current_net / prev_net * 100) if prev_net > 0 else 0
-            monthly_item_yoy['가방'].append(round(yoy))
-            
-            # 기타ACC
-            current_net = monthly_item_data[period]['기타ACC']['net_sales']
-            prev_net = prev_monthly_item_data.get(prev_period_for_yoy, {}).get('기타ACC', {}).get('net_sales', 0)
-            yoy = (current_net / prev_net * 100) if prev_net > 0 else 0
-            monthly_item_yoy['기타ACC'].append(round(yoy))
-
-            # 전체합계 (당시즌F/S + 과시즌F/S + 신발 + 모자 + 가방 + 기타ACC)
-            current_total = (
-                monthly_item_data[period]['당시즌F']['net_sales'] +
-                monthly_item_data[period]['당시즌S']['net_sales'] +
-                monthly_item_data[period]['과시즌F']['net_sales'] +
-                monthly_item_data[period]['과시즌S']['net_sales'] +
-                monthly_item_data[period]['신발']['net_sales'] +
-                monthly_item_data[period]['모자']['net_sales'] +
-                monthly_item_data[period]['가방']['net_sales'] +
-                monthly_item_data[period]['기타ACC']['net_sales']
-            )
-            prev_total = 0
-            if prev_period_for_yoy in prev_monthly_item_data:
-                prev_item = prev_monthly_item_data[prev_period_for_yoy]
-                prev_total = (
-                    prev_item['당시즌F']['net_sales'] +
-                    prev_item['당시즌S']['net_sales'] +
-                    prev_item['과시즌F']['net_sales'] +
-                    prev_item['과시즌S']['net_sales'] +
-                    prev_item['신발']['net_sales'] +
-                    prev_item['모자']['net_sales'] +
-                    prev_item['가방']['net_sales'] +
-                    prev_item['기타ACC']['net_sales']
-                )
-            total_yoy = (current_total / prev_total * 100) if prev_total > 0 else 0
-            monthly_item_yoy['전체합계'].append(round(total_yoy))
+    monthly_item_yoy['전체합계'] = [round(yoy) for yoy in yoy_percent(*trends.yoy_pair('Net_Sales', recent_periods)).tolist()]
     
     # 재고주수 계산 (최근 6개월 매출 필요)
     print("재고주수 계산 중...")
-    recent_6m_periods = sorted([p for p in periods if p <= last_period])[-6:]
+    # Category × Period N시즌 판매수량/매출 합계 (원천 1회 순회 + Period 누적합, ACC 재고주수와 공용)
+    n_season_sums = period_sums(
+        data,
+        lambda row: row['Category'] if row['Brand'] == 'MLB' and row['Season_Code'].endswith('N') else None,
+        ['Sales_Qty', 'Gross_Sales'],
+        periods,
+    )
     
     for category in category_summary:
-        # 최근 6개월 매출 합계
-        sales_6m = 0
-        for period in recent_6m_periods:
-            period_data = [row for row in data 
-                          if row['Period'] == period 
-                          and row['Brand'] == 'MLB'
-                          and row['Category'] == category
-                          and row['Season_Code'].endswith('N')]
-            sales_6m += sum(float(row['Sales_Qty'] or 0) for row in period_data)
-        
-        category_summary[category]['current']['sales_qty_6m'] = sales_6m
+        # 최근 6개월 매출 합계 (last_period 이하 최근 6개 Period)
+        category_summary[category]['current']['sales_qty_6m'] = n_season_sums['Sales_Qty'].last_n_sum(category, last_period, 6)
         
         # 재고주수 계산
         stock_price = category_summary[category]['current']['stock_price']
@@ -972,10 +699,6 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
         },
     })
     
-    # 직전 6개월 Period 찾기
-    recent_6m_periods_acc = sorted([p for p in periods if p <= last_period])[-6:]
-    prev_6m_periods_acc = sorted([p for p in periods if p <= prev_period])[-6:]
-    
     # 현재 Period의 N시즌 데이터에서 재고 Tag가 집계
     for row in current_data:
         if row['Season_Code'].endswith('N'):  # N시즌만
@@ -995,46 +718,15 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
             if category in acc_stock_summary:
                 acc_stock_summary[category]['previous']['stock_price'] += float(row['Stock_Price'] or 0)
     
-    # 직전 6개월 누적매출 계산 (Gross_Sales 기준)
-    for period in recent_6m_periods_acc:
-        if period in periods:
-            period_data = [row for row in data 
-                          if row['Period'] == period 
-                          and row['Brand'] == 'MLB'
-                          and row['Season_Code'].endswith('N')]  # N시즌만
-            
-            for row in period_data:
-                category = row['Category']
-                if category in acc_stock_summary:
-                    acc_stock_summary[category]['current']['gross_sales_6m'] += float(row['Gross_Sales'] or 0)
-    
-    for period in prev_6m_periods_acc:
-        if period in periods:
-            period_data = [row for row in data 
-                          if row['Period'] == period 
-                          and row['Brand'] == 'MLB'
-                          and row['Season_Code'].endswith('N')]  # N시즌만
-            
-            for row in period_data:
-                category = row['Category']
-                if category in acc_stock_summary:
-                    acc_stock_summary[category]['previous']['gross_sales_6m'] += float(row['Gross_Sales'] or 0)
-    
-    # 재고주수 계산 (주 단위)
-    # 재고주수 = (재고 Tag가 / 월평균 매출) * 4주
-    # 월평균 매출 = 6개월 누적매출 / 6
+    # 직전 6개월 누적매출 (Gross_Sales 기준, 기준월 이하 최근 6개 Period)
+    # 재고주수 = (재고 Tag가 / 월평균 매출) * 4주, 월평균 매출 = 6개월 누적매출 / 6
+    n_season_sales = n_season_sums['Gross_Sales']
     for category in acc_stock_summary:
         acc = acc_stock_summary[category]
-        
-        # 현재
-        avg_monthly_sales = acc['current']['gross_sales_6m'] / 6 if 6 > 0 else 0
-        if avg_monthly_sales > 0:
-            acc['current']['stock_weeks'] = (acc['current']['stock_price'] / avg_monthly_sales) * 4
-        
-        # 전년
-        avg_monthly_sales_prev = acc['previous']['gross_sales_6m'] / 6 if 6 > 0 else 0
-        if avg_monthly_sales_prev > 0:
-            acc['previous']['stock_weeks'] = (acc['previous']['stock_price'] / avg_monthly_sales_prev) * 4
+        acc['current']['gross_sales_6m'] = n_season_sales.last_n_sum(category, last_period, 6)
+        acc['previous']['gross_sales_6m'] = n_season_sales.last_n_sum(category, prev_period, 6)
+        acc['current']['stock_weeks'] = stock_weeks(acc['current']['stock_price'], acc['current']['gross_sales_6m'] / 6)
+        acc['previous']['stock_weeks'] = stock_weeks(acc['previous']['stock_price'], acc['previous']['gross_sales_6m'] / 6)
         
         # 변화량
         acc['stock_weeks_change'] = acc['current']['stock_weeks'] - acc['previous']['stock_weeks']
@@ -1052,13 +744,8 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
     }
     
     # ACC 전체 재고주수 계산
-    avg_monthly_sales_total = acc_total_current['gross_sales_6m'] / 6 if 6 > 0 else 0
-    if avg_monthly_sales_total > 0:
-        acc_total_current['stock_weeks'] = (acc_total_current['stock_price'] / avg_monthly_sales_total) * 4
-    
-    avg_monthly_sales_total_prev = acc_total_previous['gross_sales_6m'] / 6 if 6 > 0 else 0
-    if avg_monthly_sales_total_prev > 0:
-        acc_total_previous['stock_weeks'] = (acc_total_previous['stock_price'] / avg_monthly_sales_total_prev) * 4
+    acc_total_current['stock_weeks'] = stock_weeks(acc_total_current['stock_price'], acc_total_current['gross_sales_6m'] / 6)
+    acc_total_previous['stock_weeks'] = stock_weeks(acc_total_previous['stock_price'], acc_total_previous['gross_sales_6m'] / 6)
     
     acc_total_change = acc_total_current['stock_weeks'] - acc_total_previous['stock_weeks']
     
@@ -1277,51 +964,30 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
         },
     })
     
-    # 과시즌 FW 시즌별 재고 (1년차, 2년차, 3년차 이상)
-    past_season_fw_inventory = defaultdict(lambda: {
-        'season_code': '',
-        'year': 0,
-        'current': {
-            'stock_price': 0,
-        },
-        'previous': {
-            'stock_price': 0,
-        },
-    })
+    # 과시즌 에이징 큐브 (시즌 연차 × Subcategory × Period, MLB) - 과시즌 재고 / 판매 카드 공통
+    aging = AgingCube(data, include=lambda row: row['Brand'] == 'MLB', periods=periods)
     
-    # 과시즌 FW 시즌별 그룹화 (1년차, 2년차, 3년차 이상) - 먼저 초기화
+    # 과시즌 FW 연차별 재고 (1년차, 2년차, 3년차 이상) - 연차는 각 기준 Period(당월 / 전년 동월) 기준
     prev_prev_season_f = f"{prev_year % 100 - 1}F"  # 23F
-    prev_prev_prev_season_f = f"{prev_year % 100 - 2}F"  # 22F
-    
-    past_season_fw_by_year = {
-        '1년차': {
-            'season_codes': [previous_season_f],  # 24F
-            'current': {'stock_price': 0},
-            'previous': {'stock_price': 0},
-        },
-        '2년차': {
-            'season_codes': [prev_prev_season_f],  # 23F
-            'current': {'stock_price': 0},
-            'previous': {'stock_price': 0},
-        },
-        '3년차_이상': {
-            'season_codes': [],  # 22F 이하
-            'current': {'stock_price': 0},
-            'previous': {'stock_price': 0},
-        },
-    }
+    past_season_fw_by_year = {}
+    for year_key, season_codes in [('1년차', [previous_season_f]), ('2년차', [prev_prev_season_f]), ('3년차_이상', [])]:
+        past_season_fw_by_year[year_key] = {
+            'season_codes': season_codes,  # 24F / 23F / 22F 이하
+            'current': {'stock_price': aging.bucket('Stock_Price', last_period, year_key)},
+            'previous': {'stock_price': aging.bucket('Stock_Price', prev_period, year_key)},
+        }
     
-    # 25년 1년차 과시즌재고 (24FW) Subcategory별
-    past_season_fw_1year_subcat = defaultdict(lambda: {
-        'subcategory_code': '',
-        'subcategory_name': '',
-        'current': {
-            'stock_price': 0,
-        },
-        'previous': {
-            'stock_price': 0,
-        },
-    })
+    # 1년차 과시즌재고 Subcategory별 (당월 24FW, 전년 동월 23FW)
+    past_season_fw_1year_subcat = {}
+    for period, side in [(last_period, 'current'), (prev_period, 'previous')]:
+        for subcat_code in aging.subcategories(period, min_age=1, max_age=1):
+            subcat = past_season_fw_1year_subcat.setdefault(subcat_code, {
+                'subcategory_code': subcat_code,
+                'subcategory_name': aging.subcategory_name(period, subcat_code, 1),
+                'current': {'stock_price': 0},
+                'previous': {'stock_price': 0},
+            })
+            subcat[side]['stock_price'] = aging.total('Stock_Price', period, min_age=1, max_age=1, subcategory=subcat_code)
     
     # 악세 (N시즌) 별도 집계
     acc_ending_inventory = defaultdict(lambda: {
@@ -1352,24 +1018,6 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
             # 과시즌 FW
             ending_inventory['과시즌_FW']['season_type'] = '과시즌 FW'
             ending_inventory['과시즌_FW']['current']['stock_price'] += stock_price
-            
-            # 시즌 코드에서 연도 추출
-            if len(season_code) >= 2:
-                season_year = int(season_code[:2])
-                year_diff = last_year % 100 - season_year
-                
-                # 과시즌 FW 시즌별 집계
-                past_season_fw_inventory[season_code]['season_code'] = season_code
-                past_season_fw_inventory[season_code]['year'] = season_year
-                past_season_fw_inventory[season_code]['current']['stock_price'] += stock_price
-                
-                # 1년차 (24FW) Subcategory별 집계
-                if season_code == previous_season_f:  # 24F
-                    subcat_code = row['Subcategory_Code'].strip()
-                    subcat_name = row['Subcategory'].strip()
-                    past_season_fw_1year_subcat[subcat_code]['subcategory_code'] = subcat_code
-                    past_season_fw_1year_subcat[subcat_code]['subcategory_name'] = subcat_name
-                    past_season_fw_1year_subcat[subcat_code]['current']['stock_price'] += stock_price
         elif season_code.endswith('S'):
             # 과시즌 SS
             ending_inventory['과시즌_SS']['season_type'] = '과시즌 SS'
@@ -1396,28 +1044,6 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
         elif season_code.endswith('F'):
             # 과시즌 FW
             ending_inventory['과시즌_FW']['previous']['stock_price'] += stock_price
-            
-            # 과시즌 FW 시즌별 집계 (전년 동월 기준)
-            if len(season_code) >= 2:
-                season_year = int(season_code[:2])
-                # 전년 동월(2410) 기준으로 시즌별 분류
-                if season_code == prev_prev_season_f:  # 23F (전년 기준 1년차)
-                    past_season_fw_by_year['1년차']['previous']['stock_price'] += stock_price
-                    # Subcategory별 집계 (전년 1년차 = 23F)
-                    subcat_code = row['Subcategory_Code'].strip()
-                    subcat_name = row['Subcategory'].strip()
-                    if subcat_code not in past_season_fw_1year_subcat:
-                        past_season_fw_1year_subcat[subcat_code] = {
-                            'subcategory_code': subcat_code,
-                            'subcategory_name': subcat_name,
-                            'current': {'stock_price': 0},
-                            'previous': {'stock_price': 0},
-                        }
-                    past_season_fw_1year_subcat[subcat_code]['previous']['stock_price'] += stock_price
-                elif season_code == prev_prev_prev_season_f:  # 22F (전년 기준 2년차)
-                    past_season_fw_by_year['2년차']['previous']['stock_price'] += stock_price
-                elif len(season_code) >= 2 and int(season_code[:2]) < prev_year % 100 - 2:  # 21F 이하 (전년 기준 3년차 이상)
-                    past_season_fw_by_year['3년차_이상']['previous']['stock_price'] += stock_price
         elif season_code.endswith('S'):
             # 과시즌 SS
             ending_inventory['과시즌_SS']['previous']['stock_price'] += stock_price
@@ -1427,19 +1053,6 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
             if category in acc_ending_inventory:
                 acc_ending_inventory[category]['previous']['stock_price'] += stock_price
     
-    # 현재 Period 기준으로 1년차, 2년차, 3년차 이상 집계
-    for season_code, inv_data in past_season_fw_inventory.items():
-        if season_code == previous_season_f:  # 24F (현재 기준 1년차)
-            past_season_fw_by_year['1년차']['current']['stock_price'] += inv_data['current']['stock_price']
-        elif season_code == prev_prev_season_f:  # 23F (현재 기준 2년차)
-            past_season_fw_by_year['2년차']['current']['stock_price'] += inv_data['current']['stock_price']
-        else:
-            # 3년차 이상 (22F 이하)
-            if len(season_code) >= 2:
-                season_year = int(season_code[:2])
-                if season_year < prev_year % 100 - 1:
-                    past_season_fw_by_year['3년차_이상']['current']['stock_price'] += inv_data['current']['stock_price']
-    
     # YOY 계산
     for key in ending_inventory:
         inv = ending_inventory[key]
@@ -1482,65 +1095,19 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
     # 과시즌 판매 데이터 계산 (택가 기준, Gross_Sales)
     print("과시즌 판매 데이터 계산 중...")
     past_season_sales_by_year = {
-        '1년차': {
-            'current': {'gross_sales': 0},
-            'previous': {'gross_sales': 0},
-        },
-        '2년차': {
-            'current': {'gross_sales': 0},
-            'previous': {'gross_sales': 0},
-        },
-        '3년차_이상': {
-            'current': {'gross_sales': 0},
-            'previous': {'gross_sales': 0},
-        },
+        year_key: {
+            'current': {'gross_sales': aging.bucket('Gross_Sales', last_period, year_key)},
+            'previous': {'gross_sales': aging.bucket('Gross_Sales', prev_period, year_key)},
+        }
+        for year_key in ['1년차', '2년차', '3년차_이상']
     }
+    # 과시즌S: 당시즌 S(연차 0)를 제외한 S 시즌 (차기 시즌 포함)
     past_season_sales_ss = {
-        'current': {'gross_sales': 0},
-        'previous': {'gross_sales': 0},
+        side: {'gross_sales': aging.total('Gross_Sales', period, 'S', max_age=-1)
+                              + aging.total('Gross_Sales', period, 'S', min_age=1)}
+        for period, side in [(last_period, 'current'), (prev_period, 'previous')]
     }
     
-    # 현재 Period 과시즌 판매 계산
-    for row in current_data:
-        season_code = row['Season_Code']
-        gross_sales = float(row['Gross_Sales'] or 0)
-        
-        if season_code.endswith('F') and season_code != current_season_f:
-            # 과시즌F
-            if len(season_code) >= 2:
-                season_year = int(season_code[:2])
-                year_diff = last_year % 100 - season_year
-                
-                if season_code == previous_season_f:  # 24F (1년차)
-                    past_season_sales_by_year['1년차']['current']['gross_sales'] += gross_sales
-                elif season_code == prev_prev_season_f:  # 23F (2년차)
-                    past_season_sales_by_year['2년차']['current']['gross_sales'] += gross_sales
-                elif season_year < prev_year % 100 - 1:  # 22F 이하 (3년차 이상)
-                    past_season_sales_by_year['3년차_이상']['current']['gross_sales'] += gross_sales
-        elif season_code.endswith('S') and season_code != current_season_s:
-            # 과시즌S
-            past_season_sales_ss['current']['gross_sales'] += gross_sales
-    
-    # 전년 동월 과시즌 판매 계산
-    for row in prev_data:
-        season_code = row['Season_Code']
-        gross_sales = float(row['Gross_Sales'] or 0)
-        
-        if season_code.endswith('F') and season_code != previous_season_f:
-            # 과시즌F (전년 동월 기준)
-            if len(season_code) >= 2:
-                season_year = int(season_code[:2])
-                # 전년 동월(2411) 기준으로 시즌별 분류
-                if season_code == prev_prev_season_f:  # 23F (전년 기준 1년차)
-                    past_season_sales_by_year['1년차']['previous']['gross_sales'] += gross_sales
-                elif season_code == prev_prev_prev_season_f:  # 22F (전년 기준 2년차)
-                    past_season_sales_by_year['2년차']['previous']['gross_sales'] += gross_sales
-                elif season_year < prev_year % 100 - 2:  # 21F 이하 (전년 기준 3년차 이상)
-                    past_season_sales_by_year['3년차_이상']['previous']['gross_sales'] += gross_sales
-        elif season_code.endswith('S') and season_code != previous_season_s:
-            # 과시즌S
-            past_season_sales_ss['previous']['gross_sales'] += gross_sales
-    
     # YOY 및 증감 계산
     for year_key in past_season_sales_by_year:
         year_data = past_season_sales_by_year[year_key]
@@ -1569,151 +1136,23 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
         '기타ACC': {'stock_price': 0, 'stock_weeks': 0},
     })
     
-    # 각 Period별로 재고 데이터 집계
+    # 아이템 × Period 재고/매출 합계 (원천 1회 순회 + Period 누적합, 아이템 분류: 로드 시 조인한 Item_Bucket)
+    item_sums = period_sums(
+        data,
+        lambda row: ITEM_LABELS[row['Item_Bucket']] if row['Brand'] == 'MLB' and row['Item_Bucket'] != UNCLASSIFIED else None,
+        ['Stock_Price', 'Gross_Sales'],
+        periods,
+    )
+    item_stock, item_sales = item_sums['Stock_Price'], item_sums['Gross_Sales']
+
+    # 각 Period별 재고 / 재고주수 (해당 월 매출 기준)
     for period in recent_periods:
-        period_data = [row for row in data if row['Period'] == period and row['Brand'] == 'MLB']
         monthly_inventory_data[period]['period'] = period
-        
-        period_year, period_month = parse_period(period)
-        
-        # 해당 Period의 재고 데이터 집계
-        for row in period_data:
-            season_code = row['Season_Code']
-            category = row['Category']
-            stock_price = float(row['Stock_Price'] or 0)
-            
-            # F당시즌: 1~6월은 전년 시즌(24F), 7~12월은 현재 시즌(25F)
-            if period_year and period_month:
-                if period_month <= 6:
-                    # 1~6월: 전년 시즌 F (24F)
-                    prev_season_f = f"{(period_year - 1) % 100:02d}F"
-                    if season_code == prev_season_f:
-                        monthly_inventory_data[period]['F당시즌']['stock_price'] += stock_price
-                        continue  # F당시즌에 포함되었으므로 다음 행으로
-                else:
-                    # 7~12월: 현재 시즌 F (25F)
-                    if season_code == current_season_f:
-                        monthly_inventory_data[period]['F당시즌']['stock_price'] += stock_price
-                        continue  # F당시즌에 포함되었으므로 다음 행으로
-            
-            # S당시즌 (현재 시즌 S)
-            if season_code == current_season_s:
-                monthly_inventory_data[period]['S당시즌']['stock_price'] += stock_price
-            # 과시즌FW: F당시즌에 포함되지 않은 F로 끝나는 시즌만
-            elif season_code.endswith('F'):
-                monthly_inventory_data[period]['과시즌FW']['stock_price'] += stock_price
-            # 과시즌SS
-            elif season_code.endswith('S'):
-                monthly_inventory_data[period]['과시즌SS']['stock_price'] += stock_price
-            # 악세 (N시즌, 4개 카테고리)
-            elif season_code.endswith('N'):
-                acc_category = get_acc_category(category)
-                monthly_inventory_data[period][acc_category]['stock_price'] += stock_price
-        
-        # 각 아이템별 재고주수 계산 (직전 6개월 매출 기준)
-        period_year, period_month = parse_period(period)
-        if period_year and period_month:
-            # 직전 6개월 Period 찾기
-            prev_6m_periods = []
-            for i in range(6, 0, -1):
-                month = period_month - i
-                year = period_year
-                if month <= 0:
-                    month += 12
-                    year -= 1
-                prev_6m_periods.append(f"{year % 100:02d}{month:02d}")
-            
-            # 각 아이템별로 재고주수 계산
-            for item_key in ['F당시즌', 'S당시즌', '과시즌FW', '과시즌SS', '신발', '모자', '가방', '기타ACC']:
-                stock_price = monthly_inventory_data[period][item_key]['stock_price']
-                
-                # 직전 6개월 매출 계산
-                gross_sales_6m = 0
-                for prev_period in prev_6m_periods:
-                    if prev_period in periods:
-                        prev_period_data = [row for row in data 
-                                          if row['Period'] == prev_period 
-                                          and row['Brand'] == 'MLB']
-                        
-                        for row in prev_period_data:
-                            season_code = row['Season_Code']
-                            category = row['Category']
-                            
-                            # 아이템별 필터링
-                            if item_key == 'F당시즌':
-                                # 1~6월은 전년 시즌(24F), 7~12월은 현재 시즌(25F)
-                                if period_year and period_month:
-                                    if period_month <= 6:
-                                        prev_season_f = f"{(period_year - 1) % 100:02d}F"
-                                        if season_code == prev_season_f:
-                                            gross_sales_6m += float(row['Gross_Sales'] or 0)
-                                    else:
-                                        if season_code == current_season_f:
-                                            gross_sales_6m += float(row['Gross_Sales'] or 0)
-                            elif item_key == 'S당시즌' and season_code == current_season_s:
-                                gross_sales_6m += float(row['Gross_Sales'] or 0)
-                            elif item_key == '과시즌FW':
-                                # F당시즌에 포함되지 않은 F로 끝나는 시즌만
-                                if period_year and period_month:
-                                    if period_month <= 6:
-                                        prev_season_f = f"{(period_year - 1) % 100:02d}F"
-                                        if season_code.endswith('F') and season_code != prev_season_f:
-                                            gross_sales_6m += float(row['Gross_Sales'] or 0)
-                                    else:
-                                        if season_code.endswith('F') and season_code != current_season_f:
-                                            gross_sales_6m += float(row['Gross_Sales'] or 0)
-                            elif item_key == '과시즌SS' and season_code.endswith('S'):
-                                gross_sales_6m += float(row['Gross_Sales'] or 0)
-                            elif item_key in ['신발', '모자', '가방', '기타ACC'] and season_code.endswith('N'):
-                                acc_category = get_acc_category(category)
-                                if item_key == acc_category:
-                                    gross_sales_6m += float(row['Gross_Sales'] or 0)
-                
-                # 재고주수 계산 (주 단위) - 최근 1개월 매출 기준
-                # 해당 월의 매출 계산
-                monthly_sales = 0
-                period_data = [row for row in data 
-                              if row['Period'] == period 
-                              and row['Brand'] == 'MLB']
-                
-                for row in period_data:
-                    season_code = row['Season_Code']
-                    category = row['Category']
-                    
-                    # 아이템별 필터링
-                    if item_key == 'F당시즌':
-                        if period_year and period_month:
-                            if period_month <= 6:
-                                prev_season_f = f"{(period_year - 1) % 100:02d}F"
-                                if season_code == prev_season_f:
-                                    monthly_sales += float(row['Gross_Sales'] or 0)
-                            else:
-                                if season_code == current_season_f:
-                                    monthly_sales += float(row['Gross_Sales'] or 0)
-                    elif item_key == 'S당시즌' and season_code == current_season_s:
-                        monthly_sales += float(row['Gross_Sales'] or 0)
-                    elif item_key == '과시즌FW':
-                        if period_year and period_month:
-                            if period_month <= 6:
-                                prev_season_f = f"{(period_year - 1) % 100:02d}F"
-                                if season_code.endswith('F') and season_code != prev_season_f:
-                                    monthly_sales += float(row['Gross_Sales'] or 0)
-                            else:
-                                if season_code.endswith('F') and season_code != current_season_f:
-                                    monthly_sales += float(row['Gross_Sales'] or 0)
-                    elif item_key == '과시즌SS' and season_code.endswith('S'):
-                        monthly_sales += float(row['Gross_Sales'] or 0)
-                    elif item_key in ['신발', '모자', '가방', '기타ACC'] and season_code.endswith('N'):
-                        acc_category = get_acc_category(category)
-                        if item_key == acc_category:
-                            monthly_sales += float(row['Gross_Sales'] or 0)
-                
-                # 재고주수 = (재고금액 / 해당 월 매출) * 4주
-                if monthly_sales > 0:
-                    stock_weeks = (stock_price / monthly_sales) * 4
-                    monthly_inventory_data[period][item_key]['stock_weeks'] = round(stock_weeks, 1)
-                else:
-                    monthly_inventory_data[period][item_key]['stock_weeks'] = 0
+        for item_key in ITEM_KEYS:
+            stock_price = item_stock.month(item_key, period)
+            monthly_inventory_data[period][item_key]['stock_price'] = stock_price
+            # 재고주수 = (재고금액 / 해당 월 매출) * 4주
+            monthly_inventory_data[period][item_key]['stock_weeks'] = round(stock_weeks(stock_price, item_sales.month(item_key, period)), 1)
     
     # 재고 YOY 데이터 계산
     print("재고 YOY 데이터 계산 중...")
@@ -1732,106 +1171,18 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
         '기타ACC': {'stock_price': 0, 'stock_weeks': 0},
     })
     
-    # 전년 Period별 재고 데이터 집계
+    # 전년 Period별 재고 / 재고주수 (전년 기준 아이템 분류, 같은 합계 행렬 사용)
     for period in recent_periods:
         period_year, period_month = parse_period(period)
         if period_year and period_month:
             prev_period_for_yoy = f"{(period_year - 1) % 100:02d}{period_month:02d}"
             if prev_period_for_yoy in periods:
-                period_data = [row for row in data if row['Period'] == prev_period_for_yoy and row['Brand'] == 'MLB']
                 prev_monthly_inventory_data[prev_period_for_yoy]['period'] = prev_period_for_yoy
-                
-                for row in period_data:
-                    season_code = row['Season_Code']
-                    category = row['Category']
-                    stock_price = float(row['Stock_Price'] or 0)
-                    
-                    # F당시즌: 1~6월은 전년 전년 시즌(23F), 7~12월은 전년 시즌(24F)
-                    if period_year and period_month:
-                        if period_month <= 6:
-                            # 1~6월: 전년 전년 시즌 F (23F)
-                            prev_prev_season_f = f"{(period_year - 2) % 100:02d}F"
-                            if season_code == prev_prev_season_f:
-                                prev_monthly_inventory_data[prev_period_for_yoy]['F당시즌']['stock_price'] += stock_price
-                                continue  # F당시즌에 포함되었으므로 다음 행으로
-                        else:
-                            # 7~12월: 전년 시즌 F (24F)
-                            prev_season_f = f"{(period_year - 1) % 100:02d}F"
-                            if season_code == prev_season_f:
-                                prev_monthly_inventory_data[prev_period_for_yoy]['F당시즌']['stock_price'] += stock_price
-                                continue  # F당시즌에 포함되었으므로 다음 행으로
-                    
-                    # S당시즌 (전년 현재 시즌 S)
-                    prev_season_s = f"{(period_year - 1) % 100:02d}S"
-                    if season_code == prev_season_s:
-                        prev_monthly_inventory_data[prev_period_for_yoy]['S당시즌']['stock_price'] += stock_price
-                    # 과시즌FW: F당시즌에 포함되지 않은 F로 끝나는 시즌만
-                    elif season_code.endswith('F'):
-                        prev_monthly_inventory_data[prev_period_for_yoy]['과시즌FW']['stock_price'] += stock_price
-                    # 과시즌SS
-                    elif season_code.endswith('S'):
-                        prev_monthly_inventory_data[prev_period_for_yoy]['과시즌SS']['stock_price'] += stock_price
-                    # 악세 (N시즌, 4개 카테고리)
-                    elif season_code.endswith('N'):
-                        acc_category = get_acc_category(category)
-                        prev_monthly_inventory_data[prev_period_for_yoy][acc_category]['stock_price'] += stock_price
-    
-    # 전년 재고주수 계산 (전년 매출 기준)
-    print("전년 재고주수 계산 중...")
-    for period in sorted(recent_periods):
-        period_year, period_month = parse_period(period)
-        if period_year and period_month:
-            prev_period_for_yoy = f"{(period_year - 1) % 100:02d}{period_month:02d}"
-            if prev_period_for_yoy in periods:
-                # 전년 Period의 매출 데이터
-                prev_period_data = [row for row in data if row['Period'] == prev_period_for_yoy and row['Brand'] == 'MLB']
-                prev_year, prev_month = parse_period(prev_period_for_yoy)
-                
-                # 전년 기준 시즌 코드
-                prev_season_f = f"{(prev_year - 1) % 100:02d}F" if prev_month <= 6 else f"{prev_year % 100:02d}F"
-                prev_season_s = f"{prev_year % 100:02d}S"
-                
-                for item_key in ['F당시즌', 'S당시즌', '과시즌FW', '과시즌SS', '신발', '모자', '가방', '기타ACC']:
-                    prev_stock_price = prev_monthly_inventory_data[prev_period_for_yoy][item_key]['stock_price']
-                    
-                    # 전년 해당 월 매출 계산 (전년 기준으로 시즌 판단)
-                    prev_monthly_sales = 0
-                    for row in prev_period_data:
-                        season_code = row['Season_Code']
-                        category = row['Category']
-                        
-                        # 아이템별 필터링 (전년 기준)
-                        if item_key == 'F당시즌':
-                            # 전년의 F당시즌: 전년 1~6월은 전전년F, 7~12월은 전년F
-                            if prev_month <= 6:
-                                prev_prev_season_f = f"{(prev_year - 2) % 100:02d}F"
-                                if season_code == prev_prev_season_f:
-                                    prev_monthly_sales += float(row['Gross_Sales'] or 0)
-                            else:
-                                if season_code == prev_season_f:
-                                    prev_monthly_sales += float(row['Gross_Sales'] or 0)
-                        elif item_key == 'S당시즌':
-                            if season_code == prev_season_s:
-                                prev_monthly_sales += float(row['Gross_Sales'] or 0)
-                        elif item_key == '과시즌FW':
-                            if prev_month <= 6:
-                                prev_prev_season_f = f"{(prev_year - 2) % 100:02d}F"
-                                if season_code.endswith('F') and season_code != prev_prev_season_f:
-                                    prev_monthly_sales += float(row['Gross_Sales'] or 0)
-                            else:
-                                if season_code.endswith('F') and season_code != prev_season_f:
-                                    prev_monthly_sales += float(row['Gross_Sales'] or 0)
-                        elif item_key == '과시즌SS' and season_code.endswith('S'):
-                            prev_monthly_sales += float(row['Gross_Sales'] or 0)
-                        elif item_key in ['신발', '모자', '가방', '기타ACC'] and season_code.endswith('N'):
-                            acc_category = get_acc_category(category)
-                            if item_key == acc_category:
-                                prev_monthly_sales += float(row['Gross_Sales'] or 0)
-                    
-                    # 전년 재고주수 계산
-                    if prev_monthly_sales > 0:
-                        prev_stock_weeks = (prev_stock_price / prev_monthly_sales) * 4
-                        prev_monthly_inventory_data[prev_period_for_yoy][item_key]['stock_weeks'] = round(prev_stock_weeks, 1)
+                for item_key in ITEM_KEYS:
+                    prev_stock_price = item_stock.month(item_key, prev_period_for_yoy)
+                    prev_monthly_inventory_data[prev_period_for_yoy][item_key]['stock_price'] = prev_stock_price
+                    prev_monthly_inventory_data[prev_period_for_yoy][item_key]['stock_weeks'] = round(
+                        stock_weeks(prev_stock_price, item_sales.month(item_key, prev_period_for_yoy)), 1)
     
     # YOY 계산 (아이템별 + 전체합계)
     item_keys = ['F당시즌', 'S당시즌', '과시즌FW', '과시즌SS', '신발', '모자', '가방', '기타ACC']
@@ -1896,116 +1247,47 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
             previous_season_f_oct[subcat_code]['subcategory_name'] = subcat_name
             previous_season_f_oct[subcat_code]['net_sales'] += float(row['Net_Sales'] or 0)
     
-    # 25F 누적 (7~10월) - 판매율 계산용
-    season_f_accumulated_current = defaultdict(lambda: {
-        'net_sales': 0,
-        'net_acp_p': 0,  # 누적 입고액 (택가)
-        'ac_sales_gross': 0,  # 누적 판매액 (택가)
-        'stock_price': 0,  # 재고 Tag가
-    })
-    season_f_accumulated_previous = defaultdict(lambda: {
-        'net_sales': 0,
-        'net_acp_p': 0,
-        'ac_sales_gross': 0,
-        'stock_price': 0,
-    })
-    
-    # Subcategory별 누적 데이터
-    season_f_subcat_current = defaultdict(lambda: {
-        'subcategory_code': '',
-        'subcategory_name': '',
-        'net_acp_p': 0,  # 누적 입고액
-        'ac_sales_gross': 0,  # 누적 판매액
-        'stock_price': 0,  # 재고 Tag가
-        'gross_sales_total': 0,  # 7~10월 Gross_Sales 합계 (월판매액 계산용)
-    })
-    season_f_subcat_previous = defaultdict(lambda: {
-        'subcategory_code': '',
-        'subcategory_name': '',
-        'net_acp_p': 0,
-        'ac_sales_gross': 0,
-        'stock_price': 0,
-        'gross_sales_total': 0,
-    })
+    # 당시즌 판매율 엔진 (시즌 × Subcategory × Period 누적 배열, MLB)
+    # Net_AcP_P, AC_Sales_Gross는 CSV에 이미 누적값 → 기준 Period 값 사용
+    sell_through = SellThrough(data, include=lambda row: row['Brand'] == 'MLB', periods=periods)
+    
+    def season_totals(season, period):
+        """시즌 합계 (기준 Period 값)"""
+        return {
+            'net_sales': sell_through.as_of('Net_Sales', season, period),
+            'net_acp_p': sell_through.as_of('Net_AcP_P', season, period),  # 누적 입고액 (택가)
+            'ac_sales_gross': sell_through.as_of('AC_Sales_Gross', season, period),  # 누적 판매액 (택가)
+            'stock_price': sell_through.as_of('Stock_Price', season, period),  # 재고 Tag가
+        }
     
-    # 7~10월 Period
-    season_f_periods_current = [f"{last_year % 100:02d}{m:02d}" for m in range(7, 11)]
-    season_f_periods_previous = [f"{prev_year % 100:02d}{m:02d}" for m in range(7, 11)]
+    # 25F 누적 (7~10월) - 판매율 계산용
+    season_f_accumulated_current = {'total': season_totals(current_season_f, last_period)}
+    season_f_accumulated_previous = {'total': season_totals(previous_season_f, prev_period)}
+    
+    # Subcategory별 누적 데이터 (당월 25F 행이 있는 Subcategory)
+    # gross_sales_total: 당월 Gross_Sales + 7~10월 Gross_Sales 합계 (월판매액 계산용)
+    season_f_start, season_f_end = f"{last_year % 100:02d}07", f"{last_year % 100:02d}10"
+    season_f_subcat_current = {}
+    for subcat_code in sell_through.subcategories(current_season_f, last_period):
+        subcat_values = {
+            column: sell_through.as_of(column, current_season_f, last_period, subcategory=subcat_code)
+            for column in ['Net_AcP_P', 'AC_Sales_Gross', 'Stock_Price', 'Gross_Sales']
+        }
+        season_f_subcat_current[subcat_code] = {
+            'subcategory_code': subcat_code,
+            'subcategory_name': sell_through.subcategory_name(current_season_f, subcat_code, last_period),
+            'net_acp_p': subcat_values['Net_AcP_P'],  # 누적 입고액
+            'ac_sales_gross': subcat_values['AC_Sales_Gross'],  # 누적 판매액
+            'stock_price': subcat_values['Stock_Price'],  # 재고 Tag가
+            'gross_sales_total': subcat_values['Gross_Sales'] + sell_through.season_to_date(
+                'Gross_Sales', current_season_f, season_f_start, season_f_end, subcategory=subcat_code),
+        }
     
-    # 현재 시즌 누적 데이터 (마지막 Period 기준으로 누적값 사용)
-    for row in current_data:
-        if row['Season_Code'] == current_season_f:
-            season_f_accumulated_current['total']['net_sales'] += float(row['Net_Sales'] or 0)
-            season_f_accumulated_current['total']['net_acp_p'] += float(row['Net_AcP_P'] or 0)
-            season_f_accumulated_current['total']['ac_sales_gross'] += float(row['AC_Sales_Gross'] or 0)
-            season_f_accumulated_current['total']['stock_price'] += float(row['Stock_Price'] or 0)
-            
-            # Subcategory별
-            subcat_code = row['Subcategory_Code'].strip()
-            subcat_name = row['Subcategory'].strip()
-            season_f_subcat_current[subcat_code]['subcategory_code'] = subcat_code
-            season_f_subcat_current[subcat_code]['subcategory_name'] = subcat_name
-            season_f_subcat_current[subcat_code]['net_acp_p'] += float(row['Net_AcP_P'] or 0)
-            season_f_subcat_current[subcat_code]['ac_sales_gross'] += float(row['AC_Sales_Gross'] or 0)
-            season_f_subcat_current[subcat_code]['stock_price'] += float(row['Stock_Price'] or 0)
-            season_f_subcat_current[subcat_code]['gross_sales_total'] += float(row['Gross_Sales'] or 0)  # 10월 Gross_Sales
-    
-    # 7~10월 각 Period의 Gross_Sales 합계 계산
-    for period in season_f_periods_current:
-        if period in periods:
-            period_data = [row for row in data if row['Period'] == period and row['Brand'] == 'MLB' and row['Season_Code'] == current_season_f]
-            for row in period_data:
-                subcat_code = row['Subcategory_Code'].strip()
-                if subcat_code in season_f_subcat_current:
-                    season_f_subcat_current[subcat_code]['gross_sales_total'] += float(row['Gross_Sales'] or 0)
-    
-    # 전년 시즌 누적 데이터 (7~10월 기간의 누적값 사용)
-    # 전년도 마지막 Period(2411)의 누적값을 사용 (CSV의 AC_Sales_Gross, Net_AcP_P는 누적값)
-    # 같은 Subcategory_Code가 여러 행에 있을 수 있으므로 합산
-    for row in prev_data:
-        if row['Season_Code'] == previous_season_f:
-            season_f_accumulated_previous['total']['net_sales'] += float(row['Net_Sales'] or 0)
-            season_f_accumulated_previous['total']['net_acp_p'] += float(row['Net_AcP_P'] or 0)
-            season_f_accumulated_previous['total']['ac_sales_gross'] += float(row['AC_Sales_Gross'] or 0)
-            season_f_accumulated_previous['total']['stock_price'] += float(row['Stock_Price'] or 0)
-            
-            # Subcategory별 - 같은 Subcategory_Code의 모든 행을 합산
-            subcat_code = row['Subcategory_Code'].strip()
-            subcat_name = row['Subcategory'].strip()
-            season_f_subcat_previous[subcat_code]['subcategory_code'] = subcat_code
-            season_f_subcat_previous[subcat_code]['subcategory_name'] = subcat_name
-            season_f_subcat_previous[subcat_code]['net_acp_p'] += float(row['Net_AcP_P'] or 0)  # 누적값 합산
-            season_f_subcat_previous[subcat_code]['ac_sales_gross'] += float(row['AC_Sales_Gross'] or 0)  # 누적값 합산
-            season_f_subcat_previous[subcat_code]['stock_price'] += float(row['Stock_Price'] or 0)
-            season_f_subcat_previous[subcat_code]['gross_sales_total'] += float(row['Gross_Sales'] or 0)  # 10월 Gross_Sales
-    
-    # 전년 7~10월 각 Period의 Gross_Sales 합계 계산
-    for period in season_f_periods_previous:
-        if period in periods:
-            period_data = [row for row in data if row['Period'] == period and row['Brand'] == 'MLB' and row['Season_Code'] == previous_season_f]
-            for row in period_data:
-                subcat_code = row['Subcategory_Code'].strip()
-                if subcat_code in season_f_subcat_previous:
-                    season_f_subcat_previous[subcat_code]['gross_sales_total'] += float(row['Gross_Sales'] or 0)
-    
-    # 25S 누적 (1~9월)
-    season_s_accumulated_current = defaultdict(lambda: {'net_sales': 0})
-    season_s_accumulated_previous = defaultdict(lambda: {'net_sales': 0})
-    
-    season_s_periods_current = [f"{last_year % 100:02d}{m:02d}" for m in range(1, 10)]
-    season_s_periods_previous = [f"{prev_year % 100:02d}{m:02d}" for m in range(1, 10)]
-    
-    for period in season_s_periods_current:
-        if period in periods:
-            period_data = [row for row in data if row['Period'] == period and row['Brand'] == 'MLB' and row['Season_Code'] == current_season_s]
-            for row in period_data:
-                season_s_accumulated_current['total']['net_sales'] += float(row['Net_Sales'] or 0)
-    
-    for period in season_s_periods_previous:
-        if period in periods:
-            period_data = [row for row in data if row['Period'] == period and row['Brand'] == 'MLB' and row['Season_Code'] == previous_season_s]
-            for row in period_data:
-                season_s_accumulated_previous['total']['net_sales'] += float(row['Net_Sales'] or 0)
+    # 25S 누적 (1~9월 실판매출)
+    season_s_accumulated_current = {'total': {'net_sales': sell_through.season_to_date(
+        'Net_Sales', current_season_s, f"{last_year % 100:02d}01", f"{last_year % 100:02d}09")}}
+    season_s_accumulated_previous = {'total': {'net_sales': sell_through.season_to_date(
+        'Net_Sales', previous_season_s, f"{prev_year % 100:02d}01", f"{prev_year % 100:02d}09")}}
     
     # Subcategory_Code별 TOP 5 정렬
     current_season_f_oct_sorted = sorted(current_season_f_oct.items(), key=lambda x: x[1]['net_sales'], reverse=True)[:5]
@@ -2030,11 +1312,11 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
             sales_rate = (subcat_data['ac_sales_gross'] / subcat_data['net_acp_p'] * 100) if subcat_data['net_acp_p'] > 0 else 0
             
             # 전년 입고액
-            prev_net_acp_p = season_f_subcat_previous.get(subcat_code, {}).get('net_acp_p', 0)
+            prev_net_acp_p = sell_through.as_of('Net_AcP_P', previous_season_f, prev_period, subcategory=subcat_code)
             net_acp_p_yoy_subcat = (subcat_data['net_acp_p'] / prev_net_acp_p * 100) if prev_net_acp_p > 0 else (999 if subcat_data['net_acp_p'] > 0 else 0)
             
             # 누적 판매 YOY 계산 (누적 판매액 기준)
-            prev_ac_sales_gross = season_f_subcat_previous.get(subcat_code, {}).get('ac_sales_gross', 0)
+            prev_ac_sales_gross = sell_through.as_of('AC_Sales_Gross', previous_season_f, prev_period, subcategory=subcat_code)
             ac_sales_gross_yoy = (subcat_data['ac_sales_gross'] / prev_ac_sales_gross * 100) if prev_ac_sales_gross > 0 else (999 if subcat_data['ac_sales_gross'] > 0 else 0)
             
             # 재고일수 계산 (해당 Period의 Gross_Sales 합계를 월판매액으로 사용)
@@ -2341,43 +1623,18 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
     # ============================================================
     print("매장 상세 대시보드용 데이터 생성 중...")
     
-    # 1. 매장별 월별 추세 (1~10월)
+    # 1. 매장별 월별 추세 (1~10월, 해당 월에 행이 있는 매장만)
     store_monthly_trends = defaultdict(list)
-    
-    # 현재 년도 1~10월 데이터
-    for period in sorted(periods):
-        year, month = parse_period(period)
-        if not year or not month or year != last_year or month > last_month:
-            continue
-        
-        period_data = [row for row in data if row['Period'] == period and row['Brand'] == 'MLB']
-        store_sales_current = defaultdict(float)
-        
-        for row in period_data:
-            store_code = row['Store_Code']
-            net_sales = float(row.get('Net_Sales', 0) or 0)
-            store_sales_current[store_code] += net_sales
-        
-        # 전년 동월 데이터
-        prev_period_str = f"{(year-1) % 100:02d}{month:02d}"
-        prev_period_data = [row for row in data if row['Period'] == prev_period_str and row['Brand'] == 'MLB']
-        store_sales_previous = defaultdict(float)
-        
-        for row in prev_period_data:
-            store_code = row['Store_Code']
-            net_sales = float(row.get('Net_Sales', 0) or 0)
-            store_sales_previous[store_code] += net_sales
-        
-        # 각 매장별 데이터 저장
-        for store_code in store_sales_current:
-            yoy = 0
-            if store_sales_previous[store_code] > 0:
-                yoy = round((store_sales_current[store_code] / store_sales_previous[store_code]) * 100)
-            
+    for store_code in trends.members('store'):
+        store_rows = trends.series(ROW_COUNT, recent_periods, store=store_code).tolist()
+        current_sales, previous_sales = (series.tolist() for series in trends.yoy_pair('Net_Sales', recent_periods, store=store_code))
+        for period, rows, current, previous in zip(recent_periods, store_rows, current_sales, previous_sales):
+            if not rows:
+                continue
             store_monthly_trends[store_code].append({
-                'month': month,
-                'net_sales': round(store_sales_current[store_code] / 1000, 1),  # 1K HKD
-                'yoy': yoy
+                'month': parse_period(period)[1],
+                'net_sales': round(current / 1000, 1),  # 1K HKD
+                'yoy': round((current / previous) * 100) if previous > 0 else 0
             })
     
     # 2. 매장별 아이템 전체 (서브카테고리 기준, 합계 포함)
@@ -3023,15 +2280,18 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
     
     # JSON 저장
     print(f"\n결과 저장 중: {output_file_path}")
-    with open(output_file_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
-    
-    # public 폴더에도 복사
+    # public 폴더에도 복사 (원자적 저장, 변경 없으면 생략, 매니페스트 자동 갱신)
     public_output = output_file_path.replace('components/dashboard', 'public/dashboard')
-    os.makedirs(os.path.dirname(public_output), exist_ok=True)
-    with open(public_output, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
-    print(f"  복사 완료: {public_output}")
+    with ArtifactWriter() as writer:
+        writer.write(output_file_path, result)
+        writer.write(public_output, result)
+    
+    # KPI 테이블 갱신 (CEO 인사이트 입력)
+    record_kpis('hongkong', last_period, dashboard_kpis(result))
+    
+    # 델타 번들 갱신 (Period 전환/전년 비교용) 및 매니페스트 갱신 (콘텐츠 해시 URL)
+    bundle_path = write_bundle('hongkong', dashboard_dir=os.path.dirname(public_output))
+    update_manifest([bundle_path])
     
     print("\n" + "=" * 80)
     print("완료!")
@@ -3045,6 +2305,7 @@ def generate_dashboard_data(csv_dir, output_file_path, target_period=None):
     print("=" * 80)
 
 if __name__ == '__main__':
+    instrument_cli()
     import sys
     import traceback
     from datetime import datetime
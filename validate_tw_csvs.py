@@ -1,31 +1,31 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""생성된 CSV 파일 검증"""
+"""생성된 CSV 파일 검증 (파일별 1회 로드: 행 수 / NULL 셀 확인 후 출력)"""
 
 import pandas as pd
 import os
 
-OUTPUT_DIR = '../Dashboard_Raw_Data/TW/2512/processed/'
+from preprocess_tw_cards_2512 import OUTPUT_DIR, OUTPUT_FILES
 
 print("=" * 80)
 print("생성된 CSV 파일 검증")
 print("=" * 80)
 
-files = [
-    '2512_당시즌판매율.csv',
-    '2512_ACC재고주수.csv',
-    '2512_기말재고_TAG.csv',
-    '2512_아이템별판매_TAG.csv',
-    '2512_과시즌재고_TAG.csv'
-]
-
-for filename in files:
+failed = []
+for key, filename in OUTPUT_FILES.items():
     filepath = os.path.join(OUTPUT_DIR, filename)
     print(f"\n[{filename}]")
+    if not os.path.exists(filepath):
+        print(f"❌ 파일 없음: {filepath}")
+        failed.append(filename)
+        continue
     df = pd.read_csv(filepath, encoding='utf-8-sig')
     print(df.to_string(index=False))
-    print(f"\n총 {len(df)} rows")
+    null_cells = int(df.isna().to_numpy().sum())
+    print(f"\n총 {len(df)} rows" + (f", NULL {null_cells}개" if null_cells else ""))
+    if len(df) == 0:
+        failed.append(filename)
 
 print("\n" + "=" * 80)
-print("검증 완료")
+print("검증 완료" if not failed else f"검증 실패: {failed}")
 print("=" * 80)